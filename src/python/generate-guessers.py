@@ -31,6 +31,7 @@ from sys import argv, exit, stderr
 from time import strftime
 
 from omorfi.apertium_formatter import ApertiumFormatter
+from omorfi.build_timings import add_timing_arguments, timings_from_args
 from omorfi.ftb3_formatter import Ftb3Formatter
 from omorfi.giella_formatter import GiellaFormatter
 from omorfi.labeled_segments_formatter import LabeledSegmentsFormatter
@@ -84,7 +85,9 @@ def main():
                     help="use specific output format for lexc data",
                     choices=["omor", "giella", "ftb3", "ftb1", "none", "apertium",
                              "labelsegments"])
+    add_timing_arguments(ap)
     args = ap.parse_args()
+    timings = timings_from_args('generate-guessers', args)
 
     formatter = None
     if args.format == 'omor':
@@ -116,6 +119,7 @@ def main():
             print("Not writing closed parts-of-speech data in",
                   ",".join(args.exclude_pos))
     # find deletions to map
+    timings.switch('read')
     deletions = dict()
     for tsv_filename in args.sdfilenames:
         if args.verbose:
@@ -137,8 +141,10 @@ def main():
                     deletions[tsv_parts['new_para']] = tsv_parts['deletion']
                 else:
                     deletions[tsv_parts['new_para']] = ''
+        timings.count(linecount)
 
     # print definitions to rootfile
+    timings.switch('format')
     print(formatter.copyright_lexc(), file=args.output)
     if args.verbose:
         print("Creating Multichar_Symbols and Root")
@@ -188,6 +194,7 @@ def main():
                     print(formatter.guesser2lexc(
                         None, deletions[tsv_parts[0]], tsv_parts[0]),
                         file=args.output)
+        timings.count(linecount)
     # FOLLOWING IS SHARED WITH generate-lexcies
     # print stem parts
     for tsv_filename in args.spfilenames:
@@ -226,6 +233,7 @@ def main():
                     print(formatter.continuation2lexc(
                         tsv_parts[1], tsv_parts[2], cont),
                         file=args.output)
+        timings.count(linecount)
     # print inflections
     for tsv_filename in args.inffilenames:
         if args.verbose:
@@ -264,6 +272,7 @@ def main():
                     print(formatter.continuation2lexc(
                         tsv_parts[1], tsv_parts[2], cont),
                         file=args.output)
+        timings.count(linecount)
     exit(0)
 
 
@@ -32,6 +32,7 @@ import csv
 from sys import exit, stderr
 
 from omorfi.kotus_sanalista_formatter import format_wordmap_kotus_sanalista
+from omorfi.lexdb import open_lexemes
 
 
 # standard UI stuff
@@ -95,9 +96,8 @@ def main():
             print("Reading from", tsv_filename)
         linecount = 0
         # for each line
-        with open(tsv_filename, 'r', newline='') as tsv_file:
-            tsv_reader = csv.DictReader(tsv_file, delimiter=args.separator,
-                                        quoting=quoting, quotechar=quotechar, escapechar='%', strict=True)
+        with open_lexemes(tsv_filename, delimiter=args.separator,
+                          quoting=quoting, quotechar=quotechar) as tsv_reader:
             for tsv_parts in tsv_reader:
                 linecount += 1
                 if len(tsv_parts) < 18:
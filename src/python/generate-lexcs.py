@@ -29,23 +29,405 @@ on the python's csv module, but may change in the future.
 
 import argparse
 import csv
-from sys import argv, exit, stderr
+import json
+from hashlib import sha1
+from multiprocessing import cpu_count, get_context
+from os.path import exists
+from sys import argv, exit, modules, stderr
 from time import strftime
 
 from omorfi.apertium_formatter import ApertiumFormatter
+from omorfi.build_timings import add_timing_arguments, timings_from_args
 from omorfi.ftb3_formatter import Ftb3Formatter
 from omorfi.giella_formatter import GiellaFormatter
 from omorfi.labeled_segments_formatter import LabeledSegmentsFormatter
+from omorfi.lexdb import open_lexemes
 from omorfi.no_tags_formatter import NoTagsFormatter
 from omorfi.omor_formatter import OmorFormatter
 
 
+# output formats and their options that can be given per output
+FORMATS = {'omor': ['new-para', 'allo', 'props', 'sem'], 'giella': [],
+           'ftb3': [], 'ftb1': [], 'none': ['lemmas', 'segments'],
+           'apertium': [], 'labelsegments': []}
+
+
+class LexcBlocks:
+
+    """
+    Lexc output collected in blocks of text for incremental generation.
+
+    Each block is identified by a content hash of the data it is generated
+    from and the formatter options. With a manifest from previous run, the
+    blocks whose hashes are found are copied from the previous output instead
+    of being formatted again, and the output file is not rewritten at all if
+    nothing changed.
+    """
+
+    def __init__(self, outputname, options, manifestname=None):
+        """Set up blocks for outputname using manifest from manifestname."""
+        self.outputname = outputname
+        self.manifestname = manifestname
+        self.options = sha1(options.encode('utf-8')).hexdigest()
+        self.texts = []
+        self.old_output = None
+        self.old_blocks = dict()
+        self.reused = 0
+        self.formatted = 0
+        if manifestname and exists(manifestname) and exists(outputname):
+            with open(manifestname) as manifestfile:
+                try:
+                    manifest = json.load(manifestfile)
+                except ValueError:
+                    manifest = dict()
+            if manifest.get('options') != self.options:
+                return
+            with open(outputname, newline='') as outfile:
+                old_output = outfile.read()
+            if sha1(old_output.encode('utf-8')).hexdigest() != \
+                    manifest.get('output'):
+                return
+            self.old_output = old_output
+            self.old_blocks = manifest.get('blocks', dict())
+
+    def add_text(self, text):
+        """Add text that is regenerated on every run."""
+        self.texts.append(text)
+
+    def add_block(self, rows, render):
+        """Add block generated from rows by render(), unless unchanged."""
+        blockhash = sha1(self.options.encode('utf-8'))
+        for row in rows:
+            blockhash.update(repr(row).encode('utf-8'))
+        blockhash = blockhash.hexdigest()
+        if blockhash in self.old_blocks:
+            start, end = self.old_blocks[blockhash]
+            text = self.old_output[start:end]
+            self.reused += 1
+        else:
+            text = render()
+            self.formatted += 1
+        self.texts.append((blockhash, text))
+
+    def write(self):
+        """Write output and manifest if anything changed.
+
+        Returns True if the output file was written.
+        """
+        output = []
+        offset = 0
+        positions = dict()
+        for text in self.texts:
+            if isinstance(text, tuple):
+                blockhash, text = text
+                positions[blockhash] = (offset, offset + len(text))
+            output.append(text)
+            offset += len(text)
+        output = ''.join(output)
+        if output == self.old_output:
+            return False
+        with open(self.outputname, 'w', newline='') as outfile:
+            outfile.write(output)
+        if self.manifestname:
+            with open(self.manifestname, 'w') as manifestfile:
+                json.dump({'options': self.options,
+                           'output': sha1(output.encode('utf-8')).hexdigest(),
+                           'blocks': positions}, manifestfile)
+        return True
+
+
+def format_options(args, format):
+    """Return string of everything besides the data affecting lexc output.
+
+    This includes formatter options and the source code of omorfi modules
+    doing the formatting.
+    """
+    options = [format, args.omor_new_para, args.omor_allo,
+               args.omor_props, args.omor_sem, args.none_lemmas,
+               args.none_segments]
+    for name, module in sorted(modules.items()):
+        if name == '__main__' or name.startswith('omorfi.'):
+            source = getattr(module, '__file__', None)
+            if source and source.endswith('.py'):
+                with open(source, 'rb') as sourcefile:
+                    options.append(sha1(sourcefile.read()).hexdigest())
+    return repr(options)
+
+
+def parse_format(spec, args):
+    """Parse FORMAT[:OPTION,...] output format spec.
+
+    Returns the format and a copy of args where the OPTIONs are switched on
+    as if --FORMAT-OPTION was given, e.g. none:lemmas is -f none with
+    --none-lemmas for that output only.
+    """
+    format, _, options = spec.partition(':')
+    if format not in FORMATS:
+        print("Unknown format", format, "in", spec, file=stderr)
+        exit(1)
+    format_args = argparse.Namespace(**vars(args))
+    if options:
+        for option in options.split(','):
+            if option not in FORMATS[format]:
+                print("Unknown option", option, "for format", format,
+                      "in", spec, file=stderr)
+                exit(1)
+            setattr(format_args, format + '_' + option.replace('-', '_'),
+                    True)
+    return format, format_args
+
+
+def make_formatter(format, args):
+    """Create formatter for format using options from args."""
+    if format == 'omor':
+        return OmorFormatter(args.verbose, newparas=args.omor_new_para,
+                             allo=args.omor_allo, props=args.omor_props, sem=args.omor_sem)
+    elif format == 'ftb3':
+        return Ftb3Formatter(args.verbose)
+    elif format == 'apertium':
+        return ApertiumFormatter(args.verbose)
+    elif format == 'giella':
+        return GiellaFormatter(args.verbose)
+    elif format == 'none':
+        return NoTagsFormatter(args.verbose,
+                               lemmatise=args.none_lemmas, segment=args.none_segments)
+    elif format == 'labelsegments':
+        return LabeledSegmentsFormatter(args.verbose)
+    else:
+        return None
+
+
+def read_master(tsv_filename, args, lemmas, timings):
+    """Read master database from TSV or lexdb file into lexicons.
+
+    Returns fieldnames of the database and list of (name, rows) pairs of
+    lexicons in output order, rows being tuples of fields that are turned
+    back into wordmaps when formatting. Exclusions are applied while
+    reading.
+    """
+    if args.strip == '"' or args.strip == "'":
+        quoting = csv.QUOTE_ALL
+        quotechar = args.strip
+    else:
+        quoting = csv.QUOTE_NONE
+        quotechar = None
+    # share equal field values between rows to keep the database small
+    values = dict()
+    lexicons = []
+    linecount = 0
+    curr_lexicon = ""
+    curr_rows = []
+    with open_lexemes(tsv_filename, delimiter=args.separator,
+                      quoting=quoting, quotechar=quotechar) as tsv_reader:
+        postponed_suffixes = list()
+        postponed_abbrs = {'ABBREVIATION': list(), 'ACRONYM': list()}
+        timings.switch('read')
+        for tsv_parts in tsv_reader:
+            linecount += 1
+            if args.verbose and (linecount % 10000 == 0):
+                print(linecount, "...", sep='', end='\r')
+            if len(tsv_parts) < 18:
+                print("Too few tabs on line", linecount,
+                      "skipping following line completely:", file=stderr)
+                print(tsv_parts, file=stderr)
+                continue
+            # read data from database
+            wordmap = tsv_parts
+            # exclusions
+            if wordmap['new_para'] == 'X_IGNORE':
+                continue
+            if args.exclude_pos:
+                if wordmap['pos'] in args.exclude_pos:
+                    continue
+            if args.include_lemmas:
+                if wordmap['lemma'] not in lemmas:
+                    continue
+            if args.include_origin:
+                origins = wordmap['origin'].split('|')
+                origin_ok = False
+                for origin in origins:
+                    if origin in args.include_origin:
+                        origin_ok = True
+                if not origin_ok:
+                    continue
+            if args.exclude_blacklisted:
+                if wordmap['blacklist'] in args.exclude_blacklisted:
+                    wordmap['new_para'] = 'XXX_BLACKLISTED_SINK'
+            # choose correct lexicon
+            incoming_lexicon = tsv_parts['upos']
+            if tsv_parts['is_suffix']:
+                postponed_suffixes.append(tsv_parts)
+                continue
+            elif tsv_parts['abbr']:
+                postponed_abbrs[tsv_parts['abbr']].append(tsv_parts)
+                continue
+            if curr_lexicon != incoming_lexicon:
+                if curr_rows:
+                    lexicons.append((curr_lexicon, curr_rows))
+                curr_lexicon = incoming_lexicon
+                curr_rows = []
+            # switch back to real POS when possible suffix lexicon has been
+            # selected
+            if wordmap['real_pos']:
+                wordmap['pos'] = wordmap['real_pos']
+            curr_rows.append(tuple(values.setdefault(wordmap[field],
+                                                     wordmap[field])
+                                   for field in tsv_reader.fieldnames))
+        if curr_rows:
+            lexicons.append((curr_lexicon, curr_rows))
+        if len(postponed_suffixes) > 0:
+            lexicons.append(("SUFFIX\n", [tuple(suffix[field] for field in
+                                                tsv_reader.fieldnames)
+                                          for suffix in postponed_suffixes]))
+        for key, words in sorted(postponed_abbrs.items()):
+            if len(words) > 0:
+                lexicons.append((key + " \n",
+                                 [tuple(word[field] for field in
+                                        tsv_reader.fieldnames)
+                                  for word in words]))
+    timings.count(linecount)
+    if args.verbose:
+        print("\n", linecount, " entries in master db")
+    return tsv_reader.fieldnames, lexicons
+
+
+def read_continuations(tsv_filename, args):
+    """Read continuations into list of (name, rows) pairs of lexicons."""
+    lexicons = []
+    linecount = 0
+    curr_lexicon = ""
+    curr_rows = []
+    with open(tsv_filename, 'r', newline='') as tsv_file:
+        tsv_reader = csv.reader(tsv_file, delimiter=args.separator,
+                                strict=True)
+        for tsv_parts in tsv_reader:
+            linecount += 1
+            if len(tsv_parts) < 3:
+                print(tsv_filename, linecount,
+                      "Too few tabs on line",
+                      "skipping following fields:",
+                      tsv_parts, file=stderr)
+                continue
+            pos = tsv_parts[0].split("_")[0]
+            if pos not in ["ADJ", "NOUN", "VERB", "PROPN", "NUM",
+                           "PRON", "ADP", "ADV", "SYM", "PUNCT", "INTJ", "X",
+                           "DIGITS", "CCONJ", "SCONJ", "AUX", "DET"]:
+                print("Cannot deduce pos from incoming cont:",
+                      tsv_parts[0])
+                continue
+            if pos in args.exclude_pos:
+                continue
+            if curr_lexicon != tsv_parts[0]:
+                if curr_rows:
+                    lexicons.append((curr_lexicon, curr_rows))
+                curr_lexicon = tsv_parts[0]
+                curr_rows = []
+            curr_rows.append(tsv_parts)
+        if curr_rows:
+            lexicons.append((curr_lexicon, curr_rows))
+    return lexicons
+
+
+def source_header(formatter, what, tsv_filename, date, params):
+    """Format comment header for lexc generated from tsv_filename."""
+    return "%s\n%s\n" % (' '.join(["! Omorfi", what, "generated from",
+                                   tsv_filename, date,
+                                   strftime("%Y-%m-%d %H:%M:%S+%Z"), params,
+                                   ' '.join(argv)]),
+                         formatter.copyright_lexc())
+
+
+def add_lexicon(lexc, name, fieldnames, rows, formatter):
+    """Add rows formatted into lexc LEXICON name to lexc blocks."""
+    def render():
+        lines = ["\nLEXICON " + name + "\n\n"]
+        for row in rows:
+            wordmap = dict(zip(fieldnames, row))
+            lines.append(formatter.wordmap2lexc(wordmap) + "\n")
+        return ''.join(lines)
+    lexc.add_block([name, fieldnames] + rows, render)
+
+
+def add_continuations(lexc, name, rows, formatter):
+    """Add continuation rows formatted into lexc LEXICON name to lexc blocks."""
+    def render():
+        lines = ["\nLEXICON " + name + "\n\n"]
+        for tsv_parts in rows:
+            for cont in tsv_parts[3:]:
+                lines.append(formatter.continuation2lexc(
+                    tsv_parts[1], tsv_parts[2], cont) + "\n")
+        return ''.join(lines)
+    lexc.add_block(rows, render)
+
+
+# parsed data shared with forked formatting processes
+_args = None
+_formats = None
+_formatters = None
+_sources = None
+_timings = None
+
+
+def generate_lexc(i):
+    """Format the parsed data with i-th formatter into i-th output file.
+
+    Returns the exit status, the output file name, the counts of formatted
+    and reused blocks, and whether the output file was written.
+    """
+    formatter = _formatters[i]
+    format, format_args = _formats[i]
+    output = _args.output[i]
+    manifest = _args.manifest[i] if _args.manifest else None
+    try:
+        lexc = LexcBlocks(output, format_options(format_args, format),
+                          manifest)
+        # print definitions to rootfile
+        lexc.add_text(formatter.copyright_lexc() + "\n")
+        lexc.add_text(formatter.multichars_lexc() + "\n")
+        lexc.add_text(formatter.root_lexicon_lexc() + "\n")
+        master_filename = None
+        for source, tsv_filename, fieldnames, lexicons in _sources:
+            if source == 'master':
+                master_filename = tsv_filename
+                lexc.add_block(["master", tsv_filename, argv], lambda:
+                               source_header(formatter, "stubs",
+                                             tsv_filename, "\n! date:",
+                                             "\n! params: "))
+                for name, rows in lexicons:
+                    add_lexicon(lexc, name, fieldnames, rows, formatter)
+            else:
+                # the header has always named the last master file
+                lexc.add_block(["continuations", master_filename, argv],
+                               lambda: source_header(formatter,
+                                                     "continuations",
+                                                     master_filename,
+                                                     "! date:", "! params: "))
+                for name, rows in lexicons:
+                    add_continuations(lexc, name, rows, formatter)
+        with _timings.phase('write'):
+            written = lexc.write()
+    except SystemExit as e:
+        return e.code, output, 0, 0, False
+    return 0, output, lexc.formatted, lexc.reused, written
+
+
+def _init_worker():
+    _timings.start_worker()
+
+
+def generate_lexc_in_worker(i):
+    """Format i-th output in a worker process like @c generate_lexc.
+
+    The phase times of the worker are returned along the results.
+    """
+    return generate_lexc(i), _timings.take_phases()
+
+
 # standard UI stuff
 
 
 def main():
-    # defaults
-    curr_lexicon = dict()
+    global _args, _formats, _formatters, _sources, _timings
     # initialise argument parser
     ap = argparse.ArgumentParser(
         description="Convert Finnish dictionary TSV data into xerox/HFST lexc format")
@@ -56,7 +438,8 @@ def main():
                     help="print each step to stdout while processing")
     ap.add_argument("--master", "-m", action="append", required=True,
                     dest="masterfilenames",
-                    metavar="MFILE", help="read lexical roots from MFILEs")
+                    metavar="MFILE",
+                    help="read lexical roots from MFILEs, TSV or lexdb")
     ap.add_argument("--continuations", "-c", action="append", required=True,
                     dest='contfilenames',
                     metavar="CONTFILE", help="read continuations from CONTFILEs")
@@ -75,9 +458,18 @@ def main():
                     choices=["kotus", "omorfi", "unihu", "finnwordnet",
                              "fiwiktionary", "omorfi++"])
     ap.add_argument("--version", "-V", action="version")
-    ap.add_argument("--output", "-o", "--one-file", "-1",
-                    type=argparse.FileType("w"), required=True,
-                    metavar="OFILE", help="write output to OFILE")
+    ap.add_argument("--output", "-o", "--one-file", "-1", action="append",
+                    required=True,
+                    metavar="OFILE", help="write output to OFILE, "
+                    "one for each --format")
+    ap.add_argument("--manifest", "-M", action="append",
+                    metavar="MANIFEST",
+                    help="generate incrementally, only formatting lexicons "
+                    "changed since the run that wrote MANIFEST, one for each "
+                    "--output")
+    ap.add_argument("--jobs", "-j", action="store", type=int,
+                    metavar="N", help="format outputs in N processes "
+                    "(default: one for each --output)")
     ap.add_argument("--fields", "-F", action="store", default=2,
                     metavar="N", help="read N fields from master")
     ap.add_argument("--separator", action="store", default="\t",
@@ -87,190 +479,114 @@ def main():
                     "do not have SEPs")
     ap.add_argument("--strip", action="store",
                     metavar="STRIP", help="strip STRIP from fields before using")
-    ap.add_argument("--format", "-f", action="store", default="omor",
-                    help="use specific output format for lexc data",
-                    choices=["omor", "giella", "ftb3", "ftb1", "none", "apertium",
-                             "labelsegments"])
+    ap.add_argument("--format", "-f", action="append",
+                    metavar="FORMAT[:OPTION,...]",
+                    help="use specific output format for lexc data, "
+                    "one for each --output (default: omor), OPTIONs set "
+                    "--FORMAT-OPTION flags for this output only, e.g. "
+                    "none:lemmas; FORMAT is one of " + ", ".join(FORMATS))
     ap.add_argument("--omor-new-para", action="store_true", default=False,
-                    help="include NEW_PARA= in raw analyses")
+                    help="include NEW_PARA= in raw analyses of all omor "
+                    "outputs")
     ap.add_argument("--omor-allo", action="store_true", default=False,
-                    help="include ALLO= in raw analyses")
+                    help="include ALLO= in raw analyses of all omor outputs")
     ap.add_argument("--omor-props", action="store_true", default=False,
-                    help="include PROPER= in raw analyses")
+                    help="include PROPER= in raw analyses of all omor "
+                    "outputs")
     ap.add_argument("--omor-sem", action="store_true", default=False,
-                    help="include SEM= in raw analyses")
+                    help="include SEM= in raw analyses of all omor outputs")
     ap.add_argument("--none-lemmas", action="store_true", default=False,
-                    help="include lemmas in raw analyses")
+                    help="include lemmas in raw analyses of all none outputs")
     ap.add_argument("--none-segments", action="store_true", default=False,
-                    help="include segments in raw analyses")
+                    help="include segments in raw analyses of all none "
+                    "outputs")
+    add_timing_arguments(ap)
     args = ap.parse_args()
+    timings = timings_from_args('generate-lexcs', args)
 
-    formatter = None
-    if args.format == 'omor':
-        formatter = OmorFormatter(args.verbose, newparas=args.omor_new_para,
-                                  allo=args.omor_allo, props=args.omor_props, sem=args.omor_sem)
-    elif args.format == 'ftb3':
-        formatter = Ftb3Formatter(args.verbose)
-    elif args.format == 'apertium':
-        formatter = ApertiumFormatter(args.verbose)
-    elif args.format == 'giella':
-        formatter = GiellaFormatter(args.verbose)
-    elif args.format == 'none':
-        formatter = NoTagsFormatter(args.verbose,
-                                    lemmatise=args.none_lemmas, segment=args.none_segments)
-    elif args.format == 'labelsegments':
-        formatter = LabeledSegmentsFormatter(args.verbose)
-    else:
-        print("DIDNT CONVERT FORMATTER YET", args.format)
-        exit(1)
     # check args
-    if args.strip == '"' or args.strip == "'":
-        quoting = csv.QUOTE_ALL
-        quotechar = args.strip
-    else:
-        quoting = csv.QUOTE_NONE
-        quotechar = None
-    lemmas = []
+    if not args.format:
+        args.format = ['omor']
+    if len(args.format) != len(args.output):
+        print("Need one --format for each --output, got", len(args.format),
+              "formats for", len(args.output), "outputs", file=stderr)
+        exit(1)
+    if args.manifest and len(args.manifest) != len(args.output):
+        print("Need one --manifest for each --output, got",
+              len(args.manifest), "manifests for", len(args.output),
+              "outputs", file=stderr)
+        exit(1)
+    formats = []
+    formatters = []
+    for spec in args.format:
+        format, format_args = parse_format(spec, args)
+        formatter = make_formatter(format, format_args)
+        if not formatter:
+            print("DIDNT CONVERT FORMATTER YET", format)
+            exit(1)
+        formats.append((format, format_args))
+        formatters.append(formatter)
+    lemmas = set()
     if args.include_lemmas:
         for lemma_file in args.include_lemmas:
             if args.verbose:
                 print("including only lemmas from", lemma_file.name)
             for line in lemma_file:
-                lemmas.append(line.rstrip('\n'))
+                lemmas.add(line.rstrip('\n'))
             lemma_file.close()
     if not args.exclude_pos:
         args.exclude_pos = []
     # setup files
     if args.verbose:
-        print("Writing everything to", args.output.name)
+        for format, output in zip(args.format, args.output):
+            print("Writing", format, "to", output)
         if args.exclude_pos:
             print("Not writing closed parts-of-speech data in",
                   ",".join(args.exclude_pos))
-    # print definitions to rootfile
-    print(formatter.copyright_lexc(), file=args.output)
-    if args.verbose:
-        print("Creating Multichar_Symbols and Root")
-    print(formatter.multichars_lexc(), file=args.output)
-    print(formatter.root_lexicon_lexc(), file=args.output)
     # read from csv files
+    sources = []
     for tsv_filename in args.masterfilenames:
         if args.verbose:
             print("Reading from", tsv_filename)
-        linecount = 0
-        print("! Omorfi stubs generated from", tsv_filename,
-              "\n! date:", strftime("%Y-%m-%d %H:%M:%S+%Z"),
-              "\n! params: ", ' '.join(argv), file=args.output)
-        print(formatter.copyright_lexc(), file=args.output)
-        curr_lexicon = ""
-        # for each line
-        with open(tsv_filename, "r", newline='') as tsv_file:
-            tsv_reader = csv.DictReader(tsv_file, delimiter=args.separator,
-                                        quoting=quoting, escapechar='%', quotechar=quotechar, strict=True)
-            postponed_suffixes = list()
-            postponed_abbrs = {'ABBREVIATION': list(), 'ACRONYM': list()}
-            for tsv_parts in tsv_reader:
-                linecount += 1
-                if args.verbose and (linecount % 10000 == 0):
-                    print(linecount, "...", sep='', end='\r')
-                if len(tsv_parts) < 18:
-                    print("Too few tabs on line", linecount,
-                          "skipping following line completely:", file=stderr)
-                    print(tsv_parts, file=stderr)
-                    continue
-                # read data from database
-                wordmap = tsv_parts
-                # exclusions
-                if wordmap['new_para'] == 'X_IGNORE':
-                    continue
-                if args.exclude_pos:
-                    if wordmap['pos'] in args.exclude_pos:
-                        continue
-                if args.include_lemmas:
-                    if wordmap['lemma'] not in lemmas:
-                        continue
-                if args.include_origin:
-                    origins = wordmap['origin'].split('|')
-                    origin_ok = False
-                    for origin in origins:
-                        if origin in args.include_origin:
-                            origin_ok = True
-                    if not origin_ok:
-                        continue
-                if args.exclude_blacklisted:
-                    if wordmap['blacklist'] in args.exclude_blacklisted:
-                        wordmap['new_para'] = 'XXX_BLACKLISTED_SINK'
-                # choose correct lexicon
-                incoming_lexicon = tsv_parts['upos']
-                if tsv_parts['is_suffix']:
-                    postponed_suffixes.append(tsv_parts)
-                    continue
-                elif tsv_parts['abbr']:
-                    postponed_abbrs[tsv_parts['abbr']].append(tsv_parts)
-                    continue
-                if curr_lexicon != incoming_lexicon:
-                    print("\nLEXICON", incoming_lexicon, end="\n\n",
-                          file=args.output)
-                    curr_lexicon = incoming_lexicon
-                # switch back to real POS when possible suffix lexicon has been
-                # selected
-                if wordmap['real_pos']:
-                    wordmap['pos'] = wordmap['real_pos']
-                # format output
-                print(formatter.wordmap2lexc(wordmap),
-                      file=args.output)
-            if len(postponed_suffixes) > 0:
-                print("\nLEXICON SUFFIX\n\n", file=args.output)
-                for suffix in postponed_suffixes:
-                    print(formatter.wordmap2lexc(suffix),
-                          file=args.output)
-            for key, words in sorted(postponed_abbrs.items()):
-                if len(words) > 0:
-                    print("\nLEXICON", key, "\n\n", file=args.output)
-                    for word in words:
-                        print(formatter.wordmap2lexc(word),
-                              file=args.output)
-        if args.verbose:
-            print("\n", linecount, " entries in master db")
-    # print continuation parts
+        fieldnames, lexicons = read_master(tsv_filename, args, lemmas,
+                                           timings)
+        sources.append(('master', tsv_filename, fieldnames, lexicons))
     for tsv_filename in args.contfilenames:
         if args.verbose:
             print("Reading from", tsv_filename)
-        linecount = 0
-        print("! Omorfi continuations generated from", tsv_file.name,
-              "! date:", strftime("%Y-%m-%d %H:%M:%S+%Z"),
-              "! params: ", ' '.join(argv), file=args.output)
-        print(formatter.copyright_lexc(), file=args.output)
-        curr_lexicon = ""
-        with open(tsv_filename, 'r', newline='') as tsv_file:
-            tsv_reader = csv.reader(tsv_file, delimiter=args.separator,
-                                    strict=True)
-            for tsv_parts in tsv_reader:
-                linecount += 1
-                if len(tsv_parts) < 3:
-                    print(tsv_filename, linecount,
-                          "Too few tabs on line",
-                          "skipping following fields:",
-                          tsv_parts, file=stderr)
-                    continue
-                pos = tsv_parts[0].split("_")[0]
-                if pos not in ["ADJ", "NOUN", "VERB", "PROPN", "NUM",
-                               "PRON", "ADP", "ADV", "SYM", "PUNCT", "INTJ", "X",
-                               "DIGITS", "CCONJ", "SCONJ", "AUX", "DET"]:
-                    print("Cannot deduce pos from incoming cont:",
-                          tsv_parts[0])
-                    continue
-                if pos in args.exclude_pos:
-                    continue
-                # format output
-                if curr_lexicon != tsv_parts[0]:
-                    print("\nLEXICON", tsv_parts[0], end="\n\n",
-                          file=args.output)
-                    curr_lexicon = tsv_parts[0]
-                for cont in tsv_parts[3:]:
-                    print(formatter.continuation2lexc(
-                        tsv_parts[1], tsv_parts[2], cont),
-                        file=args.output)
-    exit(0)
+        timings.switch('read')
+        sources.append(('continuations', tsv_filename, None,
+                        read_continuations(tsv_filename, args)))
+    # format all outputs from same data
+    _args = args
+    _formats = formats
+    _formatters = formatters
+    _sources = sources
+    _timings = timings
+    timings.switch('format')
+    jobs = args.jobs or min(len(args.output), cpu_count())
+    if jobs > 1 and len(args.output) > 1:
+        with get_context('fork').Pool(jobs, _init_worker) as pool:
+            # the workers charge their own format and write phases
+            timings.switch('wait')
+            results = []
+            for result, phases in pool.map(generate_lexc_in_worker,
+                                           range(len(args.output)), 1):
+                results.append(result)
+                timings.merge_phases(phases)
+    else:
+        results = [generate_lexc(i) for i in range(len(args.output))]
+    status = 0
+    for code, output, formatted, reused, written in results:
+        if code:
+            status = code
+        elif not written:
+            if args.verbose:
+                print("Nothing changed,", output, "not rewritten")
+        elif args.verbose:
+            print("Formatted", formatted, "and reused", reused,
+                  "lexc blocks of", output)
+    exit(status)
 
 
 if __name__ == "__main__":
@@ -26,6 +26,8 @@ import csv
 import re
 from sys import exit, stderr
 
+from omorfi.build_timings import add_timing_arguments, timings_from_args
+from omorfi.lexdb import open_lexemes
 from omorfi.monodix_formatter import (format_monodix_alphabet, format_monodix_entry, format_monodix_licence,
                                       format_monodix_pardef, format_monodix_sdefs)
 
@@ -43,7 +45,8 @@ def main():
     ap.add_argument("--verbose", "-v", action="store_true", default=False,
                     help="print each step to stdout while processing")
     ap.add_argument("--master", "-m", action="append", required=True,
-                    metavar="MFILE", help="read lexical roots from MFILEs")
+                    metavar="MFILE",
+                    help="read lexical roots from MFILEs, TSV or lexdb")
     ap.add_argument("--continuations", "-c", action="append", required=True,
                     metavar="CONTFILE", help="read pardefs from CONTFILEs")
     ap.add_argument("--version", "-V", action="version")
@@ -59,8 +62,10 @@ def main():
                     "do not have SEPs")
     ap.add_argument("--strip", action="store",
                     metavar="STRIP", help="strip STRIP from fields before using")
+    add_timing_arguments(ap)
 
     args = ap.parse_args()
+    timings = timings_from_args('generate-monodix', args)
 
     quoting = csv.QUOTE_NONE
     quotechar = None
@@ -71,6 +76,7 @@ def main():
     print(format_monodix_alphabet(), file=args.output)
     print(format_monodix_sdefs(), file=args.output)
     # read from csv files
+    timings.switch('format')
     print('  <pardefs>', file=args.output)
     printed_pardefs = set()
     broken_pardefs = set()
@@ -154,22 +160,26 @@ def main():
         if args.verbose:
             print("Reading from", tsv_filename)
         linecount = 0
-        with open(tsv_filename, 'r', newline='') as tsv_file:
-            tsv_reader = csv.DictReader(tsv_file, delimiter=args.separator,
-                                        quoting=quoting, quotechar=quotechar, escapechar='%', strict=True)
+        timings.switch('read')
+        with open_lexemes(tsv_filename, delimiter=args.separator,
+                          quoting=quoting, quotechar=quotechar) as tsv_reader:
             for tsv_parts in tsv_reader:
+                timings.switch('format')
                 linecount += 1
                 if args.verbose and (linecount % 10000 == 0):
                     print(linecount, "...", sep='', end='\r')
                 if len(tsv_parts) < 18:
                     print("Too few tabs on line", linecount,
                           "skipping following line completely:", file=stderr)
-                    print(tsv_line, file=stderr)
-                    tsv_line = tsv_file.readline()
+                    print(tsv_parts, file=stderr)
                     continue
                 wordmap = tsv_parts
                 # format output
-                print(format_monodix_entry(wordmap), file=args.output)
+                entry = format_monodix_entry(wordmap)
+                timings.switch('write')
+                print(entry, file=args.output)
+                timings.switch('read')
+        timings.count(linecount)
     print('  </section>', file=args.output)
     print('</dictionary>', file=args.output)
     exit()
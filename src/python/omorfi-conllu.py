@@ -1,337 +1,261 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
-# string munging
-import re
-from argparse import ArgumentParser, FileType
+from argparse import ArgumentParser, FileType, Namespace
+from collections import deque
+from io import StringIO
+from os import times
 # CLI stuff
 from sys import stderr, stdin, stdout
 # statistics
 from time import perf_counter, process_time
 
 # omorfi
-from omorfi.omorfi import Omorfi
-
-
-def get_lemmas(anal):
-    re_lemma = re.compile("\[WORD_ID=([^]]*)\]")
-    lemmas = re_lemma.finditer(anal[0])
-    rv = []
-    for lemma in lemmas:
-        s = lemma.group(1)
-        for i in range(32):
-            hnsuf = '_' + str(i)
-            if s.endswith(hnsuf):
-                s = s[:-len(hnsuf)]
-        rv += [s]
-
-    return rv
-
-
-def get_last_feat(feat, anal):
-    re_feat = re.compile("\[" + feat + "=([^]]*)\]")
-    feats = re_feat.finditer(anal[0])
-    rv = ""
-    for feat in feats:
-        rv = feat.group(1)
-    return rv
-
-
-def get_last_feats(anal):
-    re_feats = re.compile("\[[A-Z_]*=[^]]*\]")
-    rvs = list()
-    feats = re_feats.finditer(anal[0])
-    for feat in feats:
-        if 'BOUNDARY=' in feat.group(0) or 'WORD_ID=' in feat.group(0):
-            rvs = list()
-        else:
-            rvs.append(feat.group(0))
-    return rvs
-
-
-def format_feats_ud(anal, hacks=None):
-    feats = get_last_feats(anal)
-    rvs = dict()
-    for f in feats:
-        key = f.split("=")[0].lstrip("[")
-        value = f.split("=")[1].rstrip("]")
-        if key == 'CASE':
-            if value == 'LAT' and hacks != 'ftb':
-                # XXX: hack to retain compability
-                rvs['Number'] = 'Sing'
-            else:
-                rvs['Case'] = value[0] + value[1:].lower()
-        elif key == 'NUM':
-            if value == 'SG':
-                rvs['Number'] = 'Sing'
-            elif value == 'PL':
-                rvs['Number'] = 'Plur'
-        elif key == 'TENSE':
-            if 'PRESENT' in value:
-                rvs['Tense'] = 'Pres'
-            elif 'PAST' in value:
-                rvs['Tense'] = 'Past'
-        elif key == 'MOOD':
-            rvs['VerbForm'] = 'Fin'
-            if value == 'INDV':
-                rvs['Mood'] = 'Ind'
-            elif value == 'COND':
-                rvs['Mood'] = 'Cnd'
-            elif value == 'IMPV':
-                rvs['Mood'] = 'Imp'
-            else:
-                rvs['Mood'] = value[0] + value[1:].lower()
-        elif key == 'VOICE':
-            if value == 'PSS':
-                rvs['Voice'] = 'Pass'
-            elif value == 'ACT':
-                rvs['Voice'] = 'Act'
-        elif key == 'PERS':
-            if 'SG' in value:
-                rvs['Number'] = 'Sing'
-            elif 'PL' in value:
-                rvs['Number'] = 'Plur'
-            if '1' in value:
-                rvs['Person'] = '1'
-            elif '2' in value:
-                rvs['Person'] = '2'
-            elif '3' in value:
-                rvs['Person'] = '3'
-        elif key == 'POSS':
-            if 'SG' in value:
-                rvs['Number[psor]'] = 'Sing'
-            elif 'PL' in value:
-                rvs['Number[psor]'] = 'Plur'
-            if '1' in value:
-                rvs['Person[psor]'] = '1'
-            elif '2' in value:
-                rvs['Person[psor]'] = '2'
-            elif '3' in value:
-                rvs['Person[psor]'] = '3'
-        elif key == 'NEG':
-            if value == 'CON':
-                rvs['Connegative'] = 'Yes'
-                # XXX
-                rvs.pop('Voice')
-            elif value == 'NEG':
-                rvs['Polarity'] = 'Neg'
-                rvs['VerbForm'] = 'Fin'
-        elif key == 'PCP':
-            rvs['VerbForm'] = 'Part'
-            if value == 'VA':
-                rvs['PartForm'] = 'Pres'
-            elif value == 'NUT':
-                rvs['PartForm'] = 'Past'
-            elif value == 'MA':
-                rvs['PartForm'] = 'Agent'
-            elif value == 'MATON':
-                rvs['PartForm'] = 'Neg'
-        elif key == 'INF':
-            rvs['VerbForm'] = 'Inf'
-            if value == 'A':
-                rvs['InfForm'] = '1'
-            elif value == 'E':
-                rvs['InfForm'] = '2'
-                # XXX
-                rvs['Number'] = 'Sing'
-            elif value == 'MA':
-                rvs['InfForm'] = '3'
-                # XXX
-                rvs['Number'] = 'Sing'
-            elif value == 'MINEN':
-                rvs['InfForm'] = '4'
-            elif value == 'MAISILLA':
-                rvs['InfForm'] = '5'
-        elif key == 'CMP':
-            if value == 'SUP':
-                rvs['Degree'] = 'Sup'
-            elif value == 'CMP':
-                rvs['Degree'] = 'Cmp'
-            elif value == 'POS':
-                rvs['Degree'] = 'Pos'
-        elif key == 'SUBCAT':
-            if value == 'NEG':
-                rvs['Polarity'] = 'Neg'
-                rvs['VerbForm'] = 'Fin'
-            elif value == 'QUANTIFIER':
-                rvs['PronType'] = 'Ind'
-            elif value == 'REFLEXIVE':
-                rvs['Reflexive'] = 'Yes'
-            elif value in ['COMMA', 'DASH', 'QUOTATION', 'BRACKET']:
-                # not annotated in UD feats:
-                # * punctuation classes
-                continue
-            elif value in ['DECIMAL', 'ROMAN']:
-                # not annotated in UD feats:
-                # * decimal, roman NumType
-                continue
-            else:
-                print("Unhandled subcat: ", value)
-                print("in", anal[0][0])
-                exit(1)
-        elif key == 'ABBR':
-            # XXX?
-            rvs['Abbr'] = 'Yes'
-        elif key == 'NUMTYPE':
-            rvs['NumType'] = value[0] + value[1:].lower()
-        elif key == 'PRONTYPE':
-            rvs['PronType'] = value[0] + value[1:].lower()
-        elif key == 'ADPTYPE':
-            rvs['AdpType'] = value[0] + value[1:].lower()
-        elif key == 'CLIT':
-            rvs['Clitic'] = value[0] + value[1:].lower()
-        elif key == 'FOREIGN':
-            rvs['Foreign'] = value[0] + value[1:].lower()
-        elif key == 'STYLE':
-            if value in ['DIALECTAL', 'COLLOQUIAL']:
-                rvs['Style'] = 'Coll'
-            elif value == 'NONSTANDARD':
-                # XXX: Non-standard spelling is kind of a typo?
-                # e.g. seitsämän -> seitsemän
-                rvs['Typo'] = 'Yes'
-            elif value == 'ARCHAIC':
-                rvs['Style'] = 'Arch'
-            elif value == 'RARE':
-                continue
-            else:
-                print("Unknown style", value)
-                print("in", anal[0])
-                exit(1)
-        elif key in ['DRV', 'LEX']:
-            if value in ['INEN', 'JA', 'LAINEN', 'LLINEN', 'MINEN', 'STI',
-                         'TAR', 'TON', 'TTAA', 'TTAIN', 'U', 'VS']:
-                # values found in UD finnish Derivs
-                rvs['Derivation'] = value[0] + value[1:].lower()
-            elif value in ['S', 'MAISILLA', 'VA', 'MATON', 'UUS',
-                           'ADE', 'INE', 'ELA', 'ILL', 'NEN', 'MPI', 'IN',
-                           'HKO', 'ISA', 'MAINEN', 'NUT', 'TU', 'VA', 'TAVA',
-                           'MA', 'LOC', 'LA']:
-                # valuse not found in UD finnish Derivs
+from omorfi.omorfi import Omorfi, forked_omorfi
+from omorfi.omorfi_server import OmorfiClient
+from omorfi.sentence_writer import (SentenceWriter, add_output_arguments,
+                                    writer_from_args)
+from omorfi.ud_converter import get_ud_converter
+
+
+def try_analyses_conllu(original, wordn, surf, anals, outfile, hacks=None):
+    # analyses are matched with the default UD version features
+    anal = get_ud_converter().match_analysis(anals, original[2], original[3],
+                                             original[5])
+    return print_analyses_conllu(wordn, surf, anal, outfile, hacks)
+
+
+def debug_analyses_conllu(original, wordn, surf, anals, outfile, hacks=None):
+    outfile.write("# REFERENCE(python): " + str(original) + "\n")
+    for anal in anals:
+        print_analyses_conllu(wordn, surf, anal, outfile, hacks)
+
+
+def print_analyses_conllu(wordn, surf, anal, outfile, hacks=None):
+    line = get_ud_converter(hacks).format_conllu(wordn, surf, anal)
+    outfile.write(line + "\n")
+
+
+RECOGNISED_COMMENTS = ['sent_id =', 'text =', 'doc-name:', 'sentence-text:']
+
+
+def read_conllu_sentences(lines):
+    """Group CoNLL-U lines into sentences ending in their empty line."""
+    sentence = []
+    for line in lines:
+        sentence.append(line)
+        if line.strip() == '':
+            yield sentence
+            sentence = []
+    if sentence:
+        yield sentence
+
+
+def conllu_surfs(lines):
+    """List surface forms of the numbered tokens of CoNLL-U lines."""
+    surfs = []
+    for line in lines:
+        fields = line.strip().split('\t')
+        if len(fields) == 10:
+            try:
+                int(fields[0])
+            except ValueError:
                 continue
-            else:
-                print("Unknown non-inflectional affix", key, '=', value)
-                print("in", anal[0])
-                exit(1)
-        elif key in ['UPOS', 'ALLO', 'WEIGHT', 'CASECHANGE', 'NEWPARA',
-                     'GUESS', 'PROPER', 'POSITION', 'SEM', 'CONJ']:
-            # Not feats in UD:
-            # * UPOS is another field
-            # * Allomorphy is ignored
-            # * Weight = no probabilities
-            # * No feats for recasing
-            # * FIXME: lexicalised inflection usually not a feat
-            # * Guessering not a feat
-            # * Proper noun classification not a feat
-            # * punct sidedness is not a feat
-            # * XXX: sem has not been used as a feat?
-            # * special CONJ comparative is not used in UD
-            continue
+            surfs.append(fields[1])
+    return surfs
+
+
+def analyse_conllu_lines(omorfi, lines, outfile, options):
+    """Analyse CoNLL-U lines and write them to SentenceWriter outfile.
+
+    The tokens of each sentence are analysed in one batch with
+    @c analyse_many. Returns a tuple of token, unknown and sentence counts.
+    """
+    tokens = 0
+    unknowns = 0
+    sentences = 0
+    for sentence in read_conllu_sentences(lines):
+        counts = analyse_conllu_sentence(omorfi, sentence, outfile, options)
+        tokens += counts[0]
+        unknowns += counts[1]
+        sentences += counts[2]
+    return tokens, unknowns, sentences
+
+
+def analyse_conllu_sentence(omorfi, lines, outfile, options):
+    """Analyse CoNLL-U lines of one sentence and write them to outfile.
+
+    Returns a tuple of token, unknown and sentence counts.
+    """
+    tokens = 0
+    unknowns = 0
+    sentences = 0
+    analyses = iter(omorfi.analyse_many(conllu_surfs(lines)))
+    for line in lines:
+        fields = line.strip().split('\t')
+        if len(fields) == 10:
+            # conllu is 10 field format
+            tokens += 1
+            try:
+                index = int(fields[0])
+            except ValueError:
+                if '-' in fields[0]:
+                    # MWE
+                    continue
+                elif '.' in fields[0]:
+                    # a ghost
+                    continue
+                else:
+                    print(
+                        "Cannot figure out token index", fields[0], file=stderr)
+                    exit(1)
+            surf = fields[1]
+            anals = next(analyses)
+            if not anals or len(anals) == 0 or (len(anals) == 1 and
+                                                'UNKNOWN' in anals[0][0]):
+                unknowns += 1
+                anals = omorfi.guess(surf)
+            if anals and len(anals) > 0:
+                try:
+                    if options.debug:
+                        debug_analyses_conllu(
+                            fields, index, surf, anals, outfile, options.hacks)
+                    elif options.oracle:
+                        try_analyses_conllu(fields, index, surf, anals,
+                                            outfile, options.hacks)
+                    else:
+                        print_analyses_conllu(index, surf, anals[0],
+                                              outfile, options.hacks)
+                except ValueError as ve:
+                    print("Cannot convert analyses of", surf, "to UD:", ve,
+                          file=stderr)
+                    exit(1)
+        elif line.startswith('#'):
+            outfile.write(line.strip() + "\n")
+            recognised = False
+            for rec in RECOGNISED_COMMENTS:
+                if line.startswith('# ' + rec):
+                    recognised = True
+            if not recognised and options.verbose:
+                print("Warning! Unrecognised comment line:", line, sep='\n',
+                      file=stderr)
+        elif not line or line.strip() == '':
+            # retain exactly 1 empty line between sents
+            outfile.write("\n")
+            outfile.end_sentence()
+            sentences += 1
         else:
-            print("Unhandled", key, '=', value)
-            print("in", anal[0])
+            print("Error in conllu format:", line, sep='\n', file=stderr)
             exit(1)
-    rv = ''
-    for k in sorted(rvs, key=str.lower):
-        rv += k + '=' + rvs[k] + '|'
-    if len(rvs) != 0:
-        return rv.rstrip('|')
-    else:
-        return '_'
-
-
-def format_third_ftb(anal):
-    upos = get_last_feat("UPOS", anal)
-    return upos
-
-
-def format_third_tdt(upos):
-    if upos in ['NOUN', 'PROPN']:
-        return 'N'
-    elif upos == 'ADJ':
-        return 'A'
-    elif upos in ['VERB', 'AUX']:
-        return 'V'
-    elif upos in ['CCONJ', 'SCONJ']:
-        return 'C'
-    elif upos == 'ADP':
-        return 'Adp'
-    elif upos == 'ADV':
-        return 'Adv'
-    elif upos == 'PRON':
-        return 'Pron'
-    elif upos == 'PUNCT':
-        return 'Punct'
-    elif upos == 'SYM':
-        return 'Symb'
-    elif upos == 'INTJ':
-        return 'Interj'
-    elif upos == 'NUM':
-        return 'Num'
+    return tokens, unknowns, sentences
+
+
+def read_conllu_chunks(infile, chunksize):
+    """Read CoNLL-U lines in chunks of chunksize sentences."""
+    chunk = []
+    sentences = 0
+    for line in infile:
+        chunk.append(line)
+        if line.strip() == '':
+            sentences += 1
+            if sentences >= chunksize:
+                yield chunk
+                chunk = []
+                sentences = 0
+    if chunk:
+        yield chunk
+
+
+def load_omorfi(fsa, udpipe, verbose):
+    """Load omorfi models for CoNLL-U analysis."""
+    omorfi = Omorfi(verbose)
+    if fsa:
+        if verbose:
+            print("reading language models in", fsa, file=stderr)
+        omorfi.load_from_dir(fsa, analyse=True, guesser=True)
     else:
-        return 'X'
+        if verbose:
+            print("reading language models in default dirs", file=stderr)
+        omorfi.load_from_dir()
+    if udpipe:
+        if verbose:
+            print("Loading udpipe", udpipe, file=stderr)
+        omorfi.load_udpipe(udpipe)
+    return omorfi
 
 
-def get_upos(anal):
-    upos = get_last_feat("UPOS", anal)
-    drv = get_last_feat("DRV", anal)
-    if upos == 'VERB' and drv == 'MINEN':
-        upos = 'NOUN'
-    return upos
+def prepare_cache(omorfi, options):
+    """Load analysis cache snapshot or warm the cache up if requested."""
+    if options.cache_snapshot:
+        loaded = omorfi.load_cache(options.cache_snapshot)
+        if options.verbose:
+            print("loaded", loaded, "cached tokens from",
+                  options.cache_snapshot, file=stderr)
+        if loaded:
+            return
+    if options.warm_cache:
+        warmed = omorfi.warm_cache(options.warm_cache)
+        if options.verbose:
+            print("warmed cache up with", warmed, "word-forms from",
+                  options.warm_cache, file=stderr)
 
 
-def try_analyses_conllu(original, wordn, surf, anals, outfile, hacks=None):
-    for anal in anals:
-        upos = get_upos(anal)
-        if upos == original[3]:
-            feats = format_feats_ud(anal)
-            if feats == original[5]:
-                lemmas = "#".join(get_lemmas(anal))
-                if lemmas == original[2]:
-                    return print_analyses_conllu(wordn, surf, anal, outfile, hacks)
-    # no exact match found (re-try without lemma)
-    for anal in anals:
-        upos = get_upos(anal)
-        if upos == original[3]:
-            feats = format_feats_ud(anal)
-            if feats == original[5]:
-                return print_analyses_conllu(wordn, surf, anal, outfile, hacks)
-    # and re-try without feats
-    for anal in anals:
-        upos = get_upos(anal)
-        if upos == original[3]:
-            return print_analyses_conllu(wordn, surf, anal, outfile, hacks)
-    return print_analyses_conllu(wordn, surf, anals[0], outfile, hacks)
+_worker_options = None
 
 
-def debug_analyses_conllu(original, wordn, surf, anals, outfile, hacks=None):
-    print("# REFERENCE(python):", original, file=outfile)
-    for anal in anals:
-        print_analyses_conllu(wordn, surf, anal, outfile, hacks)
+def _init_worker(options):
+    global _worker_options
+    _worker_options = options
 
 
-def format_misc(anal):
-    guess = get_last_feat("GUESS", anal)
-    miscs = []
-    if guess and not guess == "":
-        miscs += ["GUESS=" + guess]
-    if len(miscs) > 0:
-        return '|'.join(miscs)
-    else:
-        return '_'
+def _analyse_conllu_chunk(lines):
+    outfile = StringIO()
+    writer = SentenceWriter(outfile, 0)
+    try:
+        counts = analyse_conllu_lines(forked_omorfi(), lines, writer,
+                                      _worker_options)
+    except SystemExit as se:
+        return None, se.code
+    writer.close()
+    return outfile.getvalue(), counts
 
-def print_analyses_conllu(wordn, surf, anal, outfile, hacks=None):
-    upos = get_last_feat("UPOS", anal)
-    if not upos or upos == "":
-        upos = 'X'
-    if hacks == 'ftb':
-        third = format_third_ftb(anal)
-    else:
-        third = format_third_tdt(upos)
-    print(wordn, surf, "#".join(get_lemmas(anal)),
-          upos,
-          third,
-          format_feats_ud(anal, hacks),
-          "_", "_", "_", format_misc(anal), sep="\t", file=outfile)
+
+def analyse_conllu_parallel(omorfi, writer, options):
+    """Analyse CoNLL-U input in options.jobs worker processes.
+
+    The workers are forked from omorfi with its automata already loaded.
+    The input is split at sentence boundaries and output is written in the
+    original order. At most 2 * options.jobs chunks are read ahead of the
+    output, so memory use does not grow with the input. Returns a tuple of
+    token, unknown and sentence counts.
+    """
+    tokens = 0
+    unknowns = 0
+    sentences = 0
+    workeroptions = Namespace(debug=options.debug, oracle=options.oracle,
+                              hacks=options.hacks, verbose=options.verbose)
+    with omorfi.fork_pool(options.jobs, _init_worker,
+                          (workeroptions,)) as pool:
+        pending = deque()
+        chunks = read_conllu_chunks(options.infile, options.chunksize)
+        chunk = next(chunks, None)
+        while chunk is not None or pending:
+            while chunk is not None and len(pending) < 2 * options.jobs:
+                pending.append(pool.apply_async(_analyse_conllu_chunk,
+                                                (chunk,)))
+                chunk = next(chunks, None)
+            output, counts = pending.popleft().get()
+            if output is None:
+                pool.terminate()
+                exit(counts)
+            writer.write(output)
+            writer.end_sentence()
+            tokens += counts[0]
+            unknowns += counts[1]
+            sentences += counts[2]
+        pool.close()
+        pool.join()
+    return tokens, unknowns, sentences
 
 
 def main():
@@ -356,90 +280,67 @@ def main():
                    choices=['ftb'])
     a.add_argument('--debug', action='store_true',
                    help="print lots of debug info while processing")
+    a.add_argument('-j', '--jobs', metavar='N', type=int, default=1,
+                   help="analyse in N parallel worker processes")
+    a.add_argument('--chunksize', metavar='SENTS', type=int, default=1000,
+                   help="send SENTS sentences at a time to each worker")
+    a.add_argument('--server', metavar='ADDR',
+                   help="use omorfi server at ADDR instead of loading automata")
+    a.add_argument('--warm-cache', metavar='FREQFILE',
+                   help="fill analysis cache with most frequent word-forms "
+                   "of FREQFILE")
+    a.add_argument('--cache-snapshot', metavar='SNAPFILE',
+                   help="load analysis cache from SNAPFILE if it was made "
+                   "with same analyser and save the cache there at end "
+                   "(not with --jobs)")
+    add_output_arguments(a)
     options = a.parse_args()
     if options.verbose:
-        print("Printing verbosely")
-    omorfi = Omorfi(options.verbose)
-    if options.fsa:
-        if options.verbose:
-            print("reading language models in", options.fsa)
-        omorfi.load_from_dir(options.fsa, analyse=True, guesser=True)
+        print("Printing verbosely", file=stderr)
+    if options.server:
+        if options.jobs > 1:
+            print("Cannot use --jobs with --server", file=stderr)
+            exit(1)
+        if options.warm_cache or options.cache_snapshot:
+            print("Cannot use analysis cache options with --server",
+                  file=stderr)
+            exit(1)
+        omorfi = OmorfiClient(options.server)
     else:
-        if options.verbose:
-            print("reading language models in default dirs")
-        omorfi.load_from_dir()
-    if options.udpipe:
-        if options.verbose:
-            print("Loading udpipe", options.udpipe)
-        omorfi.load_udpipe(options.udpipe)
+        if options.jobs > 1 and options.cache_snapshot:
+            # the workers fill their own caches so the parent would only
+            # save what it loaded
+            print("Cannot use --cache-snapshot with --jobs", file=stderr)
+            exit(1)
+        omorfi = load_omorfi(options.fsa, options.udpipe, options.verbose)
+        prepare_cache(omorfi, options)
     if not options.infile:
-        print("reading from <stdin>")
+        print("reading from <stdin>", file=stderr)
         options.infile = stdin
     if options.verbose:
-        print("analysing", options.infile.name)
+        print("analysing", options.infile.name, file=stderr)
     if not options.outfile:
         options.outfile = stdout
     if options.verbose:
-        print("writing to", options.outfile.name)
+        print("writing to", options.outfile.name, file=stderr)
     if not options.statfile:
         options.statfile = stdout
     # statistics
     realstart = perf_counter()
     cpustart = process_time()
-    tokens = 0
-    unknowns = 0
-    sentences = 0
-    recognised_comments = ['sent_id =', 'text =', 'doc-name:', 'sentence-text:']
-    for line in options.infile:
-        fields = line.strip().split('\t')
-        if len(fields) == 10:
-            # conllu is 10 field format
-            tokens += 1
-            try:
-                index = int(fields[0])
-            except ValueError:
-                if '-' in fields[0]:
-                    # MWE
-                    continue
-                elif '.' in fields[0]:
-                    # a ghost
-                    continue
-                else:
-                    print(
-                        "Cannot figure out token index", fields[0], file=stderr)
-                    exit(1)
-            surf = fields[1]
-            anals = omorfi.analyse(surf)
-            if not anals or len(anals) == 0 or (len(anals) == 1 and
-                                                'UNKNOWN' in anals[0][0]):
-                unknowns += 1
-                anals = omorfi.guess(surf)
-            if anals and len(anals) > 0:
-                if options.debug:
-                    debug_analyses_conllu(
-                        fields, index, surf, anals, options.outfile, options.hacks)
-                elif options.oracle:
-                    try_analyses_conllu(fields, index, surf, anals,
-                                        options.outfile, options.hacks)
-                else:
-                    print_analyses_conllu(index, surf, anals[0],
-                                          options.outfile, options.hacks)
-        elif line.startswith('#'):
-            print(line.strip(), file=options.outfile)
-            recognised = False
-            for rec in recognised_comments:
-                if line.startswith('# ' + rec):
-                    recognised = True
-            if not recognised and options.verbose:
-                print("Warning! Unrecognised comment line:", line, sep='\n')
-        elif not line or line.strip() == '':
-            # retain exactly 1 empty line between sents
-            print(file=options.outfile)
-            sentences += 1
-        else:
-            print("Error in conllu format:", line, sep='\n', file=stderr)
-            exit(1)
+    writer = writer_from_args(options.outfile, options)
+    if options.jobs > 1:
+        tokens, unknowns, sentences = analyse_conllu_parallel(omorfi, writer,
+                                                              options)
+    else:
+        tokens, unknowns, sentences = analyse_conllu_lines(
+            omorfi, options.infile, writer, options)
+    writer.close()
     cpuend = process_time()
+    if options.jobs > 1:
+        # workers have been joined so their CPU time is accounted for
+        children = times()
+        cpuend += children.children_user + children.children_system
     realend = perf_counter()
     print("Tokens:", tokens, "Sentences:", sentences,
           file=options.statfile)
@@ -450,6 +351,8 @@ def main():
           file=options.statfile)
     print("Tokens per timeunit:", tokens / (realend - realstart),
           file=options.statfile)
+    if options.cache_snapshot:
+        omorfi.dump_cache(options.cache_snapshot)
     exit(0)
 
 
@@ -1,10 +1,12 @@
 #!/usr/bin/env python3
 
-import re
 from argparse import ArgumentParser
-from sys import stdin, stdout
+from sys import stderr, stdin, stdout
 
+from omorfi.analysis import Analysis
 from omorfi.omorfi import Omorfi
+from omorfi.omorfi_server import OmorfiClient
+from omorfi.sentence_writer import add_output_arguments, writer_from_args
 
 
 def main():
@@ -18,16 +20,22 @@ def main():
                    help="print verbosely while processing")
     a.add_argument('-o', '--output', metavar="OUTFILE",
                    help="print factors into OUTFILE")
+    a.add_argument('--server', metavar='ADDR',
+                   help="use omorfi server at ADDR instead of loading automata")
+    add_output_arguments(a)
     options = a.parse_args()
-    omorfi = Omorfi(options.verbose)
-    if options.fsa:
-        if options.verbose:
-            print("Reading automata dir", options.fsa)
-        omorfi.load_from_dir(options.fsa)
+    if options.server:
+        omorfi = OmorfiClient(options.server)
     else:
-        if options.verbose:
-            print("Searching for automata everywhere...")
-        omorfi.load_from_dir()
+        omorfi = Omorfi(options.verbose)
+        if options.fsa:
+            if options.verbose:
+                print("Reading automata dir", options.fsa, file=stderr)
+            omorfi.load_from_dir(options.fsa)
+        else:
+            if options.verbose:
+                print("Searching for automata everywhere...", file=stderr)
+            omorfi.load_from_dir()
     if options.infile:
         infile = options.infile
     else:
@@ -37,51 +45,44 @@ def main():
     else:
         outfile = stdout
     if options.verbose:
-        print("reading from", options.infile.name)
+        print("reading from", options.infile.name, file=stderr)
     if options.verbose:
-        print("writign to", options.output)
+        print("writign to", options.output, file=stderr)
 
-    re_lemma = re.compile("\[WORD_ID=([^]]*)\]")
-    re_pos = re.compile("\[POS=([^]]*)\]")
-    re_mrd = re.compile("\[([^=]*)=([^]]*)]")
     linen = 0
+    writer = writer_from_args(outfile, options)
     for line in infile:
         line = line.strip()
         linen += 1
         if options.verbose and linen % 10000 == 0:
-            print(linen, '...')
+            print(linen, '...', file=stderr)
         if not line or line == '':
             continue
         surfs = line.split()
-        for surf in surfs:
-            anals = omorfi.analyse(surf)
+        for surf, anals in zip(surfs, omorfi.analyse_many(surfs)):
             segments = omorfi.segment(surf)
-            pos_matches = re_pos.finditer(anals[0][0])
-            pos = "UNK"
+            anal = Analysis.from_tuple(anals[0])
+            pos = anal.get_last_feat('POS', "UNK")
             mrds = []
-            lemmas = []
-            for pm in pos_matches:
-                pos = pm.group(1)
-            lemma_matches = re_lemma.finditer(anals[0][0])
-            for lm in lemma_matches:
-                lemmas += [lm.group(1)]
-            mrd_matches = re_mrd.finditer(anals[0][0])
-            for mm in mrd_matches:
-                if mm.group(1) == 'WORD_ID':
+            lemmas = anal.get_feats('WORD_ID')
+            for key, value in anal.tags:
+                if key == 'WORD_ID':
                     mrds = []
-                elif mm.group(1) == 'WEIGHT':
+                elif key == 'WEIGHT':
                     pass
                 else:
-                    mrds += [mm.group(2)]
+                    mrds += [value]
             stemfixes = segments[0][0][
                 segments[0][0].rfind("{STUB}"):].replace("{STUB}", "")
             if '{' in stemfixes:
                 morphs = stemfixes[stemfixes.find("{"):].replace("{MB}", ".")
             else:
                 morphs = '0'
-            print(surf, '+'.join(lemmas), pos, '.'.join(mrds),
-                  morphs, sep='|', end=' ', file=outfile)
-        print(file=outfile)
+            writer.write('|'.join((surf, '+'.join(lemmas), pos,
+                                   '.'.join(mrds), morphs)) + ' ')
+        writer.write('\n')
+        writer.end_sentence()
+    writer.close()
     exit(0)
 
 
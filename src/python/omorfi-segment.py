@@ -5,6 +5,8 @@ from argparse import ArgumentParser
 from sys import stderr, stdin, stdout
 
 from omorfi.omorfi import Omorfi
+from omorfi.omorfi_server import OmorfiClient
+from omorfi.sentence_writer import add_output_arguments, writer_from_args
 
 
 def print_moses_factor_segments(segments, labelsegments, surf, outfile,
@@ -64,7 +66,8 @@ def print_moses_factor_segments(segments, labelsegments, surf, outfile,
                 continue
             elif split.isupper():
                 if not allow_uppers and not splat[0].startswith(split):
-                    print("unhandlend upper string?", split, splat)
+                    print("unhandlend upper string?", split, splat,
+                          file=stderr)
                     exit(1)
                 else:
                     moses += split
@@ -226,9 +229,9 @@ def print_moses_factor_segments(segments, labelsegments, surf, outfile,
         moses = re.sub(r" ", " " + segright, moses)
         last = moses.rfind(segleft + "|")
         moses = moses[:last + len(segleft) - 1] + moses[last + len(segleft):]
-        print(moses, end=' ', file=outfile)
+        outfile.write(moses + ' ')
     else:
-        print(surf, end='|UNK ', file=outfile)
+        outfile.write(surf + '|UNK ')
 
 
 def segment_splits(segments, options):
@@ -265,14 +268,11 @@ def print_segments(segments, labelsegments, surf, outfile, options):
         if options.show_ambiguous:
             sep = ''
             for segmenteds in segments:
-                print(sep, end='', file=outfile)
-                print(segment_splits(segmenteds[0], options), end='',
-                      file=outfile)
+                outfile.write(sep + segment_splits(segmenteds[0], options))
                 sep = options.show_ambiguous
         else:
-            print(segment_splits(segments[0][0], options), end='',
-                  file=outfile)
-        print(' ', end='', file=outfile)
+            outfile.write(segment_splits(segments[0][0], options))
+        outfile.write(' ')
     else:
         print("Missing segmenter", file=stderr)
         exit(1)
@@ -310,17 +310,23 @@ def main():
                    help="mark segment boundaries with SEG")
     a.add_argument('--show-ambiguous', default=False, metavar='ASEP',
                    help="separate ambiguous segmentations with SEG")
+    a.add_argument('--server', metavar='ADDR',
+                   help="use omorfi server at ADDR instead of loading automata")
+    add_output_arguments(a)
     options = a.parse_args()
-    omorfi = Omorfi(options.verbose)
-    if options.fsa:
-        if options.verbose:
-            print("Reading automata dir", options.fsa)
-        omorfi.load_from_dir(options.fsa, segment=True,
-                             labelsegment=True, accept=True)
+    if options.server:
+        omorfi = OmorfiClient(options.server)
     else:
-        if options.verbose:
-            print("Searching for automata everywhere...")
-        omorfi.load_from_dir(labelsegment=True, segment=True, accept=True)
+        omorfi = Omorfi(options.verbose)
+        if options.fsa:
+            if options.verbose:
+                print("Reading automata dir", options.fsa, file=stderr)
+            omorfi.load_from_dir(options.fsa, segment=True,
+                                 labelsegment=True, accept=True)
+        else:
+            if options.verbose:
+                print("Searching for automata everywhere...", file=stderr)
+            omorfi.load_from_dir(labelsegment=True, segment=True, accept=True)
     if not omorfi.can_segment:
         print("Could not load segmenter(s), re-compile them or use -f option")
         print()
@@ -339,21 +345,23 @@ def main():
         outfile = stdout
     if options.segment_marker is None:
         if options.verbose:
-            print("Default segment marker is → ←")
+            print("Default segment marker is → ←", file=stderr)
         options.segment_marker = '→ ←'
     if options.verbose:
-        print("reading from", options.infile.name)
+        print("reading from", options.infile.name, file=stderr)
     if options.verbose:
-        print("writign to", options.output)
+        print("writign to", options.output, file=stderr)
 
     linen = 0
+    writer = writer_from_args(outfile, options)
     for line in infile:
         line = line.strip()
         linen += 1
         if options.verbose and linen % 10000 == 0:
-            print(linen, '...')
+            print(linen, '...', file=stderr)
         if not line or line == '':
-            print(file=outfile)
+            writer.write('\n')
+            writer.end_sentence()
             continue
         tokens = omorfi.tokenise(line)
         for token in tokens:
@@ -361,11 +369,13 @@ def main():
             labelsegments = omorfi.labelsegment(token[0])
             if options.output_format == 'moses-factors':
                 print_moses_factor_segments(
-                    segments, labelsegments, token[0], outfile, options)
+                    segments, labelsegments, token[0], writer, options)
             elif options.output_format == 'segments':
-                print_segments(segments, labelsegments, token[0], outfile,
+                print_segments(segments, labelsegments, token[0], writer,
                                options)
-        print(file=outfile)
+        writer.write('\n')
+        writer.end_sentence()
+    writer.close()
     exit(0)
 
 
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+from argparse import ArgumentParser
+from signal import SIGTERM, signal
+from sys import stderr
+
+# omorfi
+from omorfi.omorfi import Omorfi
+from omorfi.omorfi_server import OmorfiServer
+
+
+def _terminate(signum, frame):
+    exit(0)
+
+
+def main():
+    """Serve omorfi automata over a local socket."""
+    a = ArgumentParser()
+    a.add_argument('-f', '--fsa', metavar='FSAPATH',
+                   help="Path to directory of HFST format automata")
+    a.add_argument('-l', '--listen', metavar='ADDR', required=True,
+                   help="listen at ADDR, either HOST:PORT or socket path")
+    a.add_argument('-v', '--verbose', action='store_true',
+                   help="print verbosely while processing")
+    a.add_argument('--lazy', action='store_true',
+                   help="load automata on first use")
+    a.add_argument('--allow-remote', action='store_true',
+                   help="allow listening on non-loopback TCP hosts; the "
+                   "server has no authentication")
+    options = a.parse_args()
+    omorfi = Omorfi(options.verbose)
+    try:
+        server = OmorfiServer(omorfi, options.listen, options.allow_remote)
+    except ValueError as e:
+        print(e, "(use --allow-remote to override)", file=stderr)
+        exit(1)
+    except OSError as e:
+        print("Cannot listen on", options.listen, ":", e, file=stderr)
+        exit(1)
+    if options.fsa:
+        if options.verbose:
+            print("reading language models in", options.fsa)
+        omorfi.load_from_dir(options.fsa, options.lazy, analyse=True,
+                             generate=True, accept=True, tokenise=True,
+                             lemmatise=True, segment=True, labelsegment=True,
+                             guesser=True)
+    else:
+        if options.verbose:
+            print("reading language models in default dirs")
+        omorfi.load_from_dir(None, options.lazy)
+    signal(SIGTERM, _terminate)
+    if options.verbose:
+        print("listening at", options.listen)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("shutting down", file=stderr)
+    finally:
+        server.close()
+    exit(0)
+
+
+if __name__ == "__main__":
+    main()
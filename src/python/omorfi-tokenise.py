@@ -3,12 +3,14 @@
 
 from argparse import ArgumentParser, FileType
 # CLI stuff
-from sys import stdin, stdout
+from sys import stderr, stdin, stdout
 # statistics
 from time import perf_counter, process_time
 
 # omorfi
 from omorfi.omorfi import Omorfi
+from omorfi.omorfi_server import OmorfiClient
+from omorfi.sentence_writer import add_output_arguments, writer_from_args
 
 
 def main():
@@ -24,27 +26,34 @@ def main():
                    help="print output into OUTFILE", type=FileType('w'))
     a.add_argument('-x', '--statistics', metavar="STATFILE", dest="statfile",
                    help="print statistics to STATFILE", type=FileType('w'))
+    a.add_argument('--server', metavar='ADDR',
+                   help="use omorfi server at ADDR instead of loading automata")
     a.add_argument('-O', '--output-format', metavar="OUTFORMAT",
                    default="moses",
                    help="format output for OUTFORMAT", choices=['moses', 'conllu'])
+    add_output_arguments(a)
     options = a.parse_args()
-    omorfi = Omorfi(options.verbose)
-    if options.fsa:
-        if options.verbose:
-            print("reading language models in", options.fsa)
-        omorfi.load_from_dir(options.fsa, analyse=True, accept=True)
+    if options.server:
+        omorfi = OmorfiClient(options.server)
     else:
-        if options.verbose:
-            print("reading language models in default dirs")
-        omorfi.load_from_dir()
+        omorfi = Omorfi(options.verbose)
+        if options.fsa:
+            if options.verbose:
+                print("reading language models in", options.fsa, file=stderr)
+            omorfi.load_from_dir(options.fsa, analyse=True, accept=True,
+                                 tokenise=True)
+        else:
+            if options.verbose:
+                print("reading language models in default dirs", file=stderr)
+            omorfi.load_from_dir()
     if not options.infile:
         options.infile = stdin
     if options.verbose:
-        print("analysing", options.infile.name)
+        print("analysing", options.infile.name, file=stderr)
     if not options.outfile:
         options.outfile = stdout
     if options.verbose:
-        print("writing to", options.outfile.name)
+        print("writing to", options.outfile.name, file=stderr)
     if not options.statfile:
         options.statfile = stdout
     # statistics
@@ -52,29 +61,31 @@ def main():
     cpustart = process_time()
     tokens = 0
     lines = 0
+    writer = writer_from_args(options.outfile, options)
     if options.output_format == 'conllu':
-        print("# doc-name:", options.infile.name, file=options.outfile)
+        writer.write("# doc-name: " + str(options.infile.name) + "\n")
     for line in options.infile:
         line = line
         lines += 1
         if options.verbose and lines % 10000 == 0:
-            print(lines, "...")
+            print(lines, "...", file=stderr)
         if not line or line.rstrip('\n') == '':
             continue
         surfs = omorfi.tokenise(line)
         tokens += len(surfs)
         if options.output_format == 'moses':
-            print(' '.join([surf[0] for surf in surfs]), file=options.outfile)
+            writer.write(' '.join([surf[0] for surf in surfs]) + "\n")
         else:
-            print("# sentence-text:", line.rstrip("\n"), file=options.outfile)
+            writer.write("# sentence-text: " + line.rstrip("\n") + "\n")
             i = 1
             for surf in surfs:
-                print(i, surf[0], "_", "_", "_", "_", "_", "_", "_",
-                      surf[1],
-                      sep="\t", file=options.outfile)
+                writer.write("%d\t%s\t_\t_\t_\t_\t_\t_\t_\t%s\n" %
+                             (i, surf[0], surf[1]))
                 i += 1
         if options.output_format == 'conllu':
-            print(file=options.outfile)
+            writer.write("\n")
+        writer.end_sentence()
+    writer.close()
     cpuend = process_time()
     realend = perf_counter()
     print("Lines:", lines, "Tokens:", tokens, "Ratio:", tokens / lines,
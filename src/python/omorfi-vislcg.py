@@ -1,73 +1,60 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
-# string munging
-import re
 from argparse import ArgumentParser, FileType
 # CLI stuff
-from sys import stdin, stdout
+from sys import stderr, stdin, stdout
 # statistics
 from time import perf_counter, process_time
 
 # omorfi
+from omorfi.analysis import Analysis
 from omorfi.omorfi import Omorfi
+from omorfi.omorfi_server import OmorfiClient
+from omorfi.sentence_writer import add_output_arguments, writer_from_args
 
 
 def get_lemmas(anal):
-    re_lemma = re.compile("\[WORD_ID=([^]]*)\]")
-    lemmas = re_lemma.finditer(anal[0])
-    rv = []
-    for lemma in lemmas:
-        rv += [lemma.group(1)]
-    return rv
+    return Analysis.from_tuple(anal).get_feats('WORD_ID')
 
 
 def get_last_feat(feat, anal):
-    re_feat = re.compile("\[" + feat + "=([^]]*)\]")
-    feats = re_feat.finditer(anal[0])
-    rv = ""
-    for feat in feats:
-        rv = feat.group(1)
-    return rv
+    return Analysis.from_tuple(anal).get_last_feat(feat)
 
 
 def get_last_feats(anal):
-    re_feats = re.compile("\[[^]]*\]")
-    rvs = list()
-    feats = re_feats.finditer(anal[0][0])
-    for feat in feats:
-        if 'BOUNDARY=' in feat.group(0) or 'WORD_ID=' in feat.group(0):
-            rvs = list()
-        else:
-            rvs.append(feat.group(0))
-    return rvs
+    return Analysis.from_tuple(anal).last_feats
 
 
-def print_analyses_vislcg3(surf, anals, outfile):
-    print('"<', surf[0], '>"', sep='', file=outfile)
-    re_mrd = re.compile("\[([^=]*)=([^]]*)]")
+def format_analyses_vislcg3(surf, anals):
+    lines = ['"<' + surf[0] + '>"\n']
     for anal in anals:
+        anal = Analysis.from_tuple(anal)
         mrds = []
         lemmas = get_lemmas(anal)
-        mrd_matches = re_mrd.finditer(anal[0])
-        for mm in mrd_matches:
-            if mm.group(1) == 'WORD_ID':
+        for key, value in anal.tags:
+            if key == 'WORD_ID':
                 mrds = []
-            elif mm.group(1) == 'CASECHANGE' and mm.group(2) != 'NONE':
-                mrds = ['<' + mm.group(2) + '>'] + mrds
-            elif mm.group(1) == 'ALLO':
-                mrds = ['<' + mm.group(2) + '>'] + mrds
-            elif mm.group(1) == 'WEIGHT' and mm.group(2) != 'inf':
-                mrds += ['<W=' + str(int(float(mm.group(2)) * 100)) + '>']
-            elif mm.group(1) == 'WEIGHT' and mm.group(2) == 'inf':
+            elif key == 'CASECHANGE' and value != 'NONE':
+                mrds = ['<' + value + '>'] + mrds
+            elif key == 'ALLO':
+                mrds = ['<' + value + '>'] + mrds
+            elif key == 'WEIGHT' and value != 'inf':
+                mrds += ['<W=' + str(int(float(value) * 100)) + '>']
+            elif key == 'WEIGHT' and value == 'inf':
                 mrds += ['<W=65536>']
-            elif mm.group(1) in ['STYLE']:
-                mrds += ['<' + mm.group(2) + '>']
+            elif key in ['STYLE']:
+                mrds += ['<' + value + '>']
             else:
-                mrds += [mm.group(2)]
-        print('\t"', ''.join(lemmas).replace('"', '\\"'), '" ',
-              ' '.join(mrds), sep='', file=outfile)
-    print(file=outfile)
+                mrds += [value]
+        lemma = ''.join(lemmas).replace('"', '\\"')
+        lines.append('\t"' + lemma + '" ' + ' '.join(mrds) + '\n')
+    lines.append('\n')
+    return ''.join(lines)
+
+
+def print_analyses_vislcg3(surf, anals, outfile):
+    outfile.write(format_analyses_vislcg3(surf, anals))
 
 
 def main():
@@ -83,24 +70,31 @@ def main():
                    help="print output into OUTFILE", type=FileType('w'))
     a.add_argument('-x', '--statistics', metavar="STATFILE", dest="statfile",
                    help="print statistics to STATFILE", type=FileType('w'))
+    a.add_argument('--server', metavar='ADDR',
+                   help="use omorfi server at ADDR instead of loading automata")
+    add_output_arguments(a)
     options = a.parse_args()
-    omorfi = Omorfi(options.verbose)
-    if options.fsa:
-        if options.verbose:
-            print("reading language models in", options.fsa)
-        omorfi.load_from_dir(options.fsa, analyse=True, accept=True)
+    if options.server:
+        omorfi = OmorfiClient(options.server)
     else:
-        if options.verbose:
-            print("reading language models in default dirs")
-        omorfi.load_from_dir()
+        omorfi = Omorfi(options.verbose)
+        if options.fsa:
+            if options.verbose:
+                print("reading language models in", options.fsa, file=stderr)
+            omorfi.load_from_dir(options.fsa, analyse=True, accept=True,
+                                 tokenise=True)
+        else:
+            if options.verbose:
+                print("reading language models in default dirs", file=stderr)
+            omorfi.load_from_dir()
     if not options.infile:
         options.infile = stdin
     if options.verbose:
-        print("analysing", options.infile.name)
+        print("analysing", options.infile.name, file=stderr)
     if not options.outfile:
         options.outfile = stdout
     if options.verbose:
-        print("writing to", options.outfile.name)
+        print("writing to", options.outfile.name, file=stderr)
     if not options.statfile:
         options.statfile = stdout
     # statistics
@@ -108,18 +102,20 @@ def main():
     cpustart = process_time()
     tokens = 0
     unknowns = 0
+    writer = writer_from_args(options.outfile, options)
     for line in options.infile:
         line = line
         if not line or line == '':
             continue
         surfs = omorfi.tokenise(line)
-        for surf in surfs:
+        for surf, anals in zip(surfs, omorfi.analyse_many(surfs)):
             tokens += 1
-            anals = omorfi.analyse(surf)
-            print_analyses_vislcg3(surf, anals, options.outfile)
+            print_analyses_vislcg3(surf, anals, writer)
             if len(anals) == 0 or (len(anals) == 1 and
                                    'UNKNOWN' in anals[0][0]):
                 unknowns += 1
+        writer.end_sentence()
+    writer.close()
     cpuend = process_time()
     realend = perf_counter()
     print("Tokens:", tokens, "Unknown:", unknowns, unknowns / tokens * 100,
@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Analysis results of omorfi with lazily parsed omor tags.
+
+@c Omorfi.analyse returns tuples of omor string, weight and possibly misc
+by default, with objects=True it returns @c Analysis objects instead. The
+objects can be indexed and unpacked like the tuples, and the [KEY=VALUE]
+tags of the omor string are parsed on the first use of an accessor and
+kept for the rest.
+"""
+
+# Author: Omorfi contributors <omorfi-devel@groups.google.com> 2015
+
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import re
+
+re_tag = re.compile(r"\[([^]=]*)=([^]]*)\]")
+
+# homonym numbers stripped from WORD_IDs when getting lemmas
+homonym_suffixes = ['_' + str(i) for i in range(32)]
+
+
+def strip_homonym(lemma):
+    """Strip homonym number suffixes from WORD_ID value."""
+    for suffix in homonym_suffixes:
+        if lemma.endswith(suffix):
+            lemma = lemma[:-len(suffix)]
+    return lemma
+
+
+class Analysis:
+
+    """
+    One analysis of a token, as returned by omorfi.
+
+    Indexing, unpacking, len and comparison work on the underlying
+    (omorstring, weight[, misc]) tuple. The tags are parsed from the omor
+    string once, when first needed.
+    """
+
+    __slots__ = ('_anal', '_tags', '_lemmas', '_last_feats')
+
+    def __init__(self, anal):
+        self._anal = tuple(anal)
+        self._tags = None
+        self._lemmas = None
+        self._last_feats = None
+
+    @classmethod
+    def from_tuple(cls, anal):
+        """Get analysis for anal tuple, or anal itself if it is one."""
+        if isinstance(anal, cls):
+            return anal
+        return cls(anal)
+
+    def __getitem__(self, i):
+        return self._anal[i]
+
+    def __len__(self):
+        return len(self._anal)
+
+    def __iter__(self):
+        return iter(self._anal)
+
+    def __eq__(self, other):
+        if isinstance(other, Analysis):
+            return self._anal == other._anal
+        return self._anal == other
+
+    def __hash__(self):
+        return hash(self._anal)
+
+    def __repr__(self):
+        return 'Analysis(%r)' % (self._anal,)
+
+    def astuple(self):
+        """Get the analysis as tuple."""
+        return self._anal
+
+    @property
+    def raw(self):
+        """Omor string of the analysis."""
+        return self._anal[0]
+
+    @property
+    def weight(self):
+        """Weight of the analysis."""
+        return self._anal[1]
+
+    @property
+    def misc(self):
+        """Misc field of the analysis or None if there is none."""
+        if len(self._anal) > 2:
+            return self._anal[2]
+        return None
+
+    @property
+    def tags(self):
+        """Tuple of (key, value) pairs of all tags in order."""
+        if self._tags is None:
+            self._tags = tuple(re_tag.findall(self._anal[0]))
+        return self._tags
+
+    @property
+    def lemmas(self):
+        """Tuple of lemmas of the compound parts, homonym numbers stripped."""
+        if self._lemmas is None:
+            self._lemmas = tuple(strip_homonym(value)
+                                 for key, value in self.tags
+                                 if key == 'WORD_ID')
+        return self._lemmas
+
+    @property
+    def upos(self):
+        """Last UPOS of the analysis or empty string."""
+        return self.get_last_feat('UPOS')
+
+    @property
+    def last_feats(self):
+        """Tuple of (key, value) tags after the last WORD_ID or BOUNDARY."""
+        if self._last_feats is None:
+            feats = []
+            for key, value in self.tags:
+                if key in ('WORD_ID', 'BOUNDARY'):
+                    feats = []
+                else:
+                    feats.append((key, value))
+            self._last_feats = tuple(feats)
+        return self._last_feats
+
+    @property
+    def feats(self):
+        """Dict of the last_feats, later values overriding earlier ones."""
+        return dict(self.last_feats)
+
+    @property
+    def parts(self):
+        """List of tag tuples of each compound part.
+
+        A new part starts at each WORD_ID, the BOUNDARY=COMPOUND tags between
+        the parts are left out.
+        """
+        parts = []
+        part = []
+        for tag in self.tags:
+            if tag[0] == 'WORD_ID' and part:
+                parts.append(tuple(part))
+                part = []
+            if tag != ('BOUNDARY', 'COMPOUND'):
+                part.append(tag)
+        if part:
+            parts.append(tuple(part))
+        return parts
+
+    def get_last_feat(self, key, default=""):
+        """Get value of the last tag with key, or default if there is none."""
+        for tagkey, value in reversed(self.tags):
+            if tagkey == key:
+                return value
+        return default
+
+    def get_feats(self, key):
+        """Get values of all tags with key in order."""
+        return [value for tagkey, value in self.tags if tagkey == key]
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Asyncio interface for omorfi. The lookups of an Omorfi object are run in an
+executor so that they do not block the event loop.
+"""
+
+import asyncio
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from multiprocessing import get_context
+from threading import Lock
+from weakref import WeakKeyDictionary
+
+_process_omorfi = None
+
+
+def _init_process(omorfi):
+    global _process_omorfi
+    _process_omorfi = omorfi
+
+
+def _process_call(method, *args):
+    return getattr(_process_omorfi, method)(*args)
+
+
+class AsyncOmorfi:
+
+    """
+    An asyncio wrapper for Omorfi dispatching lookups to an executor.
+
+    By default lookups are run in a thread pool sharing the wrapped Omorfi
+    object, one lookup at a time. With processes=True the lookups are run
+    in a pool of worker processes forked from the current one, sharing the
+    loaded automata; in that case the automata must be loaded before the
+    first lookup. At most max_in_flight lookups of each event loop are
+    submitted to the executor at a time, further awaits wait for their turn.
+    """
+
+    def __init__(self, omorfi=None, max_workers=1, max_in_flight=64,
+                 processes=False):
+        """Construct async omorfi wrapping omorfi or a new Omorfi object."""
+        if omorfi is None:
+            from .omorfi import Omorfi
+            omorfi = Omorfi()
+        self.omorfi = omorfi
+        self._processes = processes
+        self._lock = Lock()
+        if processes:
+            self._executor = ProcessPoolExecutor(
+                max_workers, mp_context=get_context('fork'),
+                initializer=_init_process, initargs=(omorfi,))
+        else:
+            self._executor = ThreadPoolExecutor(max_workers)
+        self._started = False
+        self._max_in_flight = max_in_flight
+        self._semaphores = WeakKeyDictionary()
+
+    def load_from_dir(self, path=None, lazy=False, **include):
+        """Load automata, see @c Omorfi.load_from_dir.
+
+        With processes=True raises RuntimeError after the first lookup,
+        since the worker processes would not see the new automata.
+        """
+        if self._processes and self._started:
+            raise RuntimeError("cannot load automata after worker processes "
+                               "have started")
+        self.omorfi.load_from_dir(path, lazy, **include)
+
+    def _thread_call(self, method, *args):
+        with self._lock:
+            return getattr(self.omorfi, method)(*args)
+
+    async def _call(self, method, *args):
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self._max_in_flight)
+            self._semaphores[loop] = semaphore
+        self._started = True
+        async with semaphore:
+            if self._processes:
+                return await loop.run_in_executor(self._executor,
+                                                  _process_call, method,
+                                                  *args)
+            return await loop.run_in_executor(self._executor,
+                                              self._thread_call, method,
+                                              *args)
+
+    async def analyse(self, token):
+        """Analyse token, see @c Omorfi.analyse."""
+        return await self._call('analyse', token)
+
+    async def analyse_many(self, tokens):
+        """Analyse many tokens, see @c Omorfi.analyse_many."""
+        return await self._call('analyse_many', list(tokens))
+
+    async def analyse_sentence(self, s):
+        """Tokenise and analyse sentence, see @c Omorfi.analyse_sentence."""
+        return await self._call('analyse_sentence', s)
+
+    async def tokenise(self, line):
+        """Tokenise line, see @c Omorfi.tokenise."""
+        return await self._call('tokenise', line)
+
+    async def generate(self, omorstring):
+        """Generate from omorstring, see @c Omorfi.generate."""
+        return await self._call('generate', omorstring)
+
+    def close(self):
+        """Shut down the executor."""
+        self._executor.shutdown()
@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Timing and profiling of the build steps done by the generator scripts.
+
+The scripts create @c BuildTimings from the --profile and --timings options
+added by @c add_timing_arguments and call @c BuildTimings.switch when they
+move from one phase of work to another, e.g. read, parse, guess, format and
+write. The time between switches is charged to the current phase. When the
+script exits, the wall and CPU time of each phase, the number of rows
+processed and the peak memory use are written as JSON to the --timings
+file, and with --profile the functions that took most time are printed.
+
+Scripts that work in forked worker processes call
+@c BuildTimings.start_worker in each worker, return
+@c BuildTimings.take_phases with the results of each task and merge them
+in the parent with @c BuildTimings.merge_phases. The wall time of a phase
+is then summed over the processes that worked in it, and the CPU time of
+the workers is added to the total CPU time.
+"""
+
+# Author: Omorfi contributors <omorfi-devel@groups.google.com> 2015
+
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import atexit
+import cProfile
+import json
+import pstats
+from contextlib import contextmanager
+from io import StringIO
+from sys import argv, stderr
+from time import perf_counter, process_time, strftime
+
+can_rusage = True
+try:
+    import resource
+except ImportError:
+    can_rusage = False
+
+# number of functions listed in profiles
+PROFILE_FUNCTIONS = 25
+
+
+def add_timing_arguments(ap):
+    """Add --profile and --timings options to argument parser ap."""
+    ap.add_argument("--profile", action="store_true", default=False,
+                    help="profile the run and print the slowest functions "
+                    "to stderr")
+    ap.add_argument("--timings", action="store", metavar="TFILE",
+                    help="write JSON report of time spent in each phase "
+                    "to TFILE")
+
+
+def timings_from_args(step, args):
+    """Create BuildTimings for build step using parsed timing options."""
+    return BuildTimings(step, args.timings, args.profile)
+
+
+def peak_rss():
+    """Get peak resident set size in KiB of this process and its children.
+
+    Returns None if it cannot be measured on this platform.
+    """
+    if not can_rusage:
+        return None
+    return {'self': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+            'children': resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss}
+
+
+class BuildTimings:
+    """Wall and CPU time spent in the phases of one build step.
+
+    If neither timings file nor profiling is requested, the switches do
+    nothing, so the scripts can call them unconditionally.
+    """
+
+    def __init__(self, step, timingsfile=None, profile=False):
+        self.step = step
+        self.timingsfile = timingsfile
+        self.enabled = bool(timingsfile or profile)
+        self.phases = dict()
+        self.rows = 0
+        self.current = None
+        self.profiler = None
+        self.finished = False
+        self.worker_cpu = 0.0
+        if not self.enabled:
+            return
+        self.started = strftime("%Y-%m-%d %H:%M:%S+%Z")
+        self.start_wall = self.wall = perf_counter()
+        self.start_cpu = self.cpu = process_time()
+        if profile:
+            self.profiler = cProfile.Profile()
+            self.profiler.enable()
+        atexit.register(self.finish)
+
+    def switch(self, phase):
+        """Charge time since previous switch to current phase and start phase.
+
+        Returns the phase that was current before.
+        """
+        previous = self.current
+        if not self.enabled:
+            return previous
+        wall = perf_counter()
+        cpu = process_time()
+        if previous is not None:
+            times = self.phases.get(previous)
+            if times is None:
+                times = self.phases[previous] = [0.0, 0.0]
+            times[0] += wall - self.wall
+            times[1] += cpu - self.cpu
+        self.current = phase
+        self.wall = wall
+        self.cpu = cpu
+        return previous
+
+    @contextmanager
+    def phase(self, phase):
+        """Charge time spent in the with block to phase."""
+        previous = self.switch(phase)
+        try:
+            yield self
+        finally:
+            self.switch(previous)
+
+    def start_worker(self, phase=None):
+        """Start timing afresh in a forked worker process.
+
+        The phase times copied from the parent are dropped and phase, or
+        the phase current at fork, is charged from now on.
+        """
+        if not self.enabled:
+            return
+        if phase is not None:
+            self.current = phase
+        self.phases = dict()
+        self.rows = 0
+        self.wall = perf_counter()
+        self.cpu = process_time()
+
+    def take_phases(self):
+        """Take phase times charged since start or previous take.
+
+        Returns the times as a dict of phase to wall and CPU time.
+        """
+        if not self.enabled:
+            return dict()
+        self.switch(self.current)
+        phases = self.phases
+        self.phases = dict()
+        return phases
+
+    def merge_phases(self, phases):
+        """Add phase times taken in a worker process."""
+        if not self.enabled:
+            return
+        for phase, (wall, cpu) in phases.items():
+            times = self.phases.get(phase)
+            if times is None:
+                times = self.phases[phase] = [0.0, 0.0]
+            times[0] += wall
+            times[1] += cpu
+            self.worker_cpu += cpu
+
+    def count(self, rows=1):
+        """Count rows processed by the build step."""
+        self.rows += rows
+
+    def report(self):
+        """Get timings collected so far as a dict for JSON."""
+        wall = perf_counter() - self.start_wall
+        cpu = process_time() - self.start_cpu + self.worker_cpu
+        return {'step': self.step,
+                'argv': argv,
+                'started': self.started,
+                'wall': wall,
+                'cpu': cpu,
+                'worker_cpu': self.worker_cpu,
+                'rows': self.rows,
+                'rows_per_second': self.rows / wall if wall > 0 else None,
+                'peak_rss_kib': peak_rss(),
+                'phases': {phase: {'wall': times[0], 'cpu': times[1]}
+                           for phase, times in self.phases.items()}}
+
+    def profile_stats(self):
+        """Get slowest functions of the profile as list of dicts."""
+        stats = pstats.Stats(self.profiler, stream=StringIO())
+        stats.sort_stats('cumulative')
+        functions = []
+        for func in stats.fcn_list[:PROFILE_FUNCTIONS]:
+            calls, primitive_calls, tottime, cumtime, _ = stats.stats[func]
+            functions.append({'function': pstats.func_std_string(func),
+                              'calls': calls, 'tottime': tottime,
+                              'cumtime': cumtime})
+        return functions
+
+    def finish(self):
+        """Stop timing and write the report and profile.
+
+        This is called at exit, so scripts need not call it themselves.
+        """
+        if not self.enabled or self.finished:
+            return
+        self.finished = True
+        self.switch(None)
+        if self.profiler:
+            self.profiler.disable()
+        report = self.report()
+        if self.profiler:
+            report['profile'] = self.profile_stats()
+            pstats.Stats(self.profiler, stream=stderr).\
+                sort_stats('cumulative').print_stats(PROFILE_FUNCTIONS)
+            print(self.step, "took", "%.3f" % report['wall'], "s,",
+                  "%.3f" % report['cpu'], "s CPU,", report['rows'], "rows",
+                  file=stderr)
+            for phase, times in sorted(report['phases'].items(),
+                                       key=lambda x: -x[1]['wall']):
+                print("  %-10s %8.3f s %8.3f s CPU" %
+                      (phase, times['wall'], times['cpu']), file=stderr)
+        if self.timingsfile:
+            with open(self.timingsfile, 'w') as timingsfile:
+                json.dump(report, timingsfile, indent=2, sort_keys=True)
+                print(file=timingsfile)
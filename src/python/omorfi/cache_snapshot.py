@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Analysis cache snapshots and word-form frequency lists for warming it up.
+
+@c Omorfi.warm_cache analyses the most frequent word-forms of a list read
+by @c read_frequency_list, and @c Omorfi.dump_cache and
+@c Omorfi.load_cache save the populated cache to a snapshot file and read
+it back in a fresh process. The snapshot is gzipped JSON of the cache
+entries together with the size, mtime and sha256 hash of the analyser
+automaton file, and it is only loaded for the same file.
+"""
+
+# Author: Omorfi contributors <omorfi-devel@groups.google.com> 2015
+
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import gzip
+import hashlib
+import json
+import zlib
+from os import replace, stat
+from sys import stderr
+
+# version of the snapshot files
+SNAPSHOT_FORMAT = 2
+
+# types of the values in cache keys and analysis tuples
+_SCALARS = (str, int, float, bool, type(None))
+
+# sha256 of files by path, size and mtime
+_file_hashes = dict()
+
+
+def file_signature(path):
+    """Get dict of size, mtime and sha256 hash of file at path.
+
+    The hash is only computed once per process for each version of a file.
+    """
+    st = stat(path)
+    key = (path, st.st_size, st.st_mtime_ns)
+    digest = _file_hashes.get(key)
+    if digest is None:
+        sha256 = hashlib.sha256()
+        with open(path, 'rb') as automaton:
+            for block in iter(lambda: automaton.read(1 << 20), b''):
+                sha256.update(block)
+        digest = _file_hashes[key] = sha256.hexdigest()
+    return {'size': st.st_size, 'mtime': st.st_mtime_ns, 'sha256': digest}
+
+
+def read_frequency_list(freqfile, top_n=None):
+    """Read at most top_n word-forms from ranked frequency list freqfile.
+
+    The file has one word-form per line, optionally preceded by its count
+    and a tab, most frequent first, like test/coverage-fast-alls.freqs and
+    test/wordforms-common.list.
+    """
+    words = []
+    with open(freqfile) as freqs:
+        for line in freqs:
+            if top_n is not None and len(words) >= top_n:
+                break
+            word = line.rstrip('\n')
+            if '\t' in word:
+                count, rest = word.split('\t', 1)
+                if count.strip().isdigit():
+                    word = rest
+            if word:
+                words.append(word)
+    return words
+
+
+def _scalar_tuple(values):
+    if not isinstance(values, list):
+        raise ValueError("not a cache entry: %r" % (values,))
+    values = tuple(values)
+    for value in values:
+        if not isinstance(value, _SCALARS):
+            raise ValueError("not a cache entry value: %r" % (value,))
+    return values
+
+
+def _entries_from_json(entries):
+    """Rebuild (key, analyses) pairs of tuples from lists of snapshot."""
+    if not isinstance(entries, list):
+        raise ValueError("cache snapshot entries are not a list")
+    return [(_scalar_tuple(key), tuple(_scalar_tuple(anal) for anal in anals))
+            for key, anals in entries]
+
+
+def dump_cache_snapshot(cache, automaton, filename):
+    """Write cache of analyses made with automaton file to filename.
+
+    The cache maps tuple keys to tuples of analysis tuples, holding
+    strings, numbers, booleans or None. Returns the number of keys written.
+    """
+    snapshot = {'format': SNAPSHOT_FORMAT,
+                'automaton': file_signature(automaton),
+                'entries': list(cache.items())}
+    # written aside and renamed so readers never see a partial file
+    with gzip.open(filename + '.tmp', 'wt', encoding='utf-8') as snapfile:
+        json.dump(snapshot, snapfile, ensure_ascii=False)
+    replace(filename + '.tmp', filename)
+    return len(snapshot['entries'])
+
+
+def load_cache_snapshot(filename, automaton, verbose=False):
+    """Read snapshot of cache of analyses made with automaton file.
+
+    Returns list of (key, analyses) pairs from least to most recently used,
+    or empty list if the snapshot cannot be read or the size, mtime or hash
+    of automaton differ from those of the snapshot.
+    """
+    try:
+        with gzip.open(filename, 'rt', encoding='utf-8') as snapfile:
+            snapshot = json.load(snapfile)
+    except (OSError, EOFError, zlib.error, ValueError) as e:
+        if verbose:
+            print("Cannot read cache snapshot", filename, e, file=stderr)
+        return []
+    try:
+        signature = file_signature(automaton)
+    except OSError:
+        signature = None
+    if not isinstance(snapshot, dict) or \
+            snapshot.get('format') != SNAPSHOT_FORMAT or \
+            snapshot.get('automaton') != signature:
+        if verbose:
+            print("Cache snapshot", filename, "is not for", automaton,
+                  file=stderr)
+        return []
+    try:
+        return _entries_from_json(snapshot.get('entries'))
+    except (TypeError, ValueError) as e:
+        if verbose:
+            print("Broken cache snapshot", filename, e, file=stderr)
+        return []
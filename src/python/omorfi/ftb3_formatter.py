@@ -550,7 +550,7 @@ class Ftb3Formatter(Formatter):
     def multichars_lexc(self):
         multichars = "Multichar_Symbols\n"
         multichars += "!! FTB 3.1 multichar set:\n"
-        for mcs in self.multichars:
+        for mcs in sorted(self.multichars):
             multichars += mcs + "\n"
         multichars += Formatter.multichars_lexc(self)
         return multichars
@@ -491,7 +491,7 @@ class GiellaFormatter(Formatter):
 
     def multichars_lexc(self):
         multichars = "Multichar_Symbols\n!! giellatekno multichar set:\n"
-        for mcs in self.giella_multichars:
+        for mcs in sorted(self.giella_multichars):
             multichars += mcs + "\n"
         multichars += Formatter.multichars_lexc(self)
         return multichars
@@ -1,6 +1,13 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
-"""Functions to guess omorfi paradigm from other omorfi data."""
+"""Functions to guess omorfi paradigm from other omorfi data.
+
+Nouns, adjectives and verbs are classified from the rule tables
+@c NEW_PARA_RULES, which are compiled at import into nested dicts keyed by
+plurale tantum, kotus class and kotus gradation, and reverse suffix tries
+for the lemma endings. The rest of the parts of speech are guessed with
+plain code.
+"""
 
 # Author: Omorfi contributors <omorfi-devel@groups.google.com> 2015
 
@@ -17,6 +24,10 @@
 #   You should have received a copy of the GNU General Public License
 #   along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+from itertools import product
+from operator import itemgetter
+from sys import exit
+
 from .error_logging import fail_guess_because
 from .string_manglers import three_syllable
 
@@ -33,12 +44,8 @@ def guess_new_class(wordmap):
         wordmap['new_para'] = '#'
     if wordmap['is_prefix']:
         wordmap['new_para'] = 'N_COMPOUND'
-    elif wordmap['pos'] in ['PROPER', 'NOUN']:
-        wordmap = guess_new_noun(wordmap)
-    elif wordmap['pos'] == 'ADJECTIVE':
-        wordmap = guess_new_adjective(wordmap)
-    elif wordmap['pos'] == 'VERB':
-        wordmap = guess_new_verb(wordmap)
+    elif wordmap['pos'] in NEW_PARA_RULES:
+        wordmap = guess_new_para_from_rules(wordmap, wordmap['pos'])
     elif wordmap['pos'] == 'PRONOUN':
         wordmap = guess_new_pronoun(wordmap)
     elif wordmap['pos'] == 'ACRONYM':
@@ -58,4666 +65,3918 @@ def guess_new_class(wordmap):
     return wordmap
 
 
+# The rule tables are nested dicts keyed by the fields in @c RULE_KEYS of the
+# part of speech, in order: plurale tantum ('common' for lexemes that are
+# not plurale tantum), kotus class and kotus gradation (False for none). The
+# key ELSE is used for the values that are not listed. The innermost lists
+# are rules tried in order until one matches. A rule is a tuple of
+# (endings, action, test...): endings is a suffix or a tuple of suffixes that
+# the lemma must end in, or None, and each test is a tuple of
+# (field, operator, value) from @c _FIELDS and @c _OPERATORS. The action is
+# the new_para to set, None to stop without setting anything, or one of
+# @c fail() and @c assign().
+
+ELSE = '*'
+
+
+def fail(matches, failures, moar=None, new_para=None, fatal=False):
+    '''Rule action to report an unguessable lexeme and optionally set
+    new_para or exit.'''
+    return ('fail', matches, failures, moar, new_para, fatal)
+
+
+def assign(field, source):
+    '''Rule action to copy source field to field and try the next rules.'''
+    return ('assign', field, source)
+
+
+BACK = ('harmony', '==', 'back')
+FRONT = ('harmony', '==', 'front')
+NO_STEM_VOWEL = ('stem_vowel', 'bool', False)
+NOT_PLURALE_LEMMA = (None, fail(['N', 'PLT'], ['-t'], 'not a plt lemma'),
+                     ('lemma', 'not endswith', 't'))
+
+
+_NOUN_RULES = {
+    'common': {
+        1: {
+            False: [
+                (('o', 'O'), 'N_TALO'),
+                (('u', 'U'), 'N_ASU'),
+                ('ú', 'N_ASU'),
+                (('y', 'Y'), 'N_KÄRRY'),
+                ('ÿ', 'N_KÄRRY'),
+                ('ö', 'N_MÖMMÖ'),
+                (None, fail(['N', 1, False], ['o O', 'u ú', 'y ÿ Y', 'ö'])),
+            ],
+            'A': [
+                ('ko', 'N_UKKO'),
+                ('ku', 'N_TIKKU'),
+                ('ky', 'N_MYRKKY'),
+                ('kö', 'N_YÖKKÖ'),
+                (None, fail(['N', 1, 'A'], ['ko', 'ku', 'ky', 'kö'])),
+            ],
+            'B': [
+                ('ppo', 'N_HAPPO'),
+                ('ppu', 'N_LIPPU'),
+                ('ppy', 'N_RYYPPY'),
+                ('ppö', 'N_TÖRPPÖ'),
+                (None, fail(['N', 1, 'B'], ['ppo', 'ppu', 'ppy', 'ppö'])),
+            ],
+            'D': [
+                ('uoko', 'N_RUOKO'),
+                ('iuku', 'N_LIUKU'),
+                ('oko', 'N_KOKO'),
+                (('hko', 'lko', 'rko'), 'N_PELKO'),
+                (('hku', 'lku', 'rku'), 'N_ALKU'),
+                (('hky', 'lky', 'rky'), 'N_HYLKY'),
+                (('hkö', 'lkö', 'rkö'), 'N_MÖRKÖ'),
+                ('ko', 'N_TEKO'),
+                ('ku', 'N_MAKU'),
+                ('ky', 'N_NÄKY'),
+                ('kö', 'N_NÄKÖ'),
+                (None, fail(['N', 1, 'D'], ['ko', 'ku', 'ky', 'kö'])),
+            ],
+            'C': [
+                ('tto', 'N_HIRTTO'),
+                ('ttu', 'N_TORTTU'),
+                ('tty', 'N_PYTTY'),
+                ('ttö', 'N_PÖNTTÖ'),
+                (None, fail(['N', 1, 'C'], ['tto', 'ttu', 'tty', 'ttö'])),
+            ],
+            'E': [
+                ('po', 'N_HEPO'),
+                ('pu', 'N_APU'),
+                ('py', 'N_KÄPY'),
+                ('pö', 'N_LÖPÖ'),
+                (None, fail(['N', 1, 'E'], ['po', 'pu', 'py', 'pö'])),
+            ],
+            'F': [
+                ('to', 'N_VETO'),
+                ('tu', 'N_KUITU'),
+                ('ty', 'N_VETY'),
+                ('tö', 'N_HÄÄTÖ'),
+                (None, fail(['N', 1, 'F'], ['to', 'tu', 'ty', 'tö'])),
+            ],
+            'G': [
+                ('nko', 'N_RUNKO'),
+                ('nku', 'N_VINKU'),
+                ('nky', 'N_SÄNKY'),
+                ('nkö', 'N_YLÄNKÖ'),
+                (None, fail(['N', 1, 'G'], ['nko', 'nku', 'nky', 'nkö'])),
+            ],
+            'H': [
+                ('mpo', 'N_SAMPO'),
+                ('mpu', 'N_RUMPU'),
+                ('mpö', 'N_LÄMPÖ'),
+                (None, fail(['N', 1, 'H'], ['mpo', 'mpu', 'mpö'])),
+            ],
+            'I': [
+                ('lto', 'N_KIELTO'),
+                ('ltu', 'N_HUOLITELTU'),
+                ('lty', 'N_EPÄILTY'),
+                ('ltö', 'N_SISÄLTÖ'),
+                (None, fail(['N', 1, 'I'], ['lto', 'ltu', 'lty', 'ltö'])),
+            ],
+            'J': [
+                ('nto', 'N_TUNTO'),
+                ('ntu', 'N_LINTU'),
+                ('nty', 'N_MÄNTY'),
+                ('ntö', 'N_KÄÄNTÖ'),
+                (None, fail(['N', 1, 'J'], ['nto', 'ntu', 'nty', 'ntö'])),
+            ],
+            'K': [
+                ('rto', 'N_SIIRTO'),
+                ('rtu', 'N_MERTU'),
+                ('rtö', 'N_VÄRTÖ'),
+                (None, fail(['N', 1, 'K'], ['rto'])),
+            ],
+            'M': [
+                ('ko', 'N_MALKO'),
+                ('ku', 'N_LUKU'),
+                ('ky', 'N_KYKY'),
+                (None, fail(['N', 1, 'M'], ['ko', 'ku', 'ky'])),
+            ],
+            ELSE: [
+                (None, fail(['N', 1], ['A–K', 'M'])),
+            ],
+        },
+        2: {
+            False: [
+                ('o', 'N_RUIPELO'),
+                ('u', 'N_SEIKKAILU'),
+                ('y', 'N_VEHKEILY'),
+                ('ö', 'N_JÄÄTELÖ'),
+                ('e', 'N_EUGENE', BACK),
+                ('e', 'N_SELENE', FRONT),
+                (None, fail(['N', 2, False], ['o', 'u', 'y', 'ö', 'e'])),
+            ],
+            ELSE: [
+                (None, fail(['N', 2], [False])),
+            ],
+        },
+        3: {
+            False: [
+                ('ao', 'N_TUOMIO'),
+                ('ão', 'N_TUOMIO'),
+                ('ae', 'N_ZOMBIE'),
+                ('eo', 'N_TUOMIO'),
+                ('io', 'N_TUOMIO'),
+                ('iö', 'N_HÄIRIÖ'),
+                ('ie', 'N_ZOMBIE', BACK),
+                ('ie', 'N_BERNIE', FRONT),
+                ('ye', 'N_BERNIE', FRONT),
+                ('oe', 'N_ZOMBIE'),
+                ('ue', 'N_ZOMBIE'),
+                ('yo', 'N_TUOMIO'),
+                ('yö', 'N_HÄIRIÖ'),
+                ('kolme', 'N_AAMUKOLME'),
+                (None,
+                 fail(['N', 3, False],
+                      ['ae', 'ao ão', 'eo', 'io', 'ie', 'iö', 'oe', 'ue', '*yo ye'])),
+            ],
+            ELSE: [
+                (None, fail(['N', 3], [False])),
+            ],
+        },
+        4: {
+            'A': [
+                ('kko', 'N_LEPAKKO'),
+                ('kkö', 'N_YKSIKKÖ'),
+                (None, fail(['N', 4, 'A'], ['kko', 'kkö'])),
+            ],
+            ELSE: [
+                (None, fail(['N', 4], ['A'])),
+            ],
+        },
+        5: {
+            False: [
+                (None, 'N_PUNK', ('lemma', 'not endswith', 'i'), BACK),
+                (None, 'N_ZEN', ('lemma', 'not endswith', 'i'), FRONT),
+                (None, fail(['N', 5, False, '!i'], ['front', 'back']),
+                 ('lemma', 'not endswith', 'i')),
+                (None, 'N_RUUVI', BACK),
+                (None, 'N_TYYLI', FRONT),
+                (None, fail(['N', 5, False, 'i'], ['front', 'back'])),
+            ],
+            'A': [
+                (None, 'N_PUNK', ('lemma', 'not endswith', 'i'), BACK),
+                (None, 'N_ZEN', ('lemma', 'not endswith', 'i'), FRONT),
+                (None, fail(['N', 5, False, '!i'], ['front', 'back']),
+                 ('lemma', 'not endswith', 'i')),
+                ('ki', 'N_LOKKI', BACK),
+                ('ki', 'N_HÄKKI', FRONT),
+                (None, fail(['N', 5, 'A'], ['ki', 'front', 'back'])),
+            ],
+            'B': [
+                (None, 'N_PUNK', ('lemma', 'not endswith', 'i'), BACK),
+                (None, 'N_ZEN', ('lemma', 'not endswith', 'i'), FRONT),
+                (None, fail(['N', 5, False, '!i'], ['front', 'back']),
+                 ('lemma', 'not endswith', 'i')),
+                ('ppi', 'N_KUPPI', BACK),
+                ('ppi', 'N_TYYPPI', FRONT),
+                (None, fail(['N', 5, 'B'], ['ppi', 'front', 'back'])),
+            ],
+            'D': [
+                (None, 'N_PUNK', ('lemma', 'not endswith', 'i'), BACK),
+                (None, 'N_ZEN', ('lemma', 'not endswith', 'i'), FRONT),
+                (None, fail(['N', 5, False, '!i'], ['front', 'back']),
+                 ('lemma', 'not endswith', 'i')),
+                ('ki', 'N_LAKI', BACK),
+                ('ki', 'N_HÄKKI', FRONT),
+                (None, fail(['N', 5, 'D'], ['ki', 'front', 'back'])),
+            ],
+            'C': [
+                (None, 'N_PUNK', ('lemma', 'not endswith', 'i'), BACK),
+                (None, 'N_ZEN', ('lemma', 'not endswith', 'i'), FRONT),
+                (None, fail(['N', 5, False, '!i'], ['front', 'back']),
+                 ('lemma', 'not endswith', 'i')),
+                ('tti', 'N_KORTTI', BACK),
+                ('tti', 'N_SKEITTI', FRONT),
+                (None, fail(['N', 5, 'C'], ['tti', 'front', 'back'])),
+            ],
+            'E': [
+                (None, 'N_PUNK', ('lemma', 'not endswith', 'i'), BACK),
+                (None, 'N_ZEN', ('lemma', 'not endswith', 'i'), FRONT),
+                (None, fail(['N', 5, False, '!i'], ['front', 'back']),
+                 ('lemma', 'not endswith', 'i')),
+                ('pi', 'N_HUPI', BACK),
+                ('pi', 'N_RIIPI', FRONT),
+                (None, fail(['N', 5, 'E'], ['pi', 'back', 'front'])),
+            ],
+            'F': [
+                (None, 'N_PUNK', ('lemma', 'not endswith', 'i'), BACK),
+                (None, 'N_ZEN', ('lemma', 'not endswith', 'i'), FRONT),
+                (None, fail(['N', 5, False, '!i'], ['front', 'back']),
+                 ('lemma', 'not endswith', 'i')),
+                ('ti', 'N_TAUTI', BACK),
+                ('ti', 'N_NIHTI', FRONT),
+                (None, fail(['N', 5, 'F'], ['ti', 'front', 'back'])),
+            ],
+            'G': [
+                (None, 'N_PUNK', ('lemma', 'not endswith', 'i'), BACK),
+                (None, 'N_ZEN', ('lemma', 'not endswith', 'i'), FRONT),
+                (None, fail(['N', 5, False, '!i'], ['front', 'back']),
+                 ('lemma', 'not endswith', 'i')),
+                ('nki', 'N_VANKI', BACK),
+                ('nki', 'N_HÄMMINKI', FRONT),
+                (None, fail(['N', 5, 'F'], ['nki', 'front', 'back'])),
+            ],
+            'H': [
+                (None, 'N_PUNK', ('lemma', 'not endswith', 'i'), BACK),
+                (None, 'N_ZEN', ('lemma', 'not endswith', 'i'), FRONT),
+                (None, fail(['N', 5, False, '!i'], ['front', 'back']),
+                 ('lemma', 'not endswith', 'i')),
+                ('mpi', 'N_LAMMI', BACK),
+                ('mpi', 'N_RIMMI', FRONT),
+                (None, fail(['N', 5, 'H'], ['mpi', 'front', 'back'])),
+            ],
+            'I': [
+                (None, 'N_PUNK', ('lemma', 'not endswith', 'i'), BACK),
+                (None, 'N_ZEN', ('lemma', 'not endswith', 'i'), FRONT),
+                (None, fail(['N', 5, False, '!i'], ['front', 'back']),
+                 ('lemma', 'not endswith', 'i')),
+                ('lti', 'N_PELTI', FRONT),
+                (None, fail(['N', 5, 'I'], ['lti', 'back'])),
+            ],
+            'J': [
+                (None, 'N_PUNK', ('lemma', 'not endswith', 'i'), BACK),
+                (None, 'N_ZEN', ('lemma', 'not endswith', 'i'), FRONT),
+                (None, fail(['N', 5, False, '!i'], ['front', 'back']),
+                 ('lemma', 'not endswith', 'i')),
+                ('nti', 'N_SOINTI', BACK),
+                ('nti', 'N_VIENTI', FRONT),
+                (None, fail(['N', 5, 'J'], ['nti', 'front', 'back'])),
+            ],
+            ELSE: [
+                (None, 'N_PUNK', ('lemma', 'not endswith', 'i'), BACK),
+                (None, 'N_ZEN', ('lemma', 'not endswith', 'i'), FRONT),
+                (None, fail(['N', 5, False, '!i'], ['front', 'back']),
+                 ('lemma', 'not endswith', 'i')),
+                (None,
+                 fail(['N', 5], ['A', 'B', 'C', 'D', 'E', 'F', 'I', 'J'])),
+            ],
+        },
+        6: {
+            False: [
+                (None, 'N_STADION', ('lemma', 'not endswith', 'i'), BACK),
+                (None, 'N_BESSERWISSER', ('lemma', 'not endswith', 'i'),
+                 FRONT),
+                (None, fail(['N', 6, False, '!i'], ['front', 'back']),
+                 ('lemma', 'not endswith', 'i')),
+                (None, 'N_KANAALI', BACK),
+                (None, 'N_KEHVELI', FRONT),
+                (None, fail(['N', 6, False, 'i'], ['front', 'back'])),
+            ],
+            ELSE: [
+                (None, 'N_STADION', ('lemma', 'not endswith', 'i'), BACK),
+                (None, 'N_BESSERWISSER', ('lemma', 'not endswith', 'i'),
+                 FRONT),
+                (None, fail(['N', 6, False, '!i'], ['front', 'back']),
+                 ('lemma', 'not endswith', 'i')),
+                (None, fail(['N', 6], [False])),
+            ],
+        },
+        7: {
+            False: [
+                (None, 'N_ONNI', BACK),
+                (None, 'N_KIVI', FRONT),
+                (None, fail(['N', 7, False], ['front', 'back'])),
+            ],
+            'B': [
+                ('ppi', 'N_HAPPI', BACK),
+                ('ppi', 'N_TYPPI', FRONT),
+                (None, fail(['N', 7, 'B'], ['ppi', 'front', 'back'])),
+            ],
+            'D': [
+                ('ki', 'N_NOKI', BACK),
+                ('ki', 'N_KÄKI', FRONT),
+                (None, fail(['N', 7, 'D'], ['ki', 'front', 'back'])),
+            ],
+            'E': [
+                ('pi', 'N_KORPI', BACK),
+                ('pi', 'N_KILPI', FRONT),
+                (None, fail(['N', 7, 'E'], ['pi', 'front', 'back'])),
+            ],
+            'F': [
+                ('ti', 'N_LAHTI', BACK),
+                ('ti', 'N_LEHTI', FRONT),
+                (None, fail(['N', 7, 'F'], ['hti', 'front', 'back'])),
+            ],
+            'G': [
+                ('nki', 'N_ONKI', BACK),
+                ('nki', 'N_HENKI', FRONT),
+                (None, fail(['N', 7, 'G'], ['nki', 'front', 'back'])),
+            ],
+            'H': [
+                ('mpi', 'N_SAMPI', BACK),
+                ('mpi', 'N_RIMPI', FRONT),
+                (None, fail(['N', 7, 'H'], ['mpi', 'front', 'back'])),
+            ],
+            'L': [
+                ('ki', 'N_ARKI', BACK),
+                ('ki', 'N_JÄRKI', FRONT),
+                (None, fail(['N', 7, 'H'], ['ki', 'front', 'back'])),
+            ],
+            ELSE: [
+                (None, fail(['N', 7], [False, 'B', 'D', 'E', 'G', 'H'])),
+            ],
+        },
+        8: {
+            False: [
+                ('e', 'N_NALLE', BACK),
+                ('e', 'N_NISSE', FRONT),
+                ('E', 'N_NALLE', BACK),
+                ('E', 'N_NISSE', FRONT),
+                ('ë', 'N_NALLE', BACK),
+                ('ě', 'N_NALLE', BACK),
+                ('ě', 'N_NISSE', FRONT),
+                ('ë', 'N_NISSE', FRONT),
+                ('an', 'N_AAMUKAHDEKSAN', FRONT),
+                ('än', 'N_AAMUYHDEKSÄN', FRONT),
+                ('en', 'N_AAMUKYMMENEN', FRONT),
+                (None,
+                 fail(['N', 8, False], ['e', 'ë', 'ě', 'front', 'back'])),
+            ],
+            'A': [
+                ('kke', 'N_NUKKE', BACK),
+                ('kke', 'N_EKKE', FRONT),
+                (None, fail(['N', 8, 'A'], ['kke', 'back'])),
+            ],
+            'B': [
+                ('ppe', 'N_RAPPE', BACK),
+                ('ppe', 'N_JEPPE', FRONT),
+                (None, fail(['N', 8, 'B'], ['ppe', 'front'])),
+            ],
+            'C': [
+                ('tte', 'N_LOTTE', BACK),
+                ('tte', 'N_METTE', FRONT),
+                (None, fail(['N', 8, 'C'], ['tte', 'front', 'back'])),
+            ],
+            ELSE: [
+                (None,
+                 fail(['N', 8], [False, 'A', 'B', 'C'],
+                      'New loan words do not simply walk into qualitative gradation')),
+            ],
+        },
+        9: {
+            False: [
+                (None, 'N_KANGASALA',
+                 ('lemma', 'in', ('Kangasala', 'Koskenala'))),
+                ('a', 'N_KIRJA'),
+                ('A', 'N_FIFA'),
+                ('ä', 'N_YMPÄRYSTÄ'),
+                (None, fail(['N', 9, False], ['a', 'ä'])),
+            ],
+            'A': [
+                ('ka', 'N_POLITIIKKA'),
+                (None, fail(['N', 9, 'A'], ['kka'])),
+            ],
+            'B': [
+                ('ppa', 'N_TIPPA'),
+                (None, fail(['N', 9, 'B'], ['ppa'])),
+            ],
+            'D': [
+                ('aaka', 'N_VAAKA'),
+                ('ka', 'N_VIKA'),
+                (None, fail(['N', 9, 'D'], ['ka'])),
+            ],
+            'C': [
+                ('tta', 'N_MITTA'),
+                ('ttä', 'N_YRITTÄ'),
+                (None, fail(['N', 9, 'C'], ['tta', 'ttä'])),
+            ],
+            'E': [
+                ('pa', 'N_SALPA'),
+                (None, fail(['N', 9, 'E'], ['pa'])),
+            ],
+            'F': [
+                ('ta', 'N_PATA'),
+                (None, fail(['N', 9, 'F'], ['ta'])),
+            ],
+            'G': [
+                ('nka', 'N_LANKA'),
+                (None, fail(['N', 9, 'G'], ['nka'])),
+            ],
+            'H': [
+                ('mpa', 'N_RAMPA'),
+                (None, fail(['N', 9, 'H'], ['mpa'])),
+            ],
+            'I': [
+                ('lta', 'N_VALTA'),
+                (None, fail(['N', 9, 'I'], ['lta'])),
+            ],
+            'J': [
+                ('nta', 'N_KUTSUNTA'),
+                ('ntä', 'N_KYSYNTÄ'),
+                (None, fail(['N', 9, 'J'], ['nta', 'ntä'])),
+            ],
+            'K': [
+                ('rta', 'N_KERTA'),
+                (None, fail(['N', 9, 'K'], ['rta'])),
+            ],
+            ELSE: [
+                (None, fail(['N', 9], [False, 'A-K'])),
+            ],
+        },
+        10: {
+            False: [
+                ('a', 'N_ASEMA', ('three_syllable(stub)', 'bool', True)),
+                ('a', 'N_VOIMA'),
+                ('A', 'N_FIFA'),
+                ('ă', 'N_VODĂ'),
+                ('ä', 'N_ELÄMÄ', ('three_syllable(stub)', 'bool', True)),
+                ('ä', ['N_HÖPÖTTÄJÄ']),
+                ('an', 'N_AAMUKAHDEKSAN'),
+                ('än', 'N_AAMUYHDEKSÄN'),
+                (None, fail(['N', 10, False], ['a ă', 'ä'])),
+            ],
+            'A': [
+                ('ka', 'N_LUOKKA'),
+                ('kä', 'N_HÖLKKÄ'),
+                (None, fail(['N', 10, 'A'], ['kka', 'kkä'])),
+            ],
+            'B': [
+                ('ppa', 'N_KUOPPA'),
+                ('ppä', 'N_SEPPÄ'),
+                (None, fail(['N', 10, 'B'], ['ppa', 'ppä'])),
+            ],
+            'D': [
+                ('lka', 'N_SULKA'),
+                ('lkä', 'N_NÄLKÄ'),
+                ('uoka', 'N_RUOKA'),
+                ('ka', 'N_LOKA'),
+                ('kä', 'N_REIKÄ'),
+                (None, fail(['N', 10, 'D'], ['ka', 'kä'])),
+            ],
+            'C': [
+                ('tta', 'N_ROTTA'),
+                ('ttä', 'N_KENTTÄ'),
+                (None, fail(['N', 10, 'C'], ['tta', 'ttä'])),
+            ],
+            'E': [
+                ('pa', 'N_LUPA'),
+                ('pä', 'N_LEIPÄ'),
+                (None, fail(['N', 10, 'E'], ['pa', 'pä'])),
+            ],
+            'F': [
+                ('ta', 'N_SOTA'),
+                ('tä', 'N_PÖYTÄ'),
+                (None, fail(['N', 10, 'F'], ['ta', 'tä'])),
+            ],
+            'G': [
+                ('nka', 'N_HONKA'),
+                ('nkä', 'N_KENKÄ'),
+                (None, fail(['N', 10, 'G'], ['nka', 'nkä'])),
+            ],
+            'H': [
+                ('mpa', 'N_KOMPA'),
+                (None, fail(['N', 10, 'H'], ['mpa', 'mpä'])),
+            ],
+            'I': [
+                ('lta', 'N_MULTA'),
+                ('ltä', 'N_SYLTÄ'),
+                (None, fail(['N', 10, 'I'], ['lta', 'ltä'])),
+            ],
+            'J': [
+                ('nta', 'N_KUNTA'),
+                ('ntä', 'N_HÄNTÄ'),
+                (None, fail(['N', 10, 'J'], ['nta', 'ntä'])),
+            ],
+            'K': [
+                ('rta', 'N_HORTA'),
+                (None, fail(['N', 10, 'K'], ['rta'])),
+            ],
+            'L': [
+                ('kä', 'N_SELKÄ'),
+                ('ka', 'N_OLKA'),
+                (None, fail(['N', 10, 'L'], ['kä'])),
+            ],
+            ELSE: [
+                (None, fail(['N', 10], [False, 'A-J', 'L'])),
+            ],
+        },
+        11: {
+            False: [
+                ('a', 'N_PROBLEEMA'),
+                ('ä', 'N_KÄPÄLÄ'),
+                (None, fail(['N', 11, False], ['a', 'ä'])),
+            ],
+            ELSE: [
+                (None, fail(['N', 11], [False])),
+            ],
+        },
+        12: {
+            False: [
+                ('a', 'N_MAKKARA'),
+                ('ä', 'N_HÄKKYRÄ'),
+                ('A', 'N_FIFA'),
+                (None, fail(['N', 12, False], ['a', 'ä'])),
+            ],
+            ELSE: [
+                (None, fail(['N', 12], [False])),
+            ],
+        },
+        13: {
+            False: [
+                ('a', 'N_KITARA'),
+                ('ä', 'N_SIIVILÄ'),
+                (None, fail(['N', 13, False], ['a', 'ä'])),
+            ],
+            ELSE: [
+                (None, fail(['N', 13], [False])),
+            ],
+        },
+        14: {
+            'A': [
+                ('kka', 'N_LUSIKKA'),
+                ('kkä', 'N_KÄMMEKKÄ'),
+                (None, fail(['N', 14, 'A'], ['kka', 'kkä'])),
+            ],
+            'B': [
+                ('ppa', 'N_ULAPPA'),
+                (None, fail(['N', 14, 'B'], ['ppä'])),
+            ],
+            'C': [
+                ('tta', 'N_POHATTA'),
+                (None, fail(['N', 14, 'C'], ['tta'])),
+            ],
+            ELSE: [
+                (None, fail(['N', 14], ['A', 'B', 'C'])),
+            ],
+        },
+        15: {
+            False: [
+                ('oa', 'N_PIIROA'),
+                ('ôa', 'N_PIIROA'),
+                ('ea', 'N_SOKEA'),
+                ('eä', 'N_LIPEÄ'),
+                ('ua', 'N_TANHUA'),
+                (None, fail(['N', 15, False], ['oa ôa', 'ea', 'eä', 'ua'])),
+            ],
+            ELSE: [
+                (None, fail(['N', 15], [False])),
+            ],
+        },
+        16: {
+            'H': [
+                (None, 'N_VANHEMPI', BACK),
+                (None, fail(['N', 16, 'H'], ['back'])),
+            ],
+            ELSE: [
+                (None, fail(['N', 16], ['H'])),
+            ],
+        },
+        17: {
+            False: [
+                ('aa', 'N_VAINAA'),
+                ('ee', 'N_TOKEE', BACK),
+                ('ee', 'N_LENTTEE', FRONT),
+                ('ii', 'N_VAANII', BACK),
+                ('ii', 'N_TIHVII', FRONT),
+                ('oo', 'N_TIENOO'),
+                ('uu', 'N_LEIKKUU'),
+                ('yy', 'N_HYÖTYY'),
+                ('ää', 'N_PYHTÄÄ'),
+                ('öö', 'N_YLÖÖ'),
+                (None,
+                 fail(['N', 17, False],
+                      ['aa', 'ee', 'oo', 'uu', 'yy', 'ää', 'öö'])),
+            ],
+            ELSE: [
+                (None, fail(['N', 17], [False])),
+            ],
+        },
+        18: {
+            False: [
+                ('a', 'N_MAA'),
+                ('e', 'N_MATEE', BACK),
+                ('e', 'N_TEE', FRONT),
+                ('i', 'N_HAI', BACK),
+                ('i', 'N_PII', FRONT),
+                ('o', 'N_OOKOO'),
+                ('u', 'N_PUU'),
+                ('y', 'N_PYY'),
+                ('ä', 'N_PÄÄ'),
+                ('ö', 'N_KÖÖ'),
+                (None,
+                 fail(['N', 18, False],
+                      ['a', 'e', 'i', 'o', 'u', 'y', 'ä', 'ö', 'back', 'front'])),
+            ],
+            ELSE: [
+                (None, fail(['N', 18], [False])),
+            ],
+        },
+        19: {
+            False: [
+                ('uo', 'N_VUO'),
+                ('ie', 'N_TIE', FRONT),
+                ('yö', 'N_TYÖ'),
+                (None, fail(['N', 19, False], ['ie', 'uo', 'yö'])),
+            ],
+            ELSE: [
+                (None, fail(['N', 19], [False])),
+            ],
+        },
+        20: {
+            False: [
+                ('aa', 'N_NUGAA'),
+                ('ee', 'N_PATEE', BACK),
+                ('ee', 'N_BIDEE', FRONT),
+                ('EE', 'N_PATEE', BACK),
+                ('EE', 'N_BIDEE', FRONT),
+                ('oo', 'N_TRIKOO'),
+                ('uu', 'N_RAGUU'),
+                ('yy', 'N_FONDYY'),
+                ('öö', 'N_MILJÖÖ'),
+                (None,
+                 fail(['N', 20, False], ['aa', 'ee', 'oo', 'uu', 'yy', 'öö'])),
+            ],
+            ELSE: [
+                (None, fail(['N', 20], [False])),
+            ],
+        },
+        21: {
+            False: [
+                # no pre-defined pronunciation, guess from ending or use
+                # last ortographic vowel
+                ('ae', 'N_REGGAE', NO_STEM_VOWEL),
+                ('ie', 'N_BRASSERIE', NO_STEM_VOWEL, BACK),
+                ('ie', 'N_BRIE', NO_STEM_VOWEL, FRONT),
+                ('ci', 'N_JOCKEY', NO_STEM_VOWEL),
+                (('ay', 'ey'), 'N_GAY', NO_STEM_VOWEL, ('len(lemma)', '<', 5)),
+                (('ay', 'ey'), 'N_JOCKEY', NO_STEM_VOWEL),
+                (('oy', 'uy'), 'N_COWBOY', NO_STEM_VOWEL),
+                ('y', 'N_SPOTIFY', NO_STEM_VOWEL),
+                (None, assign('stem_vowel', 'lemma[-1]'), NO_STEM_VOWEL),
+                (None, 'N_CHACHACHA', ('stem_vowel', 'in', 'aAáàâãăąā')),
+                (None, 'N_ROSÉ', ('stem_vowel', 'in', 'eEéèêėěęē'), BACK),
+                (None, 'N_BÉBÉ', ('stem_vowel', 'in', 'eEéèêëėěęē'), FRONT),
+                (None, 'N_GAY', ('stem_vowel', 'in', 'iIíìîïī'),
+                 ('lemma[-2]', 'in', ('a', 'e')), ('len(lemma)', '<', 5)),
+                (None, 'N_JOCKEY', ('stem_vowel', 'in', 'iIíìîïī'),
+                 ('lemma[-2]', 'in', ('a', 'e'))),
+                (None, 'N_COWBOY', ('stem_vowel', 'in', 'iIíìîïī'),
+                 ('lemma[-2]', 'in', ('o', 'u'))),
+                (None, 'N_SPOTIFY', ('stem_vowel', 'in', 'iIíìîïī'),
+                 ('lemma[-1]', '==', 'y')),
+                (None, 'N_BRASSERIE', ('stem_vowel', 'in', 'iIíìîïī'), BACK),
+                (None, 'N_BRIE', ('stem_vowel', 'in', 'iIíìîïī'), FRONT),
+                (None, 'N_ESQUIMAU', ('stem_vowel', 'in', 'oOóòôõōå')),
+                (None, 'N_KUNGFU', ('stem_vowel', 'in', 'uUúùûū')),
+                (None, 'N_FONDUE', ('stem_vowel', 'in', 'yYýÿüű')),
+                (None, 'N_MALMÖ', ('stem_vowel', 'in', 'öÖøő')),
+                (None,
+                 fail(['N', 21, False], ['gay', 'eéè', 'etc.'],
+                      'unhandled stem type for 21 - using #', new_para='#')),
+            ],
+            ELSE: [
+                (None, fail(['N', 21], [False])),
+            ],
+        },
+        22: {
+            False: [
+                (None, 'N_NOUGAT', ('stem_vowel', '==', 'a')),
+                (None, 'N_PARFAIT', ('stem_vowel', '==', 'e'), BACK),
+                (None, 'N_BEIGNET', ('stem_vowel', '==', 'e'), FRONT),
+                (None, 'N_VERSAILLES', ('stem_vowel', '==', 'i'), BACK),
+                (None, 'N_BEIGNET', ('stem_vowel', '==', 'i'), FRONT),
+                (None, 'N_BORDEAUX', ('stem_vowel', '==', 'o')),
+                (None, 'N_SHOW', ('stem_vowel', '==', 'u')),
+                (None, 'N_CAMUS', ('stem_vowel', '==', 'y')),
+                (None, 'N_MONSIEUR', ('stem_vowel', '==', 'ö')),
+                ('j', 'N_SERGEJ'),
+                ('ah', 'N_NOUGAT'),
+                ('at', 'N_NOUGAT'),
+                ('ait', 'N_PARFAIT'),
+                ('et', 'N_BEIGNET'),
+                ('ot', 'N_BORDEAUX'),
+                ('os', 'N_BORDEAUX'),
+                ('us', 'N_CAMUS'),
+                ('ois', 'N_NOUGAT'),
+                ('ew', 'N_SHOW'),
+                ('ow', 'N_SHOW'),
+                ('ough', 'N_SHOW'),
+                ('oux', 'N_SHOW'),
+                ('aux', 'N_BORDEAUX'),
+                ('eux', 'N_MONSIEUR'),
+                (None,
+                 fail(['N', 22, False], ['ait', 'ow', 'etc.'],
+                      'unhandled stem type for 22 - using #', new_para='#')),
+            ],
+            ELSE: [
+                (None, fail(['N', 22], [False])),
+            ],
+        },
+        23: {
+            False: [
+                (None, 'N_TULI', BACK),
+                (None, 'N_SYLI', FRONT),
+                (None, fail(['N', 23, False], ['back', 'front'])),
+            ],
+            ELSE: [
+                (None, fail(['N', 23], [False])),
+            ],
+        },
+        25: {
+            False: [
+                (None, 'N_TAIMI', BACK),
+                (None, 'N_LIEMI', FRONT),
+                (None, fail(['N', 25, False], ['back', 'front'])),
+            ],
+            ELSE: [
+                (None, fail(['N', 25], [False])),
+            ],
+        },
+        24: {
+            False: [
+                (None, 'N_RUUHI', BACK),
+                ('meri', 'N_MERI', FRONT),
+                ('veri', 'N_VERI', FRONT),
+                (None, 'N_HIIRI', FRONT),
+                (None, fail(['N', 24, 26, False], ['back', 'front'])),
+            ],
+            ELSE: [
+                (None, fail(['N', 24, 26], [False])),
+            ],
+        },
+        26: {
+            False: [
+                (None, 'N_RUUHI', BACK),
+                ('meri', 'N_MERI', FRONT),
+                ('veri', 'N_VERI', FRONT),
+                (None, 'N_HIIRI', FRONT),
+                (None, fail(['N', 24, 26, False], ['back', 'front'])),
+            ],
+            ELSE: [
+                (None, fail(['N', 24, 26], [False])),
+            ],
+        },
+        27: {
+            False: [
+                ('si', 'N_KAUSI', BACK),
+                ('si', 'N_KÖYSI', FRONT),
+                ('si', fail(['N', 27, False, 'si'], ['back', 'front'])),
+                ('s', 'N_KUUS', BACK),
+                ('s', 'N_VIIS', FRONT),
+                ('s', fail(['N', 27, False, 's'], ['back', 'front'])),
+                (None, fail(['N', 27, False], ['si', 's'])),
+            ],
+            'F': [
+                ('si', 'N_KAUSI', BACK),
+                ('si', 'N_KÖYSI', FRONT),
+                ('si', fail(['N', 27, 'F', 'si'], ['back', 'front'])),
+            ],
+            ELSE: [
+                (None, fail(['N', 27], [False])),
+            ],
+        },
+        28: {
+            False: [
+                ('nsi', 'N_PONSI', BACK),
+                ('nsi', 'N_LÄNSI', FRONT),
+                ('nsi', fail(['N', 28, 'F', 'nsi'], ['back', 'front'])),
+                ('rsi', 'N_VARSI', BACK),
+                ('rsi', 'N_VIRSI', FRONT),
+                ('rsi', fail(['N', 28, 'F', 'rsi'], ['back', 'front'])),
+                ('lsi', 'N_JÄLSI', FRONT),
+                ('lsi', fail(['N', 28, 'F', 'lsi'], ['front'])),
+                (None, fail(['N', 28, False], ['nsi', 'rsi', 'lsi'])),
+            ],
+            'I': [
+                ('lsi', 'N_JÄLSI', FRONT),
+                ('lsi', fail(['N', 28, 'I', 'lsi'], ['front'])),
+                (None, fail(['N', 28, 'I'], ['lsi'])),
+            ],
+            'J': [
+                ('nsi', 'N_PONSI', BACK),
+                ('nsi', 'N_LÄNSI', FRONT),
+                ('nsi', fail(['N', 28, 'J', 'nsi'], ['back', 'front'])),
+                (None, fail(['N', 28, 'J'], ['nsi'])),
+            ],
+            'K': [
+                ('rsi', 'N_VARSI', BACK),
+                ('rsi', 'N_VIRSI', FRONT),
+                ('rsi', fail(['N', 28, 'K', 'rsi'], ['back', 'front'])),
+                (None, fail(['N', 28, 'K'], ['rsi'])),
+            ],
+            ELSE: [
+                (None, fail(['N', 28], [False, 'J', 'K', 'I'])),
+            ],
+        },
+        32: {
+            False: [
+                (None, 'N_JOUTSEN', BACK),
+                (None, 'N_SIEMEN', FRONT),
+                (None, fail(['N', 32, False], ['back', 'front'])),
+            ],
+            'D': [
+                (None, 'N_IEN', FRONT),
+                (None, fail(['N', 32, 'D'], ['back', 'front'])),
+            ],
+            'C': [
+                (None, 'N_AJATAR', BACK),
+                (None, 'N_TYTÄR', FRONT),
+                (None, fail(['N', 32, 'C'], ['back', 'front'])),
+            ],
+            ELSE: [
+                (None, fail(['N', 32], [False, 'C', 'D'])),
+            ],
+        },
+        29: {
+            False: [
+                ('psi', 'N_LAPSI', BACK),
+                ('psi', fail(['N', 29, False, 'psi'], ['back'])),
+                ('ksi', 'N_UKSI', BACK),
+                ('ksi', fail(['N', 29, False, 'ksi'], ['back'])),
+                (None, fail(['N', 29, False], ['psi'])),
+            ],
+            ELSE: [
+                (None, fail(['N', 29], [False])),
+            ],
+        },
+        33: {
+            False: [
+                (None, 'N_PUHELIN', BACK),
+                (None, 'N_ELIN', FRONT),
+                (None, fail(['N', 33, False], ['back', 'front'])),
+            ],
+            'A': [
+                ('kin', 'N_HÄRKIN', FRONT),
+                (None, fail(['N', 33, 'A'], ['kin', 'front'])),
+            ],
+            'D': [
+                ('in', 'N_PUIN', BACK),
+                ('in', 'N_PYYHIN', FRONT),
+                (None, fail(['N', 33, 'D'], ['in', 'back', 'front'])),
+            ],
+            'C': [
+                ('tin', 'N_SUODATIN', BACK),
+                ('tin', 'N_HEITIN', FRONT),
+                (None, fail(['N', 33, 'C'], ['tin', 'back', 'front'])),
+            ],
+            'E': [
+                ('vin', 'N_RAAVIN', BACK),
+                ('vin', 'N_SÄRVIN', FRONT),
+                (None, fail(['N', 33, 'E'], ['vin', 'back', 'front'])),
+            ],
+            'F': [
+                ('din', 'N_VAADIN', BACK),
+                ('din', 'N_SÄÄDIN', FRONT),
+                ('don', 'N_JÄRVITAHDON'),
+                ('dun', 'N_LAIDUN'),
+                (None, fail(['N', 33, 'F'], ['din', 'dun', 'back', 'front'])),
+            ],
+            'I': [
+                ('llin', 'N_ASKELLIN', BACK),
+                ('llin', 'N_SIVELLIN', FRONT),
+                (None, fail(['N', 33, 'I'], ['llin', 'back', 'front'])),
+            ],
+            'J': [
+                ('nnin', 'N_MUUNNIN', BACK),
+                ('in', 'N_KÄÄNNIN', FRONT),
+                (None, fail(['N', 33, 'J'], ['nnin', 'back', 'front'])),
+            ],
+            'K': [
+                ('rrin', 'N_KIHARRIN', BACK),
+                ('rrin', 'N_KIERRIN', FRONT),
+                ('rroin', 'N_KERROIN'),
+                (None,
+                 fail(['N', 33, 'K'], ['rrin', 'rroin', 'back', 'front'])),
+            ],
+            'L': [
+                ('jin', 'N_POLJIN', BACK),
+                ('jin', 'N_NYLJIN', FRONT),
+                (None, fail(['N', 33, 'J'], ['jin', 'back', 'front'])),
+            ],
+            ELSE: [
+                (None, fail(['N', 33], [False, 'A', 'C-F', 'I-L'])),
+            ],
+        },
+        30: {
+            False: [
+                ('tsi', 'N_VEITSI', FRONT),
+                ('tsi', fail(['N', 30, False, 'tsi'], ['front'])),
+                (None, fail(['N', 30, False], ['tsi'])),
+            ],
+            ELSE: [
+                (None, fail(['N', 30], [False])),
+            ],
+        },
+        34: {
+            'B': [
+                ('pan', 'N_HAPAN'),
+                (None, fail(['N', 34, 'B'], ['pan'])),
+            ],
+            'C': [
+                ('ton', 'N_OSATON'),
+                ('tön', 'N_NIMETÖN'),
+                ('toin', 'N_KALATOIN'),
+                ('töin', 'N_NIMETÖIN'),
+                (None, fail(['N', 34, 'C'], ['ton', 'tön', 'toin', 'töin'])),
+            ],
+            ELSE: [
+                (None, fail(['N', 34], [False, 'C'])),
+            ],
+        },
+        31: {
+            False: [
+                ('ksi', 'N_HAAKSI', BACK),
+                ('ksi', 'N_AAMUYKSI', FRONT),
+                ('ksi', fail(['N', 31, False, 'ksi'], ['back', 'front'])),
+                (None, fail(['N', 31, False], ['ksi'])),
+            ],
+            ELSE: [
+                (None, fail(['N', 31], [False])),
+            ],
+        },
+        38: {
+            False: [
+                (None, 'N_AAKKOSTAMINEN', BACK),
+                (None, 'N_KYLKIÄINEN', FRONT),
+                (None, fail(['N', 38, False], ['front', 'back'])),
+            ],
+            ELSE: [
+                (None, fail(['N', 38], [False], 'cannot have gradation')),
+            ],
+        },
+        39: {
+            False: [
+                (None, 'N_VAKUUTUS', BACK),
+                (None, 'N_RÄJÄYTYS', FRONT),
+                (None, fail(['N', 39, False], ['front', 'back'])),
+            ],
+            ELSE: [
+                (None, fail(['N', 39], [False], 'cannot have gradation')),
+            ],
+        },
+        40: {
+            False: [
+                ('at', 'N_TOULAT'),
+                (None, 'N_AAKKOSELLISUUS', BACK),
+                (None, 'N_KÖYHYYS', FRONT),
+                (None, fail(['N', 38, False], ['front', 'back'])),
+            ],
+            ELSE: [
+                (None, fail(['N', 38], [False], 'cannot have gradation')),
+            ],
+        },
+        41: {
+            False: [
+                ('as', 'N_PATSAS'),
+                ('es', 'N_ARISTOTELES', BACK),
+                ('es', 'N_KIRVES', FRONT),
+                ('is', 'N_RUUMIS', BACK),
+                ('is', 'N_DIMITRIS', FRONT),
+                ('os', 'N_UROS'),
+                ('äs', 'N_ÄYRÄS'),
+                (None,
+                 fail(['N', 41, False],
+                      ['as', 'es', 'is', 'os', 'äs', 'front', 'back'])),
+            ],
+            'A': [
+                ('kas', 'N_ASUKAS'),
+                ('käs', 'N_KÄRSÄKÄS'),
+                (None, fail(['N', 41, 'A'], ['kas', 'käs'])),
+            ],
+            'B': [
+                ('pas', 'N_SAAPAS'),
+                ('päs', 'N_RYPÄS'),
+                (None, fail(['N', 41, 'B'], ['pas', 'päs'])),
+            ],
+            'D': [
+                ('as', 'N_VARAS'),
+                ('es', 'N_IES', FRONT),
+                ('is', 'N_RUIS', BACK),
+                (None,
+                 fail(['N', 41, 'D'], ['as', 'es', 'is', 'front', 'back'])),
+            ],
+            'C': [
+                ('tas', 'N_RATAS'),
+                ('tes', 'N_KORTES', BACK),
+                ('tis', 'N_ALTIS', BACK),
+                ('tis', 'N_KELTIS', FRONT),
+                ('täs', 'N_MÄTÄS'),
+                ('tus', 'N_VANTUS'),
+                (None,
+                 fail(['N', 41, 'C'], ['tas', 'tis', 'tus', 'täs', 'front'])),
+            ],
+            'E': [
+                ('vas', 'N_VARVAS'),
+                ('väs', 'N_SEIVÄS'),
+                (None, fail(['N', 41, 'E'], ['vas', 'väs'])),
+            ],
+            'F': [
+                ('das', 'N_TEHDAS'),
+                ('des', 'N_LUODES', BACK),
+                ('des', 'N_LÄHDES', FRONT),
+                (None, fail(['N', 41, 'F'], ['das', 'des'])),
+            ],
+            'G': [
+                ('ngas', 'N_KANGAS'),
+                ('ngäs', 'N_KÖNGÄS'),
+                (None, fail(['N', 41, 'G'], ['gas', 'gäs'])),
+            ],
+            'H': [
+                ('mmas', 'N_HAMMAS'),
+                (None, fail(['N', 41, 'H'], ['mmas'])),
+            ],
+            'I': [
+                ('llas', 'N_ALLAS'),
+                (None, fail(['N', 41, 'I'], ['llas', 'lles', 'back'])),
+            ],
+            'J': [
+                ('nnas', 'N_KINNAS'),
+                ('nnäs', 'N_RYNNÄS'),
+                (None, fail(['N', 41, 'J'], ['nnas', 'nnäs'])),
+            ],
+            'K': [
+                ('ras', 'N_PORRAS'),
+                (None, fail(['N', 41, 'K'], ['rras'])),
+            ],
+            ELSE: [
+                (None, fail(['N', 41], [False, 'A-K'])),
+            ],
+        },
+        35: {
+            'H': [
+                (None, 'N_LÄMMIN', FRONT),
+                (None, fail(['N', 35, False], ['back', 'front'])),
+            ],
+            ELSE: [
+                (None, fail(['N', 35], ['H'])),
+            ],
+        },
+        42: {
+            False: [
+                (('mies', 'Mies'), 'N_MIES'),
+                (None, fail(['N', 42, False], ['mies'])),
+            ],
+            ELSE: [
+                (None, fail(['N', 42], [False], 'cannot gradate')),
+            ],
+        },
+        36: {
+            False: [
+                (None, 'N_KYLÄNVANHIN', BACK),
+                (None, 'N_LÄHIN', FRONT),
+                (None, fail(['N', 36, 'J'], ['jin', 'back'])),
+            ],
+            ELSE: [
+                (None, fail(['N', 36], [False], 'cannot have gradation')),
+            ],
+        },
+        43: {
+            False: [
+                ('ut', 'N_OLUT'),
+                ('yt', 'N_NEITSYT'),
+                (None, fail(['N', 43, False], ['ut', 'yt'])),
+            ],
+            'D': [
+                ('ut', 'N_POIUT'),
+                (None, fail(['N', 43, 'D'], ['ut'])),
+            ],
+            'H': [
+                ('mmyt', 'N_IMMYT'),
+                (None, fail(['N', 43, 'H'], ['mmyt'])),
+            ],
+            ELSE: [
+                (None, fail(['N', 43], [False, 'H'])),
+            ],
+        },
+        37: {
+            False: [
+                ('vasen', 'N_VASEN'),
+                (None, fail(['N', 37, False], ['vasen'])),
+            ],
+            ELSE: [
+                (None, fail(['N', 37], [False], 'cannot have gradation')),
+            ],
+        },
+        47: {
+            False: [
+                ('ut', 'N_AIVOKUOLLUT'),
+                ('yt', 'N_SIVISTYNYT'),
+                (None, fail(['N', 47, False], ['yt'])),
+            ],
+            ELSE: [
+                (None, fail(['N', 47], [False], 'cannot gradate')),
+            ],
+        },
+        48: {
+            False: [
+                ('e', 'N_ASTE', BACK),
+                ('e', 'N_PISTE', FRONT),
+                ('e', fail(['N', 48, False], ['front', 'back'])),
+                ('i', 'N_ORI', BACK),
+                ('i', fail(['N', 48, False, 'i'], ['back'])),
+                ('u', 'N_KIIRU'),
+                (None, fail(['N', 48], ['e', 'i', 'u'])),
+            ],
+            'A': [
+                ('ke', 'N_KASTIKE', BACK),
+                ('ke', 'N_LÄÄKE', FRONT),
+                ('e', fail(['N', 48, 'A'], ['ke', 'front', 'back'])),
+                ('i', fail(['N', 48, 'i'], [False])),
+                ('u', fail(['N', 48, 'u'], [False])),
+                (None, fail(['N', 48], ['e', 'i', 'u'])),
+            ],
+            'B': [
+                ('pe', 'N_APE', BACK),
+                ('pe', 'N_RIPE', FRONT),
+                ('e', fail(['N', 48, 'B'], ['pe', 'front', 'back'])),
+                ('i', fail(['N', 48, 'i'], [False])),
+                ('u', fail(['N', 48, 'u'], [False])),
+                (None, fail(['N', 48], ['e', 'i', 'u'])),
+            ],
+            'D': [
+                ('e', 'N_KOE', BACK),
+                ('e', 'N_PYYHE', FRONT),
+                ('e', fail(['N', 48, 'D'], ['e', 'front', 'back'])),
+                ('i', fail(['N', 48, 'i'], [False])),
+                ('u', fail(['N', 48, 'u'], [False])),
+                (None, fail(['N', 48], ['e', 'i', 'u'])),
+            ],
+            'C': [
+                ('te', 'N_OSOITE', BACK),
+                ('te', 'N_KÄSITE', FRONT),
+                ('e', fail(['N', 48, 'C'], ['te', 'front', 'back'])),
+                ('i', fail(['N', 48, 'i'], [False])),
+                ('u', fail(['N', 48, 'u'], [False])),
+                (None, fail(['N', 48], ['e', 'i', 'u'])),
+            ],
+            'E': [
+                ('ve', 'N_TARVE', BACK),
+                ('ve', 'N_VIIVE', FRONT),
+                ('e', fail(['N', 48, 'E'], ['ve', 'front', 'back'])),
+                ('i', fail(['N', 48, 'i'], [False])),
+                ('u', fail(['N', 48, 'u'], [False])),
+                (None, fail(['N', 48], ['e', 'i', 'u'])),
+            ],
+            'F': [
+                ('de', 'N_LUODE', BACK),
+                ('de', 'N_KIDE', FRONT),
+                ('e', fail(['N', 48, 'F'], ['de', 'front', 'back'])),
+                ('i', fail(['N', 48, 'i'], [False])),
+                ('u', fail(['N', 48, 'u'], [False])),
+                (None, fail(['N', 48], ['e', 'i', 'u'])),
+            ],
+            'G': [
+                ('ge', 'N_MIELENGE', FRONT),
+                ('e', fail(['N', 48, 'F'], ['ge', 'front'])),
+                ('i', fail(['N', 48, 'i'], [False])),
+                ('u', fail(['N', 48, 'u'], [False])),
+                (None, fail(['N', 48], ['e', 'i', 'u'])),
+            ],
+            'H': [
+                ('mme', 'N_LUMME', BACK),
+                ('e', fail(['N', 48, 'H'], ['mme', 'back'])),
+                ('i', fail(['N', 48, 'i'], [False])),
+                ('u', fail(['N', 48, 'u'], [False])),
+                (None, fail(['N', 48], ['e', 'i', 'u'])),
+            ],
+            'I': [
+                ('lle', 'N_VUOLLE', BACK),
+                ('lle', 'N_MIELLE', FRONT),
+                ('e', fail(['N', 48, 'I'], ['lle', 'front', 'back'])),
+                ('i', fail(['N', 48, 'i'], [False])),
+                ('u', fail(['N', 48, 'u'], [False])),
+                (None, fail(['N', 48], ['e', 'i', 'u'])),
+            ],
+            'J': [
+                ('nne', 'N_RAKENNE', BACK),
+                ('nne', 'N_KIINNE', FRONT),
+                ('e', fail(['N', 48, 'J'], ['nne', 'front', 'back'])),
+                ('i', fail(['N', 48, 'i'], [False])),
+                ('u', fail(['N', 48, 'u'], [False])),
+                (None, fail(['N', 48], ['e', 'i', 'u'])),
+            ],
+            'K': [
+                ('rre', 'N_AARRE', BACK),
+                ('rre', 'N_KIERRE', FRONT),
+                ('e', fail(['N', 48, 'K'], ['rre', 'front', 'back'])),
+                ('i', fail(['N', 48, 'i'], [False])),
+                ('u', fail(['N', 48, 'u'], [False])),
+                (None, fail(['N', 48], ['e', 'i', 'u'])),
+            ],
+            'L': [
+                ('je', 'N_POHJE', BACK),
+                ('je', 'N_HYLJE', FRONT),
+                ('e', fail(['N', 48, 'L'], ['je', 'front', 'back'])),
+                ('i', fail(['N', 48, 'i'], [False])),
+                ('u', fail(['N', 48, 'u'], [False])),
+                (None, fail(['N', 48], ['e', 'i', 'u'])),
+            ],
+            ELSE: [
+                ('e', fail(['N', 48], [False, 'A-L'])),
+                ('i', fail(['N', 48, 'i'], [False])),
+                ('u', fail(['N', 48, 'u'], [False])),
+                (None, fail(['N', 48], ['e', 'i', 'u'])),
+            ],
+        },
+        49: {
+            False: [
+                ('al', 'N_ASKAR'),
+                ('ar', 'N_ASKAR'),
+                ('en', 'N_ASKAR', BACK),
+                ('el', 'N_ASKAR', BACK),
+                ('el', 'N_KYYNEL', FRONT),
+                ('e', 'N_ASTE', BACK),
+                ('e', 'N_PISTE', FRONT),
+                (None,
+                 fail(['N', 49, False],
+                      ['al ar', 'el en', 'e', 'front', 'back'])),
+            ],
+            'D': [
+                ('en', 'N_SÄEN', FRONT),
+                (None, fail(['N', 49, 'D'], ['en', 'front'])),
+            ],
+            'E': [
+                ('val', 'N_TAIVAL'),
+                (None, fail(['N', 49, 'E'], ['al', 'front'])),
+            ],
+            'F': [
+                ('dar', 'N_UDAR'),
+                (None, fail(['N', 49, 'F'], ['dar'])),
+            ],
+            'G': [
+                ('nger', 'N_PENGER', FRONT),
+                (None, fail(['N', 49, 'G'], ['ger', 'front'])),
+            ],
+            'H': [
+                ('mmel', 'N_OMMEL', BACK),
+                ('mmel', 'N_VEMMEL', FRONT),
+                ('mmol', 'N_LOMMOL'),
+                (None,
+                 fail(['N', 49, 'H'], ['mmel', 'mmol', 'front', 'back'])),
+            ],
+            'J': [
+                ('nnar', 'N_PIENNAR'),
+                ('nnel', 'N_KANNEL', BACK),
+                ('nner', 'N_MANNER', BACK),
+                ('nner', 'N_KINNER', FRONT),
+                (None,
+                 fail(['N', 49, 'J'], ['nnar', 'nnel', 'nner', 'front'])),
+            ],
+            'T': [
+                ('auer', 'N_AUER'),
+                (None, fail(['N', 49, 'T'], ['auer'])),
+            ],
+            ELSE: [
+                (None, fail(['N', 49], [False, 'D-H', 'J', 'T'])),
+            ],
+        },
+        1007: {
+            False: [
+                (('veli', 'Veli'), 'N_VELI'),
+                (None,
+                 fail(['N', 7, False, 'VELI'], ['veli'], 'must be veli')),
+            ],
+            ELSE: [
+                (None, fail(['N', 7, 'VELI'], [False], 'Cannot gradate')),
+            ],
+        },
+        1010: {
+            False: [
+                ('poika', fail(['poika'], ['D'], fatal=True)),
+                (None,
+                 fail(['N', 10, 'D', 'POIKA'], ['poika'], 'must be poika')),
+            ],
+            'D': [
+                (('poika', 'Poika'), 'N_POIKA'),
+                (None,
+                 fail(['N', 10, 'D', 'POIKA'], ['poika'], 'must be poika')),
+            ],
+            ELSE: [
+                (None, fail(['N', 10, 'POIKA'], ['D'], 'must be D')),
+            ],
+        },
+        44: {
+            False: [
+                ('ät', 'N_KEVÄT'),
+                ('et', 'N_KAARET', BACK),
+                ('et', 'N_HÄMET', FRONT),
+                (None, fail(['N', 44, False], ['ät', 'et'])),
+            ],
+            'D': [
+                ('et', 'N_LOUET', BACK),
+                (None, fail(['N', 44, 'D'], ['et'])),
+            ],
+            'C': [
+                ('tet', 'N_KORTET', BACK),
+                (None, fail(['N', 44, 'C'], ['tet'])),
+            ],
+            'F': [
+                ('det', 'N_AHDET', BACK),
+                ('det', 'N_LÄHDET', FRONT),
+                (None, fail(['N', 44, 'F'], ['det'])),
+            ],
+            'G': [
+                ('get', 'N_INGET', FRONT),
+                (None, fail(['N', 44, 'F'], ['det'])),
+            ],
+            'I': [
+                ('llet', 'N_VUOLLET', BACK),
+                (None, fail(['N', 44, 'I'], ['llet'])),
+            ],
+            'J': [
+                ('nnet', 'N_LANNET', BACK),
+                ('nnet', 'N_RINNET', FRONT),
+                (None, fail(['N', 44, 'J'], ['nnet'])),
+            ],
+            'K': [
+                ('rret', 'N_KAARRET', BACK),
+                ('rret', 'N_VIIRRET', FRONT),
+                (None, fail(['N', 44, 'K'], ['rret'])),
+            ],
+            ELSE: [
+                (None,
+                 fail(['N', 44], [False, 'C', 'D', 'F', 'G', 'I', 'J', 'K'])),
+            ],
+        },
+        45: {
+            False: [
+                ('s', 'N_TUHANNES'),
+                (None, fail(['N', 45, False], ['s'])),
+            ],
+            ELSE: [
+                (None, fail(['N', 45], [False], 'cannot gradate')),
+            ],
+        },
+        46: {
+            False: [
+                ('tuhat', 'N_VUOSITUHAT'),
+                (None, fail(['N', 46, False], ['tuhat'])),
+            ],
+            ELSE: [
+                (None, fail(['N', 46], [False], 'cannot gradate')),
+            ],
+        },
+        1009: {
+            False: [
+                (('aika', 'Aika'), fail(['aika'], ['D'], fatal=True)),
+                (None, fail(['N', 9, 'D', 'AIKA'], ['aika'], 'must be aika')),
+            ],
+            'D': [
+                (('aika', 'Aika'), 'N_AIKA'),
+                (None, fail(['N', 9, 'D', 'AIKA'], ['aika'], 'must be aika')),
+            ],
+            'L': [
+                ('aika', fail(['aika'], ['D'], new_para='N_AIKA', fatal=True)),
+                (None, fail(['N', 9, 'D', 'AIKA'], ['aika'], 'must be aika')),
+            ],
+            ELSE: [
+                (None, fail(['N', 9, 'AIKA'], ['D'], 'must be D')),
+            ],
+        },
+        1024: {
+            False: [
+                (('meri', 'Meri'), 'N_MERI'),
+                (None,
+                 fail(['N', 24, False, 'MERI'], ['meri'], 'must be meri')),
+            ],
+            ELSE: [
+                (None, fail(['N', 24, 'MERI'], [False], 'must be 0')),
+            ],
+        },
+        1026: {
+            False: [
+                (('veri', 'Veri'), 'N_VERI'),
+                (None,
+                 fail(['N', 24, 'False', 'VERI'], ['veri'], 'must be veri')),
+            ],
+            ELSE: [
+                (None, fail(['N', 26, 'VERI'], [False], 'must be 0')),
+            ],
+        },
+        99: {
+            ELSE: [
+                (None,
+                 fail(['N', 99], [99],
+                      'Illegal class for N, 99 can only apply to P (and PropN)',
+                      new_para='#'), ('is_proper', 'bool', False)),
+                (None, 'N_VAASAN', ('is_proper', 'bool', True)),
+                (None, fail(['N'], ['1-49', '99', '1007-1026'])),
+            ],
+        },
+        ELSE: {
+            ELSE: [
+                (None, fail(['N'], ['1-49', '99', '1007-1026'])),
+            ],
+        },
+    },
+    ELSE: {
+        1: {
+            False: [
+                NOT_PLURALE_LEMMA,
+                ('ot', 'N_AIVOT'),
+                ('yt', 'N_PÖKSYT'),
+                ('ut', 'N_HOUSUT'),
+                ('öt', 'N_PÖLLÖT'),
+                (None, fail(['N', 1, False, 'PLT'], ['ot', 'ut', 'yt'])),
+            ],
+            'A': [
+                NOT_PLURALE_LEMMA,
+                ('ot', 'N_JOUKOT'),
+                ('ut', 'N_FARKUT'),
+                ('yt', 'N_JYLKYT'),
+                (None, fail(['N', 1, 'A', 'PLT'], ['kot', 'kut', 'kyt'])),
+            ],
+            'B': [
+                NOT_PLURALE_LEMMA,
+                ('put', 'N_RAPUT'),
+                ('pot', 'N_PEIPOT'),
+                (None, fail(['N', 1, 'B', 'PLT'], ['put'])),
+            ],
+            'D': [
+                NOT_PLURALE_LEMMA,
+                ('ot', 'N_JOUKOT'),
+                ('ut', 'N_FARKUT'),
+                ('yt', 'N_JYLKYT'),
+                (None, fail(['N', 1, 'A', 'PLT'], ['kot', 'kut', 'kyt'])),
+            ],
+            'C': [
+                NOT_PLURALE_LEMMA,
+                ('tyt', 'N_NIITYT'),
+                ('tut', 'N_NIITUT'),
+                ('tot', 'N_ROITOT'),
+                ('töt', 'N_TYTÖT'),
+                (None, fail(['N', 1, 'C', 'PLT'], ['tyt', 'tut', 'töt'])),
+            ],
+            'E': [
+                NOT_PLURALE_LEMMA,
+                ('vut', 'N_RAVUT'),
+                ('vot', 'N_KOUVOT'),
+                (None, fail(['N', 1, 'E', 'PLT'], ['vut'])),
+            ],
+            'F': [
+                NOT_PLURALE_LEMMA,
+                ('dot', 'N_PIDOT'),
+                ('dyt', 'N_KÄÄDYT'),
+                ('döt', 'N_KYDÖT'),
+                (None, fail(['N', 1, 'F', 'PLT'], ['dot', 'dyt'])),
+            ],
+            'G': [
+                NOT_PLURALE_LEMMA,
+                ('got', 'N_LINGOT'),
+                (None, fail(['N', 1, 'F', 'PLT'], ['dot', 'dyt'])),
+            ],
+            'H': [
+                NOT_PLURALE_LEMMA,
+                ('mmut', 'N_KUMMUT'),
+                (None, fail(['N', 1, 'H', 'PLT'], ['mmut'])),
+            ],
+            'I': [
+                NOT_PLURALE_LEMMA,
+                ('llot', 'N_AALLOT'),
+                (None, fail(['N', 1, 'I', 'PLT'], ['llot'])),
+            ],
+            'J': [
+                NOT_PLURALE_LEMMA,
+                ('nnot', 'N_OPINNOT'),
+                ('nnyt', 'N_MÄNNYT'),
+                ('nnöt', 'N_SÄÄNNÖT'),
+                (None, fail(['N', 1, 'J', 'PLT'], ['nnot', 'nnöt'])),
+            ],
+            'K': [
+                NOT_PLURALE_LEMMA,
+                ('rrot', 'N_KAARROT'),
+                (None, fail(['N', 1, 'K', 'PLT'], ['rrot'])),
+            ],
+            ELSE: [
+                NOT_PLURALE_LEMMA,
+                (None, fail(['N', 1, 'PLT'], [False, 'A-F', 'I', 'J'])),
+            ],
+        },
+        2: {
+            False: [
+                NOT_PLURALE_LEMMA,
+                ('ot', 'N_PIPPALOT'),
+                ('ut', 'N_NEUVOTTELUT'),
+                ('öt', 'N_JÄRJESTÖT'),
+                (None, fail(['N', 2, False, 'PLT'], ['ot', 'ut', 'öt'])),
+            ],
+            ELSE: [
+                NOT_PLURALE_LEMMA,
+                (None, fail(['N', 2, 'PLT'], [False])),
+            ],
+        },
+        3: {
+            False: [
+                NOT_PLURALE_LEMMA,
+                ('ot', 'N_RAUNIOT'),
+                ('öt', 'N_YHTIÖT'),
+                (None, fail(['N', 3, False, 'PLT'], ['ot', 'öt'])),
+            ],
+            ELSE: [
+                NOT_PLURALE_LEMMA,
+                (None, fail(['N', 3, 'PLT'], [False])),
+            ],
+        },
+        4: {
+            'A': [
+                NOT_PLURALE_LEMMA,
+                ('öt', 'N_TÖLPÄKÖT'),
+                ('ot', 'N_LUOLIKOT'),
+                (None, fail(['N', 4, 'A', 'PLT'], ['ot'])),
+            ],
+            ELSE: [
+                NOT_PLURALE_LEMMA,
+                (None, fail(['N', 4, 'PLT'], [False])),
+            ],
+        },
+        5: {
+            False: [
+                NOT_PLURALE_LEMMA,
+                ('it', 'N_LASIT', BACK),
+                ('it', 'N_LIIVIT', FRONT),
+                (None, fail(['N', 5, False, 'PLT'], ['it', 'back'])),
+            ],
+            'A': [
+                NOT_PLURALE_LEMMA,
+                ('kit', 'N_PANKIT', BACK),
+                ('kit', 'N_FÄNRIKIT', FRONT),
+                (None, fail(['N', 5, 'A', 'PLT'], ['kit', 'back'])),
+            ],
+            'B': [
+                NOT_PLURALE_LEMMA,
+                ('pit', 'N_KLUMPIT', BACK),
+                (None, fail(['N', 5, 'C', 'PLT'], ['pit', 'back'])),
+            ],
+            'C': [
+                NOT_PLURALE_LEMMA,
+                ('tit', 'N_KASTANJETIT', BACK),
+                ('tit', 'N_PINSETIT', FRONT),
+                (None, fail(['N', 5, 'C', 'PLT'], ['tit', 'back'])),
+            ],
+            'F': [
+                NOT_PLURALE_LEMMA,
+                ('dit', 'N_TAUDIT', BACK),
+                ('dit', 'N_PIHDIT', FRONT),
+                (None, fail(['N', 5, 'F', 'PLT'], ['dit'])),
+            ],
+            'G': [
+                NOT_PLURALE_LEMMA,
+                ('ngit', 'N_TONGIT', BACK),
+                ('ngit', 'N_SYÖMINGIT', FRONT),
+                (None, fail(['N', 5, 'G', 'PLT'], ['ngit', 'back'])),
+            ],
+            'H': [
+                NOT_PLURALE_LEMMA,
+                ('mmit', 'N_LAMMIT', BACK),
+                ('mmit', 'N_RIMMIT', FRONT),
+                (None, fail(['N', 5, 'H', 'PLT'], ['mmit', 'back'])),
+            ],
+            'J': [
+                NOT_PLURALE_LEMMA,
+                ('nnit', 'N_TUNNIT', BACK),
+                (None, fail(['N', 5, 'J', 'PLT'], ['nnit', 'back'])),
+            ],
+            ELSE: [
+                NOT_PLURALE_LEMMA,
+                (None, fail(['N', 5, 'PLT'], [False, 'C', 'F', 'G', 'J'])),
+            ],
+        },
+        6: {
+            False: [
+                NOT_PLURALE_LEMMA,
+                (None, 'N_FARMARIT', BACK),
+                (None, 'N_BIKINIT', FRONT),
+                (None, fail(['N', 6, False, 'PLT'], ['back'])),
+            ],
+            ELSE: [
+                NOT_PLURALE_LEMMA,
+                (None, fail(['N', 6, 'PLT'], [False])),
+            ],
+        },
+        7: {
+            False: [
+                NOT_PLURALE_LEMMA,
+                (None, 'N_SAKSET', BACK),
+                (None, 'N_RIPSET', FRONT),
+                (None, fail(['N', 7, False, 'PLT'], ['front', 'back'])),
+            ],
+            'D': [
+                NOT_PLURALE_LEMMA,
+                (None, 'N_LAET', BACK),
+                (None, 'N_MÄET', FRONT),
+                (None, fail(['N', 7, 'D', 'PLT'], ['front'])),
+            ],
+            'E': [
+                NOT_PLURALE_LEMMA,
+                (None, 'N_KORVET', BACK),
+                (None, 'N_RIIVET', FRONT),
+                (None, fail(['N', 7, 'E', 'PLT'], ['front'])),
+            ],
+            'F': [
+                NOT_PLURALE_LEMMA,
+                (None, 'N_LAHDET', BACK),
+                (None, 'N_LEHDET', FRONT),
+                (None, fail(['N', 7, 'F', 'PLT'], ['front'])),
+            ],
+            'G': [
+                NOT_PLURALE_LEMMA,
+                (None, 'N_LÄNGET', FRONT),
+                (None, fail(['N', 7, 'G', 'PLT'], ['front'])),
+            ],
+            'H': [
+                NOT_PLURALE_LEMMA,
+                (None, 'N_LAMMET', BACK),
+                (None, fail(['N', 7, 'H', 'PLT'], ['front'])),
+            ],
+            'J': [
+                NOT_PLURALE_LEMMA,
+                (None, 'N_ONNET', BACK),
+                (None, fail(['N', 7, 'J', 'PLT'], ['front'])),
+            ],
+            'L': [
+                NOT_PLURALE_LEMMA,
+                (None, 'N_KÄRJET', FRONT),
+                (None, fail(['N', 7, 'L', 'PLT'], ['front'])),
+            ],
+            ELSE: [
+                NOT_PLURALE_LEMMA,
+                (None,
+                 fail(['N', 7, 'PLT'], [False, 'F', 'G', 'H', 'J', 'L'])),
+            ],
+        },
+        8: {
+            False: [
+                NOT_PLURALE_LEMMA,
+                (None, 'N_RAVET', BACK),
+                (None, 'N_BÄNET', FRONT),
+                (None, fail(['N', 8, False, 'PLT'], ['back'])),
+            ],
+            ELSE: [
+                NOT_PLURALE_LEMMA,
+                (None, fail(['N', 8, 'PLT'], [False])),
+            ],
+        },
+        9: {
+            False: [
+                NOT_PLURALE_LEMMA,
+                ('at', 'N_VARAT'),
+                (None, fail(['N', 9, False, 'PLT'], ['at'])),
+            ],
+            'A': [
+                NOT_PLURALE_LEMMA,
+                ('at', 'N_PAIKAT'),
+                (None, fail(['N', 9, 'A', 'PLT'], ['kat'])),
+            ],
+            'B': [
+                NOT_PLURALE_LEMMA,
+                ('pat', 'N_HIPAT'),
+                (None, fail(['N', 9, 'B', 'PLT'], ['pat'])),
+            ],
+            'D': [
+                NOT_PLURALE_LEMMA,
+                ('at', 'N_PAIKAT'),
+                (None, fail(['N', 9, 'A', 'PLT'], ['kat'])),
+            ],
+            'C': [
+                NOT_PLURALE_LEMMA,
+                ('tat', 'N_RIUTAT'),
+                (None, fail(['N', 9, 'B', 'PLT'], ['pat'])),
+            ],
+            'E': [
+                NOT_PLURALE_LEMMA,
+                ('vat', 'N_TAVAT'),
+                (None, fail(['N', 9, 'E', 'PLT'], ['vat'])),
+            ],
+            'F': [
+                NOT_PLURALE_LEMMA,
+                ('dat', 'N_RAUDAT'),
+                (None, fail(['N', 9, 'F', 'PLT'], ['dat'])),
+            ],
+            'G': [
+                NOT_PLURALE_LEMMA,
+                ('gat', 'N_RANGAT'),
+                (None, fail(['N', 9, 'G', 'PLT'], ['gat'])),
+            ],
+            'I': [
+                NOT_PLURALE_LEMMA,
+                ('llat', 'N_VALLAT'),
+                (None, fail(['N', 9, 'I', 'PLT'], ['llat'])),
+            ],
+            'J': [
+                NOT_PLURALE_LEMMA,
+                ('nnat', 'N_RANNAT'),
+                (None, fail(['N', 9, 'J', 'PLT'], ['llat'])),
+            ],
+            'K': [
+                NOT_PLURALE_LEMMA,
+                ('rrat', 'N_KARRAT'),
+                (None, fail(['N', 9, 'K', 'PLT'], ['rrat'])),
+            ],
+            ELSE: [
+                NOT_PLURALE_LEMMA,
+                (None, fail(['N', 9, 'PLT'], [False, 'A-G', 'I-K'])),
+            ],
+        },
+        10: {
+            False: [
+                NOT_PLURALE_LEMMA,
+                ('at', 'N_JUHLAT'),
+                ('ät', 'N_KÄRÄJÄT'),
+                (None, fail(['N', 10, False, 'PLT'], ['at', 'ät'])),
+            ],
+            'A': [
+                NOT_PLURALE_LEMMA,
+                ('kat', 'N_SUKAT'),
+                ('kät', 'N_SÄRKÄT'),
+                (None, fail(['N', 10, 'A', 'PLT'], ['kat', 'kät'])),
+            ],
+            'B': [
+                NOT_PLURALE_LEMMA,
+                ('pat', 'N_KUOPAT'),
+                ('pät', 'N_TÖLPÄT'),
+                (None, fail(['N', 10, 'B', 'PLT'], ['pat'])),
+            ],
+            'D': [
+                NOT_PLURALE_LEMMA,
+                ('ät', 'N_REIÄT'),
+                (None, fail(['N', 10, 'D', 'PLT'], ['ät'])),
+            ],
+            'C': [
+                NOT_PLURALE_LEMMA,
+                ('tat', 'N_ROTAT'),
+                ('tät', 'N_KENTÄT'),
+                (None, fail(['N', 10, 'C', 'PLT'], ['tät'])),
+            ],
+            'E': [
+                NOT_PLURALE_LEMMA,
+                ('vat', 'N_JUOVAT'),
+                (None, fail(['N', 10, 'E', 'PLT'], ['vat'])),
+            ],
+            'F': [
+                NOT_PLURALE_LEMMA,
+                ('dat', 'N_LUHDAT'),
+                (None, fail(['N', 10, 'D', 'PLT'], ['dat'])),
+            ],
+            'G': [
+                NOT_PLURALE_LEMMA,
+                ('ngät', 'N_KENGÄT'),
+                (None, fail(['N', 10, 'G', 'PLT'], ['ngät'])),
+            ],
+            'J': [
+                NOT_PLURALE_LEMMA,
+                ('nnat', 'N_KUNNAT'),
+                ('nnät', 'N_HÄNNÄT'),
+                (None, fail(['N', 10, 'J', 'PLT'], ['nnat'])),
+            ],
+            'L': [
+                NOT_PLURALE_LEMMA,
+                ('ljät', 'N_SELJÄT'),
+                (None, fail(['N', 10, 'L', 'PLT'], ['ljät'])),
+            ],
+            ELSE: [
+                NOT_PLURALE_LEMMA,
+                (None,
+                 fail(['N', 10, 'PLT'], [False, 'A', 'B', 'D', 'FG', 'J'])),
+            ],
+        },
+        11: {
+            False: [
+                NOT_PLURALE_LEMMA,
+                ('at', 'N_KIHARAT'),
+                (None, fail(['N', 11, False, 'PLT'], ['at'])),
+            ],
+            ELSE: [
+                NOT_PLURALE_LEMMA,
+                (None, fail(['N', 11, 'PLT'], [False])),
+            ],
+        },
+        12: {
+            False: [
+                NOT_PLURALE_LEMMA,
+                ('at', 'N_MARKKINAT'),
+                ('ät', 'N_RÄMIÄT'),
+                (None, fail(['N', 12, False, 'PLT'], ['at', 'ät'])),
+            ],
+            ELSE: [
+                NOT_PLURALE_LEMMA,
+                (None, fail(['N', 12, 'PLT'], [False])),
+            ],
+        },
+        13: {
+            False: [
+                NOT_PLURALE_LEMMA,
+                ('at', 'N_KASTILJAT'),
+                (None, fail(['N', 13, False, 'PLT'], ['at'])),
+            ],
+            ELSE: [
+                NOT_PLURALE_LEMMA,
+                (None, fail(['N', 13, 'PLT'], [False])),
+            ],
+        },
+        14: {
+            'A': [
+                NOT_PLURALE_LEMMA,
+                ('kat', 'N_SILAKAT'),
+                (None, fail(['N', 14, 'A', 'PLT'], ['at'])),
+            ],
+            ELSE: [
+                NOT_PLURALE_LEMMA,
+                (None, fail(['N', 14, 'PLT'], ['A'])),
+            ],
+        },
+        15: {
+            False: [
+                NOT_PLURALE_LEMMA,
+                ('at', 'N_HOPEAT'),
+                ('ät', 'N_RÄMEÄT'),
+                (None, fail(['N', 15, False, 'PLT'], ['at'])),
+            ],
+            ELSE: [
+                NOT_PLURALE_LEMMA,
+                (None, fail(['N', 15, 'PLT'], [False])),
+            ],
+        },
+        16: {
+            'H': [
+                NOT_PLURALE_LEMMA,
+                ('mmat', 'N_VANHEMMAT'),
+                (None, fail(['N', 16, 'H', 'PLT'], ['at'])),
+            ],
+            ELSE: [
+                NOT_PLURALE_LEMMA,
+                (None, fail(['N', 16, 'PLT'], ['H'])),
+            ],
+        },
+        17: {
+            False: [
+                NOT_PLURALE_LEMMA,
+                ('aat', 'N_HARMAAT'),
+                ('oot', 'N_TALKOOT'),
+                ('yyt', 'N_HYNTTYYT'),
+                ('äät', 'N_PÖLHÄÄT'),
+                (None, fail(['N', 17, False, 'PLT'], ['oot', 'yyt', 'äät'])),
+            ],
+            ELSE: [
+                NOT_PLURALE_LEMMA,
+                (None, fail(['N', 17, 'PLT'], [False])),
+            ],
+        },
+        18: {
+            False: [
+                NOT_PLURALE_LEMMA,
+                ('aat', 'N_ITÄMAAT'),
+                ('ait', 'N_HAIT'),
+                ('uut', 'N_PUUT'),
+                ('yyt', 'N_PYYT'),
+                ('äät', 'N_HÄÄT'),
+                (None,
+                 fail(['N', 18, False, 'PLT'],
+                      ['aat', 'ait', 'uut', 'yyt', 'äät'])),
+            ],
+            ELSE: [
+                NOT_PLURALE_LEMMA,
+                (None, fail(['N', 18, 'PLT'], [False])),
+            ],
+        },
+        19: {
+            False: [
+                NOT_PLURALE_LEMMA,
+                ('iet', 'N_TIET', FRONT),
+                ('uot', 'N_SUOT'),
+                ('yöt', 'N_TYÖT'),
+                (None, fail(['N', 19, False, 'PLT'], ['iet', 'uot', 'yöt'])),
+            ],
+            ELSE: [
+                NOT_PLURALE_LEMMA,
+                (None, fail(['N', 19, 'PLT'], [False])),
+            ],
+        },
+        20: {
+            False: [
+                NOT_PLURALE_LEMMA,
+                ('ööt', 'N_MILJÖÖT'),
+                (None, fail(['N', 20, False, 'PLT'], ['ööt'])),
+            ],
+            ELSE: [
+                NOT_PLURALE_LEMMA,
+                (None, fail(['N', 20, 'PLT'], [False])),
+            ],
+        },
+        21: {
+            False: [
+                NOT_PLURALE_LEMMA,
+                ('át', 'N_LIVVADIEVÁT'),
+                (None, fail(['N', 21, False, 'PLT'], ['át'])),
+            ],
+            ELSE: [
+                NOT_PLURALE_LEMMA,
+                (None, fail(['N', 21, 'PLT'], [False])),
+            ],
+        },
+        25: {
+            False: [
+                NOT_PLURALE_LEMMA,
+                ('met', 'N_TOIMET', BACK),
+                ('met', 'N_NIEMET', FRONT),
+                (None, fail(['N', 25, False, 'PLT'], ['met'])),
+            ],
+            ELSE: [
+                NOT_PLURALE_LEMMA,
+                (None, fail(['N', 25, 'PLT'], [False])),
+            ],
+        },
+        24: {
+            False: [
+                NOT_PLURALE_LEMMA,
+                ('et', 'N_SAARET', BACK),
+                ('et', 'N_SÄÄRET', FRONT),
+                (None, fail(['N', 26, False, 'PLT'], ['et'])),
+            ],
+            ELSE: [
+                NOT_PLURALE_LEMMA,
+                (None, fail(['N', 26, 'PLT'], [False])),
+            ],
+        },
+        26: {
+            False: [
+                NOT_PLURALE_LEMMA,
+                ('et', 'N_SAARET', BACK),
+                ('et', 'N_SÄÄRET', FRONT),
+                (None, fail(['N', 26, False, 'PLT'], ['et'])),
+            ],
+            ELSE: [
+                NOT_PLURALE_LEMMA,
+                (None, fail(['N', 26, 'PLT'], [False])),
+            ],
+        },
+        27: {
+            False: [
+                NOT_PLURALE_LEMMA,
+                ('det', 'N_VUODET', BACK),
+                (None, fail(['N', 27, False, 'PLT'], ['det'])),
+            ],
+            'F': [
+                NOT_PLURALE_LEMMA,
+                ('det', 'N_VUODET', BACK),
+                (None, fail(['N', 27, False, 'PLT'], ['det'])),
+            ],
+            ELSE: [
+                NOT_PLURALE_LEMMA,
+                (None, fail(['N', 27, 'PLT'], [False])),
+            ],
+        },
+        28: {
+            False: [
+                NOT_PLURALE_LEMMA,
+                ('nnet', 'N_KANNET', BACK),
+                ('rret', 'N_VIRRET', FRONT),
+                (None, fail(['N', 28, False, 'PLT'], ['nnet', 'rret'])),
+            ],
+            'J': [
+                NOT_PLURALE_LEMMA,
+                ('nnet', 'N_KANNET', BACK),
+                ('nnet', 'N_KYNNET', FRONT),
+                (None, fail(['N', 28, 'J', 'PLT'], ['nnet'])),
+            ],
+            ELSE: [
+                NOT_PLURALE_LEMMA,
+                (None, fail(['N', 28, 'PLT'], ['J'])),
+            ],
+        },
+        32: {
+            False: [
+                NOT_PLURALE_LEMMA,
+                ('et', 'N_HÖYHENET', FRONT),
+                (None, fail(['N', 32, False, 'PLT'], ['et'])),
+            ],
+            'D': [
+                NOT_PLURALE_LEMMA,
+                ('kenet', 'N_IKENET', FRONT),
+                (None, fail(['N', 32, 'D', 'PLT'], ['kenet'])),
+            ],
+            'C': [
+                NOT_PLURALE_LEMMA,
+                ('taret', 'N_LIPOTTARET'),
+                ('täret', 'N_KIRITTÄRET'),
+                (None, fail(['N', 32, 'C', 'PLT'], ['taret'])),
+            ],
+            ELSE: [
+                NOT_PLURALE_LEMMA,
+                (None, fail(['N', 32, 'PLT'], [False])),
+            ],
+        },
+        33: {
+            False: [
+                NOT_PLURALE_LEMMA,
+                ('met', 'N_ATERIMET', BACK),
+                ('met', 'N_KERITSIMET', FRONT),
+                (None, fail(['N', 33, False, 'PLT'], ['met'])),
+            ],
+            'D': [
+                NOT_PLURALE_LEMMA,
+                ('kimet', 'N_PUKIMET', BACK),
+                (None, fail(['N', 33, 'D', 'PLT'], ['kimet'])),
+            ],
+            'C': [
+                NOT_PLURALE_LEMMA,
+                ('ttimet', 'N_HOKSOTTIMET', BACK),
+                ('ttimet', 'N_SYNNYTTIMET', FRONT),
+                (None, fail(['N', 33, 'C', 'PLT'], ['ttimet'])),
+            ],
+            'F': [
+                NOT_PLURALE_LEMMA,
+                ('timet', 'N_ROHTIMET', BACK),
+                ('timet', 'N_VETIMET', FRONT),
+                (None, fail(['N', 33, 'F', 'PLT'], ['timet'])),
+            ],
+            'J': [
+                NOT_PLURALE_LEMMA,
+                ('ntimet', 'N_ANTIMET', BACK),
+                (None, fail(['N', 33, 'J', 'PLT'], ['ntimet'])),
+            ],
+            ELSE: [
+                NOT_PLURALE_LEMMA,
+                (None, fail(['N', 33, 'PLT'], [False, 'C', 'D', 'F', 'J'])),
+            ],
+        },
+        34: {
+            'C': [
+                NOT_PLURALE_LEMMA,
+                ('mat', 'N_SIUNAAMATTOMAT'),
+                ('mät', 'N_TYÖTTÖMÄT'),
+                (None, fail(['N', 34, 'C', 'PLT'], ['mät'])),
+            ],
+            ELSE: [
+                NOT_PLURALE_LEMMA,
+                (None, fail(['N', 34, 'PLT'], ['C'])),
+            ],
+        },
+        38: {
+            False: [
+                NOT_PLURALE_LEMMA,
+                ('set', 'N_RAPPUSET', BACK),
+                ('set', 'N_VIHKIÄISET', FRONT),
+                (None, fail(['N', 38, False, 'PLT'], ['eet'])),
+            ],
+            ELSE: [
+                NOT_PLURALE_LEMMA,
+                (None, fail(['N', 38, 'PLT'], [False])),
+            ],
+        },
+        39: {
+            False: [
+                NOT_PLURALE_LEMMA,
+                ('set', 'N_SERKUKSET', BACK),
+                ('set', 'N_YSTÄVYKSET', FRONT),
+                (None, fail(['N', 39, False, 'PLT'], ['eet'])),
+            ],
+            ELSE: [
+                NOT_PLURALE_LEMMA,
+                (None, fail(['N', 39, 'PLT'], [False])),
+            ],
+        },
+        40: {
+            False: [
+                NOT_PLURALE_LEMMA,
+                ('det', 'N_OIKEUDET', BACK),
+                (None, fail(['N', 40, False, 'PLT'], ['eet'])),
+            ],
+            ELSE: [
+                NOT_PLURALE_LEMMA,
+                (None, fail(['N', 40, 'PLT'], [False])),
+            ],
+        },
+        41: {
+            False: [
+                NOT_PLURALE_LEMMA,
+                ('aat', 'N_VALJAAT'),
+                ('äät', 'N_KYNNÄÄT'),
+                (None, fail(['N', 41, False, 'PLT'], ['aat'])),
+            ],
+            'A': [
+                NOT_PLURALE_LEMMA,
+                ('kaat', 'N_TIKKAAT'),
+                ('käät', 'N_KILPIKKÄÄT'),
+                (None, fail(['N', 41, 'A', 'PLT'], ['kaat'])),
+            ],
+            'B': [
+                NOT_PLURALE_LEMMA,
+                ('ppaat', 'N_RUOPPAAT'),
+                (None, fail(['N', 41, 'C', 'PLT'], ['ttaat'])),
+            ],
+            'D': [
+                NOT_PLURALE_LEMMA,
+                ('kaat', 'N_TIKKAAT'),
+                ('käät', 'N_KILPIKKÄÄT'),
+                (None, fail(['N', 41, 'A', 'PLT'], ['kaat'])),
+            ],
+            'C': [
+                NOT_PLURALE_LEMMA,
+                ('ttaat', 'N_RATTAAT'),
+                ('ttyyt', 'N_RYNTTYYT'),
+                ('ttäät', 'N_MÄTTÄÄT'),
+                (None, fail(['N', 41, 'C', 'PLT'], ['ttaat'])),
+            ],
+            'E': [
+                NOT_PLURALE_LEMMA,
+                ('paat', 'N_VARPAAT'),
+                (None, fail(['N', 41, 'E', 'PLT'], ['rpaat'])),
+            ],
+            'F': [
+                NOT_PLURALE_LEMMA,
+                ('taat', 'N_TEHTAAT'),
+                (None, fail(['N', 41, 'F', 'PLT'], ['taat'])),
+            ],
+            'G': [
+                NOT_PLURALE_LEMMA,
+                ('nkaat', 'N_RENKAAT'),
+                ('nkahat', 'N_KANKAHAT'),
+                (None, fail(['N', 41, 'G', 'PLT'], ['nkaat'])),
+            ],
+            'H': [
+                NOT_PLURALE_LEMMA,
+                ('mpaat', 'N_ROMPAAT'),
+                (None, fail(['N', 41, 'H', 'PLT'], ['mpaat'])),
+            ],
+            'I': [
+                NOT_PLURALE_LEMMA,
+                ('ltaat', 'N_MALTAAT'),
+                (None, fail(['N', 41, 'I', 'PLT'], ['ltaat'])),
+            ],
+            'J': [
+                NOT_PLURALE_LEMMA,
+                ('ntäät', 'N_RYNTÄÄT'),
+                (None, fail(['N', 41, 'J', 'PLT'], ['ntäät'])),
+            ],
+            'K': [
+                NOT_PLURALE_LEMMA,
+                ('rtaat', 'N_PORTAAT'),
+                (None, fail(['N', 41, 'K', 'PLT'], ['rtaat'])),
+            ],
+            ELSE: [
+                NOT_PLURALE_LEMMA,
+                (None,
+                 fail(['N', 41, 'PLT'],
+                      [False, 'A', 'C', 'F', 'G', 'J', 'K'])),
+            ],
+        },
+        42: {
+            False: [
+                NOT_PLURALE_LEMMA,
+                ('iehet', 'N_MIEHET'),
+                (None, fail(['N', 42, False, 'PLT'], ['het'])),
+            ],
+            ELSE: [
+                NOT_PLURALE_LEMMA,
+                (None, fail(['N', 42, 'PLT'], [False])),
+            ],
+        },
+        43: {
+            False: [
+                NOT_PLURALE_LEMMA,
+                ('uet', 'N_MATKUET'),
+                (None, fail(['N', 43, False, 'PLT'], ['uet'])),
+            ],
+            ELSE: [
+                NOT_PLURALE_LEMMA,
+                (None, fail(['N', 43, 'PLT'], [False])),
+            ],
+        },
+        47: {
+            False: [
+                NOT_PLURALE_LEMMA,
+                ('eet', 'N_LIITTOUTUNEET', BACK),
+                ('eet', 'N_HÄVINNEET', FRONT),
+                (None, fail(['N', 47, False, 'PLT'], ['eet'])),
+            ],
+            ELSE: [
+                NOT_PLURALE_LEMMA,
+                (None, fail(['N', 47, 'PLT'], [False])),
+            ],
+        },
+        48: {
+            False: [
+                NOT_PLURALE_LEMMA,
+                ('eet', 'N_HIUTALEET', BACK),
+                ('eet', 'N_RÄMEET', FRONT),
+                (None, fail(['N', 48, False, 'PLT'], ['eet'])),
+            ],
+            'A': [
+                NOT_PLURALE_LEMMA,
+                ('keet', 'N_KUULOKKEET', BACK),
+                ('keet', 'N_SILMÄKKEET', FRONT),
+                (None, fail(['N', 48, 'AD', 'PLT'], ['peet'])),
+            ],
+            'B': [
+                NOT_PLURALE_LEMMA,
+                ('peet', 'N_KAMPPEET', BACK),
+                (None, fail(['N', 48, 'B', 'PLT'], ['peet'])),
+            ],
+            'D': [
+                NOT_PLURALE_LEMMA,
+                ('keet', 'N_KUULOKKEET', BACK),
+                ('keet', 'N_SILMÄKKEET', FRONT),
+                (None, fail(['N', 48, 'AD', 'PLT'], ['peet'])),
+            ],
+            'C': [
+                NOT_PLURALE_LEMMA,
+                ('teet', 'N_VAATTEET', BACK),
+                ('teet', 'N_HYNTTEET', FRONT),
+                (None, fail(['N', 48, 'C', 'PLT'], ['teet'])),
+            ],
+            'E': [
+                NOT_PLURALE_LEMMA,
+                ('peet', 'N_TARPEET', BACK),
+                (None, fail(['N', 48, 'E', 'PLT'], ['teet'])),
+            ],
+            'F': [
+                NOT_PLURALE_LEMMA,
+                ('teet', 'N_SUHTEET', BACK),
+                ('teet', 'N_TIETEET', FRONT),
+                (None, fail(['N', 48, 'F', 'PLT'], ['teet'])),
+            ],
+            'J': [
+                NOT_PLURALE_LEMMA,
+                ('nteet', 'N_SALONTEET', BACK),
+                ('nteet', 'N_RINTEET', FRONT),
+                (None, fail(['N', 48, 'J', 'PLT'], ['teet'])),
+            ],
+            'K': [
+                NOT_PLURALE_LEMMA,
+                ('rteet', 'N_MURTEET', BACK),
+                (None, fail(['N', 48, 'J', 'PLT'], ['teet'])),
+            ],
+            'L': [
+                NOT_PLURALE_LEMMA,
+                ('keet', 'N_ALKEET', BACK),
+                ('keet', 'N_PERKEET', FRONT),
+                (None, fail(['N', 48, 'L', 'PLT'], ['teet'])),
+            ],
+            ELSE: [
+                NOT_PLURALE_LEMMA,
+                (None, fail(['N', 48, 'PLT'], ['F'])),
+            ],
+        },
+        49: {
+            False: [
+                NOT_PLURALE_LEMMA,
+                ('et', 'N_SAMMALET', BACK),
+                (None, fail(['N', 49, False, 'PLT'], ['eet'])),
+            ],
+            ELSE: [
+                NOT_PLURALE_LEMMA,
+                (None, fail(['N', 49, 'PLT'], [False])),
+            ],
+        },
+        1007: {
+            False: [
+                NOT_PLURALE_LEMMA,
+                (('veljet', 'Veljet'), 'N_VELJET'),
+                (None, fail(['N', 7, False, 'PLT'], ['veljet'])),
+            ],
+            'D': [
+                NOT_PLURALE_LEMMA,
+                (('veljet', 'Veljet'), 'N_VELJET'),
+                (None, fail(['N', 7, False, 'PLT'], ['veljet'])),
+            ],
+            'L': [
+                NOT_PLURALE_LEMMA,
+                (('veljet', 'Veljet'), 'N_VELJET'),
+                (None, fail(['N', 7, False, 'PLT'], ['veljet'])),
+            ],
+            ELSE: [
+                NOT_PLURALE_LEMMA,
+                (None, fail(['N', 7, 'PLT'], [False, 'D', 'L'])),
+            ],
+        },
+        1010: {
+            False: [
+                NOT_PLURALE_LEMMA,
+                (('pojat', 'Pojat'), 'N_POJAT'),
+                (None, fail(['N', 10, False, 'PLT'], ['pojat'])),
+            ],
+            'D': [
+                NOT_PLURALE_LEMMA,
+                (('pojat', 'Pojat'), 'N_POJAT'),
+                (None, fail(['N', 10, False, 'PLT'], ['pojat'])),
+            ],
+            'L': [
+                NOT_PLURALE_LEMMA,
+                (('pojat', 'Pojat'), 'N_POJAT'),
+                (None, fail(['N', 10, False, 'PLT'], ['pojat'])),
+            ],
+            ELSE: [
+                NOT_PLURALE_LEMMA,
+                (None, fail(['N', 10, 'PLT'], [False, 'D', 'L'])),
+            ],
+        },
+        ELSE: {
+            ELSE: [
+                NOT_PLURALE_LEMMA,
+                (None, fail(['N', 'PLT'], [1, 2, 3, 8])),
+            ],
+        },
+    },
+}
+
+
+_ADJECTIVE_RULES = {
+    1: {
+        False: [
+            (('o', 'O'), 'A_TUMMAHKO'),
+            (('u', 'U'), 'A_VALKAISTU'),
+            (('y', 'Y'), 'A_HÄPÄISTY'),
+            ('ö', 'A_HÖLÖ'),
+            (None, fail(['A', 1, False], ['o O', 'u', 'yY', 'ö'])),
+        ],
+        'A': [
+            ('ko', 'A_KOLKKO'),
+            ('ku', 'A_VIRKKU'),
+            ('ky', 'A_SÄIKKY'),
+            ('kö', 'A_KÖKKÖ'),
+            (None, fail(['A', 1, 'A'], ['ko', 'ku', 'ky', 'kö'])),
+        ],
+        'B': [
+            ('ppo', 'A_SUIPPO'),
+            ('ppu', 'A_IKÄLOPPU'),
+            ('ppö', 'A_LÖRPPÖ'),
+            (None, fail(['A', 1, 'B'], ['ppo', 'ppu', 'ppö'])),
+        ],
+        'C': [
+            ('tto', 'A_VELTTO'),
+            ('ttu', 'A_VIMMATTU'),
+            ('tty', 'A_YLENNETTY'),
+            ('ttö', 'A_KYYTTÖ'),
+            (None, fail(['A', 1, 'C'], ['tto', 'ttu', 'tty', 'ttö'])),
+        ],
+        'D': [
+            ('ko', 'A_LAKO'),
+            (None, fail(['A', 1, 'D'], ['ko'])),
+        ],
+        'E': [
+            ('po', 'A_KELPO'),
+            (None, fail(['A', 1, 'E'], ['po'])),
+        ],
+        'F': [
+            ('to', 'A_MIETO'),
+            ('tu', 'A_VIIPALOITU'),
+            ('ty', 'A_YKSILÖITY'),
+            ('tö', fail(['A', 1, 'F'], ['to', 'tu', 'ty'])),
+        ],
+        'G': [
+            ('nko', 'A_LENKO'),
+            (None, fail(['A', 1, 'G'], ['nko'])),
+        ],
+        'I': [
+            ('lto', 'A_MELTO'),
+            ('ltu', 'A_PARANNELTU'),
+            ('lty', 'A_VÄHÄTELTY'),
+            (None, fail(['A', 1, 'I'], ['lto', 'ltu', 'lty'])),
+        ],
+        'J': [
+            ('nto', 'A_VENTO'),
+            ('ntu', 'A_PANTU'),
+            ('nty', 'A_MENTY'),
+            (None, fail(['A', 1, 'J'], ['nto', 'ntu', 'nty'])),
+        ],
+        'K': [
+            ('rto', 'A_MARTO'),
+            ('rtu', 'A_PURTU'),
+            ('rty', 'A_PIERTY'),
+            (None, fail(['A', 1, 'K'], ['rto', 'rto', 'rty'])),
+        ],
+        ELSE: [
+            (None, fail(['A', 1], ['A–K'])),
+        ],
+    },
+    2: {
+        False: [
+            ('o', 'A_KOHELO'),
+            ('ö', 'A_LÖPERÖ'),
+            (None, fail(['A', 2, False], ['o', 'ö'])),
+        ],
+        ELSE: [
+            (None, fail(['A', 2], [False])),
+        ],
+    },
+    3: {
+        False: [
+            ('io', 'A_AUTIO'),
+            ('iö', 'A_RIIVIÖ'),
+            (None, fail(['A', 3, False], ['io', 'iö'])),
+        ],
+        ELSE: [
+            (None, fail(['A', 3], [False])),
+        ],
+    },
+    4: {
+        'A': [
+            ('kko', 'A_HUPAKKO'),
+            (None, fail(['A', 4, 'A'], ['kko'])),
+        ],
+        ELSE: [
+            (None, fail(['A', 4], ['A'])),
+        ],
+    },
+    5: {
+        False: [
+            (None, 'A_ABNORMI', BACK),
+            (None, 'A_STYDI', FRONT),
+            (None, fail(['A', 5, False, 'i'], ['front', 'back'])),
+        ],
+        'A': [
+            ('ki', 'A_OPAAKKI', BACK),
+            ('ki', 'A_PINKKI', FRONT),
+            (None, fail(['A', 5, 'A'], ['ki', 'front', 'back'])),
+        ],
+        'B': [
+            ('ppi', 'A_SIPPI', FRONT),
+            (None, fail(['A', 5, 'B'], ['ppi', 'front', 'back'])),
+        ],
+        'C': [
+            ('tti', 'A_HURTTI', BACK),
+            ('tti', 'A_VÄÄRTTI', FRONT),
+            (None, fail(['A', 5, 'C'], ['tti', 'front', 'back'])),
+        ],
+        'F': [
+            ('ti', 'A_TUHTI', BACK),
+            ('ti', 'A_REHTI', FRONT),
+            (None, fail(['A', 5, 'F'], ['ti', 'front', 'back'])),
+        ],
+        ELSE: [],
+    },
+    6: {
+        False: [
+            (None, 'A_ABNORMAALI', BACK),
+            (None, 'A_ÖYKKÄRI', FRONT),
+            (None, fail(['A', 6, False, 'i'], ['front', 'back'])),
+        ],
+        ELSE: [
+            (None, fail(['A', 6], [False])),
+        ],
+    },
+    8: {
+        False: [
+            ('e', 'A_TOOPE', BACK),
+            ('e', 'A_BEIGE', FRONT),
+            (None, fail(['A', 8, False], ['e', 'front', 'back'])),
+        ],
+        ELSE: [
+            (None, fail(['A', 8], [False])),
+        ],
+    },
+    9: {
+        False: [
+            (('a', 'A'), 'A_AAVA'),
+            (None, fail(['A', 9, False], ['a'])),
+        ],
+        'A': [
+            ('ka', 'A_TARKKA'),
+            (None, fail(['A', 9, 'A'], ['kka'])),
+        ],
+        'C': [
+            ('tta', 'A_MATTA'),
+            (None, fail(['A', 9, 'C'], ['tta'])),
+        ],
+        'D': [
+            ('ka', 'A_TARKKA'),
+            (None, fail(['A', 9, 'D'], ['ka'])),
+        ],
+        'E': [
+            ('pa', 'A_HALPA'),
+            (None, fail(['A', 9, 'E'], ['pa'])),
+        ],
+        'F': [
+            ('ta', 'A_EHTA'),
+            (None, fail(['A', 9, 'F'], ['ta'])),
+        ],
+        'G': [
+            ('nka', 'A_SANKA'),
+            (None, fail(['A', 9, 'F'], ['ta'])),
+        ],
+        'J': [
+            ('nta', 'A_VIHANTA'),
+        ],
+        'H': [
+            ('mpa', 'A_RAMPA'),
+            (None, fail(['A', 9, 'H'], ['mpa'])),
+        ],
+        ELSE: [
+            (None, fail(['A', 9], [False, 'A-K'])),
+        ],
+    },
+    10: {
+        False: [
+            (('a', 'A'), 'A_MATALA', ('three_syllable(stub)', 'bool', True)),
+            (('a', 'A'), 'A_RUMA'),
+            ('ä', 'A_TERÄVÄ', ('three_syllable(stub)', 'bool', True)),
+            ('ä', 'A_TYHMÄ'),
+            (None, fail(['A', 10, False], ['a', 'ä'])),
+        ],
+        'A': [
+            ('ka', 'A_HOIKKA'),
+            ('kä', 'A_MYKKÄ'),
+            (None, fail(['A', 10, 'A'], ['kka', 'kkä'])),
+        ],
+        'B': [
+            ('ppa', 'A_POPPA'),
+            ('ppä', 'A_HÖMPPÄ'),
+            (None, fail(['A', 10, 'B'], ['ppa', 'ppä'])),
+        ],
+        'D': [
+            ('ka', 'A_HOIKKA'),
+            ('kä', 'A_MYKKÄ'),
+            (None, fail(['A', 10, 'A'], ['kka', 'kkä'])),
+        ],
+        'E': [
+            ('pa', 'A_VOIPA'),
+            ('pä', 'A_KÄYPÄ'),
+            (None, fail(['A', 10, 'E'], ['pa', 'pä'])),
+        ],
+        'F': [
+            ('tä', 'A_MÄTÄ'),
+            (None, fail(['A', 10, 'F'], ['ta', 'tä'])),
+        ],
+        'G': [
+            ('nka', 'A_SANKA'),
+            ('nkä', 'A_VÄNKÄ'),
+            (None, fail(['A', 10, 'G'], ['nka', 'nkä'])),
+        ],
+        'I': [
+            ('lta', 'A_KULTA'),
+            (None, fail(['A', 10, 'I'], ['lta'])),
+        ],
+        'J': [
+            ('ntä', 'A_LÄNTÄ'),
+            (None, fail(['A', 10, 'J'], ['ntä'])),
+        ],
+        'K': [
+            ('rta', 'A_TURTA'),
+            (None, fail(['A', 10, 'K'], ['rta'])),
+        ],
+        ELSE: [
+            (None, fail(['A', 10], [False, 'A', 'B', 'E', 'G', 'I-K'])),
+        ],
+    },
+    11: {
+        False: [
+            ('a', 'A_HAPERA'),
+            ('ä', 'A_SÄKKÄRÄ'),
+            (None, fail(['A', 11, False], ['a', 'ä'])),
+        ],
+        ELSE: [
+            (None, fail(['A', 11], [False])),
+        ],
+    },
+    12: {
+        False: [
+            (('a', 'A'), 'A_HARMAJA'),
+            ('ä', 'A_HÖPPÄNÄ'),
+            (None, fail(['A', 12, False], ['a', 'ä'])),
+        ],
+        ELSE: [
+            (None, fail(['A', 12], [False])),
+        ],
+    },
+    13: {
+        False: [
+            ('a', 'A_LATUSKA'),
+            ('ä', 'A_LÄTYSKÄ'),
+            (None, fail(['A', 13, False], ['a', 'ä'])),
+        ],
+        ELSE: [
+            (None, fail(['A', 13], [False])),
+        ],
+    },
+    14: {
+        'A': [
+            ('kka', 'A_HAILAKKA'),
+            ('kkä', 'A_RÄVÄKKÄ'),
+            (None, fail(['A', 14, 'A'], ['kka', 'kkä'])),
+        ],
+        'C': [
+            ('tta', 'A_POHATTA'),
+            (None, fail(['A', 14, 'C'], ['tta'])),
+        ],
+        ELSE: [
+            (None, fail(['A', 14], ['A', 'C'])),
+        ],
+    },
+    15: {
+        False: [
+            ('oa', 'A_AINOA'),
+            ('ea', 'A_KORKEA'),
+            ('eä', 'A_JÄREÄ'),
+            (None, fail(['A', 15, False], ['oa', 'ea', 'eä'])),
+        ],
+        ELSE: [
+            (None, fail(['A', 15], [False])),
+        ],
+    },
+    16: {
+        'H': [
+            (None, 'A_AIEMPI', BACK),
+            (None, 'A_LÄHEMPI', FRONT),
+            (None, fail(['A', 16, 'H'], ['back'])),
+        ],
+        ELSE: [
+            (None, fail(['A', 16], ['H'])),
+        ],
+    },
+    17: {
+        False: [
+            ('aa', 'A_VAPAA'),
+            ('ee', 'A_OIKEE'),
+            (None, fail(['A', 17, False], ['aa', 'ee'])),
+        ],
+        ELSE: [
+            (None, fail(['A', 17], [False])),
+        ],
+    },
+    18: {
+        False: [
+            ('a', 'A_PEEAA'),
+            ('u', 'A_MUU'),
+            ('ä', 'A_SYYPÄÄ'),
+            (None, fail(['A', 18, False], ['a', 'u', 'ä'])),
+        ],
+        ELSE: [
+            (None, fail(['A', 18], [False])),
+        ],
+    },
+    20: {
+        ELSE: [
+            (None, fail(['A', 20], [False])),
+        ],
+    },
+    21: {
+        False: [
+            ('gay', 'A_GAY'),
+            (None,
+             fail(['A', 21, False], ['gay', 'é', 'è'],
+                  'guessing 21 is not possible')),
+        ],
+        ELSE: [
+            (None, fail(['A', 21], [False])),
+        ],
+    },
+    24: {
+        False: [
+            (None, 'A_SUURI', BACK),
+            (None, 'A_PIENI', FRONT),
+            (None, fail(['A', 23, False], ['back', 'front'])),
+        ],
+        ELSE: [
+            (None, fail(['A', 22], [False])),
+        ],
+    },
+    26: {
+        False: [
+            (None, 'A_SUURI', BACK),
+            (None, 'A_PIENI', FRONT),
+            (None, fail(['A', 23, False], ['back', 'front'])),
+        ],
+        ELSE: [
+            (None, fail(['A', 22], [False])),
+        ],
+    },
+    27: {
+        False: [
+            ('si', 'A_UUSI', BACK),
+            ('si', 'A_TÄYSI', FRONT),
+            ('si', fail(['A', 26, False, 'si'], ['back', 'front'])),
+        ],
+        'F': [
+            ('si', 'A_UUSI', BACK),
+            ('si', 'A_TÄYSI', FRONT),
+            ('si', fail(['A', 27, 'F', 'si'], ['back', 'front'])),
+        ],
+        ELSE: [
+            (None, fail(['A', 27], [False])),
+        ],
+    },
+    32: {
+        False: [
+            (None, 'A_TYVEN', FRONT),
+            (None, fail(['A', 32, False], ['front'])),
+        ],
+        ELSE: [],
+    },
+    33: {
+        False: [
+            ('in', 'A_AVOIN', BACK),
+            (None, fail(['A', 33, 'B'], ['in', 'back'])),
+        ],
+        'B': [
+            ('hapan', 'A_HAPAN'),
+            (None, fail(['A', 33, 'B'], ['hapan'])),
+        ],
+        ELSE: [
+            (None, fail(['A', 33], ['B'])),
+        ],
+    },
+    34: {
+        False: [
+            ('ton', 'A_ALASTON'),
+            (None, fail(['A', 34, False], ['ton'])),
+        ],
+        'C': [
+            ('ton', 'A_VIATON'),
+            ('tön', 'A_KYVYTÖN'),
+            (None, fail(['A', 34, 'C'], ['ton', 'tön'])),
+        ],
+        ELSE: [
+            (None, fail(['A', 34], [False, 'C'])),
+        ],
+    },
+    35: {
+        'H': [
+            (None, 'A_LÄMMIN', FRONT),
+            (None, fail(['A', 35, False], ['front'])),
+        ],
+        ELSE: [
+            (None, fail(['A', 35], ['H'])),
+        ],
+    },
+    36: {
+        False: [
+            (None, 'A_PAHIN', BACK),
+            (None, 'A_SISIN', FRONT),
+            (None, fail(['A', 36, 'J'], ['front', 'back'])),
+        ],
+        ELSE: [
+            (None, fail(['A', 36], [False], 'cannot have gradation')),
+        ],
+    },
+    37: {
+        False: [
+            ('vasen', 'A_VASEN'),
+            (None, fail(['A', 37, False], ['vasen'])),
+        ],
+        ELSE: [
+            (None, fail(['A', 37], [False], 'cannot have gradation')),
+        ],
+    },
+    38: {
+        False: [
+            (None, 'A_AAKKOSELLINEN', BACK),
+            (None, 'A_KYLMÄJÄRKINEN', FRONT),
+            (None, fail(['A', 38, False], ['front', 'back'])),
+        ],
+        ELSE: [
+            (None, fail(['A', 38], [False], 'cannot have gradation')),
+        ],
+    },
+    39: {
+        False: [
+            (None, 'A_SYMPPIS', FRONT),
+            (None, fail(['A', 38, False], ['front', 'back'])),
+        ],
+        ELSE: [
+            (None, fail(['A', 38], [False], 'cannot have gradation')),
+        ],
+    },
+    40: {
+        False: [
+            ('yys', 'A_LÄHTEISYYS'),
+            (None, fail(['A', 40], ['yys'])),
+        ],
+        ELSE: [
+            (None, fail(['A', 40], [False], 'cannot have gradation')),
+        ],
+    },
+    41: {
+        False: [
+            ('paras', 'A_PARAS'),
+            ('as', 'A_AUTUAS'),
+            ('is', 'A_VALMIS', BACK),
+            ('is', 'A_TIIVIS', FRONT),
+            ('äs', 'A_TYÖLÄS'),
+            (None, fail(['A', 41, False], ['as', 'is', 'äs'])),
+        ],
+        'A': [
+            ('kas', 'A_VOIMAKAS'),
+            ('käs', 'A_TYYLIKÄS'),
+            (None, fail(['A', 41, 'A'], ['kas', 'käs'])),
+        ],
+        'B': [
+            ('pas', 'A_REIPAS'),
+            (None, fail(['A', 41, 'B'], ['pas', 'päs'])),
+        ],
+        'C': [
+            ('tas', 'A_RIETAS'),
+            ('tis', 'A_RAITIS', BACK),
+            (None,
+             fail(['A', 41, 'C'], ['tas', 'tis', 'tus', 'täs', 'front'])),
+        ],
+        'F': [
+            ('das', 'A_HIDAS'),
+            (None, fail(['A', 41, 'F'], ['das'])),
+        ],
+        'K': [
+            ('ras', 'A_HARRAS'),
+            (None, fail(['A', 41, 'K'], ['rras'])),
+        ],
+        ELSE: [
+            (None, fail(['A', 41], [False, 'A B C F K'])),
+        ],
+    },
+    43: {
+        False: [
+            ('ut', 'A_OHUT'),
+            ('yt', 'A_EHYT'),
+            (None, fail(['A', 43, False], ['ut', 'yt'])),
+        ],
+        ELSE: [
+            (None, fail(['A', 43], [False])),
+        ],
+    },
+    44: {
+        False: [
+            ('ut', 'A_AINUT'),
+            (None, fail(['A', 44, False], ['ut'])),
+        ],
+        ELSE: [
+            (None, fail(['A', 44], [False])),
+        ],
+    },
+    47: {
+        False: [
+            ('ut', 'A_KULUNUT'),
+            ('yt', 'A_ÄLLISTYNYT'),
+            (None, fail(['A', 47, False], ['yt'])),
+        ],
+        ELSE: [
+            (None, fail(['A', 47], [False], 'cannot gradate')),
+        ],
+    },
+    48: {
+        False: [
+            (None, 'A_AHNE', BACK),
+            (None, 'A_TERVE', FRONT),
+            (None, fail(['A', 48, False], ['front', 'back'])),
+        ],
+        'F': [
+            ('de', 'A_KADE', BACK),
+            (None, fail(['A', 48, 'F'], ['de', 'front', 'back'])),
+        ],
+        'I': [
+            ('lle', 'A_HELLE', FRONT),
+            (None, fail(['A', 48, 'I'], ['lle', 'front', 'back'])),
+        ],
+        ELSE: [
+            (None, fail(['A', 48], [False, 'F', 'I'])),
+        ],
+    },
+    99: {
+        ELSE: [
+            (None,
+             fail(['A', 99], [99],
+                  'Illegal class for A, 99 can only apply to P',
+                  new_para='#')),
+        ],
+    },
+    1010: {
+        False: [
+            ('pitkä', 'A_PITKÄ'),
+            (None, fail(['A', 10, 'D', 'PITKÄ'], ['pitkä'], 'must be pitkä')),
+        ],
+        ELSE: [
+            (None, fail(['A', 10], ['D'])),
+        ],
+    },
+    ELSE: {
+        ELSE: [
+            (None, fail(['A'], ['1-49', '99', '1010'])),
+        ],
+    },
+}
+
+
+_VERB_RULES = {
+    52: {
+        False: [
+            ('oa', 'V_PUNOA'),
+            ('ua', 'V_KAUNISTUA'),
+            ('yä', 'V_ÄLLISTYÄ'),
+            ('öä', 'V_SÄILÖÄ'),
+            (None, fail(['V', 52, False], ['oa', 'ua', 'yä', 'öä'])),
+        ],
+        'A': [
+            ('koa', 'V_HAUKKOA'),
+            ('kua', 'V_NUOKKUA'),
+            ('kyä', 'V_KÄRKKYÄ'),
+            (None, fail(['V', 52, 'A'], ['ko', 'ku', 'ky'])),
+        ],
+        'B': [
+            ('ppoa', 'V_HARPPOA'),
+            ('ppua', 'V_LOPPUA'),
+            ('ppyä', 'V_LEPPYÄ'),
+            (None, fail(['V', 52, 'B'], ['ppo', 'ppu', 'ppy'])),
+        ],
+        'C': [
+            ('ttoa', 'V_VIITTOA'),
+            ('ttua', 'V_HERMOTTUA'),
+            ('ttyä', 'V_KIVETTYÄ'),
+            (None, fail(['V', 52, 'C'], ['tto', 'ttu', 'tty'])),
+        ],
+        'F': [
+            ('toa', 'V_KIETOA'),
+            ('tua', 'V_ROHTUA'),
+            ('tyä', 'V_SILIYTYÄ'),
+            (None, fail(['V', 52, 'F'], ['toa', 'tua', 'tyä'])),
+        ],
+        'D': [
+            ('koa', 'V_TAKOA'),
+            ('ukua', 'V_MAUKUA'),
+            ('kua', 'V_NUOKKUA'),
+            ('kyä', 'V_MÄIKYÄ'),
+            (None, fail(['V', 52, 'D'], ['ko'])),
+        ],
+        'I': [
+            ('ltua', 'V_HUMALTUA'),
+            ('ltyä', 'V_MIELTYÄ'),
+            (None, fail(['V', 52, 'I'], ['lto', 'ltu', 'lty'])),
+        ],
+        'J': [
+            ('ntua', 'V_VAKAANTUA'),
+            ('ntyä', 'V_TYHJENTYÄ'),
+            (None, fail(['V', 52, 'J'], ['nto', 'ntu', 'nty'])),
+        ],
+        'E': [
+            ('poa', 'V_SILPOA'),
+            ('pua', 'V_HIIPUA'),
+            ('pyä', 'V_SYÖPYÄ'),
+            (None, fail(['V', 52, 'E'], ['poa', 'pua', 'pyä'])),
+        ],
+        'K': [
+            ('rtoa', 'V_VARTOA'),
+            ('rtua', 'V_PUSERTUA'),
+            ('rtyä', 'V_KIERTYÄ'),
+            (None, fail(['V', 52, 'K'], ['rtoa', 'rtua', 'rtyä'])),
+        ],
+        'G': [
+            ('nkua', 'V_VINKUA'),
+            ('nkoa', 'V_PENKOA'),
+            (None, fail(['V', 52, 'G'], ['nko'])),
+        ],
+        'H': [
+            ('mpoa', 'V_TEMPOA'),
+            ('mpua', 'V_AMPUA'),
+            (None, fail(['V', 52, 'G'], ['nko'])),
+        ],
+        ELSE: [
+            (None, fail(['V', 52], [False, 'A-K'])),
+        ],
+    },
+    53: {
+        False: [
+            ('aa', 'V_MUTRISTAA'),
+            ('ää', 'V_KIVISTÄÄ'),
+            (None, fail(['V', 53, False], ['aa', 'ää'])),
+        ],
+        'C': [
+            ('ttaa', 'V_VIEROITTAA'),
+            ('ttää', 'V_RÄPSYTTÄÄ'),
+            (None, fail(['V', 53, 'C'], ['nto', 'ntu', 'nty'])),
+        ],
+        'F': [
+            ('taa', 'V_MOJAHTAA'),
+            ('tää', 'V_YSKÄHTÄÄ'),
+            (None, fail(['V', 53, 'F'], ['nto', 'ntu', 'nty'])),
+        ],
+        'D': [
+            ('kaa', 'V_PURKAA'),
+            (None, fail(['V', 53, 'D'], ['nto', 'ntu', 'nty'])),
+        ],
+        'J': [
+            ('ntää', 'V_KYNTÄÄ'),
+            (None, fail(['V', 53, 'J'], ['nto', 'ntu', 'nty'])),
+        ],
+        'K': [
+            ('rtaa', 'V_SORTAA'),
+            (None, fail(['V', 53, 'K'], ['nto', 'ntu', 'nty'])),
+        ],
+        ELSE: [
+            (None, fail(['V', 53], [False])),
+        ],
+    },
+    54: {
+        'F': [
+            ('taa', 'V_HUUTAA'),
+            ('tää', 'V_PYYTÄÄ'),
+            (None, fail(['V', 54, False], ['tää', 'taa'])),
+        ],
+        'I': [
+            ('ltaa', 'V_SIVALTAA'),
+            ('ltää', 'V_VIHELTÄÄ'),
+            (None, fail(['V', 54, 'I'], ['tää', 'taa'])),
+        ],
+        'J': [
+            ('ntaa', 'V_HUONONTAA'),
+            ('ntää', 'V_HIVENTÄÄ'),
+            (None, fail(['V', 54, 'J'], ['tää', 'taa'])),
+        ],
+        'K': [
+            ('rtaa', 'V_KUHERTAA'),
+            ('rtää', 'V_NÄPERTÄÄ'),
+            (None, fail(['V', 54, 'K'], ['tää', 'taa'])),
+        ],
+        ELSE: [
+            (None, fail(['V', 54], ['F', 'I-K'])),
+        ],
+    },
+    55: {
+        'F': [
+            ('taa', 'V_JOUTAA'),
+            ('tää', 'V_KIITÄÄ'),
+            (None, fail(['V', 55, 'F'], ['kko'])),
+        ],
+        'I': [
+            ('ltää', 'V_YLTÄÄ'),
+            (None, fail(['V', 55, 'I'], ['ltää'])),
+        ],
+        'J': [
+            ('ntää', 'V_ENTÄÄ'),
+            (None, fail(['V', 55, 'J'], ['tää', 'taa'])),
+        ],
+        ELSE: [
+            (None, fail(['V', 55], ['F', 'I', 'J'])),
+        ],
+    },
+    56: {
+        False: [
+            ('aa', 'V_KASVAA'),
+            (None, fail(['V', 56, False], ['front', 'back'])),
+        ],
+        'A': [
+            ('kaa', 'V_VIRKKAA'),
+            (None, fail(['V', 56, 'A'], ['kaa'])),
+        ],
+        'B': [
+            ('ppaa', 'V_TAPPAA'),
+            (None, fail(['V', 56, 'B'], ['kkaa'])),
+        ],
+        'C': [
+            ('ttaa', 'V_AUTTAA'),
+            (None, fail(['V', 56, 'C'], ['kkaa'])),
+        ],
+        'F': [
+            ('taa', 'V_SATAA'),
+            (None, fail(['V', 56, 'F'], ['kkaa'])),
+        ],
+        'D': [
+            ('kaa', 'V_VIRKKAA'),
+            (None, fail(['V', 56, 'A'], ['kaa'])),
+        ],
+        'J': [
+            ('ntaa', 'V_KANTAA'),
+            (None, fail(['V', 56, 'J'], ['kkaa'])),
+        ],
+        ELSE: [
+            (None, fail(['V', 56], [False])),
+        ],
+    },
+    57: {
+        'F': [
+            ('taa', 'V_KAATAA'),
+            (None, fail(['V', 57, 'F'], ['e', 'front', 'back'])),
+        ],
+        'K': [
+            ('rtaa', 'V_SAARTAA'),
+            (None, fail(['V', 57, 'K'], ['e', 'front', 'back'])),
+        ],
+        ELSE: [
+            (None, fail(['V', 57], [False])),
+        ],
+    },
+    58: {
+        False: [
+            ('ea', 'V_SOTKEA'),
+            ('eä', 'V_KYTKEÄ'),
+            (None, fail(['V', 58, False], ['ea', 'eä'])),
+        ],
+        'F': [
+            ('tea', 'V_KUTEA'),
+            ('teä', 'V_PÄTEÄ'),
+            (None, fail(['V', 58, 'F'], ['ka'])),
+        ],
+        'D': [
+            ('kea', 'V_PUKEA'),
+            (None, fail(['V', 58, 'D'], ['kka'])),
+        ],
+        'E': [
+            ('peä', 'V_RYPEÄ'),
+            (None, fail(['V', 58, 'E'], ['tta'])),
+        ],
+        'G': [
+            ('nkea', 'V_TUNKEA'),
+            (None, fail(['V', 58, 'G'], ['pa'])),
+        ],
+        'L': [
+            ('kea', 'V_POLKEA'),
+            ('keä', 'V_SÄRKEÄ'),
+            (None, fail(['V', 58, 'L'], ['ta'])),
+        ],
+        ELSE: [
+            (None, fail(['V', 58], [False, 'V-K'])),
+        ],
+    },
+    59: {
+        'J': [
+            ('ntea', 'V_TUNTEA'),
+            (None, fail(['V', 59, False], ['a', 'ä'])),
+        ],
+        ELSE: [
+            (None, fail(['V', 59, 'K'], ['rta'])),
+        ],
+    },
+    60: {
+        'F': [
+            ('hteä', 'V_LÄHTEÄ'),
+            (None, fail(['V', 60, False], ['a', 'ä'])),
+        ],
+        ELSE: [
+            (None, fail(['V', 60], [False])),
+        ],
+    },
+    61: {
+        False: [
+            ('ia', 'V_KOSIA'),
+            ('iä', 'V_RYSKIÄ'),
+            (None, fail(['V', 61, False], ['ia', 'iä'])),
+        ],
+        'A': [
+            ('kia', 'V_KUKKIA'),
+            ('kiä', 'V_SÖRKKIÄ'),
+            (None, fail(['V', 61, 'A'], ['kia', 'kiä'])),
+        ],
+        'B': [
+            ('ppia', 'V_KALPPIA'),
+            ('ppiä', 'V_HYPPIÄ'),
+            (None, fail(['V', 61, 'B'], ['a'])),
+        ],
+        'C': [
+            ('ttia', 'V_MOITTIA'),
+            ('ttiä', 'V_MIETTIÄ'),
+            (None, fail(['V', 61, 'C'], ['a'])),
+        ],
+        'F': [
+            ('tia', 'V_AHNEHTIA'),
+            ('tiä', 'V_EHTIÄ'),
+            (None, fail(['V', 61, 'F'], ['a'])),
+        ],
+        'D': [
+            ('kia', 'V_KUKKIA'),
+            ('kiä', 'V_SÖRKKIÄ'),
+            (None, fail(['V', 61, 'D'], ['a'])),
+        ],
+        'J': [
+            ('ntia', 'V_KONTIA'),
+            (None, fail(['V', 61, 'J'], ['a'])),
+        ],
+        'E': [
+            ('pia', 'V_RAAPIA'),
+            ('piä', 'V_RIIPIÄ'),
+            (None, fail(['V', 61, 'E'], ['a'])),
+        ],
+        'G': [
+            ('nkia', 'V_ONKIA'),
+            ('nkiä', 'V_MÖNKIÄ'),
+            (None, fail(['V', 61, 'G'], ['a'])),
+        ],
+        'H': [
+            ('mpiä', 'V_TYMPIÄ'),
+            (None, fail(['V', 61, 'H'], ['a'])),
+        ],
+        'L': [
+            ('kiä', 'V_HYLKIÄ'),
+            (None, fail(['V', 61, 'L'], ['a'])),
+        ],
+        ELSE: [
+            (None, fail(['V', 61], [False])),
+        ],
+    },
+    62: {
+        False: [
+            ('ida', 'V_KOPIOIDA'),
+            ('idä', 'V_ÖYKKÄRÖIDÄ'),
+            (None, fail(['V', 62, False], ['ida', 'idä'])),
+        ],
+        ELSE: [
+            (None, fail(['V', 62], [False])),
+        ],
+    },
+    63: {
+        False: [
+            ('aada', 'V_SAADA'),
+            ('yydä', 'V_MYYDÄ'),
+            ('äädä', 'V_JÄÄDÄ'),
+            (None, fail(['V', 63, False], ['kka', 'kkä'])),
+        ],
+        ELSE: [
+            (None, fail(['V', 63], [False])),
+        ],
+    },
+    64: {
+        False: [
+            ('iedä', 'V_VIEDÄ'),
+            ('uoda', 'V_TUODA'),
+            ('yödä', 'V_SYÖDÄ'),
+            (None, fail(['V', 64, False], ['oa', 'ea', 'eä'])),
+        ],
+        ELSE: [
+            (None, fail(['V', 64], [False])),
+        ],
+    },
+    65: {
+        False: [
+            ('käydä', 'V_KÄYDÄ'),
+            (None, fail(['V', 65, False], ['back'])),
+        ],
+        ELSE: [
+            (None, fail(['V', 65], ['H'])),
+        ],
+    },
+    66: {
+        False: [
+            ('ta', 'V_MARISTA'),
+            ('tä', 'V_ÄRISTÄ'),
+            (None, fail(['V', 66, False], ['ta', 'tä'])),
+        ],
+        'E': [
+            ('vista', 'V_VAVISTA'),
+            ('väistä', 'V_HÄVÄISTÄ'),
+            (None, fail(['V', 66, False], ['vista', 'väistä'])),
+        ],
+        'G': [
+            ('ngaista', 'V_RANGAISTA'),
+            (None, fail(['V', 66, False], ['gaista'])),
+        ],
+        ELSE: [
+            (None, fail(['V', 66], [False])),
+        ],
+    },
+    67: {
+        False: [
+            ('tulla', 'V_TULLA'),
+            (('ailla', 'oilla'), 'V_ARVAILLA'),
+            (('äillä', 'öilla'), 'V_LEPÄILLÄ'),
+            ('lla', 'V_ETUILLA'),
+            ('llä', 'V_ÄKSYILLÄ'),
+            ('nna', 'V_PANNA'),
+            ('nnä', 'V_MENNÄ'),
+            ('rra', 'V_SURRA'),
+            ('rrä', 'V_PIERRÄ'),
+            (None, fail(['V', 67, False], ['rra', 'rrä'])),
+        ],
+        'A': [
+            ('ella', 'V_NAKELLA'),
+            ('ellä', 'V_LEIKELLÄ'),
+            (None, fail(['V', 67, 'A'], ['a'])),
+        ],
+        'B': [
+            ('pella', 'V_TAPELLA'),
+            ('pellä', 'V_HYPELLÄ'),
+            (None, fail(['V', 67, 'B'], ['a'])),
+        ],
+        'C': [
+            ('tella', 'V_SULATELLA'),
+            ('tellä', 'V_HERÄTELLÄ'),
+            (None, fail(['V', 67, 'C'], ['a'])),
+        ],
+        'F': [
+            ('della', 'V_TIPAHDELLA'),
+            ('dellä', 'V_SÄPSÄHDELLÄ'),
+            (None, fail(['V', 67, 'F'], ['a'])),
+        ],
+        'D': [
+            ('ella', 'V_NAKELLA'),
+            ('ellä', 'V_LEIKELLÄ'),
+            (None, fail(['V', 67, 'A'], ['a'])),
+        ],
+        'I': [
+            ('llella', 'V_VAELLELLA'),
+            ('llellä', 'V_KIILLELLÄ'),
+            (None, fail(['V', 67, 'I'], ['a'])),
+        ],
+        'J': [
+            ('nnella', 'V_KOMENNELLA'),
+            ('nnellä', 'V_KÄÄNNELLÄ'),
+            (None, fail(['V', 67, 'J'], ['a'])),
+        ],
+        'K': [
+            ('rrella', 'V_NAKERRELLA'),
+            ('rrellä', 'V_KIHERRELLÄ'),
+            (None, fail(['V', 67, 'K'], ['a'])),
+        ],
+        'H': [
+            ('mmella', 'V_OMMELLA'),
+            (None, fail(['V', 67, 'H'], ['a'])),
+        ],
+        ELSE: [
+            (None, fail(['V', 18], [False])),
+        ],
+    },
+    68: {
+        False: [
+            ('oida', 'V_MELLAKOIDA'),
+            ('öidä', 'V_ISÄNNÖIDÄ'),
+            (None, fail(['V', 68, False], ['a'])),
+        ],
+        ELSE: [
+            (None, fail(['V', 68], [False])),
+        ],
+    },
+    69: {
+        False: [
+            ('ita', 'V_PALKITA'),
+            ('itä', 'V_MERKITÄ'),
+            (None, fail(['V', 69, False], ['a'])),
+        ],
+        ELSE: [
+            (None, fail(['V', 69], [False])),
+        ],
+    },
+    70: {
+        False: [
+            ('sta', 'V_JUOSTA'),
+            ('stä', 'V_PIESTÄ'),
+            (None, fail(['V', 70, False], ['back', 'front'])),
+        ],
+        ELSE: [
+            (None, fail(['V', 70], [False])),
+        ],
+    },
+    71: {
+        False: [
+            ('hdä', 'V_NÄHDÄ'),
+            (None, fail(['V', 71, False], ['back', 'front'])),
+        ],
+        ELSE: [
+            (None, fail(['V', 71], [False])),
+        ],
+    },
+    72: {
+        False: [
+            ('ta', 'V_KARHETA'),
+            ('tä', 'V_VÄHETÄ'),
+            (None, fail(['V', 72, False], ['back', 'front'])),
+        ],
+        'A': [
+            ('keta', 'V_NIUKETA'),
+            ('kota', 'V_ULOTA'),
+            ('ketä', 'V_JYRKETÄ'),
+            (None, fail(['V', 72, 'A'], ['back', 'front'])),
+        ],
+        'B': [
+            ('peta', 'V_SUPETA'),
+            ('petä', 'V_TYLPETÄ'),
+            ('pota', 'V_HELPOTA'),
+            ('pata', 'V_HAPATA'),
+            (None, fail(['V', 72, 'B'], ['peta', 'petä', 'pata', 'pota'])),
+        ],
+        'C': [
+            ('tota', 'V_LOITOTA'),
+            (None, fail(['V', 72, 'C'], ['back', 'front'])),
+        ],
+        'F': [
+            ('dota', 'V_LEUDOTA'),
+            ('detä', 'V_PIDETÄ'),
+            ('dätä', 'V_MÄDÄTÄ'),
+            (None, fail(['V', 72, 'F'], ['back', 'front'])),
+        ],
+        'D': [
+            ('ota', 'V_ULOTA'),
+            ('ata', 'V_ERATA'),
+            ('eta', 'V_NIUKETA'),
+            ('etä', 'V_JYRKETÄ'),
+            (None, fail(['V', 72, 'D'], ['back', 'front'])),
+        ],
+        'J': [
+            ('nnetä', 'V_KIINNETÄ'),
+            ('nnota', 'V_RENNOTA'),
+            (None, fail(['V', 72, 'J'], ['nnetä', 'nnota'])),
+        ],
+        'E': [
+            ('veta', 'V_KAVETA'),
+            ('vetä', 'V_KIVETÄ'),
+            (None, fail(['V', 72, 'E'], ['back', 'front'])),
+        ],
+        'H': [
+            ('mmetä', 'V_LÄMMETÄ'),
+            (None, fail(['V', 72, 'H'], ['back', 'front'])),
+        ],
+        'L': [
+            ('jeta', 'V_ROHJETA'),
+            ('jetä', 'V_ILJETÄ'),
+            (None, fail(['V', 72, 'L'], ['back', 'front'])),
+        ],
+        ELSE: [
+            (None, fail(['V', 72], [False, 'A-L'])),
+        ],
+    },
+    73: {
+        False: [
+            ('ata', 'V_ARVATA'),
+            ('ätä', 'V_YNNÄTÄ'),
+            (None, fail(['V', 73, False], ['ata', 'ätä'])),
+        ],
+        'A': [
+            ('ata', 'V_MORKATA'),
+            ('ätä', 'V_YÖKÄTÄ'),
+            (None, fail(['V', 73, 'A'], ['hapan'])),
+        ],
+        'B': [
+            ('pata', 'V_SIEPATA'),
+            ('pätä', 'V_VÄLPÄTÄ'),
+            (None, fail(['V', 73, 'B'], ['hapan'])),
+        ],
+        'C': [
+            ('tata', 'V_LUNTATA'),
+            ('tätä', 'V_LÄNTÄTÄ'),
+            (None, fail(['V', 73, 'C'], ['hapan'])),
+        ],
+        'F': [
+            ('data', 'V_JAHDATA'),
+            ('dätä', 'V_TÄHDÄTÄ'),
+            (None, fail(['V', 73, 'F'], ['hapan'])),
+        ],
+        'D': [
+            ('ata', 'V_MORKATA'),
+            ('ätä', 'V_YÖKÄTÄ'),
+            (None, fail(['V', 73, 'A'], ['hapan'])),
+        ],
+        'I': [
+            ('llata', 'V_MULLATA'),
+            (None, fail(['V', 73, 'I'], ['hapan'])),
+        ],
+        'J': [
+            ('nnata', 'V_SUUNNATA'),
+            ('nnätä', 'V_RYNNÄTÄ'),
+            (None, fail(['V', 73, 'J'], ['hapan'])),
+        ],
+        'E': [
+            ('vata', 'V_KAIVATA'),
+            ('vätä', 'V_LEVÄTÄ'),
+            (None, fail(['V', 73, 'E'], ['hapan'])),
+        ],
+        'K': [
+            ('rata', 'V_VERRATA'),
+            (None, fail(['V', 73, 'K'], ['hapan'])),
+        ],
+        'G': [
+            ('gata', 'V_VONGATA'),
+            ('gätä', 'V_VÄNGÄTÄ'),
+            (None, fail(['V', 73, 'G'], ['hapan'])),
+        ],
+        'H': [
+            ('mmata', 'V_TEMMATA'),
+            (None, fail(['V', 73, 'H'], ['hapan'])),
+        ],
+        'L': [
+            ('jätä', 'V_HYLJÄTÄ'),
+            (None, fail(['V', 73, 'K'], ['hapan'])),
+        ],
+        'O': [
+            ('gata', 'V_DIGATA'),
+            (None, fail(['V', 73, 'N'], ['hapan'])),
+        ],
+        'P': [
+            ('bata', 'V_LOBATA'),
+            (None, fail(['V', 73, 'P'], ['hapan'])),
+        ],
+        ELSE: [
+            (None, fail(['V', 73], [False, 'A-P'])),
+        ],
+    },
+    74: {
+        False: [
+            ('ta', 'V_KARHUTA'),
+            ('tä', 'V_TÄHYTÄ'),
+            (None, fail(['V', 74, False], ['ton'])),
+        ],
+        'A': [
+            ('ota', 'V_KAIKOTA'),
+            ('eta', 'V_POIKETA'),
+            ('etä', 'V_KERETÄ'),
+            ('uta', 'V_KOUKUTA'),
+            (None, fail(['V', 74, 'A'], ['hapan'])),
+        ],
+        'B': [
+            ('puta', 'V_PULPUTA'),
+            ('pota', 'V_UPOTA'),
+            (None, fail(['V', 74, 'B'], ['hapan'])),
+        ],
+        'C': [
+            ('tota', 'V_LOTOTA'),
+            ('tuta', 'V_LUUTUTA'),
+            (None, fail(['V', 74, 'C'], ['hapan'])),
+        ],
+        'F': [
+            ('duta', 'V_LIIDUTA'),
+            ('deta', 'V_TODETA'),
+            ('dota', 'V_VAAHDOTA'),
+            ('detä', 'V_VYYHDETÄ'),
+            (None, fail(['V', 74, 'F'], ['deta', 'detä', 'dota', 'duta'])),
+        ],
+        'D': [
+            ('ota', 'V_KAIKOTA'),
+            ('eta', 'V_POIKETA'),
+            ('etä', 'V_KERETÄ'),
+            ('uta', 'V_KOUKUTA'),
+            (None, fail(['V', 74, 'A'], ['hapan'])),
+        ],
+        'J': [
+            ('nnota', 'V_INNOTA'),
+            (None, fail(['V', 74, 'J'], ['hapan'])),
+        ],
+        'E': [
+            ('vuta', 'V_KIVUTA'),
+            ('veta', 'V_KORVETA'),
+            ('vetä', 'V_REVETÄ'),
+            ('vota', 'V_KIRVOTA'),
+            (None, fail(['V', 74, 'E'], ['hapan'])),
+        ],
+        'K': [
+            ('rrota', 'V_IRROTA'),
+            (None, fail(['V', 74, 'K'], ['hapan'])),
+        ],
+        'G': [
+            ('geta', 'V_TUNGETA'),
+            ('gota', 'V_PINGOTA'),
+            ('getä', 'V_ÄNGETÄ'),
+            (None, fail(['V', 74, 'G'], ['hapan'])),
+        ],
+        'H': [
+            ('mmuta', 'V_KUMMUTA'),
+            ('mmeta', 'V_KAMMETA'),
+            ('mmota', 'V_SAMMOTA'),
+            (None, fail(['V', 74, 'H'], ['hapan'])),
+        ],
+        'L': [
+            ('jeta', 'V_HALJETA'),
+            ('jetä', 'V_ILJETÄ'),
+            (None, fail(['V', 74, 'K'], ['hapan'])),
+        ],
+        ELSE: [
+            (None, fail(['V', 74], [False, 'A-K'])),
+        ],
+    },
+    75: {
+        False: [
+            ('ta', 'V_LASSOTA'),
+            ('tä', 'V_SELVITÄ'),
+            (None, fail(['V', 75, False], ['ta', 'tä'])),
+        ],
+        'B': [
+            ('pytä', 'V_RYÖPYTÄ'),
+            (None, fail(['V', 75, 'B'], ['ton'])),
+        ],
+        'C': [
+            ('tota', 'V_PEITOTA'),
+            (None, fail(['V', 75, 'C'], ['ton'])),
+        ],
+        'F': [
+            ('dota', 'V_MUODOTA'),
+            (None, fail(['V', 75, 'E'], ['ton'])),
+        ],
+        'D': [
+            ('itä', 'V_KERITÄ'),
+            (None, fail(['V', 75, 'D'], ['ton'])),
+        ],
+        'I': [
+            ('llitä', 'V_HELLITÄ'),
+            ('llota', 'V_AALLOTA'),
+            (None, fail(['V', 75, 'I'], ['ton'])),
+        ],
+        'H': [
+            ('mmitä', 'V_LÄMMITÄ'),
+            (None, fail(['V', 75, 'H'], ['ton'])),
+        ],
+        ELSE: [
+            (None, fail(['V', 75], [False, 'B', 'D', 'F', 'H', 'I'])),
+        ],
+    },
+    76: {
+        'F': [
+            ('taa', 'V_TAITAA'),
+            ('tää', 'V_TIETÄÄ'),
+            (None, fail(['V', 76, 'F'], ['front', 'back'])),
+        ],
+        ELSE: [
+            (None, fail(['V', 76], ['F'])),
+        ],
+    },
+    77: {
+        False: [
+            ('aa', 'V_VIPAJAA'),
+            ('ää', 'V_HELÄJÄÄ'),
+            (None, fail(['V', 77, False], ['vasen'])),
+        ],
+        ELSE: [
+            (None, fail(['V', 77], [False], 'cannot have gradation')),
+        ],
+    },
+    78: {
+        False: [
+            ('aa', 'V_RAIKAA'),
+            ('ää', 'V_ÄHKÄÄ'),
+            ('ata', 'V_HALAJAA'),
+            (None, fail(['V', 78, False], ['aa', 'ää', 'ata'])),
+        ],
+        'A': [
+            ('kkaa', 'V_TUIKKAA'),
+            (None, fail(['V', 78, 'A'], ['kkaa'])),
+        ],
+        ELSE: [
+            (None, fail(['V', 78], [False, 'A'])),
+        ],
+    },
+    99: {
+        ELSE: [
+            (None,
+             fail(['V', 99], [99],
+                  'Illegal class for V, 99 can only apply to P',
+                  new_para='#')),
+        ],
+    },
+    1067: {
+        False: [
+            ('olla', 'V_OLLA'),
+            (None, fail(['V', 10, 'D', 'OLLA'], ['olla'], 'must be olla')),
+        ],
+        ELSE: [],
+    },
+    1099: {
+        False: [
+            ('ei', 'V_EI'),
+            (None, fail(['V', 99, 'D', 'EI'], ['ei'], 'must be ei')),
+        ],
+        ELSE: [],
+    },
+    ELSE: {
+        ELSE: [
+            (None, fail(['V'], ['52-78', '99', '1067'])),
+        ],
+    },
+}
+
+
+NEW_PARA_RULES = {
+    'NOUN': _NOUN_RULES,
+    'PROPER': _NOUN_RULES,
+    'ADJECTIVE': _ADJECTIVE_RULES,
+    'VERB': _VERB_RULES,
+}
+
+RULE_KEYS = {
+    'NOUN': ['plurale_tantum', 'kotus_tn', 'kotus_av'],
+    'PROPER': ['plurale_tantum', 'kotus_tn', 'kotus_av'],
+    'ADJECTIVE': ['kotus_tn', 'kotus_av'],
+    'VERB': ['kotus_tn', 'kotus_av'],
+}
+
+
+_KEYS = {
+    'plurale_tantum': lambda value: value or 'common',
+    'kotus_tn': int,
+    'kotus_av': lambda value: value or False,
+}
+
+# field values that are looked up like the listed key value
+_KEY_ALIASES = {
+    'plurale_tantum': {'common': [None, '']},
+    'kotus_av': {False: [None, '']},
+}
+
+_FIELDS = {
+    'lemma[-1]': lambda wordmap: wordmap['lemma'][-1],
+    'lemma[-2]': lambda wordmap: wordmap['lemma'][-2],
+    'len(lemma)': lambda wordmap: len(wordmap['lemma']),
+    'three_syllable(stub)': lambda wordmap: three_syllable(wordmap['stub']),
+}
+
+# operators make test functions from field getter and value
+_OPERATORS = {
+    '==': lambda get, value: lambda wordmap: get(wordmap) == value,
+    '<': lambda get, value: lambda wordmap: get(wordmap) < value,
+    'in': lambda get, value: lambda wordmap: get(wordmap) in value,
+    'bool': lambda get, value: (lambda wordmap: bool(get(wordmap)) == value),
+    'not endswith': lambda get, value:
+        lambda wordmap: not get(wordmap).endswith(value),
+}
+
+
+def _field_getter(field):
+    if field in _FIELDS:
+        return _FIELDS[field]
+    return itemgetter(field)
+
+
+def _compile_test(test):
+    field, operator, value = test
+    return _OPERATORS[operator](_field_getter(field), value)
+
+
+def _compile_tests(tests):
+    if not tests:
+        return None
+    if len(tests) == 1:
+        return _compile_test(tests[0])
+    tests = [_compile_test(test) for test in tests]
+
+    def test_all(wordmap):
+        for test in tests:
+            if not test(wordmap):
+                return False
+        return True
+    return test_all
+
+
+def _compile_rules(rules):
+    '''Compile rule list into a reverse suffix trie of the lemma endings.
+
+    The trie nodes are dicts from characters to nodes. Under key None each
+    node has the rules to try for lemmas ending in the suffix spelled out by
+    the path to the node, as (test, action) pairs in rule order, so that
+    only the node of the longest matching suffix needs to be looked at.
+    The tests for lemma not ending in a suffix are resolved in the trie as
+    well.
+    '''
+    trie = dict()
+    compiled = []
+
+    def add(ending, i, kind):
+        node = trie
+        for c in reversed(ending):
+            node = node.setdefault(c, dict())
+        node.setdefault(kind, set()).add(i)
+
+    for i, rule in enumerate(rules):
+        endings = rule[0]
+        if endings is None:
+            endings = ['']
+        elif isinstance(endings, str):
+            endings = [endings]
+        for ending in endings:
+            add(ending, i, None)
+        tests = []
+        for test in rule[2:]:
+            if test[:2] == ('lemma', 'not endswith') and \
+                    isinstance(test[2], str):
+                add(test[2], i, 'not')
+            else:
+                tests.append(test)
+        action = rule[1]
+        if action is None:
+            action = ('stop',)
+        elif not isinstance(action, tuple):
+            action = ('para', action)
+        elif action[0] == 'assign':
+            action = ('assign', action[1], _field_getter(action[2]))
+        compiled.append((_compile_tests(tests), action))
+
+    def collect(node, ending, excluded):
+        ending = ending | node.get(None, set())
+        excluded = excluded | node.pop('not', set())
+        for c, child in node.items():
+            if c is not None:
+                collect(child, ending, excluded)
+        node[None] = tuple(compiled[i] for i in sorted(ending - excluded))
+    collect(trie, set(), set())
+    return trie
+
+
+def _compile_table(table):
+    if isinstance(table, list):
+        return _compile_rules(table)
+    return {key: _compile_table(subtable) for key, subtable in table.items()}
+
+
+def _find_rules(table, key):
+    for value in key:
+        table = table[value] if value in table else table[ELSE]
+    return table
+
+
+def _flatten_table(table, keys):
+    '''Map all combinations of listed values of keys in table to rules.
+
+    The mapping is keyed by the field values before @c _KEYS normalisation,
+    and it has the @c _KEY_ALIASES of the listed values as well.
+    '''
+    values = [set() for _ in keys]
+    tables = [table]
+    for level in values:
+        subtables = []
+        for subtable in tables:
+            level.update(subtable.keys())
+            subtables.extend(subtable.values())
+        level.discard(ELSE)
+        tables = subtables
+    flat = dict()
+    for key in product(*values):
+        rules = _find_rules(table, key)
+        aliases = [[value] + _KEY_ALIASES.get(field, {}).get(value, [])
+                   for field, value in zip(keys, key)]
+        for alias in product(*aliases):
+            flat[alias] = rules
+    return flat
+
+
+def _compile_new_para_rules():
+    compiled = dict()
+    for pos, table in NEW_PARA_RULES.items():
+        keys = RULE_KEYS[pos]
+        table = _compile_table(table)
+        compiled[pos] = (itemgetter(*keys), [_KEYS[key] for key in keys],
+                         table, _flatten_table(table, keys))
+    return compiled
+
+
+_COMPILED_RULES = _compile_new_para_rules()
+
+
+def guess_new_para_from_rules(wordmap, pos):
+    '''Guess new_para of wordmap from rule table for pos.'''
+    get_key, normalisers, table, flat = _COMPILED_RULES[pos]
+    key = get_key(wordmap)
+    node = flat.get(key)
+    if node is None:
+        node = _find_rules(table, [normalise(value) for normalise, value
+                                   in zip(normalisers, key)])
+    for c in reversed(wordmap['lemma']):
+        child = node.get(c)
+        if child is None:
+            break
+        node = child
+    for test, action in node[None]:
+        if test is not None and not test(wordmap):
+            continue
+        if action[0] == 'para':
+            wordmap['new_para'] = action[1]
+        elif action[0] == 'fail':
+            _, matches, failures, moar, new_para, fatal = action
+            if new_para is not None:
+                wordmap['new_para'] = new_para
+            fail_guess_because(wordmap, matches, failures, moar)
+            if fatal:
+                exit(1)
+        elif action[0] == 'assign':
+            wordmap[action[1]] = action[2](wordmap)
+            continue
+        break
+    return wordmap
+
+
 def guess_new_noun(wordmap):
     '''Guessing new noun class based on kotus class.'''
-    tn = int(wordmap['kotus_tn'])
-    if not wordmap['plurale_tantum'] or wordmap['plurale_tantum'] == 'common':
-        if tn == 1:
-            if not wordmap['kotus_av']:
-                if wordmap['lemma'].endswith('o') or wordmap['lemma'].endswith('O'):
-                    wordmap['new_para'] = 'N_TALO'
-                elif wordmap['lemma'].endswith('u') or wordmap['lemma'].endswith('U'):
-                    wordmap['new_para'] = 'N_ASU'
-                elif wordmap['lemma'].endswith('ú'):
-                    wordmap['new_para'] = 'N_ASU'
-                elif wordmap['lemma'].endswith('y') or wordmap['lemma'].endswith('Y'):
-                    wordmap['new_para'] = 'N_KÄRRY'
-                elif wordmap['lemma'].endswith('ÿ'):
-                    wordmap['new_para'] = 'N_KÄRRY'
-                elif wordmap['lemma'].endswith('ö'):
-                    wordmap['new_para'] = 'N_MÖMMÖ'
-                else:
-                    fail_guess_because(wordmap, ['N', 1, False],
-                                       ['o O', 'u ú', 'y ÿ Y', 'ö'])
-            elif wordmap['kotus_av'] == 'A':
-                if wordmap['lemma'].endswith('ko'):
-                    wordmap['new_para'] = 'N_UKKO'
-                elif wordmap['lemma'].endswith('ku'):
-                    wordmap['new_para'] = 'N_TIKKU'
-                elif wordmap['lemma'].endswith('ky'):
-                    wordmap['new_para'] = 'N_MYRKKY'
-                elif wordmap['lemma'].endswith('kö'):
-                    wordmap['new_para'] = 'N_YÖKKÖ'
-                else:
-                    fail_guess_because(wordmap, ['N', 1, 'A'],
-                                       ['ko', 'ku', 'ky', 'kö'])
-            elif wordmap['kotus_av'] == 'B':
-                if wordmap['lemma'].endswith('ppo'):
-                    wordmap['new_para'] = 'N_HAPPO'
-                elif wordmap['lemma'].endswith('ppu'):
-                    wordmap['new_para'] = 'N_LIPPU'
-                elif wordmap['lemma'].endswith('ppy'):
-                    wordmap['new_para'] = 'N_RYYPPY'
-                elif wordmap['lemma'].endswith('ppö'):
-                    wordmap['new_para'] = 'N_TÖRPPÖ'
-                else:
-                    fail_guess_because(wordmap, ['N', 1, 'B'],
-                                       ['ppo', 'ppu', 'ppy', 'ppö'])
-            elif wordmap['kotus_av'] == 'C':
-                if wordmap['lemma'].endswith('tto'):
-                    wordmap['new_para'] = 'N_HIRTTO'
-                elif wordmap['lemma'].endswith('ttu'):
-                    wordmap['new_para'] = 'N_TORTTU'
-                elif wordmap['lemma'].endswith('tty'):
-                    wordmap['new_para'] = 'N_PYTTY'
-                elif wordmap['lemma'].endswith('ttö'):
-                    wordmap['new_para'] = 'N_PÖNTTÖ'
-                else:
-                    fail_guess_because(wordmap, ['N', 1, 'C'],
-                                       ['tto', 'ttu', 'tty', 'ttö'])
-            elif wordmap['kotus_av'] == 'D':
-                if wordmap['lemma'].endswith('uoko'):
-                    wordmap['new_para'] = 'N_RUOKO'
-                elif wordmap['lemma'].endswith('iuku'):
-                    wordmap['new_para'] = 'N_LIUKU'
-                elif wordmap['lemma'].endswith('oko'):
-                    wordmap['new_para'] = 'N_KOKO'
-                elif wordmap['lemma'].endswith('hko') or \
-                        wordmap['lemma'].endswith('lko') or \
-                        wordmap['lemma'].endswith('rko'):
-                    wordmap['new_para'] = 'N_PELKO'
-                elif wordmap['lemma'].endswith('hku') or \
-                        wordmap['lemma'].endswith('lku') or \
-                        wordmap['lemma'].endswith('rku'):
-                    wordmap['new_para'] = 'N_ALKU'
-                elif wordmap['lemma'].endswith('hky') or \
-                        wordmap['lemma'].endswith('lky') or \
-                        wordmap['lemma'].endswith('rky'):
-                    wordmap['new_para'] = 'N_HYLKY'
-                elif wordmap['lemma'].endswith('hkö') or \
-                        wordmap['lemma'].endswith('lkö') or \
-                        wordmap['lemma'].endswith('rkö'):
-                    wordmap['new_para'] = 'N_MÖRKÖ'
-                elif wordmap['lemma'].endswith('ko'):
-                    wordmap['new_para'] = 'N_TEKO'
-                elif wordmap['lemma'].endswith('ku'):
-                    wordmap['new_para'] = 'N_MAKU'
-                elif wordmap['lemma'].endswith('ky'):
-                    wordmap['new_para'] = 'N_NÄKY'
-                elif wordmap['lemma'].endswith('kö'):
-                    wordmap['new_para'] = 'N_NÄKÖ'
-                else:
-                    fail_guess_because(wordmap, ['N', 1, 'D'],
-                                       ['ko', 'ku', 'ky', 'kö'])
-            elif wordmap['kotus_av'] == 'E':
-                if wordmap['lemma'].endswith('po'):
-                    wordmap['new_para'] = 'N_HEPO'
-                elif wordmap['lemma'].endswith('pu'):
-                    wordmap['new_para'] = 'N_APU'
-                elif wordmap['lemma'].endswith('py'):
-                    wordmap['new_para'] = 'N_KÄPY'
-                elif wordmap['lemma'].endswith('pö'):
-                    wordmap['new_para'] = 'N_LÖPÖ'
-                else:
-                    fail_guess_because(wordmap, ['N', 1, 'E'],
-                                       ['po', 'pu', 'py', 'pö'])
-            elif wordmap['kotus_av'] == 'F':
-                if wordmap['lemma'].endswith('to'):
-                    wordmap['new_para'] = 'N_VETO'
-                elif wordmap['lemma'].endswith('tu'):
-                    wordmap['new_para'] = 'N_KUITU'
-                elif wordmap['lemma'].endswith('ty'):
-                    wordmap['new_para'] = 'N_VETY'
-                elif wordmap['lemma'].endswith('tö'):
-                    wordmap['new_para'] = 'N_HÄÄTÖ'
-                else:
-                    fail_guess_because(wordmap, ['N', 1, 'F'],
-                                       ['to', 'tu', 'ty', 'tö'])
-            elif wordmap['kotus_av'] == 'G':
-                if wordmap['lemma'].endswith('nko'):
-                    wordmap['new_para'] = 'N_RUNKO'
-                elif wordmap['lemma'].endswith('nku'):
-                    wordmap['new_para'] = 'N_VINKU'
-                elif wordmap['lemma'].endswith('nky'):
-                    wordmap['new_para'] = 'N_SÄNKY'
-                elif wordmap['lemma'].endswith('nkö'):
-                    wordmap['new_para'] = 'N_YLÄNKÖ'
-                else:
-                    fail_guess_because(wordmap, ['N', 1, 'G'],
-                                       ['nko', 'nku', 'nky', 'nkö'])
-            elif wordmap['kotus_av'] == 'H':
-                if wordmap['lemma'].endswith('mpo'):
-                    wordmap['new_para'] = 'N_SAMPO'
-                elif wordmap['lemma'].endswith('mpu'):
-                    wordmap['new_para'] = 'N_RUMPU'
-                elif wordmap['lemma'].endswith('mpö'):
-                    wordmap['new_para'] = 'N_LÄMPÖ'
-                else:
-                    fail_guess_because(wordmap, ['N', 1, 'H'],
-                                       ['mpo', 'mpu', 'mpö'])
-            elif wordmap['kotus_av'] == 'I':
-                if wordmap['lemma'].endswith('lto'):
-                    wordmap['new_para'] = 'N_KIELTO'
-                elif wordmap['lemma'].endswith('ltu'):
-                    wordmap['new_para'] = 'N_HUOLITELTU'
-                elif wordmap['lemma'].endswith('lty'):
-                    wordmap['new_para'] = 'N_EPÄILTY'
-                elif wordmap['lemma'].endswith('ltö'):
-                    wordmap['new_para'] = 'N_SISÄLTÖ'
-                else:
-                    fail_guess_because(wordmap, ['N', 1, 'I'],
-                                       ['lto', 'ltu', 'lty', 'ltö'])
-            elif wordmap['kotus_av'] == 'J':
-                if wordmap['lemma'].endswith('nto'):
-                    wordmap['new_para'] = 'N_TUNTO'
-                elif wordmap['lemma'].endswith('ntu'):
-                    wordmap['new_para'] = 'N_LINTU'
-                elif wordmap['lemma'].endswith('nty'):
-                    wordmap['new_para'] = 'N_MÄNTY'
-                elif wordmap['lemma'].endswith('ntö'):
-                    wordmap['new_para'] = 'N_KÄÄNTÖ'
-                else:
-                    fail_guess_because(wordmap, ['N', 1, 'J'],
-                                       ['nto', 'ntu', 'nty', 'ntö'])
-            elif wordmap['kotus_av'] == 'K':
-                if wordmap['lemma'].endswith('rto'):
-                    wordmap['new_para'] = 'N_SIIRTO'
-                elif wordmap['lemma'].endswith('rtu'):
-                    wordmap['new_para'] = 'N_MERTU'
-                elif wordmap['lemma'].endswith('rtö'):
-                    wordmap['new_para'] = 'N_VÄRTÖ'
-                else:
-                    fail_guess_because(wordmap, ['N', 1, 'K'],
-                                       ['rto'])
-            elif wordmap['kotus_av'] == 'M':
-                if wordmap['lemma'].endswith('ko'):
-                    wordmap['new_para'] = 'N_MALKO'
-                elif wordmap['lemma'].endswith('ku'):
-                    wordmap['new_para'] = 'N_LUKU'
-                elif wordmap['lemma'].endswith('ky'):
-                    wordmap['new_para'] = 'N_KYKY'
-                else:
-                    fail_guess_because(wordmap, ['N', 1, 'M'],
-                                       ['ko', 'ku', 'ky'])
-            else:
-                fail_guess_because(wordmap, ['N', 1], ['A–K', 'M'])
-        elif tn == 2:
-            if not wordmap['kotus_av']:
-                if wordmap['lemma'].endswith('o'):
-                    wordmap['new_para'] = 'N_RUIPELO'
-                elif wordmap['lemma'].endswith('u'):
-                    wordmap['new_para'] = 'N_SEIKKAILU'
-                elif wordmap['lemma'].endswith('y'):
-                    wordmap['new_para'] = 'N_VEHKEILY'
-                elif wordmap['lemma'].endswith('ö'):
-                    wordmap['new_para'] = 'N_JÄÄTELÖ'
-                elif wordmap['lemma'].endswith('e') and wordmap['harmony'] == 'back':
-                    wordmap['new_para'] = 'N_EUGENE'
-                elif wordmap['lemma'].endswith('e') and wordmap['harmony'] == 'front':
-                    wordmap['new_para'] = 'N_SELENE'
-                else:
-                    fail_guess_because(wordmap, ['N', 2, False],
-                                       ['o', 'u', 'y', 'ö', 'e'])
-            else:
-                fail_guess_because(wordmap, ['N', 2], [False])
-        elif tn == 3:
-            if not wordmap['kotus_av']:
-                if wordmap['lemma'].endswith('ao'):
-                    wordmap['new_para'] = 'N_TUOMIO'
-                elif wordmap['lemma'].endswith('ão'):
-                    wordmap['new_para'] = 'N_TUOMIO'
-                elif wordmap['lemma'].endswith('ae'):
-                    wordmap['new_para'] = 'N_ZOMBIE'
-                elif wordmap['lemma'].endswith('eo'):
-                    wordmap['new_para'] = 'N_TUOMIO'
-                elif wordmap['lemma'].endswith('io'):
-                    wordmap['new_para'] = 'N_TUOMIO'
-                elif wordmap['lemma'].endswith('iö'):
-                    wordmap['new_para'] = 'N_HÄIRIÖ'
-                elif wordmap['lemma'].endswith('ie') and wordmap['harmony'] == 'back':
-                    wordmap['new_para'] = 'N_ZOMBIE'
-                elif wordmap['lemma'].endswith('ie') and wordmap['harmony'] == 'front':
-                    wordmap['new_para'] = 'N_BERNIE'
-                elif wordmap['lemma'].endswith('ye') and wordmap['harmony'] == 'front':
-                    wordmap['new_para'] = 'N_BERNIE'
-                elif wordmap['lemma'].endswith('oe'):
-                    wordmap['new_para'] = 'N_ZOMBIE'
-                elif wordmap['lemma'].endswith('ue'):
-                    wordmap['new_para'] = 'N_ZOMBIE'
-                elif wordmap['lemma'].endswith('yo'):
-                    wordmap['new_para'] = 'N_TUOMIO'
-                elif wordmap['lemma'].endswith('yö'):
-                    wordmap['new_para'] = 'N_HÄIRIÖ'
-                elif wordmap['lemma'].endswith('kolme'):
-                    wordmap['new_para'] = 'N_AAMUKOLME'
-                else:
-                    fail_guess_because(wordmap, ['N', 3, False],
-                                       ['ae', 'ao ão', 'eo', 'io', 'ie', 'iö', 'oe', 'ue', '*yo ye'])
-            else:
-                fail_guess_because(wordmap, ['N', 3], [False])
-        elif tn == 4:
-            if wordmap['kotus_av'] == 'A':
-                if wordmap['lemma'].endswith('kko'):
-                    wordmap['new_para'] = 'N_LEPAKKO'
-                elif wordmap['lemma'].endswith('kkö'):
-                    wordmap['new_para'] = 'N_YKSIKKÖ'
-                else:
-                    fail_guess_because(wordmap, ['N', 4, 'A'],
-                                       ['kko', 'kkö'])
-            else:
-                fail_guess_because(wordmap, ['N', 4], ['A'])
-        elif tn == 5:
-            if not wordmap['lemma'].endswith('i'):
-                if wordmap['harmony'] == 'back':
-                    wordmap['new_para'] = 'N_PUNK'
-                elif wordmap['harmony'] == 'front':
-                    wordmap['new_para'] = 'N_ZEN'
-                else:
-                    fail_guess_because(wordmap, ['N', 5, False, '!i'],
-                                       ['front', 'back'])
-            elif not wordmap['kotus_av']:
-                if wordmap['harmony'] == 'back':
-                    wordmap['new_para'] = 'N_RUUVI'
-                elif wordmap['harmony'] == 'front':
-                    wordmap['new_para'] = 'N_TYYLI'
-                else:
-                    fail_guess_because(wordmap, ['N', 5, False, 'i'],
-                                       ['front', 'back'])
-            elif wordmap['kotus_av'] == 'A':
-                if wordmap['lemma'].endswith('ki') and wordmap['harmony'] == 'back':
-                    wordmap['new_para'] = 'N_LOKKI'
-                elif wordmap['lemma'].endswith('ki') and wordmap['harmony'] == 'front':
-                    wordmap['new_para'] = 'N_HÄKKI'
-                else:
-                    fail_guess_because(wordmap, ['N', 5, 'A'],
-                                       ['ki', 'front', 'back'])
-            elif wordmap['kotus_av'] == 'B':
-                if wordmap['lemma'].endswith('ppi') and wordmap['harmony'] == 'back':
-                    wordmap['new_para'] = 'N_KUPPI'
-                elif wordmap['lemma'].endswith('ppi') and wordmap['harmony'] == 'front':
-                    wordmap['new_para'] = 'N_TYYPPI'
-                else:
-                    fail_guess_because(wordmap, ['N', 5, 'B'],
-                                       ['ppi', 'front', 'back'])
-            elif wordmap['kotus_av'] == 'C':
-                if wordmap['lemma'].endswith('tti') and wordmap['harmony'] == 'back':
-                    wordmap['new_para'] = 'N_KORTTI'
-                elif wordmap['lemma'].endswith('tti') and wordmap['harmony'] == 'front':
-                    wordmap['new_para'] = 'N_SKEITTI'
-                else:
-                    fail_guess_because(wordmap, ['N', 5, 'C'],
-                                       ['tti', 'front', 'back'])
-            elif wordmap['kotus_av'] == 'D':
-                if wordmap['lemma'].endswith('ki') and wordmap['harmony'] == 'back':
-                    wordmap['new_para'] = 'N_LAKI'
-                elif wordmap['lemma'].endswith('ki') and wordmap['harmony'] == 'front':
-                    wordmap['new_para'] = 'N_HÄKKI'
-                else:
-                    fail_guess_because(wordmap, ['N', 5, 'D'],
-                                       ['ki', 'front', 'back'])
-            elif wordmap['kotus_av'] == 'E':
-                if wordmap['lemma'].endswith('pi') and wordmap['harmony'] == 'back':
-                    wordmap['new_para'] = 'N_HUPI'
-                elif wordmap['lemma'].endswith('pi') and wordmap['harmony'] == 'front':
-                    wordmap['new_para'] = 'N_RIIPI'
-                else:
-                    fail_guess_because(wordmap, ['N', 5, 'E'],
-                                       ['pi', 'back', 'front'])
-            elif wordmap['kotus_av'] == 'F':
-                if wordmap['lemma'].endswith('ti') and wordmap['harmony'] == 'back':
-                    wordmap['new_para'] = 'N_TAUTI'
-                elif wordmap['lemma'].endswith('ti') and wordmap['harmony'] == 'front':
-                    wordmap['new_para'] = 'N_NIHTI'
-                else:
-                    fail_guess_because(wordmap, ['N', 5, 'F'],
-                                       ['ti', 'front', 'back'])
-            elif wordmap['kotus_av'] == 'G':
-                if wordmap['lemma'].endswith('nki') and wordmap['harmony'] == 'back':
-                    wordmap['new_para'] = 'N_VANKI'
-                elif wordmap['lemma'].endswith('nki') and wordmap['harmony'] == 'front':
-                    wordmap['new_para'] = 'N_HÄMMINKI'
-                else:
-                    fail_guess_because(wordmap, ['N', 5, 'F'],
-                                       ['nki', 'front', 'back'])
-            elif wordmap['kotus_av'] == 'H':
-                # obs! lampi och rimpi kan vara 5 eller 7
-                if wordmap['lemma'].endswith('mpi') and wordmap['harmony'] == 'back':
-                    wordmap['new_para'] = 'N_LAMMI'
-                elif wordmap['lemma'].endswith('mpi') and wordmap['harmony'] == 'front':
-                    wordmap['new_para'] = 'N_RIMMI'
-                else:
-                    fail_guess_because(wordmap, ['N', 5, 'H'],
-                                       ['mpi', 'front', 'back'])
-            elif wordmap['kotus_av'] == 'I':
-                if wordmap['lemma'].endswith('lti') and wordmap['harmony'] == 'front':
-                    wordmap['new_para'] = 'N_PELTI'
-                else:
-                    fail_guess_because(wordmap, ['N', 5, 'I'],
-                                       ['lti', 'back'])
-            elif wordmap['kotus_av'] == 'J':
-                if wordmap['lemma'].endswith('nti') and wordmap['harmony'] == 'back':
-                    wordmap['new_para'] = 'N_SOINTI'
-                elif wordmap['lemma'].endswith('nti') and wordmap['harmony'] == 'front':
-                    wordmap['new_para'] = 'N_VIENTI'
-                else:
-                    fail_guess_because(wordmap, ['N', 5, 'J'],
-                                       ['nti', 'front', 'back'])
-            else:
-                fail_guess_because(wordmap, ['N', 5],
-                                   ['A', 'B', 'C', 'D', 'E', 'F', 'I', 'J'])
-        elif tn == 6:
-            if not wordmap['lemma'].endswith('i'):
-                if wordmap['harmony'] == 'back':
-                    wordmap['new_para'] = 'N_STADION'
-                elif wordmap['harmony'] == 'front':
-                    wordmap['new_para'] = 'N_BESSERWISSER'
-                else:
-                    fail_guess_because(wordmap, ['N', 6, False, '!i'],
-                                       ['front', 'back'])
-            elif not wordmap['kotus_av']:
-                if wordmap['harmony'] == 'back':
-                    wordmap['new_para'] = 'N_KANAALI'
-                elif wordmap['harmony'] == 'front':
-                    wordmap['new_para'] = 'N_KEHVELI'
-                else:
-                    fail_guess_because(wordmap, ['N', 6, False, 'i'],
-                                       ['front', 'back'])
-            else:
-                fail_guess_because(wordmap, ['N', 6],
-                                   [False])
-        elif tn == 7:
-            if not wordmap['kotus_av']:
-                if wordmap['harmony'] == 'back':
-                    wordmap['new_para'] = 'N_ONNI'
-                elif wordmap['harmony'] == 'front':
-                    wordmap['new_para'] = 'N_KIVI'
-                else:
-                    fail_guess_because(wordmap, ['N', 7, False],
-                                       ['front', 'back'])
-            elif wordmap['kotus_av'] == 'B':
-                if wordmap['lemma'].endswith('ppi') and wordmap['harmony'] == 'back':
-                    wordmap['new_para'] = 'N_HAPPI'
-                elif wordmap['lemma'].endswith('ppi') and wordmap['harmony'] == 'front':
-                    wordmap['new_para'] = 'N_TYPPI'
-                else:
-                    fail_guess_because(wordmap, ['N', 7, 'B'],
-                                       ['ppi', 'front', 'back'])
-            elif wordmap['kotus_av'] == 'D':
-                if wordmap['lemma'].endswith('ki') and wordmap['harmony'] == 'back':
-                    wordmap['new_para'] = 'N_NOKI'
-                elif wordmap['lemma'].endswith('ki') and wordmap['harmony'] == 'front':
-                    wordmap['new_para'] = 'N_KÄKI'
-                else:
-                    fail_guess_because(wordmap, ['N', 7, 'D'],
-                                       ['ki', 'front', 'back'])
-            elif wordmap['kotus_av'] == 'E':
-                if wordmap['lemma'].endswith('pi') and wordmap['harmony'] == 'back':
-                    wordmap['new_para'] = 'N_KORPI'
-                elif wordmap['lemma'].endswith('pi') and wordmap['harmony'] == 'front':
-                    wordmap['new_para'] = 'N_KILPI'
-                else:
-                    fail_guess_because(wordmap, ['N', 7, 'E'],
-                                       ['pi', 'front', 'back'])
-            elif wordmap['kotus_av'] == 'F':
-                if wordmap['lemma'].endswith('ti') and wordmap['harmony'] == 'back':
-                    wordmap['new_para'] = 'N_LAHTI'
-                elif wordmap['lemma'].endswith('ti') and wordmap['harmony'] == 'front':
-                    wordmap['new_para'] = 'N_LEHTI'
-                else:
-                    fail_guess_because(wordmap, ['N', 7, 'F'],
-                                       ['hti', 'front', 'back'])
-            elif wordmap['kotus_av'] == 'G':
-                if wordmap['lemma'].endswith('nki') and wordmap['harmony'] == 'back':
-                    wordmap['new_para'] = 'N_ONKI'
-                elif wordmap['lemma'].endswith('nki') and wordmap['harmony'] == 'front':
-                    wordmap['new_para'] = 'N_HENKI'
-                else:
-                    fail_guess_because(wordmap, ['N', 7, 'G'],
-                                       ['nki', 'front', 'back'])
-            elif wordmap['kotus_av'] == 'H':
-                if wordmap['lemma'].endswith('mpi') and wordmap['harmony'] == 'back':
-                    wordmap['new_para'] = 'N_SAMPI'
-                elif wordmap['lemma'].endswith('mpi') and wordmap['harmony'] == 'front':
-                    wordmap['new_para'] = 'N_RIMPI'
-                else:
-                    fail_guess_because(wordmap, ['N', 7, 'H'],
-                                       ['mpi', 'front', 'back'])
-            elif wordmap['kotus_av'] == 'L':
-                if wordmap['lemma'].endswith('ki') and wordmap['harmony'] == 'back':
-                    wordmap['new_para'] = 'N_ARKI'
-                elif wordmap['lemma'].endswith('ki') and wordmap['harmony'] == 'front':
-                    wordmap['new_para'] = 'N_JÄRKI'
-                else:
-                    fail_guess_because(wordmap, ['N', 7, 'H'],
-                                       ['ki', 'front', 'back'])
-            else:
-                fail_guess_because(wordmap, ['N', 7],
-                                   [False, 'B', 'D', 'E', 'G', 'H'])
-        elif tn == 8:
-            if not wordmap['kotus_av']:
-                if wordmap['lemma'].endswith('e') and wordmap['harmony'] == 'back':
-                    wordmap['new_para'] = 'N_NALLE'
-                elif wordmap['lemma'].endswith('e') and wordmap['harmony'] == 'front':
-                    wordmap['new_para'] = 'N_NISSE'
-                elif wordmap['lemma'].endswith('E') and wordmap['harmony'] == 'back':
-                    wordmap['new_para'] = 'N_NALLE'
-                elif wordmap['lemma'].endswith('E') and wordmap['harmony'] == 'front':
-                    wordmap['new_para'] = 'N_NISSE'
-                elif wordmap['lemma'].endswith('ë') and wordmap['harmony'] == 'back':
-                    wordmap['new_para'] = 'N_NALLE'
-                elif wordmap['lemma'].endswith('ě') and wordmap['harmony'] == 'back':
-                    wordmap['new_para'] = 'N_NALLE'
-                elif wordmap['lemma'].endswith('ě') and wordmap['harmony'] == 'front':
-                    wordmap['new_para'] = 'N_NISSE'
-                elif wordmap['lemma'].endswith('ë') and wordmap['harmony'] == 'front':
-                    wordmap['new_para'] = 'N_NISSE'
-                elif wordmap['lemma'].endswith('an') and wordmap['harmony'] == 'front':
-                    wordmap['new_para'] = 'N_AAMUKAHDEKSAN'
-                elif wordmap['lemma'].endswith('än') and wordmap['harmony'] == 'front':
-                    wordmap['new_para'] = 'N_AAMUYHDEKSÄN'
-                elif wordmap['lemma'].endswith('en') and wordmap['harmony'] == 'front':
-                    wordmap['new_para'] = 'N_AAMUKYMMENEN'
-                else:
-                    fail_guess_because(wordmap, ['N', 8, False],
-                                       ['e', 'ë', 'ě', 'front', 'back'])
-            elif wordmap['kotus_av'] == 'A':
-                if wordmap['lemma'].endswith('kke') and wordmap['harmony'] == 'back':
-                    wordmap['new_para'] = 'N_NUKKE'
-                elif wordmap['lemma'].endswith('kke') and wordmap['harmony'] == 'front':
-                    wordmap['new_para'] = 'N_EKKE'
-                else:
-                    fail_guess_because(wordmap, ['N', 8, 'A'],
-                                       ['kke', 'back'])
-            elif wordmap['kotus_av'] == 'B':
-                if wordmap['lemma'].endswith('ppe') and wordmap['harmony'] == 'back':
-                    wordmap['new_para'] = 'N_RAPPE'
-                elif wordmap['lemma'].endswith('ppe') and wordmap['harmony'] == 'front':
-                    wordmap['new_para'] = 'N_JEPPE'
-                else:
-                    fail_guess_because(wordmap, ['N', 8, 'B'],
-                                       ['ppe', 'front'])
-            elif wordmap['kotus_av'] == 'C':
-                if wordmap['lemma'].endswith('tte') and wordmap['harmony'] == 'back':
-                    wordmap['new_para'] = 'N_LOTTE'
-                elif wordmap['lemma'].endswith('tte') and wordmap['harmony'] == 'front':
-                    wordmap['new_para'] = 'N_METTE'
-                else:
-                    fail_guess_because(wordmap, ['N', 8, 'C'],
-                                       ['tte', 'front', 'back'])
-            else:
-                fail_guess_because(wordmap, ['N', 8],
-                                   [False, 'A', 'B', 'C'],
-                                   "New loan words do not simply walk into qualitative gradation")
-        elif tn == 9:
-            if not wordmap['kotus_av']:
-                if wordmap['lemma'] in ["Kangasala", "Koskenala"]:
-                    wordmap['new_para'] = 'N_KANGASALA'
-                elif wordmap['lemma'].endswith('a'):
-                    wordmap['new_para'] = 'N_KIRJA'
-                elif wordmap['lemma'].endswith('A'):
-                    wordmap['new_para'] = 'N_FIFA'
-                elif wordmap['lemma'].endswith('ä'):
-                    wordmap['new_para'] = 'N_YMPÄRYSTÄ'
-                else:
-                    fail_guess_because(wordmap, ['N', 9, False],
-                                       ['a', 'ä'])
-            elif wordmap['kotus_av'] == 'A':
-                if wordmap['lemma'].endswith('ka'):
-                    wordmap['new_para'] = 'N_POLITIIKKA'
-                else:
-                    fail_guess_because(wordmap, ['N', 9, 'A'],
-                                       ['kka'])
-            elif wordmap['kotus_av'] == 'B':
-                if wordmap['lemma'].endswith('ppa'):
-                    wordmap['new_para'] = 'N_TIPPA'
-                else:
-                    fail_guess_because(wordmap, ['N', 9, 'B'],
-                                       ['ppa'])
-            elif wordmap['kotus_av'] == 'C':
-                if wordmap['lemma'].endswith('tta'):
-                    wordmap['new_para'] = 'N_MITTA'
-                elif wordmap['lemma'].endswith('ttä'):
-                    wordmap['new_para'] = 'N_YRITTÄ'
-                else:
-                    fail_guess_because(wordmap, ['N', 9, 'C'],
-                                       ['tta', 'ttä'])
-            elif wordmap['kotus_av'] == 'D':
-                if wordmap['lemma'].endswith('aaka'):
-                    wordmap['new_para'] = 'N_VAAKA'
-                elif wordmap['lemma'].endswith('ka'):
-                    wordmap['new_para'] = 'N_VIKA'
-                else:
-                    fail_guess_because(wordmap, ['N', 9, 'D'],
-                                       ['ka'])
-            elif wordmap['kotus_av'] == 'E':
-                if wordmap['lemma'].endswith('pa'):
-                    wordmap['new_para'] = 'N_SALPA'
-                else:
-                    fail_guess_because(wordmap, ['N', 9, 'E'],
-                                       ['pa'])
-            elif wordmap['kotus_av'] == 'F':
-                if wordmap['lemma'].endswith('ta'):
-                    wordmap['new_para'] = 'N_PATA'
-                else:
-                    fail_guess_because(wordmap, ['N', 9, 'F'],
-                                       ['ta'])
-            elif wordmap['kotus_av'] == 'G':
-                if wordmap['lemma'].endswith('nka'):
-                    wordmap['new_para'] = 'N_LANKA'
-                else:
-                    fail_guess_because(wordmap, ['N', 9, 'G'],
-                                       ['nka'])
-            elif wordmap['kotus_av'] == 'H':
-                if wordmap['lemma'].endswith('mpa'):
-                    wordmap['new_para'] = 'N_RAMPA'
-                else:
-                    fail_guess_because(wordmap, ['N', 9, 'H'],
-                                       ['mpa'])
-            elif wordmap['kotus_av'] == 'I':
-                if wordmap['lemma'].endswith('lta'):
-                    wordmap['new_para'] = 'N_VALTA'
-                else:
-                    fail_guess_because(wordmap, ['N', 9, 'I'],
-                                       ['lta'])
-            elif wordmap['kotus_av'] == 'J':
-                if wordmap['lemma'].endswith('nta'):
-                    wordmap['new_para'] = 'N_KUTSUNTA'
-                elif wordmap['lemma'].endswith('ntä'):
-                    wordmap['new_para'] = 'N_KYSYNTÄ'
-                else:
-                    fail_guess_because(wordmap, ['N', 9, 'J'],
-                                       ['nta', 'ntä'])
-            elif wordmap['kotus_av'] == 'K':
-                if wordmap['lemma'].endswith('rta'):
-                    wordmap['new_para'] = 'N_KERTA'
-                else:
-                    fail_guess_because(wordmap, ['N', 9, 'K'],
-                                       ['rta'])
-            else:
-                fail_guess_because(wordmap, ['N', 9],
-                                   [False, 'A-K'])
-        elif tn == 10:
-            if not wordmap['kotus_av']:
-                if wordmap['lemma'].endswith('a'):
-                    if three_syllable(wordmap['stub']):
-                        wordmap['new_para'] = 'N_ASEMA'
-                    else:
-                        wordmap['new_para'] = 'N_VOIMA'
-                elif wordmap['lemma'].endswith('A'):
-                    wordmap['new_para'] = 'N_FIFA'
-                elif wordmap['lemma'].endswith('ă'):
-                    wordmap['new_para'] = 'N_VODĂ'
-                elif wordmap['lemma'].endswith('ä'):
-                    if three_syllable(wordmap['stub']):
-                        wordmap['new_para'] = 'N_ELÄMÄ'
-                    else:
-                        wordmap['new_para'] = ['N_HÖPÖTTÄJÄ']
-                elif wordmap['lemma'].endswith('an'):
-                    wordmap['new_para'] = 'N_AAMUKAHDEKSAN'
-                elif wordmap['lemma'].endswith('än'):
-                    wordmap['new_para'] = 'N_AAMUYHDEKSÄN'
-                else:
-                    fail_guess_because(wordmap, ['N', 10, False],
-                                       ['a ă', 'ä'])
-            elif wordmap['kotus_av'] == 'A':
-                if wordmap['lemma'].endswith('ka'):
-                    wordmap['new_para'] = 'N_LUOKKA'
-                elif wordmap['lemma'].endswith('kä'):
-                    wordmap['new_para'] = 'N_HÖLKKÄ'
-                else:
-                    fail_guess_because(wordmap, ['N', 10, 'A'],
-                                       ['kka', 'kkä'])
-            elif wordmap['kotus_av'] == 'B':
-                if wordmap['lemma'].endswith('ppa'):
-                    wordmap['new_para'] = 'N_KUOPPA'
-                elif wordmap['lemma'].endswith('ppä'):
-                    wordmap['new_para'] = 'N_SEPPÄ'
-                else:
-                    fail_guess_because(wordmap, ['N', 10, 'B'],
-                                       ['ppa', 'ppä'])
-            elif wordmap['kotus_av'] == 'C':
-                if wordmap['lemma'].endswith('tta'):
-                    wordmap['new_para'] = 'N_ROTTA'
-                elif wordmap['lemma'].endswith('ttä'):
-                    wordmap['new_para'] = 'N_KENTTÄ'
-                else:
-                    fail_guess_because(wordmap, ['N', 10, 'C'],
-                                       ['tta', 'ttä'])
-            elif wordmap['kotus_av'] == 'D':
-                if wordmap['lemma'].endswith('lka'):
-                    wordmap['new_para'] = 'N_SULKA'
-                elif wordmap['lemma'].endswith('lkä'):
-                    wordmap['new_para'] = 'N_NÄLKÄ'
-                elif wordmap['lemma'].endswith('uoka'):
-                    wordmap['new_para'] = 'N_RUOKA'
-                elif wordmap['lemma'].endswith('ka'):
-                    wordmap['new_para'] = 'N_LOKA'
-                elif wordmap['lemma'].endswith('kä'):
-                    wordmap['new_para'] = 'N_REIKÄ'
-                else:
-                    fail_guess_because(wordmap, ['N', 10, 'D'],
-                                       ['ka', 'kä'])
-            elif wordmap['kotus_av'] == 'E':
-                if wordmap['lemma'].endswith('pa'):
-                    wordmap['new_para'] = 'N_LUPA'
-                elif wordmap['lemma'].endswith('pä'):
-                    wordmap['new_para'] = 'N_LEIPÄ'
-                else:
-                    fail_guess_because(wordmap, ['N', 10, 'E'],
-                                       ['pa', 'pä'])
-            elif wordmap['kotus_av'] == 'F':
-                if wordmap['lemma'].endswith('ta'):
-                    wordmap['new_para'] = 'N_SOTA'
-                elif wordmap['lemma'].endswith('tä'):
-                    wordmap['new_para'] = 'N_PÖYTÄ'
-                else:
-                    fail_guess_because(wordmap, ['N', 10, 'F'],
-                                       ['ta', 'tä'])
-            elif wordmap['kotus_av'] == 'G':
-                if wordmap['lemma'].endswith('nka'):
-                    wordmap['new_para'] = 'N_HONKA'
-                elif wordmap['lemma'].endswith('nkä'):
-                    wordmap['new_para'] = 'N_KENKÄ'
-                else:
-                    fail_guess_because(wordmap, ['N', 10, 'G'],
-                                       ['nka', 'nkä'])
-            elif wordmap['kotus_av'] == 'H':
-                if wordmap['lemma'].endswith('mpa'):
-                    wordmap['new_para'] = 'N_KOMPA'
-                else:
-                    fail_guess_because(wordmap, ['N', 10, 'H'],
-                                       ['mpa', 'mpä'])
-            elif wordmap['kotus_av'] == 'I':
-                if wordmap['lemma'].endswith('lta'):
-                    wordmap['new_para'] = 'N_MULTA'
-                elif wordmap['lemma'].endswith('ltä'):
-                    wordmap['new_para'] = 'N_SYLTÄ'
-                else:
-                    fail_guess_because(wordmap, ['N', 10, 'I'],
-                                       ['lta', 'ltä'])
-            elif wordmap['kotus_av'] == 'J':
-                if wordmap['lemma'].endswith('nta'):
-                    wordmap['new_para'] = 'N_KUNTA'
-                elif wordmap['lemma'].endswith('ntä'):
-                    wordmap['new_para'] = 'N_HÄNTÄ'
-                else:
-                    fail_guess_because(wordmap, ['N', 10, 'J'],
-                                       ['nta', 'ntä'])
-            elif wordmap['kotus_av'] == 'K':
-                if wordmap['lemma'].endswith('rta'):
-                    wordmap['new_para'] = 'N_HORTA'
-                else:
-                    fail_guess_because(wordmap, ['N', 10, 'K'],
-                                       ['rta'])
-            elif wordmap['kotus_av'] == 'L':
-                if wordmap['lemma'].endswith('kä'):
-                    wordmap['new_para'] = 'N_SELKÄ'
-                elif wordmap['lemma'].endswith('ka'):
-                    wordmap['new_para'] = 'N_OLKA'
-                else:
-                    fail_guess_because(wordmap, ['N', 10, 'L'],
-                                       ['kä'])
-            else:
-                fail_guess_because(wordmap, ['N', 10],
-                                   [False, 'A-J', 'L'])
-        elif tn == 11:
-            if not wordmap['kotus_av']:
-                if wordmap['lemma'].endswith('a'):
-                    wordmap['new_para'] = 'N_PROBLEEMA'
-                elif wordmap['lemma'].endswith('ä'):
-                    wordmap['new_para'] = 'N_KÄPÄLÄ'
-                else:
-                    fail_guess_because(wordmap, ['N', 11, False],
-                                       ['a', 'ä'])
-            else:
-                fail_guess_because(wordmap, ['N', 11],
-                                   [False])
-        elif tn == 12:
-            if not wordmap['kotus_av']:
-                if wordmap['lemma'].endswith('a'):
-                    wordmap['new_para'] = 'N_MAKKARA'
-                elif wordmap['lemma'].endswith('ä'):
-                    wordmap['new_para'] = 'N_HÄKKYRÄ'
-                elif wordmap['lemma'].endswith('A'):
-                    wordmap['new_para'] = 'N_FIFA'
-                else:
-                    fail_guess_because(wordmap, ['N', 12, False],
-                                       ['a', 'ä'])
-            else:
-                fail_guess_because(wordmap, ['N', 12],
-                                   [False])
-        elif tn == 13:
-            if not wordmap['kotus_av']:
-                if wordmap['lemma'].endswith('a'):
-                    wordmap['new_para'] = 'N_KITARA'
-                elif wordmap['lemma'].endswith('ä'):
-                    wordmap['new_para'] = 'N_SIIVILÄ'
-                else:
-                    fail_guess_because(wordmap, ['N', 13, False],
-                                       ['a', 'ä'])
-            else:
-                fail_guess_because(wordmap, ['N', 13],
-                                   [False])
-        elif tn == 14:
-            if wordmap['kotus_av'] == 'A':
-                if wordmap['lemma'].endswith('kka'):
-                    wordmap['new_para'] = 'N_LUSIKKA'
-                elif wordmap['lemma'].endswith('kkä'):
-                    wordmap['new_para'] = 'N_KÄMMEKKÄ'
-                else:
-                    fail_guess_because(wordmap, ['N', 14, 'A'],
-                                       ['kka', 'kkä'])
-            elif wordmap['kotus_av'] == 'B':
-                if wordmap['lemma'].endswith('ppa'):
-                    wordmap['new_para'] = 'N_ULAPPA'
-                else:
-                    fail_guess_because(wordmap, ['N', 14, 'B'],
-                                       ['ppä'])
-            elif wordmap['kotus_av'] == 'C':
-                if wordmap['lemma'].endswith('tta'):
-                    wordmap['new_para'] = 'N_POHATTA'
-                else:
-                    fail_guess_because(wordmap, ['N', 14, 'C'],
-                                       ['tta'])
-            else:
-                fail_guess_because(wordmap, ['N', 14],
-                                   ['A', 'B', 'C'])
-        elif tn == 15:
-            if not wordmap['kotus_av']:
-                if wordmap['lemma'].endswith('oa'):
-                    wordmap['new_para'] = 'N_PIIROA'
-                elif wordmap['lemma'].endswith('ôa'):
-                    wordmap['new_para'] = 'N_PIIROA'
-                elif wordmap['lemma'].endswith('ea'):
-                    wordmap['new_para'] = 'N_SOKEA'
-                elif wordmap['lemma'].endswith('eä'):
-                    wordmap['new_para'] = 'N_LIPEÄ'
-                elif wordmap['lemma'].endswith('ua'):
-                    wordmap['new_para'] = 'N_TANHUA'
-                else:
-                    fail_guess_because(wordmap, ['N', 15, False],
-                                       ['oa ôa', 'ea', 'eä', 'ua'])
-            else:
-                fail_guess_because(wordmap, ['N', 15],
-                                   [False])
-        elif tn == 16:
-            if wordmap['kotus_av'] == 'H':
-                if wordmap['harmony'] == 'back':
-                    wordmap['new_para'] = 'N_VANHEMPI'
-                else:
-                    fail_guess_because(wordmap, ['N', 16, 'H'],
-                                       ['back'])
-            else:
-                fail_guess_because(wordmap, ['N', 16],
-                                   ['H'])
-        elif tn == 17:
-            if not wordmap['kotus_av']:
-                if wordmap['lemma'].endswith('aa'):
-                    wordmap['new_para'] = 'N_VAINAA'
-                elif wordmap['lemma'].endswith('ee') and wordmap['harmony'] == 'back':
-                    wordmap['new_para'] = 'N_TOKEE'
-                elif wordmap['lemma'].endswith('ee') and wordmap['harmony'] == 'front':
-                    wordmap['new_para'] = 'N_LENTTEE'
-                elif wordmap['lemma'].endswith('ii') and wordmap['harmony'] == 'back':
-                    wordmap['new_para'] = 'N_VAANII'
-                elif wordmap['lemma'].endswith('ii') and wordmap['harmony'] == 'front':
-                    wordmap['new_para'] = 'N_TIHVII'
-                elif wordmap['lemma'].endswith('oo'):
-                    wordmap['new_para'] = 'N_TIENOO'
-                elif wordmap['lemma'].endswith('uu'):
-                    wordmap['new_para'] = 'N_LEIKKUU'
-                elif wordmap['lemma'].endswith('yy'):
-                    wordmap['new_para'] = 'N_HYÖTYY'
-                elif wordmap['lemma'].endswith('ää'):
-                    wordmap['new_para'] = 'N_PYHTÄÄ'
-                elif wordmap['lemma'].endswith('öö'):
-                    wordmap['new_para'] = 'N_YLÖÖ'
-                else:
-                    fail_guess_because(wordmap, ['N', 17, False],
-                                       ['aa', 'ee', 'oo', 'uu', 'yy', 'ää', 'öö'])
-            else:
-                fail_guess_because(wordmap, ['N', 17],
-                                   [False])
-        elif tn == 18:
-            if not wordmap['kotus_av']:
-                if wordmap['lemma'].endswith('a'):
-                    wordmap['new_para'] = 'N_MAA'
-                elif wordmap['lemma'].endswith('e') and wordmap['harmony'] == 'back':
-                    wordmap['new_para'] = 'N_MATEE'
-                elif wordmap['lemma'].endswith('e') and wordmap['harmony'] == 'front':
-                    wordmap['new_para'] = 'N_TEE'
-                elif wordmap['lemma'].endswith('i') and wordmap['harmony'] == 'back':
-                    wordmap['new_para'] = 'N_HAI'
-                elif wordmap['lemma'].endswith('i') and wordmap['harmony'] == 'front':
-                    wordmap['new_para'] = 'N_PII'
-                elif wordmap['lemma'].endswith('o'):
-                    wordmap['new_para'] = 'N_OOKOO'
-                elif wordmap['lemma'].endswith('u'):
-                    wordmap['new_para'] = 'N_PUU'
-                elif wordmap['lemma'].endswith('y'):
-                    wordmap['new_para'] = 'N_PYY'
-                elif wordmap['lemma'].endswith('ä'):
-                    wordmap['new_para'] = 'N_PÄÄ'
-                elif wordmap['lemma'].endswith('ö'):
-                    wordmap['new_para'] = 'N_KÖÖ'
-                else:
-                    fail_guess_because(wordmap, ['N', 18, False],
-                                       ['a', 'e', 'i', 'o', 'u', 'y', 'ä', 'ö', 'back', 'front'])
-            else:
-                fail_guess_because(wordmap, ['N', 18],
-                                   [False])
-        elif tn == 19:
-            if not wordmap['kotus_av']:
-                if wordmap['lemma'].endswith('uo'):
-                    wordmap['new_para'] = 'N_VUO'
-                elif wordmap['lemma'].endswith('ie') and wordmap['harmony'] == 'front':
-                    wordmap['new_para'] = 'N_TIE'
-                elif wordmap['lemma'].endswith('yö'):
-                    wordmap['new_para'] = 'N_TYÖ'
-                else:
-                    fail_guess_because(wordmap, ['N', 19, False],
-                                       ['ie', 'uo', 'yö'])
-            else:
-                fail_guess_because(wordmap, ['N', 19],
-                                   [False])
-        elif tn == 20:
-            if not wordmap['kotus_av']:
-                if wordmap['lemma'].endswith('aa'):
-                    wordmap['new_para'] = 'N_NUGAA'
-                elif wordmap['lemma'].endswith('ee') and wordmap['harmony'] == 'back':
-                    wordmap['new_para'] = 'N_PATEE'
-                elif wordmap['lemma'].endswith('ee') and wordmap['harmony'] == 'front':
-                    wordmap['new_para'] = 'N_BIDEE'
-                elif wordmap['lemma'].endswith('EE') and wordmap['harmony'] == 'back':
-                    wordmap['new_para'] = 'N_PATEE'
-                elif wordmap['lemma'].endswith('EE') and wordmap['harmony'] == 'front':
-                    wordmap['new_para'] = 'N_BIDEE'
-                elif wordmap['lemma'].endswith('oo'):
-                    wordmap['new_para'] = 'N_TRIKOO'
-                elif wordmap['lemma'].endswith('uu'):
-                    wordmap['new_para'] = 'N_RAGUU'
-                elif wordmap['lemma'].endswith('yy'):
-                    wordmap['new_para'] = 'N_FONDYY'
-                elif wordmap['lemma'].endswith('öö'):
-                    wordmap['new_para'] = 'N_MILJÖÖ'
-                else:
-                    fail_guess_because(wordmap, ['N', 20, False],
-                                       ['aa', 'ee', 'oo', 'uu', 'yy', 'öö'])
-            else:
-                fail_guess_because(wordmap, ['N', 20],
-                                   [False])
-        elif tn == 21:
-            if not wordmap['kotus_av']:
-                if not wordmap['stem_vowel']:
-                    # No pre-defined pronunciation, use guessing
-                    if wordmap['lemma'].endswith('ae'):
-                        wordmap['new_para'] = 'N_REGGAE'
-                    elif wordmap['lemma'].endswith('ie') and wordmap['harmony'] == 'back':
-                        wordmap['new_para'] = 'N_BRASSERIE'
-                    elif wordmap['lemma'].endswith('ie') and wordmap['harmony'] == 'front':
-                        wordmap['new_para'] = 'N_BRIE'
-                    elif wordmap['lemma'].endswith('ci'):
-                        wordmap['new_para'] = 'N_JOCKEY'
-                    elif wordmap['lemma'].endswith('ay') or wordmap['lemma'].endswith('ey'):
-                        if len(wordmap['lemma']) < 5:
-                            wordmap['new_para'] = 'N_GAY'
-                        else:
-                            wordmap['new_para'] = 'N_JOCKEY'
-                    elif wordmap['lemma'].endswith('oy') or wordmap['lemma'].endswith('uy'):
-                        wordmap['new_para'] = 'N_COWBOY'
-                    elif wordmap['lemma'].endswith('y'):
-                        wordmap['new_para'] = 'N_SPOTIFY'
-                    else:
-                        wordmap['stem_vowel'] = wordmap['lemma'][-1]
-                if wordmap['stem_vowel']:
-                    # Pre-defined pronunciation or last ortographic vowel if
-                    # not handled above
-                    if wordmap['stem_vowel'] in 'aAáàâãăąā':
-                        wordmap['new_para'] = 'N_CHACHACHA'
-                    elif wordmap['stem_vowel'] in 'eEéèêėěęē' and wordmap['harmony'] == 'back':
-                        wordmap['new_para'] = 'N_ROSÉ'
-                    elif wordmap['stem_vowel'] in 'eEéèêëėěęē' and wordmap['harmony'] == 'front':
-                        wordmap['new_para'] = 'N_BÉBÉ'
-                    elif wordmap['stem_vowel'] in 'iIíìîïī' and (wordmap['lemma'][-2] == 'a' or
-                                                                 wordmap['lemma'][-2] == 'e'):
-                        if len(wordmap['lemma']) < 5:
-                            wordmap['new_para'] = 'N_GAY'
-                        else:
-                            wordmap['new_para'] = 'N_JOCKEY'
-                    elif wordmap['stem_vowel'] in 'iIíìîïī' and (wordmap['lemma'][-2] == 'o' or
-                                                                 wordmap['lemma'][-2] == 'u'):
-                        wordmap['new_para'] = 'N_COWBOY'
-                    elif wordmap['stem_vowel'] in 'iIíìîïī' and wordmap['lemma'][-1] == 'y':
-                        wordmap['new_para'] = 'N_SPOTIFY'
-                    elif wordmap['stem_vowel'] in 'iIíìîïī' and wordmap['harmony'] == 'back':
-                        wordmap['new_para'] = 'N_BRASSERIE'
-                    elif wordmap['stem_vowel'] in 'iIíìîïī' and wordmap['harmony'] == 'front':
-                        wordmap['new_para'] = 'N_BRIE'
-                    elif wordmap['stem_vowel'] in 'oOóòôõōå':
-                        wordmap['new_para'] = 'N_ESQUIMAU'
-                    elif wordmap['stem_vowel'] in 'uUúùûū':
-                        wordmap['new_para'] = 'N_KUNGFU'
-                    elif wordmap['stem_vowel'] in 'yYýÿüű':
-                        wordmap['new_para'] = 'N_FONDUE'
-                    elif wordmap['stem_vowel'] in 'öÖøő':
-                        wordmap['new_para'] = 'N_MALMÖ'
-                if not wordmap['new_para']:
-                    fail_guess_because(wordmap, ['N', 21, False],
-                                       ['gay', 'eéè', "etc."], "unhandled stem type for 21 - using #")
-                    wordmap['new_para'] = '#'
-            else:
-                fail_guess_because(wordmap, ['N', 21],
-                                   [False])
-        elif tn == 22:
-            if not wordmap['kotus_av']:
-                # Known pronunciations
-                if wordmap['stem_vowel'] == 'a':
-                    wordmap['new_para'] = 'N_NOUGAT'
-                elif wordmap['stem_vowel'] == 'e' and wordmap['harmony'] == 'back':
-                    wordmap['new_para'] = 'N_PARFAIT'
-                elif wordmap['stem_vowel'] == 'e' and wordmap['harmony'] == 'front':
-                    wordmap['new_para'] = 'N_BEIGNET'
-                elif wordmap['stem_vowel'] == 'i' and wordmap['harmony'] == 'back':
-                    wordmap['new_para'] = 'N_VERSAILLES'
-                elif wordmap['stem_vowel'] == 'i' and wordmap['harmony'] == 'front':
-                    wordmap['new_para'] = 'N_BEIGNET'  # !
-                elif wordmap['stem_vowel'] == 'o':
-                    wordmap['new_para'] = 'N_BORDEAUX'
-                elif wordmap['stem_vowel'] == 'u':
-                    wordmap['new_para'] = 'N_SHOW'
-                elif wordmap['stem_vowel'] == 'y':
-                    wordmap['new_para'] = 'N_CAMUS'
-                elif wordmap['stem_vowel'] == 'ö':
-                    wordmap['new_para'] = 'N_MONSIEUR'
-                # Guessed pronunciations
-                elif wordmap['lemma'].endswith('j'):
-                    wordmap['new_para'] = 'N_SERGEJ'
-                elif wordmap['lemma'].endswith('ah'):
-                    wordmap['new_para'] = 'N_NOUGAT'
-                elif wordmap['lemma'].endswith('at'):
-                    wordmap['new_para'] = 'N_NOUGAT'
-                elif wordmap['lemma'].endswith('ait'):
-                    wordmap['new_para'] = 'N_PARFAIT'
-                elif wordmap['lemma'].endswith('et'):
-                    wordmap['new_para'] = 'N_BEIGNET'
-                elif wordmap['lemma'].endswith('ot'):
-                    wordmap['new_para'] = 'N_BORDEAUX'
-                elif wordmap['lemma'].endswith('os'):
-                    wordmap['new_para'] = 'N_BORDEAUX'
-                elif wordmap['lemma'].endswith('us'):
-                    wordmap['new_para'] = 'N_CAMUS'
-                elif wordmap['lemma'].endswith('ois'):
-                    wordmap['new_para'] = 'N_NOUGAT'
-                elif wordmap['lemma'].endswith('ew'):
-                    wordmap['new_para'] = 'N_SHOW'
-                elif wordmap['lemma'].endswith('ow'):
-                    wordmap['new_para'] = 'N_SHOW'
-                elif wordmap['lemma'].endswith('ough'):
-                    wordmap['new_para'] = 'N_SHOW'
-                elif wordmap['lemma'].endswith('oux'):
-                    wordmap['new_para'] = 'N_SHOW'
-                elif wordmap['lemma'].endswith('aux'):
-                    wordmap['new_para'] = 'N_BORDEAUX'
-                elif wordmap['lemma'].endswith('eux'):
-                    wordmap['new_para'] = 'N_MONSIEUR'
-                else:
-                    fail_guess_because(wordmap, ['N', 22, False],
-                                       ['ait', 'ow', "etc."], "unhandled stem type for 22 - using #")
-                    wordmap['new_para'] = '#'
-            else:
-                fail_guess_because(wordmap, ['N', 22],
-                                   [False])
-        elif tn == 23:
-            if not wordmap['kotus_av']:
-                if wordmap['harmony'] == 'back':
-                    wordmap['new_para'] = 'N_TULI'
-                elif wordmap['harmony'] == 'front':
-                    wordmap['new_para'] = 'N_SYLI'
-                else:
-                    fail_guess_because(wordmap, ['N', 23, False],
-                                       ['back', 'front'])
-            else:
-                fail_guess_because(wordmap, ['N', 23],
-                                   [False])
-        elif tn in [24, 26]:
-            if not wordmap['kotus_av']:
-                if wordmap['harmony'] == 'back':
-                    wordmap['new_para'] = 'N_RUUHI'
-                elif wordmap['harmony'] == 'front' and wordmap['lemma'].endswith('meri'):
-                    wordmap['new_para'] = 'N_MERI'
-                elif wordmap['harmony'] == 'front' and wordmap['lemma'].endswith('veri'):
-                    wordmap['new_para'] = 'N_VERI'
-                elif wordmap['harmony'] == 'front':
-                    wordmap['new_para'] = 'N_HIIRI'
-                else:
-                    fail_guess_because(wordmap, ['N', 24, 26, False],
-                                       ['back', 'front'])
-            else:
-                fail_guess_because(wordmap, ['N', 24, 26],
-                                   [False])
-        elif tn == 25:
-            if not wordmap['kotus_av']:
-                if wordmap['harmony'] == 'back':
-                    wordmap['new_para'] = 'N_TAIMI'
-                elif wordmap['harmony'] == 'front':
-                    wordmap['new_para'] = 'N_LIEMI'
-                else:
-                    fail_guess_because(wordmap, ['N', 25, False],
-                                       ['back', 'front'])
-            else:
-                fail_guess_because(wordmap, ['N', 25],
-                                   [False])
-        elif tn == 27:
-            if not wordmap['kotus_av']:
-                if wordmap['lemma'].endswith('si'):
-                    if wordmap['harmony'] == 'back':
-                        wordmap['new_para'] = 'N_KAUSI'
-                    elif wordmap['harmony'] == 'front':
-                        wordmap['new_para'] = 'N_KÖYSI'
-                    else:
-                        fail_guess_because(wordmap, ['N', 27, False, 'si'],
-                                           ['back', 'front'])
-                elif wordmap['lemma'].endswith('s'):
-                    if wordmap['harmony'] == 'back':
-                        wordmap['new_para'] = 'N_KUUS'
-                    elif wordmap['harmony'] == 'front':
-                        wordmap['new_para'] = 'N_VIIS'
-                    else:
-                        fail_guess_because(wordmap, ['N', 27, False, 's'],
-                                           ['back', 'front'])
-                else:
-                    fail_guess_because(wordmap, ['N', 27, False],
-                                       ['si', 's'])
-            elif wordmap['kotus_av'] == 'F':
-                if wordmap['lemma'].endswith('si'):
-                    if wordmap['harmony'] == 'back':
-                        wordmap['new_para'] = 'N_KAUSI'
-                    elif wordmap['harmony'] == 'front':
-                        wordmap['new_para'] = 'N_KÖYSI'
-                    else:
-                        fail_guess_because(wordmap, ['N', 27, 'F', 'si'],
-                                           ['back', 'front'])
-            else:
-                fail_guess_because(wordmap, ['N', 27],
-                                   [False])
-        elif tn == 28:
-            if not wordmap['kotus_av']:
-                if wordmap['lemma'].endswith('nsi'):
-                    if wordmap['harmony'] == 'back':
-                        wordmap['new_para'] = 'N_PONSI'
-                    elif wordmap['harmony'] == 'front':
-                        wordmap['new_para'] = 'N_LÄNSI'
-                    else:
-                        fail_guess_because(wordmap, ['N', 28, 'F', 'nsi'],
-                                           ['back', 'front'])
-                elif wordmap['lemma'].endswith('rsi'):
-                    if wordmap['harmony'] == 'back':
-                        wordmap['new_para'] = 'N_VARSI'
-                    elif wordmap['harmony'] == 'front':
-                        wordmap['new_para'] = 'N_VIRSI'
-                    else:
-                        fail_guess_because(wordmap, ['N', 28, 'F', 'rsi'],
-                                           ['back', 'front'])
-                elif wordmap['lemma'].endswith('lsi'):
-                    if wordmap['harmony'] == 'front':
-                        wordmap['new_para'] = 'N_JÄLSI'
-                    else:
-                        fail_guess_because(wordmap, ['N', 28, 'F', 'lsi'],
-                                           ['front'])
-                else:
-                    fail_guess_because(wordmap, ['N', 28, False],
-                                       ['nsi', 'rsi', 'lsi'])
-            elif wordmap['kotus_av'] == 'J':
-                if wordmap['lemma'].endswith('nsi'):
-                    if wordmap['harmony'] == 'back':
-                        wordmap['new_para'] = 'N_PONSI'
-                    elif wordmap['harmony'] == 'front':
-                        wordmap['new_para'] = 'N_LÄNSI'
-                    else:
-                        fail_guess_because(wordmap, ['N', 28, 'J', 'nsi'],
-                                           ['back', 'front'])
-                else:
-                    fail_guess_because(wordmap, ['N', 28, 'J'],
-                                       ['nsi'])
-            elif wordmap['kotus_av'] == 'K':
-                if wordmap['lemma'].endswith('rsi'):
-                    if wordmap['harmony'] == 'back':
-                        wordmap['new_para'] = 'N_VARSI'
-                    elif wordmap['harmony'] == 'front':
-                        wordmap['new_para'] = 'N_VIRSI'
-                    else:
-                        fail_guess_because(wordmap, ['N', 28, 'K', 'rsi'],
-                                           ['back', 'front'])
-                else:
-                    fail_guess_because(wordmap, ['N', 28, 'K'],
-                                       ['rsi'])
-            elif wordmap['kotus_av'] == 'I':
-                if wordmap['lemma'].endswith('lsi'):
-                    if wordmap['harmony'] == 'front':
-                        wordmap['new_para'] = 'N_JÄLSI'
-                    else:
-                        fail_guess_because(wordmap, ['N', 28, 'I', 'lsi'],
-                                           ['front'])
-                else:
-                    fail_guess_because(wordmap, ['N', 28, 'I'],
-                                       ['lsi'])
-            else:
-                fail_guess_because(wordmap, ['N', 28],
-                                   [False, 'J', 'K', 'I'])
-        elif tn == 29:
-            if not wordmap['kotus_av']:
-                if wordmap['lemma'].endswith('psi'):
-                    if wordmap['harmony'] == 'back':
-                        wordmap['new_para'] = 'N_LAPSI'
-                    else:
-                        fail_guess_because(wordmap, ['N', 29, False, 'psi'],
-                                           ['back'])
-                elif wordmap['lemma'].endswith('ksi'):
-                    if wordmap['harmony'] == 'back':
-                        wordmap['new_para'] = 'N_UKSI'
-                    else:
-                        fail_guess_because(wordmap, ['N', 29, False, 'ksi'],
-                                           ['back'])
-                else:
-                    fail_guess_because(wordmap, ['N', 29, False],
-                                       ['psi'])
-            else:
-                fail_guess_because(wordmap, ['N', 29],
-                                   [False])
-        elif tn == 30:
-            if not wordmap['kotus_av']:
-                if wordmap['lemma'].endswith('tsi'):
-                    if wordmap['harmony'] == 'front':
-                        wordmap['new_para'] = 'N_VEITSI'
-                    else:
-                        fail_guess_because(wordmap, ['N', 30, False, 'tsi'],
-                                           ['front'])
-                else:
-                    fail_guess_because(wordmap, ['N', 30, False],
-                                       ['tsi'])
-            else:
-                fail_guess_because(wordmap, ['N', 30],
-                                   [False])
-        elif tn == 31:
-            if not wordmap['kotus_av']:
-                if wordmap['lemma'].endswith('ksi'):
-                    if wordmap['harmony'] == 'back':
-                        wordmap['new_para'] = 'N_HAAKSI'
-                    elif wordmap['harmony'] == 'front':
-                        wordmap['new_para'] = 'N_AAMUYKSI'
-                    else:
-                        fail_guess_because(wordmap, ['N', 31, False, 'ksi'],
-                                           ['back', 'front'])
-                else:
-                    fail_guess_because(wordmap, ['N', 31, False],
-                                       ['ksi'])
-            else:
-                fail_guess_because(wordmap, ['N', 31],
-                                   [False])
-        elif tn == 32:
-            if not wordmap['kotus_av']:
-                if wordmap['harmony'] == 'back':
-                    wordmap['new_para'] = 'N_JOUTSEN'
-                elif wordmap['harmony'] == 'front':
-                    wordmap['new_para'] = 'N_SIEMEN'
-                else:
-                    fail_guess_because(wordmap, ['N', 32, False],
-                                       ['back', 'front'])
-            elif wordmap['kotus_av'] == 'C':
-                if wordmap['harmony'] == 'back':
-                    wordmap['new_para'] = 'N_AJATAR'
-                elif wordmap['harmony'] == 'front':
-                    wordmap['new_para'] = 'N_TYTÄR'
-                else:
-                    fail_guess_because(wordmap, ['N', 32, 'C'],
-                                       ['back', 'front'])
-            elif wordmap['kotus_av'] == 'D':
-                if wordmap['harmony'] == 'front':
-                    wordmap['new_para'] = 'N_IEN'
-                else:
-                    fail_guess_because(wordmap, ['N', 32, 'D'],
-                                       ['back', 'front'])
-            else:
-                fail_guess_because(wordmap, ['N', 32],
-                                   [False, 'C', 'D'])
-        elif tn == 33:
-            if not wordmap['kotus_av']:
-                if wordmap['harmony'] == 'back':
-                    wordmap['new_para'] = 'N_PUHELIN'
-                elif wordmap['harmony'] == 'front':
-                    wordmap['new_para'] = 'N_ELIN'
-                else:
-                    fail_guess_because(wordmap, ['N', 33, False],
-                                       ['back', 'front'])
-            elif wordmap['kotus_av'] == 'A':
-                if wordmap['lemma'].endswith('kin') and wordmap['harmony'] == 'front':
-                    wordmap['new_para'] = 'N_HÄRKIN'
-                else:
-                    fail_guess_because(wordmap, ['N', 33, 'A'],
-                                       ['kin', 'front'])
-            elif wordmap['kotus_av'] == 'C':
-                if wordmap['lemma'].endswith('tin') and wordmap['harmony'] == 'back':
-                    wordmap['new_para'] = 'N_SUODATIN'
-                elif wordmap['lemma'].endswith('tin') and wordmap['harmony'] == 'front':
-                    wordmap['new_para'] = 'N_HEITIN'
-                else:
-                    fail_guess_because(wordmap, ['N', 33, 'C'],
-                                       ['tin', 'back', 'front'])
-            elif wordmap['kotus_av'] == 'D':
-                if wordmap['lemma'].endswith('in') and wordmap['harmony'] == 'back':
-                    wordmap['new_para'] = 'N_PUIN'
-                elif wordmap['lemma'].endswith('in') and wordmap['harmony'] == 'front':
-                    wordmap['new_para'] = 'N_PYYHIN'
-                else:
-                    fail_guess_because(wordmap, ['N', 33, 'D'],
-                                       ['in', 'back', 'front'])
-            elif wordmap['kotus_av'] == 'E':
-                if wordmap['lemma'].endswith('vin') and wordmap['harmony'] == 'back':
-                    wordmap['new_para'] = 'N_RAAVIN'
-                elif wordmap['lemma'].endswith('vin') and wordmap['harmony'] == 'front':
-                    wordmap['new_para'] = 'N_SÄRVIN'
-                else:
-                    fail_guess_because(wordmap, ['N', 33, 'E'],
-                                       ['vin', 'back', 'front'])
-            elif wordmap['kotus_av'] == 'F':
-                if wordmap['lemma'].endswith('din') and wordmap['harmony'] == 'back':
-                    wordmap['new_para'] = 'N_VAADIN'
-                elif wordmap['lemma'].endswith('din') and wordmap['harmony'] == 'front':
-                    wordmap['new_para'] = 'N_SÄÄDIN'
-                elif wordmap['lemma'].endswith('don'):
-                    wordmap['new_para'] = 'N_JÄRVITAHDON'
-                elif wordmap['lemma'].endswith('dun'):
-                    wordmap['new_para'] = 'N_LAIDUN'
-                else:
-                    fail_guess_because(wordmap, ['N', 33, 'F'],
-                                       ['din', 'dun', 'back', 'front'])
-            elif wordmap['kotus_av'] == 'I':
-                if wordmap['lemma'].endswith('llin') and wordmap['harmony'] == 'back':
-                    wordmap['new_para'] = 'N_ASKELLIN'
-                elif wordmap['lemma'].endswith('llin') and wordmap['harmony'] == 'front':
-                    wordmap['new_para'] = 'N_SIVELLIN'
-                else:
-                    fail_guess_because(wordmap, ['N', 33, 'I'],
-                                       ['llin', 'back', 'front'])
-            elif wordmap['kotus_av'] == 'J':
-                if wordmap['lemma'].endswith('nnin') and wordmap['harmony'] == 'back':
-                    wordmap['new_para'] = 'N_MUUNNIN'
-                elif wordmap['lemma'].endswith('in') and wordmap['harmony'] == 'front':
-                    wordmap['new_para'] = 'N_KÄÄNNIN'
-                else:
-                    fail_guess_because(wordmap, ['N', 33, 'J'],
-                                       ['nnin', 'back', 'front'])
-            elif wordmap['kotus_av'] == 'K':
-                if wordmap['lemma'].endswith('rrin') and wordmap['harmony'] == 'back':
-                    wordmap['new_para'] = 'N_KIHARRIN'
-                elif wordmap['lemma'].endswith('rrin') and wordmap['harmony'] == 'front':
-                    wordmap['new_para'] = 'N_KIERRIN'
-                elif wordmap['lemma'].endswith('rroin'):
-                    wordmap['new_para'] = 'N_KERROIN'
-                else:
-                    fail_guess_because(wordmap, ['N', 33, 'K'],
-                                       ['rrin', 'rroin', 'back', 'front'])
-            elif wordmap['kotus_av'] == 'L':
-                if wordmap['lemma'].endswith('jin') and wordmap['harmony'] == 'back':
-                    wordmap['new_para'] = 'N_POLJIN'
-                elif wordmap['lemma'].endswith('jin') and wordmap['harmony'] == 'front':
-                    wordmap['new_para'] = 'N_NYLJIN'
-                else:
-                    fail_guess_because(wordmap, ['N', 33, 'J'],
-                                       ['jin', 'back', 'front'])
-            else:
-                fail_guess_because(wordmap, ['N', 33],
-                                   [False, 'A', 'C-F', 'I-L'])
-        elif wordmap['kotus_tn'] == 34:
-            if wordmap['kotus_av'] == 'B':
-                if wordmap['lemma'].endswith('pan'):
-                    wordmap['new_para'] = 'N_HAPAN'
-                else:
-                    fail_guess_because(wordmap, ['N', 34, 'B'],
-                                       ['pan'])
-            elif wordmap['kotus_av'] == 'C':
-                if wordmap['lemma'].endswith('ton'):
-                    wordmap['new_para'] = 'N_OSATON'
-                elif wordmap['lemma'].endswith('tön'):
-                    wordmap['new_para'] = 'N_NIMETÖN'
-                elif wordmap['lemma'].endswith('toin'):
-                    wordmap['new_para'] = 'N_KALATOIN'
-                elif wordmap['lemma'].endswith('töin'):
-                    wordmap['new_para'] = 'N_NIMETÖIN'
-                else:
-                    fail_guess_because(wordmap, ['N', 34, 'C'],
-                                       ['ton', 'tön', 'toin', 'töin'])
-            else:
-                fail_guess_because(wordmap, ['N', 34], [False, 'C'])
-        elif wordmap['kotus_tn'] == 35:
-            if wordmap['kotus_av'] == 'H':
-                if wordmap['harmony'] == 'front':
-                    wordmap['new_para'] = 'N_LÄMMIN'
-                else:
-                    fail_guess_because(wordmap, ['N', 35, False],
-                                       ['back', 'front'])
-            else:
-                fail_guess_because(wordmap, ['N', 35],
-                                   ['H'])
-        elif wordmap['kotus_tn'] == 36:
-            if not wordmap['kotus_av']:
-                if wordmap['harmony'] == 'back':
-                    wordmap['new_para'] = 'N_KYLÄNVANHIN'
-                elif wordmap['harmony'] == 'front':
-                    wordmap['new_para'] = 'N_LÄHIN'
-                else:
-                    fail_guess_because(wordmap, ['N', 36, 'J'],
-                                       ['jin', 'back'])
-            else:
-                fail_guess_because(wordmap, ['N', 36],
-                                   [False], "cannot have gradation")
-        elif wordmap['kotus_tn'] == 37:
-            if not wordmap['kotus_av']:
-                if wordmap['lemma'].endswith('vasen'):
-                    wordmap['new_para'] = 'N_VASEN'
-                else:
-                    fail_guess_because(wordmap, ['N', 37, False],
-                                       ['vasen'])
-            else:
-                fail_guess_because(wordmap, ['N', 37],
-                                   [False], "cannot have gradation")
-        elif wordmap['kotus_tn'] == 38:
-            if not wordmap['kotus_av']:
-                if wordmap['harmony'] == 'back':
-                    wordmap['new_para'] = 'N_AAKKOSTAMINEN'
-                elif wordmap['harmony'] == 'front':
-                    wordmap['new_para'] = 'N_KYLKIÄINEN'
-                else:
-                    fail_guess_because(wordmap, ['N', 38, False],
-                                       ['front', 'back'])
-            else:
-                fail_guess_because(wordmap, ['N', 38],
-                                   [False], "cannot have gradation")
-        elif wordmap['kotus_tn'] == 39:
-            if not wordmap['kotus_av']:
-                if wordmap['harmony'] == 'back':
-                    wordmap['new_para'] = 'N_VAKUUTUS'
-                elif wordmap['harmony'] == 'front':
-                    wordmap['new_para'] = 'N_RÄJÄYTYS'
-                else:
-                    fail_guess_because(wordmap, ['N', 39, False],
-                                       ['front', 'back'])
-            else:
-                fail_guess_because(wordmap, ['N', 39],
-                                   [False], "cannot have gradation")
-        elif wordmap['kotus_tn'] == 40:
-            if not wordmap['kotus_av']:
-                if wordmap['lemma'].endswith('at'):
-                    wordmap['new_para'] = 'N_TOULAT'
-                elif wordmap['harmony'] == 'back':
-                    wordmap['new_para'] = 'N_AAKKOSELLISUUS'
-                elif wordmap['harmony'] == 'front':
-                    wordmap['new_para'] = 'N_KÖYHYYS'
-                else:
-                    fail_guess_because(wordmap, ['N', 38, False],
-                                       ['front', 'back'])
-            else:
-                fail_guess_because(wordmap, ['N', 38],
-                                   [False], "cannot have gradation")
-        elif wordmap['kotus_tn'] == 41:
-            if not wordmap['kotus_av']:
-                if wordmap['lemma'].endswith('as'):
-                    wordmap['new_para'] = 'N_PATSAS'
-                elif wordmap['lemma'].endswith('es') and wordmap['harmony'] == 'back':
-                    wordmap['new_para'] = 'N_ARISTOTELES'
-                elif wordmap['lemma'].endswith('es') and wordmap['harmony'] == 'front':
-                    wordmap['new_para'] = 'N_KIRVES'
-                elif wordmap['lemma'].endswith('is') and wordmap['harmony'] == 'back':
-                    wordmap['new_para'] = 'N_RUUMIS'
-                elif wordmap['lemma'].endswith('is') and wordmap['harmony'] == 'front':
-                    wordmap['new_para'] = 'N_DIMITRIS'
-                elif wordmap['lemma'].endswith('os'):
-                    wordmap['new_para'] = 'N_UROS'
-                elif wordmap['lemma'].endswith('äs'):
-                    wordmap['new_para'] = 'N_ÄYRÄS'
-                else:
-                    fail_guess_because(wordmap, ['N', 41, False],
-                                       ['as', 'es', 'is', 'os', 'äs', 'front', 'back'])
-            elif wordmap['kotus_av'] == 'A':
-                if wordmap['lemma'].endswith('kas'):
-                    wordmap['new_para'] = 'N_ASUKAS'
-                elif wordmap['lemma'].endswith('käs'):
-                    wordmap['new_para'] = 'N_KÄRSÄKÄS'
-                else:
-                    fail_guess_because(wordmap, ['N', 41, 'A'],
-                                       ['kas', 'käs'])
-            elif wordmap['kotus_av'] == 'B':
-                if wordmap['lemma'].endswith('pas'):
-                    wordmap['new_para'] = 'N_SAAPAS'
-                elif wordmap['lemma'].endswith('päs'):
-                    wordmap['new_para'] = 'N_RYPÄS'
-                else:
-                    fail_guess_because(wordmap, ['N', 41, 'B'],
-                                       ['pas', 'päs'])
-            elif wordmap['kotus_av'] == 'C':
-                if wordmap['lemma'].endswith('tas'):
-                    wordmap['new_para'] = 'N_RATAS'
-                elif wordmap['lemma'].endswith('tes') and wordmap['harmony'] == 'back':
-                    wordmap['new_para'] = 'N_KORTES'
-                elif wordmap['lemma'].endswith('tis') and wordmap['harmony'] == 'back':
-                    wordmap['new_para'] = 'N_ALTIS'
-                elif wordmap['lemma'].endswith('tis') and wordmap['harmony'] == 'front':
-                    wordmap['new_para'] = 'N_KELTIS'
-                elif wordmap['lemma'].endswith('täs'):
-                    wordmap['new_para'] = 'N_MÄTÄS'
-                elif wordmap['lemma'].endswith('tus'):
-                    wordmap['new_para'] = 'N_VANTUS'
-                else:
-                    fail_guess_because(wordmap, ['N', 41, 'C'],
-                                       ['tas', 'tis', 'tus', 'täs', 'front'])
-            elif wordmap['kotus_av'] == 'D':
-                if wordmap['lemma'].endswith('as'):
-                    wordmap['new_para'] = 'N_VARAS'
-                elif wordmap['lemma'].endswith('es') and wordmap['harmony'] == 'front':
-                    wordmap['new_para'] = 'N_IES'
-                elif wordmap['lemma'].endswith('is') and wordmap['harmony'] == 'back':
-                    wordmap['new_para'] = 'N_RUIS'
-                else:
-                    fail_guess_because(wordmap, ['N', 41, 'D'],
-                                       ['as', 'es', 'is', 'front', 'back'])
-            elif wordmap['kotus_av'] == 'E':
-                if wordmap['lemma'].endswith('vas'):
-                    wordmap['new_para'] = 'N_VARVAS'
-                elif wordmap['lemma'].endswith('väs'):
-                    wordmap['new_para'] = 'N_SEIVÄS'
-                else:
-                    fail_guess_because(wordmap, ['N', 41, 'E'],
-                                       ['vas', 'väs'])
-            elif wordmap['kotus_av'] == 'F':
-                if wordmap['lemma'].endswith('das'):
-                    wordmap['new_para'] = 'N_TEHDAS'
-                elif wordmap['lemma'].endswith('des') and wordmap['harmony'] == 'back':
-                    wordmap['new_para'] = 'N_LUODES'
-                elif wordmap['lemma'].endswith('des') and wordmap['harmony'] == 'front':
-                    wordmap['new_para'] = 'N_LÄHDES'
-                else:
-                    fail_guess_because(wordmap, ['N', 41, 'F'],
-                                       ['das', 'des'])
-            elif wordmap['kotus_av'] == 'G':
-                if wordmap['lemma'].endswith('ngas'):
-                    wordmap['new_para'] = 'N_KANGAS'
-                elif wordmap['lemma'].endswith('ngäs'):
-                    wordmap['new_para'] = 'N_KÖNGÄS'
-                else:
-                    fail_guess_because(wordmap, ['N', 41, 'G'],
-                                       ['gas', 'gäs'])
-            elif wordmap['kotus_av'] == 'H':
-                if wordmap['lemma'].endswith('mmas'):
-                    wordmap['new_para'] = 'N_HAMMAS'
-                else:
-                    fail_guess_because(wordmap, ['N', 41, 'H'],
-                                       ['mmas'])
-            elif wordmap['kotus_av'] == 'I':
-                if wordmap['lemma'].endswith('llas'):
-                    wordmap['new_para'] = 'N_ALLAS'
-                else:
-                    fail_guess_because(wordmap, ['N', 41, 'I'],
-                                       ['llas', 'lles', 'back'])
-            elif wordmap['kotus_av'] == 'J':
-                if wordmap['lemma'].endswith('nnas'):
-                    wordmap['new_para'] = 'N_KINNAS'
-                elif wordmap['lemma'].endswith('nnäs'):
-                    wordmap['new_para'] = 'N_RYNNÄS'
-                else:
-                    fail_guess_because(wordmap, ['N', 41, 'J'],
-                                       ['nnas', 'nnäs'])
-            elif wordmap['kotus_av'] == 'K':
-                if wordmap['lemma'].endswith('ras'):
-                    wordmap['new_para'] = 'N_PORRAS'
-                else:
-                    fail_guess_because(wordmap, ['N', 41, 'K'],
-                                       ['rras'])
-            else:
-                fail_guess_because(wordmap, ['N', 41],
-                                   [False, 'A-K'])
-        elif wordmap['kotus_tn'] == 42:
-            if not wordmap['kotus_av']:
-                if wordmap['lemma'].endswith('mies') or wordmap['lemma'].endswith('Mies'):
-                    wordmap['new_para'] = 'N_MIES'
-                else:
-                    fail_guess_because(wordmap, ['N', 42, False],
-                                       ['mies'])
-            else:
-                fail_guess_because(wordmap, ['N', 42],
-                                   [False], "cannot gradate")
-        elif wordmap['kotus_tn'] == 43:
-            if not wordmap['kotus_av']:
-                if wordmap['lemma'].endswith('ut'):
-                    wordmap['new_para'] = 'N_OLUT'
-                elif wordmap['lemma'].endswith('yt'):
-                    wordmap['new_para'] = 'N_NEITSYT'
-                else:
-                    fail_guess_because(wordmap, ['N', 43, False],
-                                       ['ut', 'yt'])
-            elif wordmap['kotus_av'] == 'D':
-                if wordmap['lemma'].endswith('ut'):
-                    wordmap['new_para'] = 'N_POIUT'
-                else:
-                    fail_guess_because(wordmap, ['N', 43, 'D'],
-                                       ['ut'])
-            elif wordmap['kotus_av'] == 'H':
-                if wordmap['lemma'].endswith('mmyt'):
-                    wordmap['new_para'] = 'N_IMMYT'
-                else:
-                    fail_guess_because(wordmap, ['N', 43, 'H'],
-                                       ['mmyt'])
-            else:
-                fail_guess_because(wordmap, ['N', 43],
-                                   [False, 'H'])
-        elif wordmap['kotus_tn'] == 44:
-            if not wordmap['kotus_av']:
-                if wordmap['lemma'].endswith('ät'):
-                    wordmap['new_para'] = 'N_KEVÄT'
-                elif wordmap['lemma'].endswith('et') and wordmap['harmony'] == 'back':
-                    wordmap['new_para'] = 'N_KAARET'
-                elif wordmap['lemma'].endswith('et') and wordmap['harmony'] == 'front':
-                    wordmap['new_para'] = 'N_HÄMET'
-                else:
-                    fail_guess_because(wordmap, ['N', 44, False],
-                                       ['ät', 'et'])
-            elif wordmap['kotus_av'] == 'C':
-                if wordmap['lemma'].endswith('tet') and wordmap['harmony'] == 'back':
-                    wordmap['new_para'] = 'N_KORTET'
-                else:
-                    fail_guess_because(wordmap, ['N', 44, 'C'],
-                                       ['tet'])
-            elif wordmap['kotus_av'] == 'D':
-                if wordmap['lemma'].endswith('et') and wordmap['harmony'] == 'back':
-                    wordmap['new_para'] = 'N_LOUET'
-                else:
-                    fail_guess_because(wordmap, ['N', 44, 'D'],
-                                       ['et'])
-            elif wordmap['kotus_av'] == 'F':
-                if wordmap['lemma'].endswith('det') and wordmap['harmony'] == 'back':
-                    wordmap['new_para'] = 'N_AHDET'
-                elif wordmap['lemma'].endswith('det') and wordmap['harmony'] == 'front':
-                    wordmap['new_para'] = 'N_LÄHDET'
-                else:
-                    fail_guess_because(wordmap, ['N', 44, 'F'],
-                                       ['det'])
-            elif wordmap['kotus_av'] == 'G':
-                if wordmap['lemma'].endswith('get') and wordmap['harmony'] == 'front':
-                    wordmap['new_para'] = 'N_INGET'
-                else:
-                    fail_guess_because(wordmap, ['N', 44, 'F'],
-                                       ['det'])
-            elif wordmap['kotus_av'] == 'I':
-                if wordmap['lemma'].endswith('llet') and wordmap['harmony'] == 'back':
-                    wordmap['new_para'] = 'N_VUOLLET'
-                else:
-                    fail_guess_because(wordmap, ['N', 44, 'I'],
-                                       ['llet'])
-            elif wordmap['kotus_av'] == 'J':
-                if wordmap['lemma'].endswith('nnet') and wordmap['harmony'] == 'back':
-                    wordmap['new_para'] = 'N_LANNET'
-                elif wordmap['lemma'].endswith('nnet') and wordmap['harmony'] == 'front':
-                    wordmap['new_para'] = 'N_RINNET'
-                else:
-                    fail_guess_because(wordmap, ['N', 44, 'J'],
-                                       ['nnet'])
-            elif wordmap['kotus_av'] == 'K':
-                if wordmap['lemma'].endswith('rret') and wordmap['harmony'] == 'back':
-                    wordmap['new_para'] = 'N_KAARRET'
-                elif wordmap['lemma'].endswith('rret') and wordmap['harmony'] == 'front':
-                    wordmap['new_para'] = 'N_VIIRRET'
-                else:
-                    fail_guess_because(wordmap, ['N', 44, 'K'],
-                                       ['rret'])
-            else:
-                fail_guess_because(wordmap, ['N', 44],
-                                   [False, 'C', 'D', 'F', 'G', 'I', 'J', 'K'])
-        elif wordmap['kotus_tn'] == 45:
-            if not wordmap['kotus_av']:
-                if wordmap['lemma'].endswith('s'):
-                    wordmap['new_para'] = 'N_TUHANNES'
-                else:
-                    fail_guess_because(wordmap, ['N', 45, False],
-                                       ['s'])
-            else:
-                fail_guess_because(wordmap, ['N', 45],
-                                   [False], "cannot gradate")
-        elif wordmap['kotus_tn'] == 46:
-            if not wordmap['kotus_av']:
-                if wordmap['lemma'].endswith('tuhat'):
-                    wordmap['new_para'] = 'N_VUOSITUHAT'
-                else:
-                    fail_guess_because(wordmap, ['N', 46, False],
-                                       ['tuhat'])
-            else:
-                fail_guess_because(wordmap, ['N', 46],
-                                   [False], "cannot gradate")
-        elif wordmap['kotus_tn'] == 47:
-            if not wordmap['kotus_av']:
-                if wordmap['lemma'].endswith('ut'):
-                    wordmap['new_para'] = 'N_AIVOKUOLLUT'
-                elif wordmap['lemma'].endswith('yt'):
-                    wordmap['new_para'] = 'N_SIVISTYNYT'
-                else:
-                    fail_guess_because(wordmap, ['N', 47, False],
-                                       ['yt'])
-            else:
-                fail_guess_because(wordmap, ['N', 47],
-                                   [False], "cannot gradate")
-        elif tn == 48:
-            if wordmap['lemma'].endswith('e'):
-                if not wordmap['kotus_av']:
-                    if wordmap['harmony'] == 'back':
-                        wordmap['new_para'] = 'N_ASTE'
-                    elif wordmap['harmony'] == 'front':
-                        wordmap['new_para'] = 'N_PISTE'
-                    else:
-                        fail_guess_because(wordmap, ['N', 48, False],
-                                           ['front', 'back'])
-                elif wordmap['kotus_av'] == 'A':
-                    if wordmap['lemma'].endswith('ke') and wordmap['harmony'] == 'back':
-                        wordmap['new_para'] = 'N_KASTIKE'
-                    elif wordmap['lemma'].endswith('ke') and wordmap['harmony'] == 'front':
-                        wordmap['new_para'] = 'N_LÄÄKE'
-                    else:
-                        fail_guess_because(wordmap, ['N', 48, 'A'],
-                                           ['ke', 'front', 'back'])
-                elif wordmap['kotus_av'] == 'B':
-                    if wordmap['lemma'].endswith('pe') and wordmap['harmony'] == 'back':
-                        wordmap['new_para'] = 'N_APE'
-                    elif wordmap['lemma'].endswith('pe') and wordmap['harmony'] == 'front':
-                        wordmap['new_para'] = 'N_RIPE'
-                    else:
-                        fail_guess_because(wordmap, ['N', 48, 'B'],
-                                           ['pe', 'front', 'back'])
-                elif wordmap['kotus_av'] == 'C':
-                    if wordmap['lemma'].endswith('te') and wordmap['harmony'] == 'back':
-                        wordmap['new_para'] = 'N_OSOITE'
-                    elif wordmap['lemma'].endswith('te') and wordmap['harmony'] == 'front':
-                        wordmap['new_para'] = 'N_KÄSITE'
-                    else:
-                        fail_guess_because(wordmap, ['N', 48, 'C'],
-                                           ['te', 'front', 'back'])
-                elif wordmap['kotus_av'] == 'D':
-                    if wordmap['harmony'] == 'back':
-                        wordmap['new_para'] = 'N_KOE'
-                    elif wordmap['harmony'] == 'front':
-                        wordmap['new_para'] = 'N_PYYHE'
-                    else:
-                        fail_guess_because(wordmap, ['N', 48, 'D'],
-                                           ['e', 'front', 'back'])
-                elif wordmap['kotus_av'] == 'E':
-                    if wordmap['lemma'].endswith('ve') and wordmap['harmony'] == 'back':
-                        wordmap['new_para'] = 'N_TARVE'
-                    elif wordmap['lemma'].endswith('ve') and wordmap['harmony'] == 'front':
-                        wordmap['new_para'] = 'N_VIIVE'
-                    else:
-                        fail_guess_because(wordmap, ['N', 48, 'E'],
-                                           ['ve', 'front', 'back'])
-                elif wordmap['kotus_av'] == 'F':
-                    if wordmap['lemma'].endswith('de') and wordmap['harmony'] == 'back':
-                        wordmap['new_para'] = 'N_LUODE'
-                    elif wordmap['lemma'].endswith('de') and wordmap['harmony'] == 'front':
-                        wordmap['new_para'] = 'N_KIDE'
-                    else:
-                        fail_guess_because(wordmap, ['N', 48, 'F'],
-                                           ['de', 'front', 'back'])
-                elif wordmap['kotus_av'] == 'G':
-                    if wordmap['lemma'].endswith('ge') and wordmap['harmony'] == 'front':
-                        wordmap['new_para'] = 'N_MIELENGE'
-                    else:
-                        fail_guess_because(wordmap, ['N', 48, 'F'],
-                                           ['ge', 'front'])
-                elif wordmap['kotus_av'] == 'H':
-                    if wordmap['lemma'].endswith('mme') and wordmap['harmony'] == 'back':
-                        wordmap['new_para'] = 'N_LUMME'
-                    else:
-                        fail_guess_because(wordmap, ['N', 48, 'H'],
-                                           ['mme', 'back'])
-                elif wordmap['kotus_av'] == 'I':
-                    if wordmap['lemma'].endswith('lle') and wordmap['harmony'] == 'back':
-                        wordmap['new_para'] = 'N_VUOLLE'
-                    elif wordmap['lemma'].endswith('lle') and wordmap['harmony'] == 'front':
-                        wordmap['new_para'] = 'N_MIELLE'
-                    else:
-                        fail_guess_because(wordmap, ['N', 48, 'I'],
-                                           ['lle', 'front', 'back'])
-                elif wordmap['kotus_av'] == 'J':
-                    if wordmap['lemma'].endswith('nne') and wordmap['harmony'] == 'back':
-                        wordmap['new_para'] = 'N_RAKENNE'
-                    elif wordmap['lemma'].endswith('nne') and wordmap['harmony'] == 'front':
-                        wordmap['new_para'] = 'N_KIINNE'
-                    else:
-                        fail_guess_because(wordmap, ['N', 48, 'J'],
-                                           ['nne', 'front', 'back'])
-                elif wordmap['kotus_av'] == 'K':
-                    if wordmap['lemma'].endswith('rre') and wordmap['harmony'] == 'back':
-                        wordmap['new_para'] = 'N_AARRE'
-                    elif wordmap['lemma'].endswith('rre') and wordmap['harmony'] == 'front':
-                        wordmap['new_para'] = 'N_KIERRE'
-                    else:
-                        fail_guess_because(wordmap, ['N', 48, 'K'],
-                                           ['rre', 'front', 'back'])
-                elif wordmap['kotus_av'] == 'L':
-                    if wordmap['lemma'].endswith('je') and wordmap['harmony'] == 'back':
-                        wordmap['new_para'] = 'N_POHJE'
-                    elif wordmap['lemma'].endswith('je') and wordmap['harmony'] == 'front':
-                        wordmap['new_para'] = 'N_HYLJE'
-                    else:
-                        fail_guess_because(wordmap, ['N', 48, 'L'],
-                                           ['je', 'front', 'back'])
-                else:
-                    fail_guess_because(wordmap, ['N', 48],
-                                       [False, 'A-L'])
-            elif wordmap['lemma'].endswith('i'):
-                if not wordmap['kotus_av']:
-                    if wordmap['harmony'] == 'back':
-                        wordmap['new_para'] = 'N_ORI'
-                    else:
-                        fail_guess_because(wordmap, ['N', 48, False, 'i'],
-                                           ['back'])
-                else:
-                    fail_guess_because(wordmap, ['N', 48, 'i'],
-                                       [False])
-            elif wordmap['lemma'].endswith('u'):
-                if not wordmap['kotus_av']:
-                    wordmap['new_para'] = 'N_KIIRU'
-                else:
-                    fail_guess_because(wordmap, ['N', 48, 'u'],
-                                       [False])
-            else:
-                fail_guess_because(wordmap, ['N', 48],
-                                   ['e', 'i', 'u'])
-        elif tn == 49:
-            if not wordmap['kotus_av']:
-                if wordmap['lemma'].endswith('al'):
-                    wordmap['new_para'] = 'N_ASKAR'
-                elif wordmap['lemma'].endswith('ar'):
-                    wordmap['new_para'] = 'N_ASKAR'
-                elif wordmap['lemma'].endswith('en') and wordmap['harmony'] == 'back':
-                    wordmap['new_para'] = 'N_ASKAR'
-                elif wordmap['lemma'].endswith('el') and wordmap['harmony'] == 'back':
-                    wordmap['new_para'] = 'N_ASKAR'
-                elif wordmap['lemma'].endswith('el') and wordmap['harmony'] == 'front':
-                    wordmap['new_para'] = 'N_KYYNEL'
-                elif wordmap['lemma'].endswith('e') and wordmap['harmony'] == 'back':
-                    wordmap['new_para'] = 'N_ASTE'
-                elif wordmap['lemma'].endswith('e') and wordmap['harmony'] == 'front':
-                    wordmap['new_para'] = 'N_PISTE'
-                else:
-                    fail_guess_because(wordmap, ['N', 49, False],
-                                       ['al ar', 'el en', 'e', 'front', 'back'])
-            elif wordmap['kotus_av'] == 'D':
-                if wordmap['lemma'].endswith('en') and wordmap['harmony'] == 'front':
-                    wordmap['new_para'] = 'N_SÄEN'
-                else:
-                    fail_guess_because(wordmap, ['N', 49, 'D'],
-                                       ['en', 'front'])
-            elif wordmap['kotus_av'] == 'E':
-                if wordmap['lemma'].endswith('val'):
-                    wordmap['new_para'] = 'N_TAIVAL'
-                else:
-                    fail_guess_because(wordmap, ['N', 49, 'E'],
-                                       ['al', 'front'])
-            elif wordmap['kotus_av'] == 'F':
-                if wordmap['lemma'].endswith('dar'):
-                    wordmap['new_para'] = 'N_UDAR'
-                else:
-                    fail_guess_because(wordmap, ['N', 49, 'F'],
-                                       ['dar'])
-            elif wordmap['kotus_av'] == 'G':
-                if wordmap['lemma'].endswith('nger') and wordmap['harmony'] == 'front':
-                    wordmap['new_para'] = 'N_PENGER'
-                else:
-                    fail_guess_because(wordmap, ['N', 49, 'G'],
-                                       ['ger', 'front'])
-            elif wordmap['kotus_av'] == 'H':
-                if wordmap['lemma'].endswith('mmel') and wordmap['harmony'] == 'back':
-                    wordmap['new_para'] = 'N_OMMEL'
-                elif wordmap['lemma'].endswith('mmel') and wordmap['harmony'] == 'front':
-                    wordmap['new_para'] = 'N_VEMMEL'
-                elif wordmap['lemma'].endswith('mmol'):
-                    wordmap['new_para'] = 'N_LOMMOL'
-                else:
-                    fail_guess_because(wordmap, ['N', 49, 'H'],
-                                       ['mmel', 'mmol', 'front', 'back'])
-            elif wordmap['kotus_av'] == 'J':
-                if wordmap['lemma'].endswith('nnar'):
-                    wordmap['new_para'] = 'N_PIENNAR'
-                elif wordmap['lemma'].endswith('nnel') and wordmap['harmony'] == 'back':
-                    wordmap['new_para'] = 'N_KANNEL'
-                elif wordmap['lemma'].endswith('nner') and wordmap['harmony'] == 'back':
-                    wordmap['new_para'] = 'N_MANNER'
-                elif wordmap['lemma'].endswith('nner') and wordmap['harmony'] == 'front':
-                    wordmap['new_para'] = 'N_KINNER'
-                else:
-                    fail_guess_because(wordmap, ['N', 49, 'J'],
-                                       ['nnar', 'nnel', 'nner', 'front'])
-            elif wordmap['kotus_av'] == 'T':
-                if wordmap['lemma'].endswith('auer'):
-                    wordmap['new_para'] = 'N_AUER'
-                else:
-                    fail_guess_because(wordmap, ['N', 49, 'T'],
-                                       ['auer'])
-            else:
-                fail_guess_because(wordmap, ['N', 49],
-                                   [False, 'D-H', 'J', 'T'])
-        elif tn == 1007:
-            if not wordmap['kotus_av']:
-                if wordmap['lemma'].endswith('veli') or wordmap['lemma'].endswith('Veli'):
-                    wordmap['new_para'] = 'N_VELI'
-                else:
-                    fail_guess_because(wordmap, ['N', 7, False, 'VELI'],
-                                       ['veli'], 'must be veli')
-            else:
-                fail_guess_because(wordmap, ['N', 7, 'VELI'],
-                                   [False], 'Cannot gradate')
-        elif tn == 1009:
-            if wordmap['kotus_av'] == 'D':
-                if wordmap['lemma'].endswith('aika') or wordmap['lemma'].endswith('Aika'):
-                    wordmap['new_para'] = 'N_AIKA'
-                else:
-                    fail_guess_because(wordmap, ['N', 9, 'D', 'AIKA'],
-                                       ['aika'], 'must be aika')
-            elif not wordmap['kotus_av']:
-                if wordmap['lemma'].endswith('aika') or wordmap['lemma'].endswith('Aika'):
-                    fail_guess_because(wordmap, ["aika"], ["D"])
-                    exit(1)
-                    wordmap['new_para'] = 'N_AIKA'
-                else:
-                    fail_guess_because(wordmap, ['N', 9, 'D', 'AIKA'],
-                                       ['aika'], 'must be aika')
-            elif wordmap['kotus_av'] == 'L':
-                if wordmap['lemma'].endswith('aika'):
-                    wordmap['new_para'] = 'N_AIKA'
-                    fail_guess_because(wordmap, ["aika"], ["D"])
-                    exit(1)
-                else:
-                    fail_guess_because(wordmap, ['N', 9, 'D', 'AIKA'],
-                                       ['aika'], 'must be aika')
-            else:
-                fail_guess_because(wordmap, ['N', 9, 'AIKA'],
-                                   ['D'], 'must be D')
-        elif tn == 1010:
-            if wordmap['kotus_av'] == 'D':
-                if wordmap['lemma'].endswith('poika') or wordmap['lemma'].endswith('Poika'):
-                    wordmap['new_para'] = 'N_POIKA'
-                else:
-                    fail_guess_because(wordmap, ['N', 10, 'D', 'POIKA'],
-                                       ['poika'], 'must be poika')
-            elif not wordmap['kotus_av']:
-                if wordmap['lemma'].endswith('poika'):
-                    fail_guess_because(wordmap, ["poika"], ["D"])
-                    exit(1)
-                else:
-                    fail_guess_because(wordmap, ['N', 10, 'D', 'POIKA'],
-                                       ['poika'], 'must be poika')
-            else:
-                fail_guess_because(wordmap, ['N', 10, 'POIKA'],
-                                   ['D'], 'must be D')
-        elif tn == 1024:
-            if not wordmap['kotus_av']:
-                if wordmap['lemma'].endswith('meri') or wordmap['lemma'].endswith('Meri'):
-                    wordmap['new_para'] = 'N_MERI'
-                else:
-                    fail_guess_because(wordmap, ['N', 24, False, 'MERI'],
-                                       ['meri'], 'must be meri')
-            else:
-                fail_guess_because(wordmap, ['N', 24, 'MERI'],
-                                   [False], 'must be 0')
-        elif tn == 1026:
-            if not wordmap['kotus_av']:
-                if wordmap['lemma'].endswith('veri') or wordmap['lemma'].endswith('Veri'):
-                    wordmap['new_para'] = 'N_VERI'
-                else:
-                    fail_guess_because(wordmap, ['N', 24, 'False', 'VERI'],
-                                       ['veri'], 'must be veri')
-            else:
-                fail_guess_because(wordmap, ['N', 26, 'VERI'],
-                                   [False], 'must be 0')
-        elif tn == 99 and not wordmap['is_proper']:
-            fail_guess_because(wordmap, ['N', 99], [99],
-                               "Illegal class for N, 99 can only apply to P (and PropN)")
-            wordmap['new_para'] = '#'
-        elif tn == 99 and wordmap['is_proper']:
-            wordmap['new_para'] = 'N_VAASAN'
-        else:
-            fail_guess_because(wordmap, ['N'],
-                               ['1-49', '99', '1007-1026'])
-    else:
-        if not wordmap['lemma'].endswith('t'):
-            fail_guess_because(wordmap, ['N', 'PLT'],
-                               ['-t'], 'not a plt lemma')
-        elif tn == 1:
-            if not wordmap['kotus_av']:
-                if wordmap['lemma'].endswith('ot'):
-                    wordmap['new_para'] = 'N_AIVOT'
-                elif wordmap['lemma'].endswith('yt'):
-                    wordmap['new_para'] = 'N_PÖKSYT'
-                elif wordmap['lemma'].endswith('ut'):
-                    wordmap['new_para'] = 'N_HOUSUT'
-                elif wordmap['lemma'].endswith('öt'):
-                    wordmap['new_para'] = 'N_PÖLLÖT'
-                else:
-                    fail_guess_because(wordmap, ['N', 1, False, 'PLT'],
-                                       ['ot', 'ut', 'yt'])
-            elif wordmap['kotus_av'] in ['A', 'D']:
-                if wordmap['lemma'].endswith('ot'):
-                    wordmap['new_para'] = 'N_JOUKOT'
-                elif wordmap['lemma'].endswith('ut'):
-                    wordmap['new_para'] = 'N_FARKUT'
-                elif wordmap['lemma'].endswith('yt'):
-                    wordmap['new_para'] = 'N_JYLKYT'
-                else:
-                    fail_guess_because(wordmap, ['N', 1, 'A', 'PLT'],
-                                       ['kot', 'kut', 'kyt'])
-            elif wordmap['kotus_av'] == 'B':
-                if wordmap['lemma'].endswith('put'):
-                    wordmap['new_para'] = 'N_RAPUT'
-                elif wordmap['lemma'].endswith('pot'):
-                    wordmap['new_para'] = 'N_PEIPOT'
-                else:
-                    fail_guess_because(wordmap, ['N', 1, 'B', 'PLT'],
-                                       ['put'])
-            elif wordmap['kotus_av'] == 'C':
-                if wordmap['lemma'].endswith('tyt'):
-                    wordmap['new_para'] = 'N_NIITYT'
-                elif wordmap['lemma'].endswith('tut'):
-                    wordmap['new_para'] = 'N_NIITUT'
-                elif wordmap['lemma'].endswith('tot'):
-                    wordmap['new_para'] = 'N_ROITOT'
-                elif wordmap['lemma'].endswith('töt'):
-                    wordmap['new_para'] = 'N_TYTÖT'
-                else:
-                    fail_guess_because(wordmap, ['N', 1, 'C', 'PLT'],
-                                       ['tyt', 'tut', 'töt'])
-            elif wordmap['kotus_av'] == 'E':
-                if wordmap['lemma'].endswith('vut'):
-                    wordmap['new_para'] = 'N_RAVUT'
-                elif wordmap['lemma'].endswith('vot'):
-                    wordmap['new_para'] = 'N_KOUVOT'
-                else:
-                    fail_guess_because(wordmap, ['N', 1, 'E', 'PLT'],
-                                       ['vut'])
-            elif wordmap['kotus_av'] == 'F':
-                if wordmap['lemma'].endswith('dot'):
-                    wordmap['new_para'] = 'N_PIDOT'
-                elif wordmap['lemma'].endswith('dyt'):
-                    wordmap['new_para'] = 'N_KÄÄDYT'
-                elif wordmap['lemma'].endswith('döt'):
-                    wordmap['new_para'] = 'N_KYDÖT'
-                else:
-                    fail_guess_because(wordmap, ['N', 1, 'F', 'PLT'],
-                                       ['dot', 'dyt'])
-            elif wordmap['kotus_av'] == 'G':
-                if wordmap['lemma'].endswith('got'):
-                    wordmap['new_para'] = 'N_LINGOT'
-                else:
-                    fail_guess_because(wordmap, ['N', 1, 'F', 'PLT'],
-                                       ['dot', 'dyt'])
-            elif wordmap['kotus_av'] == 'H':
-                if wordmap['lemma'].endswith('mmut'):
-                    wordmap['new_para'] = 'N_KUMMUT'
-                else:
-                    fail_guess_because(wordmap, ['N', 1, 'H', 'PLT'],
-                                       ['mmut'])
-            elif wordmap['kotus_av'] == 'I':
-                if wordmap['lemma'].endswith('llot'):
-                    wordmap['new_para'] = 'N_AALLOT'
-                else:
-                    fail_guess_because(wordmap, ['N', 1, 'I', 'PLT'],
-                                       ['llot'])
-            elif wordmap['kotus_av'] == 'J':
-                if wordmap['lemma'].endswith('nnot'):
-                    wordmap['new_para'] = 'N_OPINNOT'
-                elif wordmap['lemma'].endswith('nnyt'):
-                    wordmap['new_para'] = 'N_MÄNNYT'
-                elif wordmap['lemma'].endswith('nnöt'):
-                    wordmap['new_para'] = 'N_SÄÄNNÖT'
-                else:
-                    fail_guess_because(wordmap, ['N', 1, 'J', 'PLT'],
-                                       ['nnot', 'nnöt'])
-            elif wordmap['kotus_av'] == 'K':
-                if wordmap['lemma'].endswith('rrot'):
-                    wordmap['new_para'] = 'N_KAARROT'
-                else:
-                    fail_guess_because(wordmap, ['N', 1, 'K', 'PLT'],
-                                       ['rrot'])
-            else:
-                fail_guess_because(wordmap, ['N', 1, 'PLT'],
-                                   [False, 'A-F', 'I', 'J'])
-        elif tn == 2:
-            if not wordmap['kotus_av']:
-                if wordmap['lemma'].endswith('ot'):
-                    wordmap['new_para'] = 'N_PIPPALOT'
-                elif wordmap['lemma'].endswith('ut'):
-                    wordmap['new_para'] = 'N_NEUVOTTELUT'
-                elif wordmap['lemma'].endswith('öt'):
-                    wordmap['new_para'] = 'N_JÄRJESTÖT'
-                else:
-                    fail_guess_because(wordmap, ['N', 2, False, 'PLT'],
-                                       ['ot', 'ut', 'öt'])
-            else:
-                fail_guess_because(wordmap, ['N', 2, 'PLT'],
-                                   [False])
-        elif tn == 3:
-            if not wordmap['kotus_av']:
-                if wordmap['lemma'].endswith('ot'):
-                    wordmap['new_para'] = 'N_RAUNIOT'
-                elif wordmap['lemma'].endswith('öt'):
-                    wordmap['new_para'] = 'N_YHTIÖT'
-                else:
-                    fail_guess_because(wordmap, ['N', 3, False, 'PLT'],
-                                       ['ot', 'öt'])
-            else:
-                fail_guess_because(wordmap, ['N', 3, 'PLT'],
-                                   [False])
-        elif tn == 4:
-            if wordmap['kotus_av'] == 'A':
-                if wordmap['lemma'].endswith('öt'):
-                    wordmap['new_para'] = 'N_TÖLPÄKÖT'
-                elif wordmap['lemma'].endswith('ot'):
-                    wordmap['new_para'] = 'N_LUOLIKOT'
-                else:
-                    fail_guess_because(wordmap, ['N', 4, 'A', 'PLT'],
-                                       ['ot'])
-            else:
-                fail_guess_because(wordmap, ['N', 4, 'PLT'],
-                                   [False])
-        elif tn == 5:
-            if not wordmap['kotus_av']:
-                if wordmap['lemma'].endswith('it') and wordmap['harmony'] == 'back':
-                    wordmap['new_para'] = 'N_LASIT'
-                elif wordmap['lemma'].endswith('it') and wordmap['harmony'] == 'front':
-                    wordmap['new_para'] = 'N_LIIVIT'
-                else:
-                    fail_guess_because(wordmap, ['N', 5, False, 'PLT'],
-                                       ['it', 'back'])
-            elif wordmap['kotus_av'] == 'A':
-                if wordmap['lemma'].endswith('kit') and wordmap['harmony'] == 'back':
-                    wordmap['new_para'] = 'N_PANKIT'
-                elif wordmap['lemma'].endswith('kit') and wordmap['harmony'] == 'front':
-                    wordmap['new_para'] = 'N_FÄNRIKIT'
-                else:
-                    fail_guess_because(wordmap, ['N', 5, 'A', 'PLT'],
-                                       ['kit', 'back'])
-            elif wordmap['kotus_av'] == 'B':
-                if wordmap['lemma'].endswith('pit') and wordmap['harmony'] == 'back':
-                    wordmap['new_para'] = 'N_KLUMPIT'
-                else:
-                    fail_guess_because(wordmap, ['N', 5, 'C', 'PLT'],
-                                       ['pit', 'back'])
-            elif wordmap['kotus_av'] == 'C':
-                if wordmap['lemma'].endswith('tit') and wordmap['harmony'] == 'back':
-                    wordmap['new_para'] = 'N_KASTANJETIT'
-                elif wordmap['lemma'].endswith('tit') and wordmap['harmony'] == 'front':
-                    wordmap['new_para'] = 'N_PINSETIT'
-                else:
-                    fail_guess_because(wordmap, ['N', 5, 'C', 'PLT'],
-                                       ['tit', 'back'])
-            elif wordmap['kotus_av'] == 'F':
-                if wordmap['lemma'].endswith('dit') and wordmap['harmony'] == 'back':
-                    wordmap['new_para'] = 'N_TAUDIT'
-                elif wordmap['lemma'].endswith('dit') and wordmap['harmony'] == 'front':
-                    wordmap['new_para'] = 'N_PIHDIT'
-                else:
-                    fail_guess_because(wordmap, ['N', 5, 'F', 'PLT'],
-                                       ['dit'])
-            elif wordmap['kotus_av'] == 'G':
-                if wordmap['lemma'].endswith('ngit') and wordmap['harmony'] == 'back':
-                    wordmap['new_para'] = 'N_TONGIT'
-                elif wordmap['lemma'].endswith('ngit') and wordmap['harmony'] == 'front':
-                    wordmap['new_para'] = 'N_SYÖMINGIT'
-                else:
-                    fail_guess_because(wordmap, ['N', 5, 'G', 'PLT'],
-                                       ['ngit', 'back'])
-            elif wordmap['kotus_av'] == 'H':
-                if wordmap['lemma'].endswith('mmit') and wordmap['harmony'] == 'back':
-                    wordmap['new_para'] = 'N_LAMMIT'
-                elif wordmap['lemma'].endswith('mmit') and wordmap['harmony'] == 'front':
-                    wordmap['new_para'] = 'N_RIMMIT'
-                else:
-                    fail_guess_because(wordmap, ['N', 5, 'H', 'PLT'],
-                                       ['mmit', 'back'])
-            elif wordmap['kotus_av'] == 'J':
-                if wordmap['lemma'].endswith('nnit') and wordmap['harmony'] == 'back':
-                    wordmap['new_para'] = 'N_TUNNIT'
-                else:
-                    fail_guess_because(wordmap, ['N', 5, 'J', 'PLT'],
-                                       ['nnit', 'back'])
-            else:
-                fail_guess_because(wordmap, ['N', 5, 'PLT'],
-                                   [False, 'C', 'F', 'G', 'J'])
-        elif tn == 6:
-            if not wordmap['kotus_av']:
-                if wordmap['harmony'] == 'back':
-                    wordmap['new_para'] = 'N_FARMARIT'
-                elif wordmap['harmony'] == 'front':
-                    wordmap['new_para'] = 'N_BIKINIT'
-                else:
-                    fail_guess_because(wordmap, ['N', 6, False, 'PLT'],
-                                       ['back'])
-            else:
-                fail_guess_because(wordmap, ['N', 6, 'PLT'],
-                                   [False])
-        elif tn == 7:
-            if not wordmap['kotus_av']:
-                if wordmap['harmony'] == 'back':
-                    wordmap['new_para'] = 'N_SAKSET'
-                elif wordmap['harmony'] == 'front':
-                    wordmap['new_para'] = 'N_RIPSET'
-                else:
-                    fail_guess_because(wordmap, ['N', 7, False, 'PLT'],
-                                       ['front', 'back'])
-            elif wordmap['kotus_av'] == 'D':
-                if wordmap['harmony'] == 'back':
-                    wordmap['new_para'] = 'N_LAET'
-                elif wordmap['harmony'] == 'front':
-                    wordmap['new_para'] = 'N_MÄET'
-                else:
-                    fail_guess_because(wordmap, ['N', 7, 'D', 'PLT'],
-                                       ['front'])
-            elif wordmap['kotus_av'] == 'E':
-                if wordmap['harmony'] == 'back':
-                    wordmap['new_para'] = 'N_KORVET'
-                elif wordmap['harmony'] == 'front':
-                    wordmap['new_para'] = 'N_RIIVET'
-                else:
-                    fail_guess_because(wordmap, ['N', 7, 'E', 'PLT'],
-                                       ['front'])
-            elif wordmap['kotus_av'] == 'F':
-                if wordmap['harmony'] == 'back':
-                    wordmap['new_para'] = 'N_LAHDET'
-                elif wordmap['harmony'] == 'front':
-                    wordmap['new_para'] = 'N_LEHDET'
-                else:
-                    fail_guess_because(wordmap, ['N', 7, 'F', 'PLT'],
-                                       ['front'])
-            elif wordmap['kotus_av'] == 'G':
-                if wordmap['harmony'] == 'front':
-                    wordmap['new_para'] = 'N_LÄNGET'
-                else:
-                    fail_guess_because(wordmap, ['N', 7, 'G', 'PLT'],
-                                       ['front'])
-            elif wordmap['kotus_av'] == 'H':
-                if wordmap['harmony'] == 'back':
-                    wordmap['new_para'] = 'N_LAMMET'
-                else:
-                    fail_guess_because(wordmap, ['N', 7, 'H', 'PLT'],
-                                       ['front'])
-            elif wordmap['kotus_av'] == 'J':
-                if wordmap['harmony'] == 'back':
-                    wordmap['new_para'] = 'N_ONNET'
-                else:
-                    fail_guess_because(wordmap, ['N', 7, 'J', 'PLT'],
-                                       ['front'])
-            elif wordmap['kotus_av'] == 'L':
-                if wordmap['harmony'] == 'front':
-                    wordmap['new_para'] = 'N_KÄRJET'
-                else:
-                    fail_guess_because(wordmap, ['N', 7, 'L', 'PLT'],
-                                       ['front'])
-            else:
-                fail_guess_because(wordmap, ['N', 7, 'PLT'],
-                                   [False, 'F', 'G', 'H', 'J', 'L'])
-        elif tn == 8:
-            if not wordmap['kotus_av']:
-                if wordmap['harmony'] == 'back':
-                    wordmap['new_para'] = 'N_RAVET'
-                elif wordmap['harmony'] == 'front':
-                    wordmap['new_para'] = 'N_BÄNET'
-                else:
-                    fail_guess_because(wordmap, ['N', 8, False, 'PLT'],
-                                       ['back'])
-            else:
-                fail_guess_because(wordmap, ['N', 8, 'PLT'],
-                                   [False])
-        elif tn == 9:
-            if not wordmap['kotus_av']:
-                if wordmap['lemma'].endswith('at'):
-                    wordmap['new_para'] = 'N_VARAT'
-                else:
-                    fail_guess_because(wordmap, ['N', 9, False, 'PLT'],
-                                       ['at'])
-            elif wordmap['kotus_av'] in ['A', 'D']:
-                if wordmap['lemma'].endswith('at'):
-                    wordmap['new_para'] = 'N_PAIKAT'
-                else:
-                    fail_guess_because(wordmap, ['N', 9, 'A', 'PLT'],
-                                       ['kat'])
-            elif wordmap['kotus_av'] == 'B':
-                if wordmap['lemma'].endswith('pat'):
-                    wordmap['new_para'] = 'N_HIPAT'
-                else:
-                    fail_guess_because(wordmap, ['N', 9, 'B', 'PLT'],
-                                       ['pat'])
-            elif wordmap['kotus_av'] == 'C':
-                if wordmap['lemma'].endswith('tat'):
-                    wordmap['new_para'] = 'N_RIUTAT'
-                else:
-                    fail_guess_because(wordmap, ['N', 9, 'B', 'PLT'],
-                                       ['pat'])
-            elif wordmap['kotus_av'] == 'E':
-                if wordmap['lemma'].endswith('vat'):
-                    wordmap['new_para'] = 'N_TAVAT'
-                else:
-                    fail_guess_because(wordmap, ['N', 9, 'E', 'PLT'],
-                                       ['vat'])
-            elif wordmap['kotus_av'] == 'F':
-                if wordmap['lemma'].endswith('dat'):
-                    wordmap['new_para'] = 'N_RAUDAT'
-                else:
-                    fail_guess_because(wordmap, ['N', 9, 'F', 'PLT'],
-                                       ['dat'])
-            elif wordmap['kotus_av'] == 'G':
-                if wordmap['lemma'].endswith('gat'):
-                    wordmap['new_para'] = 'N_RANGAT'
-                else:
-                    fail_guess_because(wordmap, ['N', 9, 'G', 'PLT'],
-                                       ['gat'])
-            elif wordmap['kotus_av'] == 'I':
-                if wordmap['lemma'].endswith('llat'):
-                    wordmap['new_para'] = 'N_VALLAT'
-                else:
-                    fail_guess_because(wordmap, ['N', 9, 'I', 'PLT'],
-                                       ['llat'])
-            elif wordmap['kotus_av'] == 'J':
-                if wordmap['lemma'].endswith('nnat'):
-                    wordmap['new_para'] = 'N_RANNAT'
-                else:
-                    fail_guess_because(wordmap, ['N', 9, 'J', 'PLT'],
-                                       ['llat'])
-            elif wordmap['kotus_av'] == 'K':
-                if wordmap['lemma'].endswith('rrat'):
-                    wordmap['new_para'] = 'N_KARRAT'
-                else:
-                    fail_guess_because(wordmap, ['N', 9, 'K', 'PLT'],
-                                       ['rrat'])
-            else:
-                fail_guess_because(wordmap, ['N', 9, 'PLT'],
-                                   [False, 'A-G', 'I-K'])
-        elif tn == 10:
-            if not wordmap['kotus_av']:
-                if wordmap['lemma'].endswith('at'):
-                    wordmap['new_para'] = 'N_JUHLAT'
-                elif wordmap['lemma'].endswith('ät'):
-                    wordmap['new_para'] = 'N_KÄRÄJÄT'
-                else:
-                    fail_guess_because(wordmap, ['N', 10, False, 'PLT'],
-                                       ['at', 'ät'])
-            elif wordmap['kotus_av'] == 'A':
-                if wordmap['lemma'].endswith('kat'):
-                    wordmap['new_para'] = 'N_SUKAT'
-                elif wordmap['lemma'].endswith('kät'):
-                    wordmap['new_para'] = 'N_SÄRKÄT'
-                else:
-                    fail_guess_because(wordmap, ['N', 10, 'A', 'PLT'],
-                                       ['kat', 'kät'])
-            elif wordmap['kotus_av'] == 'B':
-                if wordmap['lemma'].endswith('pat'):
-                    wordmap['new_para'] = 'N_KUOPAT'
-                elif wordmap['lemma'].endswith('pät'):
-                    wordmap['new_para'] = 'N_TÖLPÄT'
-                else:
-                    fail_guess_because(wordmap, ['N', 10, 'B', 'PLT'],
-                                       ['pat'])
-            elif wordmap['kotus_av'] == 'C':
-                if wordmap['lemma'].endswith('tat'):
-                    wordmap['new_para'] = 'N_ROTAT'
-                elif wordmap['lemma'].endswith('tät'):
-                    wordmap['new_para'] = 'N_KENTÄT'
-                else:
-                    fail_guess_because(wordmap, ['N', 10, 'C', 'PLT'],
-                                       ['tät'])
-            elif wordmap['kotus_av'] == 'D':
-                if wordmap['lemma'].endswith('ät'):
-                    wordmap['new_para'] = 'N_REIÄT'
-                else:
-                    fail_guess_because(wordmap, ['N', 10, 'D', 'PLT'],
-                                       ['ät'])
-            elif wordmap['kotus_av'] == 'E':
-                if wordmap['lemma'].endswith('vat'):
-                    wordmap['new_para'] = 'N_JUOVAT'
-                else:
-                    fail_guess_because(wordmap, ['N', 10, 'E', 'PLT'],
-                                       ['vat'])
-            elif wordmap['kotus_av'] == 'F':
-                if wordmap['lemma'].endswith('dat'):
-                    wordmap['new_para'] = 'N_LUHDAT'
-                else:
-                    fail_guess_because(wordmap, ['N', 10, 'D', 'PLT'],
-                                       ['dat'])
-            elif wordmap['kotus_av'] == 'G':
-                if wordmap['lemma'].endswith('ngät'):
-                    wordmap['new_para'] = 'N_KENGÄT'
-                else:
-                    fail_guess_because(wordmap, ['N', 10, 'G', 'PLT'],
-                                       ['ngät'])
-            elif wordmap['kotus_av'] == 'J':
-                if wordmap['lemma'].endswith('nnat'):
-                    wordmap['new_para'] = 'N_KUNNAT'
-                elif wordmap['lemma'].endswith('nnät'):
-                    wordmap['new_para'] = 'N_HÄNNÄT'
-                else:
-                    fail_guess_because(wordmap, ['N', 10, 'J', 'PLT'],
-                                       ['nnat'])
-            elif wordmap['kotus_av'] == 'L':
-                if wordmap['lemma'].endswith('ljät'):
-                    wordmap['new_para'] = 'N_SELJÄT'
-                else:
-                    fail_guess_because(wordmap, ['N', 10, 'L', 'PLT'],
-                                       ['ljät'])
-            else:
-                fail_guess_because(wordmap, ['N', 10, 'PLT'],
-                                   [False, 'A', 'B', 'D', 'F' 'G', 'J'])
-        elif tn == 11:
-            if not wordmap['kotus_av']:
-                if wordmap['lemma'].endswith('at'):
-                    wordmap['new_para'] = 'N_KIHARAT'
-                else:
-                    fail_guess_because(wordmap, ['N', 11, False, 'PLT'],
-                                       ['at'])
-            else:
-                fail_guess_because(wordmap, ['N', 11, 'PLT'],
-                                   [False])
-        elif tn == 12:
-            if not wordmap['kotus_av']:
-                if wordmap['lemma'].endswith('at'):
-                    wordmap['new_para'] = 'N_MARKKINAT'
-                elif wordmap['lemma'].endswith('ät'):
-                    wordmap['new_para'] = 'N_RÄMIÄT'
-                else:
-                    fail_guess_because(wordmap, ['N', 12, False, 'PLT'],
-                                       ['at', 'ät'])
-            else:
-                fail_guess_because(wordmap, ['N', 12, 'PLT'],
-                                   [False])
-        elif tn == 13:
-            if not wordmap['kotus_av']:
-                if wordmap['lemma'].endswith('at'):
-                    wordmap['new_para'] = 'N_KASTILJAT'
-                else:
-                    fail_guess_because(wordmap, ['N', 13, False, 'PLT'],
-                                       ['at'])
-            else:
-                fail_guess_because(wordmap, ['N', 13, 'PLT'],
-                                   [False])
-        elif tn == 14:
-            if wordmap['kotus_av'] == 'A':
-                if wordmap['lemma'].endswith('kat'):
-                    wordmap['new_para'] = 'N_SILAKAT'
-                else:
-                    fail_guess_because(wordmap, ['N', 14, 'A', 'PLT'],
-                                       ['at'])
-            else:
-                fail_guess_because(wordmap, ['N', 14, 'PLT'],
-                                   ['A'])
-        elif tn == 15:
-            if not wordmap['kotus_av']:
-                if wordmap['lemma'].endswith('at'):
-                    wordmap['new_para'] = 'N_HOPEAT'
-                elif wordmap['lemma'].endswith('ät'):
-                    wordmap['new_para'] = 'N_RÄMEÄT'
-                else:
-                    fail_guess_because(wordmap, ['N', 15, False, 'PLT'],
-                                       ['at'])
-            else:
-                fail_guess_because(wordmap, ['N', 15, 'PLT'],
-                                   [False])
-        elif tn == 16:
-            if wordmap['kotus_av'] == 'H':
-                if wordmap['lemma'].endswith('mmat'):
-                    wordmap['new_para'] = 'N_VANHEMMAT'
-                else:
-                    fail_guess_because(wordmap, ['N', 16, 'H', 'PLT'],
-                                       ['at'])
-            else:
-                fail_guess_because(wordmap, ['N', 16, 'PLT'],
-                                   ['H'])
-        elif tn == 17:
-            if not wordmap['kotus_av']:
-                if wordmap['lemma'].endswith('aat'):
-                    wordmap['new_para'] = 'N_HARMAAT'
-                elif wordmap['lemma'].endswith('oot'):
-                    wordmap['new_para'] = 'N_TALKOOT'
-                elif wordmap['lemma'].endswith('yyt'):
-                    wordmap['new_para'] = 'N_HYNTTYYT'
-                elif wordmap['lemma'].endswith('äät'):
-                    wordmap['new_para'] = 'N_PÖLHÄÄT'
-                else:
-                    fail_guess_because(wordmap, ['N', 17, False, 'PLT'],
-                                       ['oot', 'yyt', 'äät'])
-            else:
-                fail_guess_because(wordmap, ['N', 17, 'PLT'],
-                                   [False])
-        elif tn == 18:
-            if not wordmap['kotus_av']:
-                if wordmap['lemma'].endswith('aat'):
-                    wordmap['new_para'] = 'N_ITÄMAAT'
-                elif wordmap['lemma'].endswith('ait'):
-                    wordmap['new_para'] = 'N_HAIT'
-                elif wordmap['lemma'].endswith('uut'):
-                    wordmap['new_para'] = 'N_PUUT'
-                elif wordmap['lemma'].endswith('yyt'):
-                    wordmap['new_para'] = 'N_PYYT'
-                elif wordmap['lemma'].endswith('äät'):
-                    wordmap['new_para'] = 'N_HÄÄT'
-                else:
-                    fail_guess_because(wordmap, ['N', 18, False, 'PLT'],
-                                       ['aat', 'ait', 'uut', 'yyt', 'äät'])
-            else:
-                fail_guess_because(wordmap, ['N', 18, 'PLT'],
-                                   [False])
-        elif tn == 19:
-            if not wordmap['kotus_av']:
-                if wordmap['lemma'].endswith('iet') and wordmap['harmony'] == 'front':
-                    wordmap['new_para'] = 'N_TIET'
-                elif wordmap['lemma'].endswith('uot'):
-                    wordmap['new_para'] = 'N_SUOT'
-                elif wordmap['lemma'].endswith('yöt'):
-                    wordmap['new_para'] = 'N_TYÖT'
-                else:
-                    fail_guess_because(wordmap, ['N', 19, False, 'PLT'],
-                                       ['iet', 'uot', 'yöt'])
-            else:
-                fail_guess_because(wordmap, ['N', 19, 'PLT'],
-                                   [False])
-        elif tn == 20:
-            if not wordmap['kotus_av']:
-                if wordmap['lemma'].endswith('ööt'):
-                    wordmap['new_para'] = 'N_MILJÖÖT'
-                else:
-                    fail_guess_because(wordmap, ['N', 20, False, 'PLT'],
-                                       ['ööt'])
-            else:
-                fail_guess_because(wordmap, ['N', 20, 'PLT'],
-                                   [False])
-        elif tn == 21:
-            if not wordmap['kotus_av']:
-                if wordmap['lemma'].endswith('át'):
-                    wordmap['new_para'] = 'N_LIVVADIEVÁT'
-                else:
-                    fail_guess_because(wordmap, ['N', 21, False, 'PLT'],
-                                       ['át'])
-            else:
-                fail_guess_because(wordmap, ['N', 21, 'PLT'],
-                                   [False])
-        elif tn == 25:
-            if not wordmap['kotus_av']:
-                if wordmap['lemma'].endswith('met') and wordmap['harmony'] == 'back':
-                    wordmap['new_para'] = 'N_TOIMET'
-                elif wordmap['lemma'].endswith('met') and wordmap['harmony'] == 'front':
-                    wordmap['new_para'] = 'N_NIEMET'
-                else:
-                    fail_guess_because(wordmap, ['N', 25, False, 'PLT'],
-                                       ['met'])
-            else:
-                fail_guess_because(wordmap, ['N', 25, 'PLT'],
-                                   [False])
-        elif tn in [24, 26]:
-            if not wordmap['kotus_av']:
-                if wordmap['lemma'].endswith('et') and wordmap['harmony'] == 'back':
-                    wordmap['new_para'] = 'N_SAARET'
-                elif wordmap['lemma'].endswith('et') and wordmap['harmony'] == 'front':
-                    wordmap['new_para'] = 'N_SÄÄRET'
-                else:
-                    fail_guess_because(wordmap, ['N', 26, False, 'PLT'],
-                                       ['et'])
-            else:
-                fail_guess_because(wordmap, ['N', 26, 'PLT'],
-                                   [False])
-        elif tn == 27:
-            if not wordmap['kotus_av']:
-                if wordmap['lemma'].endswith('det') and wordmap['harmony'] == 'back':
-                    wordmap['new_para'] = 'N_VUODET'
-                else:
-                    fail_guess_because(wordmap, ['N', 27, False, 'PLT'],
-                                       ['det'])
-            elif wordmap['kotus_av'] == 'F':
-                if wordmap['lemma'].endswith('det') and wordmap['harmony'] == 'back':
-                    wordmap['new_para'] = 'N_VUODET'
-                else:
-                    fail_guess_because(wordmap, ['N', 27, False, 'PLT'],
-                                       ['det'])
-            else:
-                fail_guess_because(wordmap, ['N', 27, 'PLT'],
-                                   [False])
-        elif tn == 28:
-            if not wordmap['kotus_av']:
-                if wordmap['lemma'].endswith('nnet') and wordmap['harmony'] == 'back':
-                    wordmap['new_para'] = 'N_KANNET'
-                elif wordmap['lemma'].endswith('rret') and wordmap['harmony'] == 'front':
-                    wordmap['new_para'] = 'N_VIRRET'
-                else:
-                    fail_guess_because(wordmap, ['N', 28, False, 'PLT'],
-                                       ['nnet', 'rret'])
-            elif wordmap['kotus_av'] == 'J':
-                if wordmap['lemma'].endswith('nnet') and wordmap['harmony'] == 'back':
-                    wordmap['new_para'] = 'N_KANNET'
-                elif wordmap['lemma'].endswith('nnet') and wordmap['harmony'] == 'front':
-                    wordmap['new_para'] = 'N_KYNNET'
-                else:
-                    fail_guess_because(wordmap, ['N', 28, 'J', 'PLT'],
-                                       ['nnet'])
-            else:
-                fail_guess_because(wordmap, ['N', 28, 'PLT'],
-                                   ['J'])
-        elif tn == 32:
-            if not wordmap['kotus_av']:
-                if wordmap['lemma'].endswith('et') and wordmap['harmony'] == 'front':
-                    wordmap['new_para'] = 'N_HÖYHENET'
-                else:
-                    fail_guess_because(wordmap, ['N', 32, False, 'PLT'],
-                                       ['et'])
-            elif wordmap['kotus_av'] == 'C':
-                if wordmap['lemma'].endswith('taret'):
-                    wordmap['new_para'] = 'N_LIPOTTARET'
-                elif wordmap['lemma'].endswith('täret'):
-                    wordmap['new_para'] = 'N_KIRITTÄRET'
-                else:
-                    fail_guess_because(wordmap, ['N', 32, 'C', 'PLT'],
-                                       ['taret'])
-            elif wordmap['kotus_av'] == 'D':
-                if wordmap['lemma'].endswith('kenet') and wordmap['harmony'] == 'front':
-                    wordmap['new_para'] = 'N_IKENET'
-                else:
-                    fail_guess_because(wordmap, ['N', 32, 'D', 'PLT'],
-                                       ['kenet'])
-            else:
-                fail_guess_because(wordmap, ['N', 32, 'PLT'],
-                                   [False])
-        elif tn == 33:
-            if not wordmap['kotus_av']:
-                if wordmap['lemma'].endswith('met') and wordmap['harmony'] == 'back':
-                    wordmap['new_para'] = 'N_ATERIMET'
-                elif wordmap['lemma'].endswith('met') and wordmap['harmony'] == 'front':
-                    wordmap['new_para'] = 'N_KERITSIMET'
-                else:
-                    fail_guess_because(wordmap, ['N', 33, False, 'PLT'],
-                                       ['met'])
-            elif wordmap['kotus_av'] == 'C':
-                if wordmap['lemma'].endswith('ttimet') and wordmap['harmony'] == 'back':
-                    wordmap['new_para'] = 'N_HOKSOTTIMET'
-                elif wordmap['lemma'].endswith('ttimet') and wordmap['harmony'] == 'front':
-                    wordmap['new_para'] = 'N_SYNNYTTIMET'
-                else:
-                    fail_guess_because(wordmap, ['N', 33, 'C', 'PLT'],
-                                       ['ttimet'])
-            elif wordmap['kotus_av'] == 'D':
-                if wordmap['lemma'].endswith('kimet') and wordmap['harmony'] == 'back':
-                    wordmap['new_para'] = 'N_PUKIMET'
-                else:
-                    fail_guess_because(wordmap, ['N', 33, 'D', 'PLT'],
-                                       ['kimet'])
-            elif wordmap['kotus_av'] == 'F':
-                if wordmap['lemma'].endswith('timet') and wordmap['harmony'] == 'back':
-                    wordmap['new_para'] = 'N_ROHTIMET'
-                elif wordmap['lemma'].endswith('timet') and wordmap['harmony'] == 'front':
-                    wordmap['new_para'] = 'N_VETIMET'
-                else:
-                    fail_guess_because(wordmap, ['N', 33, 'F', 'PLT'],
-                                       ['timet'])
-            elif wordmap['kotus_av'] == 'J':
-                if wordmap['lemma'].endswith('ntimet') and wordmap['harmony'] == 'back':
-                    wordmap['new_para'] = 'N_ANTIMET'
-                else:
-                    fail_guess_because(wordmap, ['N', 33, 'J', 'PLT'],
-                                       ['ntimet'])
-            else:
-                fail_guess_because(wordmap, ['N', 33, 'PLT'],
-                                   [False, 'C', 'D', 'F', 'J'])
-        elif tn == 34:
-            if wordmap['kotus_av'] == 'C':
-                if wordmap['lemma'].endswith('mat'):
-                    wordmap['new_para'] = 'N_SIUNAAMATTOMAT'
-                elif wordmap['lemma'].endswith('mät'):
-                    wordmap['new_para'] = 'N_TYÖTTÖMÄT'
-                else:
-                    fail_guess_because(wordmap, ['N', 34, 'C', 'PLT'],
-                                       ['mät'])
-            else:
-                fail_guess_because(wordmap, ['N', 34, 'PLT'],
-                                   ['C'])
-        elif tn == 38:
-            if not wordmap['kotus_av']:
-                if wordmap['lemma'].endswith('set') and wordmap['harmony'] == 'back':
-                    wordmap['new_para'] = 'N_RAPPUSET'
-                elif wordmap['lemma'].endswith('set') and wordmap['harmony'] == 'front':
-                    wordmap['new_para'] = 'N_VIHKIÄISET'
-                else:
-                    fail_guess_because(wordmap, ['N', 38, False, 'PLT'],
-                                       ['eet'])
-            else:
-                fail_guess_because(wordmap, ['N', 38, 'PLT'],
-                                   [False])
-        elif tn == 39:
-            if not wordmap['kotus_av']:
-                if wordmap['lemma'].endswith('set') and wordmap['harmony'] == 'back':
-                    wordmap['new_para'] = 'N_SERKUKSET'
-                elif wordmap['lemma'].endswith('set') and wordmap['harmony'] == 'front':
-                    wordmap['new_para'] = 'N_YSTÄVYKSET'
-                else:
-                    fail_guess_because(wordmap, ['N', 39, False, 'PLT'],
-                                       ['eet'])
-            else:
-                fail_guess_because(wordmap, ['N', 39, 'PLT'],
-                                   [False])
-        elif tn == 40:
-            if not wordmap['kotus_av']:
-                if wordmap['lemma'].endswith('det') and wordmap['harmony'] == 'back':
-                    wordmap['new_para'] = 'N_OIKEUDET'
-                else:
-                    fail_guess_because(wordmap, ['N', 40, False, 'PLT'],
-                                       ['eet'])
-            else:
-                fail_guess_because(wordmap, ['N', 40, 'PLT'],
-                                   [False])
-        elif tn == 41:
-            if not wordmap['kotus_av']:
-                if wordmap['lemma'].endswith('aat'):
-                    wordmap['new_para'] = 'N_VALJAAT'
-                elif wordmap['lemma'].endswith('äät'):
-                    wordmap['new_para'] = 'N_KYNNÄÄT'
-                else:
-                    fail_guess_because(wordmap, ['N', 41, False, 'PLT'],
-                                       ['aat'])
-            elif wordmap['kotus_av'] in ['A', 'D']:
-                if wordmap['lemma'].endswith('kaat'):
-                    wordmap['new_para'] = 'N_TIKKAAT'
-                elif wordmap['lemma'].endswith('käät'):
-                    wordmap['new_para'] = 'N_KILPIKKÄÄT'
-                else:
-                    fail_guess_because(wordmap, ['N', 41, 'A', 'PLT'],
-                                       ['kaat'])
-            elif wordmap['kotus_av'] == 'B':
-                if wordmap['lemma'].endswith('ppaat'):
-                    wordmap['new_para'] = 'N_RUOPPAAT'
-                else:
-                    fail_guess_because(wordmap, ['N', 41, 'C', 'PLT'],
-                                       ['ttaat'])
-            elif wordmap['kotus_av'] == 'C':
-                if wordmap['lemma'].endswith('ttaat'):
-                    wordmap['new_para'] = 'N_RATTAAT'
-                elif wordmap['lemma'].endswith('ttyyt'):
-                    wordmap['new_para'] = 'N_RYNTTYYT'
-                elif wordmap['lemma'].endswith('ttäät'):
-                    wordmap['new_para'] = 'N_MÄTTÄÄT'
-                else:
-                    fail_guess_because(wordmap, ['N', 41, 'C', 'PLT'],
-                                       ['ttaat'])
-            elif wordmap['kotus_av'] == 'E':
-                if wordmap['lemma'].endswith('paat'):
-                    wordmap['new_para'] = 'N_VARPAAT'
-                else:
-                    fail_guess_because(wordmap, ['N', 41, 'E', 'PLT'],
-                                       ['rpaat'])
-            elif wordmap['kotus_av'] == 'F':
-                if wordmap['lemma'].endswith('taat'):
-                    wordmap['new_para'] = 'N_TEHTAAT'
-                else:
-                    fail_guess_because(wordmap, ['N', 41, 'F', 'PLT'],
-                                       ['taat'])
-            elif wordmap['kotus_av'] == 'G':
-                if wordmap['lemma'].endswith('nkaat'):
-                    wordmap['new_para'] = 'N_RENKAAT'
-                elif wordmap['lemma'].endswith('nkahat'):
-                    wordmap['new_para'] = 'N_KANKAHAT'
-                else:
-                    fail_guess_because(wordmap, ['N', 41, 'G', 'PLT'],
-                                       ['nkaat'])
-            elif wordmap['kotus_av'] == 'H':
-                if wordmap['lemma'].endswith('mpaat'):
-                    wordmap['new_para'] = 'N_ROMPAAT'
-                else:
-                    fail_guess_because(wordmap, ['N', 41, 'H', 'PLT'],
-                                       ['mpaat'])
-            elif wordmap['kotus_av'] == 'I':
-                if wordmap['lemma'].endswith('ltaat'):
-                    wordmap['new_para'] = 'N_MALTAAT'
-                else:
-                    fail_guess_because(wordmap, ['N', 41, 'I', 'PLT'],
-                                       ['ltaat'])
-            elif wordmap['kotus_av'] == 'J':
-                if wordmap['lemma'].endswith('ntäät'):
-                    wordmap['new_para'] = 'N_RYNTÄÄT'
-                else:
-                    fail_guess_because(wordmap, ['N', 41, 'J', 'PLT'],
-                                       ['ntäät'])
-            elif wordmap['kotus_av'] == 'K':
-                if wordmap['lemma'].endswith('rtaat'):
-                    wordmap['new_para'] = 'N_PORTAAT'
-                else:
-                    fail_guess_because(wordmap, ['N', 41, 'K', 'PLT'],
-                                       ['rtaat'])
-            else:
-                fail_guess_because(wordmap, ['N', 41, 'PLT'],
-                                   [False, 'A', 'C', 'F', 'G', 'J', 'K'])
-        elif tn == 42:
-            if not wordmap['kotus_av']:
-                if wordmap['lemma'].endswith('iehet'):
-                    wordmap['new_para'] = 'N_MIEHET'
-                else:
-                    fail_guess_because(wordmap, ['N', 42, False, 'PLT'],
-                                       ['het'])
-            else:
-                fail_guess_because(wordmap, ['N', 42, 'PLT'],
-                                   [False])
-        elif tn == 43:
-            if not wordmap['kotus_av']:
-                if wordmap['lemma'].endswith('uet'):
-                    wordmap['new_para'] = 'N_MATKUET'
-                else:
-                    fail_guess_because(wordmap, ['N', 43, False, 'PLT'],
-                                       ['uet'])
-            else:
-                fail_guess_because(wordmap, ['N', 43, 'PLT'],
-                                   [False])
-        elif tn == 47:
-            if not wordmap['kotus_av']:
-                if wordmap['lemma'].endswith('eet') and wordmap['harmony'] == 'back':
-                    wordmap['new_para'] = 'N_LIITTOUTUNEET'
-                elif wordmap['lemma'].endswith('eet') and wordmap['harmony'] == 'front':
-                    wordmap['new_para'] = 'N_HÄVINNEET'
-                else:
-                    fail_guess_because(wordmap, ['N', 47, False, 'PLT'],
-                                       ['eet'])
-            else:
-                fail_guess_because(wordmap, ['N', 47, 'PLT'],
-                                   [False])
-        elif tn == 48:
-            if not wordmap['kotus_av']:
-                if wordmap['lemma'].endswith('eet') and wordmap['harmony'] == 'back':
-                    wordmap['new_para'] = 'N_HIUTALEET'
-                elif wordmap['lemma'].endswith('eet') and wordmap['harmony'] == 'front':
-                    wordmap['new_para'] = 'N_RÄMEET'
-                else:
-                    fail_guess_because(wordmap, ['N', 48, False, 'PLT'],
-                                       ['eet'])
-            elif wordmap['kotus_av'] in ['A', 'D']:
-                if wordmap['lemma'].endswith('keet') and wordmap['harmony'] == 'back':
-                    wordmap['new_para'] = 'N_KUULOKKEET'
-                elif wordmap['lemma'].endswith('keet') and wordmap['harmony'] == 'front':
-                    wordmap['new_para'] = 'N_SILMÄKKEET'
-                else:
-                    fail_guess_because(wordmap, ['N', 48, 'AD', 'PLT'],
-                                       ['peet'])
-            elif wordmap['kotus_av'] == 'B':
-                if wordmap['lemma'].endswith('peet') and wordmap['harmony'] == 'back':
-                    wordmap['new_para'] = 'N_KAMPPEET'
-                else:
-                    fail_guess_because(wordmap, ['N', 48, 'B', 'PLT'],
-                                       ['peet'])
-            elif wordmap['kotus_av'] == 'C':
-                if wordmap['lemma'].endswith('teet') and wordmap['harmony'] == 'back':
-                    wordmap['new_para'] = 'N_VAATTEET'
-                elif wordmap['lemma'].endswith('teet') and wordmap['harmony'] == 'front':
-                    wordmap['new_para'] = 'N_HYNTTEET'
-                else:
-                    fail_guess_because(wordmap, ['N', 48, 'C', 'PLT'],
-                                       ['teet'])
-            elif wordmap['kotus_av'] == 'E':
-                if wordmap['lemma'].endswith('peet') and wordmap['harmony'] == 'back':
-                    wordmap['new_para'] = 'N_TARPEET'
-                else:
-                    fail_guess_because(wordmap, ['N', 48, 'E', 'PLT'],
-                                       ['teet'])
-            elif wordmap['kotus_av'] == 'F':
-                if wordmap['lemma'].endswith('teet') and wordmap['harmony'] == 'back':
-                    wordmap['new_para'] = 'N_SUHTEET'
-                elif wordmap['lemma'].endswith('teet') and wordmap['harmony'] == 'front':
-                    wordmap['new_para'] = 'N_TIETEET'
-                else:
-                    fail_guess_because(wordmap, ['N', 48, 'F', 'PLT'],
-                                       ['teet'])
-            elif wordmap['kotus_av'] == 'J':
-                if wordmap['lemma'].endswith('nteet') and wordmap['harmony'] == 'back':
-                    wordmap['new_para'] = 'N_SALONTEET'
-                elif wordmap['lemma'].endswith('nteet') and wordmap['harmony'] == 'front':
-                    wordmap['new_para'] = 'N_RINTEET'
-                else:
-                    fail_guess_because(wordmap, ['N', 48, 'J', 'PLT'],
-                                       ['teet'])
-            elif wordmap['kotus_av'] == 'K':
-                if wordmap['lemma'].endswith('rteet') and wordmap['harmony'] == 'back':
-                    wordmap['new_para'] = 'N_MURTEET'
-                else:
-                    fail_guess_because(wordmap, ['N', 48, 'J', 'PLT'],
-                                       ['teet'])
-            elif wordmap['kotus_av'] == 'L':
-                if wordmap['lemma'].endswith('keet') and wordmap['harmony'] == 'back':
-                    wordmap['new_para'] = 'N_ALKEET'
-                elif wordmap['lemma'].endswith('keet') and wordmap['harmony'] == 'front':
-                    wordmap['new_para'] = 'N_PERKEET'
-                else:
-                    fail_guess_because(wordmap, ['N', 48, 'L', 'PLT'],
-                                       ['teet'])
-            else:
-                fail_guess_because(wordmap, ['N', 48, 'PLT'],
-                                   ['F'])
-        elif tn == 49:
-            if not wordmap['kotus_av']:
-                if wordmap['lemma'].endswith('et') and wordmap['harmony'] == 'back':
-                    wordmap['new_para'] = 'N_SAMMALET'
-                else:
-                    fail_guess_because(wordmap, ['N', 49, False, 'PLT'],
-                                       ['eet'])
-            else:
-                fail_guess_because(wordmap, ['N', 49, 'PLT'],
-                                   [False])
-        elif tn == 1007:
-            if not wordmap['kotus_av']:
-                if wordmap['lemma'].endswith('veljet') or wordmap['lemma'].endswith('Veljet'):
-                    wordmap['new_para'] = 'N_VELJET'
-                else:
-                    fail_guess_because(wordmap, ['N', 7, False, 'PLT'],
-                                       ['veljet'])
-            elif wordmap['kotus_av'] in ['D', 'L']:
-                if wordmap['lemma'].endswith('veljet') or wordmap['lemma'].endswith('Veljet'):
-                    wordmap['new_para'] = 'N_VELJET'
-                else:
-                    fail_guess_because(wordmap, ['N', 7, False, 'PLT'],
-                                       ['veljet'])
-            else:
-                fail_guess_because(wordmap, ['N', 7, 'PLT'],
-                                   [False, 'D', 'L'])
-        elif tn == 1010:
-            if not wordmap['kotus_av']:
-                if wordmap['lemma'].endswith('pojat') or wordmap['lemma'].endswith('Pojat'):
-                    wordmap['new_para'] = 'N_POJAT'
-                else:
-                    fail_guess_because(wordmap, ['N', 10, False, 'PLT'],
-                                       ['pojat'])
-            elif wordmap['kotus_av'] in ['D', 'L']:
-                if wordmap['lemma'].endswith('pojat') or wordmap['lemma'].endswith('Pojat'):
-                    wordmap['new_para'] = 'N_POJAT'
-                else:
-                    fail_guess_because(wordmap, ['N', 10, False, 'PLT'],
-                                       ['pojat'])
-            else:
-                fail_guess_because(wordmap, ['N', 10, 'PLT'],
-                                   [False, 'D', 'L'])
-        else:
-            fail_guess_because(wordmap, ['N', 'PLT'],
-                               [1, 2, 3, 8])
-    return wordmap
+    return guess_new_para_from_rules(wordmap, 'NOUN')
 
 
 def guess_new_adjective(wordmap):
-    tn = int(wordmap['kotus_tn'])
-    if tn == 1:
-        if not wordmap['kotus_av']:
-            if wordmap['lemma'].endswith('o') or wordmap['lemma'].endswith('O'):
-                wordmap['new_para'] = 'A_TUMMAHKO'
-            elif wordmap['lemma'].endswith('u') or wordmap['lemma'].endswith('U'):
-                wordmap['new_para'] = 'A_VALKAISTU'
-            elif wordmap['lemma'].endswith('y') or wordmap['lemma'].endswith('Y'):
-                wordmap['new_para'] = 'A_HÄPÄISTY'
-            elif wordmap['lemma'].endswith('ö'):
-                wordmap['new_para'] = 'A_HÖLÖ'
-            else:
-                fail_guess_because(wordmap, ['A', 1, False],
-                                   ['o O', 'u', 'yY', 'ö'])
-        elif wordmap['kotus_av'] == 'A':
-            if wordmap['lemma'].endswith('ko'):
-                wordmap['new_para'] = 'A_KOLKKO'
-            elif wordmap['lemma'].endswith('ku'):
-                wordmap['new_para'] = 'A_VIRKKU'
-            elif wordmap['lemma'].endswith('ky'):
-                wordmap['new_para'] = 'A_SÄIKKY'
-            elif wordmap['lemma'].endswith('kö'):
-                wordmap['new_para'] = 'A_KÖKKÖ'
-            else:
-                fail_guess_because(wordmap, ['A', 1, 'A'],
-                                   ['ko', 'ku', 'ky', 'kö'])
-        elif wordmap['kotus_av'] == 'B':
-            if wordmap['lemma'].endswith('ppo'):
-                wordmap['new_para'] = 'A_SUIPPO'
-            elif wordmap['lemma'].endswith('ppu'):
-                wordmap['new_para'] = 'A_IKÄLOPPU'
-            elif wordmap['lemma'].endswith('ppö'):
-                wordmap['new_para'] = 'A_LÖRPPÖ'
-            else:
-                fail_guess_because(wordmap, ['A', 1, 'B'],
-                                   ['ppo', 'ppu', 'ppö'])
-        elif wordmap['kotus_av'] == 'C':
-            if wordmap['lemma'].endswith('tto'):
-                wordmap['new_para'] = 'A_VELTTO'
-            elif wordmap['lemma'].endswith('ttu'):
-                wordmap['new_para'] = 'A_VIMMATTU'
-            elif wordmap['lemma'].endswith('tty'):
-                wordmap['new_para'] = 'A_YLENNETTY'
-            elif wordmap['lemma'].endswith('ttö'):
-                wordmap['new_para'] = 'A_KYYTTÖ'
-            else:
-                fail_guess_because(wordmap, ['A', 1, 'C'],
-                                   ['tto', 'ttu', 'tty', 'ttö'])
-        elif wordmap['kotus_av'] == 'D':
-            if wordmap['lemma'].endswith('ko'):
-                wordmap['new_para'] = 'A_LAKO'
-            else:
-                fail_guess_because(wordmap, ['A', 1, 'D'],
-                                   ['ko'])
-        elif wordmap['kotus_av'] == 'E':
-            if wordmap['lemma'].endswith('po'):
-                wordmap['new_para'] = 'A_KELPO'
-            else:
-                fail_guess_because(wordmap, ['A', 1, 'E'],
-                                   ['po'])
-        elif wordmap['kotus_av'] == 'F':
-            if wordmap['lemma'].endswith('to'):
-                wordmap['new_para'] = 'A_MIETO'
-            elif wordmap['lemma'].endswith('tu'):
-                wordmap['new_para'] = 'A_VIIPALOITU'
-            elif wordmap['lemma'].endswith('ty'):
-                wordmap['new_para'] = 'A_YKSILÖITY'
-            elif wordmap['lemma'].endswith('tö'):
-                fail_guess_because(wordmap, ['A', 1, 'F'],
-                                   ['to', 'tu', 'ty'])
-        elif wordmap['kotus_av'] == 'G':
-            if wordmap['lemma'].endswith('nko'):
-                wordmap['new_para'] = 'A_LENKO'
-            else:
-                fail_guess_because(wordmap, ['A', 1, 'G'],
-                                   ['nko'])
-        elif wordmap['kotus_av'] == 'I':
-            if wordmap['lemma'].endswith('lto'):
-                wordmap['new_para'] = 'A_MELTO'
-            elif wordmap['lemma'].endswith('ltu'):
-                wordmap['new_para'] = 'A_PARANNELTU'
-            elif wordmap['lemma'].endswith('lty'):
-                wordmap['new_para'] = 'A_VÄHÄTELTY'
-            else:
-                fail_guess_because(wordmap, ['A', 1, 'I'],
-                                   ['lto', 'ltu', 'lty'])
-        elif wordmap['kotus_av'] == 'J':
-            if wordmap['lemma'].endswith('nto'):
-                wordmap['new_para'] = 'A_VENTO'
-            elif wordmap['lemma'].endswith('ntu'):
-                wordmap['new_para'] = 'A_PANTU'
-            elif wordmap['lemma'].endswith('nty'):
-                wordmap['new_para'] = 'A_MENTY'
-            else:
-                fail_guess_because(wordmap, ['A', 1, 'J'],
-                                   ['nto', 'ntu', 'nty'])
-        elif wordmap['kotus_av'] == 'K':
-            if wordmap['lemma'].endswith('rto'):
-                wordmap['new_para'] = 'A_MARTO'
-            elif wordmap['lemma'].endswith('rtu'):
-                wordmap['new_para'] = 'A_PURTU'
-            elif wordmap['lemma'].endswith('rty'):
-                wordmap['new_para'] = 'A_PIERTY'
-            else:
-                fail_guess_because(wordmap, ['A', 1, 'K'],
-                                   ['rto', 'rto', 'rty'])
-        else:
-            fail_guess_because(wordmap, ['A', 1], ['A–K'])
-    elif tn == 2:
-        if not wordmap['kotus_av']:
-            if wordmap['lemma'].endswith('o'):
-                wordmap['new_para'] = 'A_KOHELO'
-            elif wordmap['lemma'].endswith('ö'):
-                wordmap['new_para'] = 'A_LÖPERÖ'
-            else:
-                fail_guess_because(wordmap, ['A', 2, False],
-                                   ['o', 'ö'])
-        else:
-            fail_guess_because(wordmap, ['A', 2], [False])
-    elif tn == 3:
-        if not wordmap['kotus_av']:
-            if wordmap['lemma'].endswith('io'):
-                wordmap['new_para'] = 'A_AUTIO'
-            elif wordmap['lemma'].endswith('iö'):
-                wordmap['new_para'] = 'A_RIIVIÖ'
-            else:
-                fail_guess_because(wordmap, ['A', 3, False],
-                                   ['io', 'iö'])
-        else:
-            fail_guess_because(wordmap, ['A', 3], [False])
-    elif tn == 4:
-        if wordmap['kotus_av'] == 'A':
-            if wordmap['lemma'].endswith('kko'):
-                wordmap['new_para'] = 'A_HUPAKKO'
-            else:
-                fail_guess_because(wordmap, ['A', 4, 'A'],
-                                   ['kko'])
-        else:
-            fail_guess_because(wordmap, ['A', 4], ['A'])
-    elif tn == 5:
-        if not wordmap['kotus_av']:
-            if wordmap['harmony'] == 'back':
-                wordmap['new_para'] = 'A_ABNORMI'
-            elif wordmap['harmony'] == 'front':
-                wordmap['new_para'] = 'A_STYDI'
-            else:
-                fail_guess_because(wordmap, ['A', 5, False, 'i'],
-                                   ['front', 'back'])
-        elif wordmap['kotus_av'] == 'A':
-            if wordmap['lemma'].endswith('ki') and wordmap['harmony'] == 'back':
-                wordmap['new_para'] = 'A_OPAAKKI'
-            elif wordmap['lemma'].endswith('ki') and wordmap['harmony'] == 'front':
-                wordmap['new_para'] = 'A_PINKKI'
-            else:
-                fail_guess_because(wordmap, ['A', 5, 'A'],
-                                   ['ki', 'front', 'back'])
-        elif wordmap['kotus_av'] == 'B':
-            if wordmap['lemma'].endswith('ppi') and wordmap['harmony'] == 'front':
-                wordmap['new_para'] = 'A_SIPPI'
-            else:
-                fail_guess_because(wordmap, ['A', 5, 'B'],
-                                   ['ppi', 'front', 'back'])
-        elif wordmap['kotus_av'] == 'C':
-            if wordmap['lemma'].endswith('tti') and wordmap['harmony'] == 'back':
-                wordmap['new_para'] = 'A_HURTTI'
-            elif wordmap['lemma'].endswith('tti') and wordmap['harmony'] == 'front':
-                wordmap['new_para'] = 'A_VÄÄRTTI'
-            else:
-                fail_guess_because(wordmap, ['A', 5, 'C'],
-                                   ['tti', 'front', 'back'])
-        elif wordmap['kotus_av'] == 'F':
-            if wordmap['lemma'].endswith('ti') and wordmap['harmony'] == 'back':
-                wordmap['new_para'] = 'A_TUHTI'
-            elif wordmap['lemma'].endswith('ti') and wordmap['harmony'] == 'front':
-                wordmap['new_para'] = 'A_REHTI'
-            else:
-                fail_guess_because(wordmap, ['A', 5, 'F'],
-                                   ['ti', 'front', 'back'])
-    elif tn == 6:
-        if not wordmap['kotus_av']:
-            if wordmap['harmony'] == 'back':
-                wordmap['new_para'] = 'A_ABNORMAALI'
-            elif wordmap['harmony'] == 'front':
-                wordmap['new_para'] = 'A_ÖYKKÄRI'
-            else:
-                fail_guess_because(wordmap, ['A', 6, False, 'i'],
-                                   ['front', 'back'])
-        else:
-            fail_guess_because(wordmap, ['A', 6],
-                               [False])
-    elif tn == 8:
-        if not wordmap['kotus_av']:
-            if wordmap['lemma'].endswith('e') and wordmap['harmony'] == 'back':
-                wordmap['new_para'] = 'A_TOOPE'
-            elif wordmap['lemma'].endswith('e') and wordmap['harmony'] == 'front':
-                wordmap['new_para'] = 'A_BEIGE'
-            else:
-                fail_guess_because(wordmap, ['A', 8, False],
-                                   ['e', 'front', 'back'])
-        else:
-            fail_guess_because(wordmap, ['A', 8],
-                               [False])
-    elif tn == 9:
-        if not wordmap['kotus_av']:
-            if wordmap['lemma'].endswith('a') or wordmap['lemma'].endswith('A'):
-                wordmap['new_para'] = 'A_AAVA'
-            else:
-                fail_guess_because(wordmap, ['A', 9, False],
-                                   ['a'])
-        elif wordmap['kotus_av'] == 'A':
-            if wordmap['lemma'].endswith('ka'):
-                wordmap['new_para'] = 'A_TARKKA'
-            else:
-                fail_guess_because(wordmap, ['A', 9, 'A'],
-                                   ['kka'])
-        elif wordmap['kotus_av'] == 'C':
-            if wordmap['lemma'].endswith('tta'):
-                wordmap['new_para'] = 'A_MATTA'
-            else:
-                fail_guess_because(wordmap, ['A', 9, 'C'],
-                                   ['tta'])
-        elif wordmap['kotus_av'] == 'D':
-            if wordmap['lemma'].endswith('ka'):
-                wordmap['new_para'] = 'A_TARKKA'
-            else:
-                fail_guess_because(wordmap, ['A', 9, 'D'],
-                                   ['ka'])
-        elif wordmap['kotus_av'] == 'E':
-            if wordmap['lemma'].endswith('pa'):
-                wordmap['new_para'] = 'A_HALPA'
-            else:
-                fail_guess_because(wordmap, ['A', 9, 'E'],
-                                   ['pa'])
-        elif wordmap['kotus_av'] == 'F':
-            if wordmap['lemma'].endswith('ta'):
-                wordmap['new_para'] = 'A_EHTA'
-            else:
-                fail_guess_because(wordmap, ['A', 9, 'F'],
-                                   ['ta'])
-        elif wordmap['kotus_av'] == 'G':
-            if wordmap['lemma'].endswith('nka'):
-                wordmap['new_para'] = 'A_SANKA'
-            else:
-                fail_guess_because(wordmap, ['A', 9, 'F'],
-                                   ['ta'])
-        elif wordmap['kotus_av'] == 'H':
-            if wordmap['lemma'].endswith('mpa'):
-                wordmap['new_para'] = 'A_RAMPA'
-            else:
-                fail_guess_because(wordmap, ['A', 9, 'H'],
-                                   ['mpa'])
-        elif wordmap['kotus_av'] == 'J':
-            if wordmap['lemma'].endswith('nta'):
-                wordmap['new_para'] = 'A_VIHANTA'
-        else:
-            fail_guess_because(wordmap, ['A', 9],
-                               [False, 'A-K'])
-    elif tn == 10:
-        if not wordmap['kotus_av']:
-            if wordmap['lemma'].endswith('a') or wordmap['lemma'].endswith('A'):
-                if three_syllable(wordmap['stub']):
-                    wordmap['new_para'] = 'A_MATALA'
-                else:
-                    wordmap['new_para'] = 'A_RUMA'
-            elif wordmap['lemma'].endswith('ä'):
-                if three_syllable(wordmap['stub']):
-                    wordmap['new_para'] = 'A_TERÄVÄ'
-                else:
-                    wordmap['new_para'] = 'A_TYHMÄ'
-            else:
-                fail_guess_because(wordmap, ['A', 10, False],
-                                   ['a', 'ä'])
-        elif wordmap['kotus_av'] in ['A', 'D']:
-            if wordmap['lemma'].endswith('ka'):
-                wordmap['new_para'] = 'A_HOIKKA'
-            elif wordmap['lemma'].endswith('kä'):
-                wordmap['new_para'] = 'A_MYKKÄ'
-            else:
-                fail_guess_because(wordmap, ['A', 10, 'A'],
-                                   ['kka', 'kkä'])
-        elif wordmap['kotus_av'] == 'B':
-            if wordmap['lemma'].endswith('ppa'):
-                wordmap['new_para'] = 'A_POPPA'
-            elif wordmap['lemma'].endswith('ppä'):
-                wordmap['new_para'] = 'A_HÖMPPÄ'
-            else:
-                fail_guess_because(wordmap, ['A', 10, 'B'],
-                                   ['ppa', 'ppä'])
-        elif wordmap['kotus_av'] == 'E':
-            if wordmap['lemma'].endswith('pa'):
-                wordmap['new_para'] = 'A_VOIPA'
-            elif wordmap['lemma'].endswith('pä'):
-                wordmap['new_para'] = 'A_KÄYPÄ'
-            else:
-                fail_guess_because(wordmap, ['A', 10, 'E'],
-                                   ['pa', 'pä'])
-        elif wordmap['kotus_av'] == 'F':
-            if wordmap['lemma'].endswith('tä'):
-                wordmap['new_para'] = 'A_MÄTÄ'
-            else:
-                fail_guess_because(wordmap, ['A', 10, 'F'],
-                                   ['ta', 'tä'])
-        elif wordmap['kotus_av'] == 'G':
-            if wordmap['lemma'].endswith('nka'):
-                wordmap['new_para'] = 'A_SANKA'
-            elif wordmap['lemma'].endswith('nkä'):
-                wordmap['new_para'] = 'A_VÄNKÄ'
-            else:
-                fail_guess_because(wordmap, ['A', 10, 'G'],
-                                   ['nka', 'nkä'])
-        elif wordmap['kotus_av'] == 'I':
-            if wordmap['lemma'].endswith('lta'):
-                wordmap['new_para'] = 'A_KULTA'
-            else:
-                fail_guess_because(wordmap, ['A', 10, 'I'],
-                                   ['lta'])
-        elif wordmap['kotus_av'] == 'J':
-            if wordmap['lemma'].endswith('ntä'):
-                wordmap['new_para'] = 'A_LÄNTÄ'
-            else:
-                fail_guess_because(wordmap, ['A', 10, 'J'],
-                                   ['ntä'])
-        elif wordmap['kotus_av'] == 'K':
-            if wordmap['lemma'].endswith('rta'):
-                wordmap['new_para'] = 'A_TURTA'
-            else:
-                fail_guess_because(wordmap, ['A', 10, 'K'],
-                                   ['rta'])
-        else:
-            fail_guess_because(wordmap, ['A', 10],
-                               [False, 'A', 'B', 'E', 'G', 'I-K'])
-    elif tn == 11:
-        if not wordmap['kotus_av']:
-            if wordmap['lemma'].endswith('a'):
-                wordmap['new_para'] = 'A_HAPERA'
-            elif wordmap['lemma'].endswith('ä'):
-                wordmap['new_para'] = 'A_SÄKKÄRÄ'
-            else:
-                fail_guess_because(wordmap, ['A', 11, False],
-                                   ['a', 'ä'])
-        else:
-            fail_guess_because(wordmap, ['A', 11],
-                               [False])
-    elif tn == 12:
-        if not wordmap['kotus_av']:
-            if wordmap['lemma'].endswith('a') or wordmap['lemma'].endswith('A'):
-                wordmap['new_para'] = 'A_HARMAJA'
-            elif wordmap['lemma'].endswith('ä'):
-                wordmap['new_para'] = 'A_HÖPPÄNÄ'
-            else:
-                fail_guess_because(wordmap, ['A', 12, False],
-                                   ['a', 'ä'])
-        else:
-            fail_guess_because(wordmap, ['A', 12],
-                               [False])
-    elif tn == 13:
-        if not wordmap['kotus_av']:
-            if wordmap['lemma'].endswith('a'):
-                wordmap['new_para'] = 'A_LATUSKA'
-            elif wordmap['lemma'].endswith('ä'):
-                wordmap['new_para'] = 'A_LÄTYSKÄ'
-            else:
-                fail_guess_because(wordmap, ['A', 13, False],
-                                   ['a', 'ä'])
-        else:
-            fail_guess_because(wordmap, ['A', 13],
-                               [False])
-    elif tn == 14:
-        if wordmap['kotus_av'] == 'A':
-            if wordmap['lemma'].endswith('kka'):
-                wordmap['new_para'] = 'A_HAILAKKA'
-            elif wordmap['lemma'].endswith('kkä'):
-                wordmap['new_para'] = 'A_RÄVÄKKÄ'
-            else:
-                fail_guess_because(wordmap, ['A', 14, 'A'],
-                                   ['kka', 'kkä'])
-        elif wordmap['kotus_av'] == 'C':
-            if wordmap['lemma'].endswith('tta'):
-                wordmap['new_para'] = 'A_POHATTA'
-            else:
-                fail_guess_because(wordmap, ['A', 14, 'C'],
-                                   ['tta'])
-        else:
-            fail_guess_because(wordmap, ['A', 14],
-                               ['A', 'C'])
-    elif tn == 15:
-        if not wordmap['kotus_av']:
-            if wordmap['lemma'].endswith('oa'):
-                wordmap['new_para'] = 'A_AINOA'
-            elif wordmap['lemma'].endswith('ea'):
-                wordmap['new_para'] = 'A_KORKEA'
-            elif wordmap['lemma'].endswith('eä'):
-                wordmap['new_para'] = 'A_JÄREÄ'
-            else:
-                fail_guess_because(wordmap, ['A', 15, False],
-                                   ['oa', 'ea', 'eä'])
-        else:
-            fail_guess_because(wordmap, ['A', 15],
-                               [False])
-    elif tn == 16:
-        if wordmap['kotus_av'] == 'H':
-            if wordmap['harmony'] == 'back':
-                wordmap['new_para'] = 'A_AIEMPI'
-            elif wordmap['harmony'] == 'front':
-                wordmap['new_para'] = 'A_LÄHEMPI'
-            else:
-                fail_guess_because(wordmap, ['A', 16, 'H'],
-                                   ['back'])
-        else:
-            fail_guess_because(wordmap, ['A', 16],
-                               ['H'])
-    elif tn == 17:
-        if not wordmap['kotus_av']:
-            if wordmap['lemma'].endswith('aa'):
-                wordmap['new_para'] = 'A_VAPAA'
-            elif wordmap['lemma'].endswith('ee'):
-                wordmap['new_para'] = 'A_OIKEE'
-            else:
-                fail_guess_because(wordmap, ['A', 17, False],
-                                   ['aa', 'ee'])  # , 'oo', 'uu', 'yy', 'ää', 'öö'])
-        else:
-            fail_guess_because(wordmap, ['A', 17],
-                               [False])
-    elif tn == 18:
-        if not wordmap['kotus_av']:
-            if wordmap['lemma'].endswith('a'):
-                wordmap['new_para'] = 'A_PEEAA'
-            elif wordmap['lemma'].endswith('u'):
-                wordmap['new_para'] = 'A_MUU'
-            elif wordmap['lemma'].endswith('ä'):
-                wordmap['new_para'] = 'A_SYYPÄÄ'
-            else:
-                fail_guess_because(wordmap, ['A', 18, False],
-                                   ['a', 'u', 'ä'])
-        else:
-            fail_guess_because(wordmap, ['A', 18],
-                               [False])
-    elif tn == 20:
-        fail_guess_because(wordmap, ['A', 20],
-                           [False])
-    elif tn == 21:
-        if not wordmap['kotus_av']:
-            if wordmap['lemma'].endswith('gay'):
-                wordmap['new_para'] = 'A_GAY'
-            else:
-                fail_guess_because(wordmap, ['A', 21, False],
-                                   ['gay', 'é', 'è'], "guessing 21 is not possible")
-        else:
-            fail_guess_because(wordmap, ['A', 21],
-                               [False])
-    elif tn in [24, 26]:
-        if not wordmap['kotus_av']:
-            if wordmap['harmony'] == 'back':
-                wordmap['new_para'] = 'A_SUURI'
-            elif wordmap['harmony'] == 'front':
-                wordmap['new_para'] = 'A_PIENI'
-            else:
-                fail_guess_because(wordmap, ['A', 23, False],
-                                   ['back', 'front'])
-        else:
-            fail_guess_because(wordmap, ['A', 22],
-                               [False])
-    elif tn == 27:
-        if not wordmap['kotus_av']:
-            if wordmap['lemma'].endswith('si'):
-                if wordmap['harmony'] == 'back':
-                    wordmap['new_para'] = 'A_UUSI'
-                elif wordmap['harmony'] == 'front':
-                    wordmap['new_para'] = 'A_TÄYSI'
-                else:
-                    fail_guess_because(wordmap, ['A', 26, False, 'si'],
-                                       ['back', 'front'])
-        elif wordmap['kotus_av'] == 'F':
-            if wordmap['lemma'].endswith('si'):
-                if wordmap['harmony'] == 'back':
-                    wordmap['new_para'] = 'A_UUSI'
-                elif wordmap['harmony'] == 'front':
-                    wordmap['new_para'] = 'A_TÄYSI'
-                else:
-                    fail_guess_because(wordmap, ['A', 27, 'F', 'si'],
-                                       ['back', 'front'])
-        else:
-            fail_guess_because(wordmap, ['A', 27],
-                               [False])
-    elif tn == 32:
-        if not wordmap['kotus_av']:
-            if wordmap['harmony'] == 'front':
-                wordmap['new_para'] = 'A_TYVEN'
-            else:
-                fail_guess_because(wordmap, ['A', 32, False],
-                                   ['front'])
-    elif wordmap['kotus_tn'] == 33:
-        if not wordmap['kotus_av']:
-            if wordmap['lemma'].endswith('in') and wordmap['harmony'] == 'back':
-                wordmap['new_para'] = 'A_AVOIN'
-            else:
-                fail_guess_because(wordmap, ['A', 33, 'B'],
-                                   ['in', 'back'])
-        elif wordmap['kotus_av'] == 'B':
-            if wordmap['lemma'].endswith('hapan'):
-                wordmap['new_para'] = 'A_HAPAN'
-            else:
-                fail_guess_because(wordmap, ['A', 33, 'B'],
-                                   ['hapan'])
-        else:
-            fail_guess_because(wordmap, ['A', 33], ['B'])
-    elif wordmap['kotus_tn'] == 34:
-        if not wordmap['kotus_av']:
-            if wordmap['lemma'].endswith('ton'):
-                wordmap['new_para'] = 'A_ALASTON'
-            else:
-                fail_guess_because(wordmap, ['A', 34, False],
-                                   ['ton'])
-        elif wordmap['kotus_av'] == 'C':
-            if wordmap['lemma'].endswith('ton'):
-                wordmap['new_para'] = 'A_VIATON'
-            elif wordmap['lemma'].endswith('tön'):
-                wordmap['new_para'] = 'A_KYVYTÖN'
-            else:
-                fail_guess_because(wordmap, ['A', 34, 'C'],
-                                   ['ton', 'tön'])
-        else:
-            fail_guess_because(wordmap, ['A', 34], [False, 'C'])
-    elif wordmap['kotus_tn'] == 35:
-        if wordmap['kotus_av'] == 'H':
-            if wordmap['harmony'] == 'front':
-                wordmap['new_para'] = 'A_LÄMMIN'
-            else:
-                fail_guess_because(wordmap, ['A', 35, False],
-                                   ['front'])
-        else:
-            fail_guess_because(wordmap, ['A', 35],
-                               ['H'])
-    elif wordmap['kotus_tn'] == 36:
-        if not wordmap['kotus_av']:
-            if wordmap['harmony'] == 'back':
-                wordmap['new_para'] = 'A_PAHIN'
-            elif wordmap['harmony'] == 'front':
-                wordmap['new_para'] = 'A_SISIN'
-            else:
-                fail_guess_because(wordmap, ['A', 36, 'J'],
-                                   ['front', 'back'])
-        else:
-            fail_guess_because(wordmap, ['A', 36],
-                               [False], "cannot have gradation")
-    elif wordmap['kotus_tn'] == 37:
-        if not wordmap['kotus_av']:
-            if wordmap['lemma'].endswith('vasen'):
-                wordmap['new_para'] = 'A_VASEN'
-            else:
-                fail_guess_because(wordmap, ['A', 37, False],
-                                   ['vasen'])
-        else:
-            fail_guess_because(wordmap, ['A', 37],
-                               [False], "cannot have gradation")
-    elif wordmap['kotus_tn'] == 38:
-        if not wordmap['kotus_av']:
-            if wordmap['harmony'] == 'back':
-                wordmap['new_para'] = 'A_AAKKOSELLINEN'
-            elif wordmap['harmony'] == 'front':
-                wordmap['new_para'] = 'A_KYLMÄJÄRKINEN'
-            else:
-                fail_guess_because(wordmap, ['A', 38, False],
-                                   ['front', 'back'])
-        else:
-            fail_guess_because(wordmap, ['A', 38],
-                               [False], "cannot have gradation")
-    elif wordmap['kotus_tn'] == 39:
-        if not wordmap['kotus_av']:
-            if wordmap['harmony'] == 'front':
-                wordmap['new_para'] = 'A_SYMPPIS'
-            else:
-                fail_guess_because(wordmap, ['A', 38, False],
-                                   ['front', 'back'])
-        else:
-            fail_guess_because(wordmap, ['A', 38],
-                               [False], "cannot have gradation")
-    elif wordmap['kotus_tn'] == 40:
-        if not wordmap['kotus_av']:
-            if wordmap['lemma'].endswith('yys'):
-                wordmap['new_para'] = 'A_LÄHTEISYYS'
-            else:
-                fail_guess_because(wordmap, ['A', 40],
-                                   ['yys'])
-        else:
-            fail_guess_because(wordmap, ['A', 40],
-                               [False], "cannot have gradation")
-    elif wordmap['kotus_tn'] == 41:
-        if not wordmap['kotus_av']:
-            if wordmap['lemma'].endswith('paras'):
-                wordmap['new_para'] = 'A_PARAS'
-            elif wordmap['lemma'].endswith('as'):
-                wordmap['new_para'] = 'A_AUTUAS'
-            elif wordmap['lemma'].endswith('is') and wordmap['harmony'] == 'back':
-                wordmap['new_para'] = 'A_VALMIS'
-            elif wordmap['lemma'].endswith('is') and wordmap['harmony'] == 'front':
-                wordmap['new_para'] = 'A_TIIVIS'
-            elif wordmap['lemma'].endswith('äs'):
-                wordmap['new_para'] = 'A_TYÖLÄS'
-            else:
-                fail_guess_because(wordmap, ['A', 41, False],
-                                   ['as', 'is', 'äs'])
-        elif wordmap['kotus_av'] == 'A':
-            if wordmap['lemma'].endswith('kas'):
-                wordmap['new_para'] = 'A_VOIMAKAS'
-            elif wordmap['lemma'].endswith('käs'):
-                wordmap['new_para'] = 'A_TYYLIKÄS'
-            else:
-                fail_guess_because(wordmap, ['A', 41, 'A'],
-                                   ['kas', 'käs'])
-        elif wordmap['kotus_av'] == 'B':
-            if wordmap['lemma'].endswith('pas'):
-                wordmap['new_para'] = 'A_REIPAS'
-            else:
-                fail_guess_because(wordmap, ['A', 41, 'B'],
-                                   ['pas', 'päs'])
-        elif wordmap['kotus_av'] == 'C':
-            if wordmap['lemma'].endswith('tas'):
-                wordmap['new_para'] = 'A_RIETAS'
-            elif wordmap['lemma'].endswith('tis') and wordmap['harmony'] == 'back':
-                wordmap['new_para'] = 'A_RAITIS'
-            else:
-                fail_guess_because(wordmap, ['A', 41, 'C'],
-                                   ['tas', 'tis', 'tus', 'täs', 'front'])
-        elif wordmap['kotus_av'] == 'F':
-            if wordmap['lemma'].endswith('das'):
-                wordmap['new_para'] = 'A_HIDAS'
-            else:
-                fail_guess_because(wordmap, ['A', 41, 'F'],
-                                   ['das'])
-        elif wordmap['kotus_av'] == 'K':
-            if wordmap['lemma'].endswith('ras'):
-                wordmap['new_para'] = 'A_HARRAS'
-            else:
-                fail_guess_because(wordmap, ['A', 41, 'K'],
-                                   ['rras'])
-        else:
-            fail_guess_because(wordmap, ['A', 41],
-                               [False, 'A B C F K'])
-    elif wordmap['kotus_tn'] == 43:
-        if not wordmap['kotus_av']:
-            if wordmap['lemma'].endswith('ut'):
-                wordmap['new_para'] = 'A_OHUT'
-            elif wordmap['lemma'].endswith('yt'):
-                wordmap['new_para'] = 'A_EHYT'
-            else:
-                fail_guess_because(wordmap, ['A', 43, False],
-                                   ['ut', 'yt'])
-        else:
-            fail_guess_because(wordmap, ['A', 43],
-                               [False])
-    elif wordmap['kotus_tn'] == 44:
-        if not wordmap['kotus_av']:
-            if wordmap['lemma'].endswith('ut'):
-                wordmap['new_para'] = 'A_AINUT'
-            else:
-                fail_guess_because(wordmap, ['A', 44, False],
-                                   ['ut'])
-        else:
-            fail_guess_because(wordmap, ['A', 44],
-                               [False])
-    elif wordmap['kotus_tn'] == 47:
-        if not wordmap['kotus_av']:
-            if wordmap['lemma'].endswith('ut'):
-                wordmap['new_para'] = 'A_KULUNUT'
-            elif wordmap['lemma'].endswith('yt'):
-                wordmap['new_para'] = 'A_ÄLLISTYNYT'
-            else:
-                fail_guess_because(wordmap, ['A', 47, False],
-                                   ['yt'])
-        else:
-            fail_guess_because(wordmap, ['A', 47],
-                               [False], "cannot gradate")
-    elif tn == 48:
-        if not wordmap['kotus_av']:
-            if wordmap['harmony'] == 'back':
-                wordmap['new_para'] = 'A_AHNE'
-            elif wordmap['harmony'] == 'front':
-                wordmap['new_para'] = 'A_TERVE'
-            else:
-                fail_guess_because(wordmap, ['A', 48, False],
-                                   ['front', 'back'])
-        elif wordmap['kotus_av'] == 'F':
-            if wordmap['lemma'].endswith('de') and wordmap['harmony'] == 'back':
-                wordmap['new_para'] = 'A_KADE'
-            else:
-                fail_guess_because(wordmap, ['A', 48, 'F'],
-                                   ['de', 'front', 'back'])
-        elif wordmap['kotus_av'] == 'I':
-            if wordmap['lemma'].endswith('lle') and wordmap['harmony'] == 'front':
-                wordmap['new_para'] = 'A_HELLE'
-            else:
-                fail_guess_because(wordmap, ['A', 48, 'I'],
-                                   ['lle', 'front', 'back'])
-        else:
-            fail_guess_because(wordmap, ['A', 48],
-                               [False, 'F', 'I'])
-    elif tn == 99:
-        fail_guess_because(wordmap, ['A', 99], [99],
-                           "Illegal class for A, 99 can only apply to P")
-        wordmap['new_para'] = '#'
-    elif tn == 1010:
-        if not wordmap['kotus_av']:
-            if wordmap['lemma'].endswith('pitkä'):
-                wordmap['new_para'] = 'A_PITKÄ'
-            else:
-                fail_guess_because(wordmap, ['A', 10, 'D', 'PITKÄ'],
-                                   ['pitkä'], 'must be pitkä')
-        else:
-            fail_guess_because(wordmap, ['A', 10],
-                               ['D'])
-    else:
-        fail_guess_because(wordmap, ['A'],
-                           ['1-49', '99', '1010'])
-    return wordmap
+    return guess_new_para_from_rules(wordmap, 'ADJECTIVE')
 
 
 def guess_new_verb(wordmap):
-    tn = int(wordmap['kotus_tn'])
-    if tn == 52:
-        if not wordmap['kotus_av']:
-            if wordmap['lemma'].endswith('oa'):
-                wordmap['new_para'] = 'V_PUNOA'
-            elif wordmap['lemma'].endswith('ua'):
-                wordmap['new_para'] = 'V_KAUNISTUA'
-            elif wordmap['lemma'].endswith('yä'):
-                wordmap['new_para'] = 'V_ÄLLISTYÄ'
-            elif wordmap['lemma'].endswith('öä'):
-                wordmap['new_para'] = 'V_SÄILÖÄ'
-            else:
-                fail_guess_because(wordmap, ['V', 52, False],
-                                   ['oa', 'ua', 'yä', 'öä'])
-        elif wordmap['kotus_av'] == 'A':
-            if wordmap['lemma'].endswith('koa'):
-                wordmap['new_para'] = 'V_HAUKKOA'
-            elif wordmap['lemma'].endswith('kua'):
-                wordmap['new_para'] = 'V_NUOKKUA'
-            elif wordmap['lemma'].endswith('kyä'):
-                wordmap['new_para'] = 'V_KÄRKKYÄ'
-            else:
-                fail_guess_because(wordmap, ['V', 52, 'A'],
-                                   ['ko', 'ku', 'ky'])
-        elif wordmap['kotus_av'] == 'B':
-            if wordmap['lemma'].endswith('ppoa'):
-                wordmap['new_para'] = 'V_HARPPOA'
-            elif wordmap['lemma'].endswith('ppua'):
-                wordmap['new_para'] = 'V_LOPPUA'
-            elif wordmap['lemma'].endswith('ppyä'):
-                wordmap['new_para'] = 'V_LEPPYÄ'
-            else:
-                fail_guess_because(wordmap, ['V', 52, 'B'],
-                                   ['ppo', 'ppu', 'ppy'])
-        elif wordmap['kotus_av'] == 'C':
-            if wordmap['lemma'].endswith('ttoa'):
-                wordmap['new_para'] = 'V_VIITTOA'
-            elif wordmap['lemma'].endswith('ttua'):
-                wordmap['new_para'] = 'V_HERMOTTUA'
-            elif wordmap['lemma'].endswith('ttyä'):
-                wordmap['new_para'] = 'V_KIVETTYÄ'
-            else:
-                fail_guess_because(wordmap, ['V', 52, 'C'],
-                                   ['tto', 'ttu', 'tty'])
-        elif wordmap['kotus_av'] == 'D':
-            if wordmap['lemma'].endswith('koa'):
-                wordmap['new_para'] = 'V_TAKOA'
-            elif wordmap['lemma'].endswith('ukua'):
-                wordmap['new_para'] = 'V_MAUKUA'
-            elif wordmap['lemma'].endswith('kua'):
-                wordmap['new_para'] = 'V_NUOKKUA'
-            elif wordmap['lemma'].endswith('kyä'):
-                wordmap['new_para'] = 'V_MÄIKYÄ'
-            else:
-                fail_guess_because(wordmap, ['V', 52, 'D'],
-                                   ['ko'])
-        elif wordmap['kotus_av'] == 'E':
-            if wordmap['lemma'].endswith('poa'):
-                wordmap['new_para'] = 'V_SILPOA'
-            elif wordmap['lemma'].endswith('pua'):
-                wordmap['new_para'] = 'V_HIIPUA'
-            elif wordmap['lemma'].endswith('pyä'):
-                wordmap['new_para'] = 'V_SYÖPYÄ'
-            else:
-                fail_guess_because(wordmap, ['V', 52, 'E'],
-                                   ['poa', 'pua', 'pyä'])
-        elif wordmap['kotus_av'] == 'F':
-            if wordmap['lemma'].endswith('toa'):
-                wordmap['new_para'] = 'V_KIETOA'
-            elif wordmap['lemma'].endswith('tua'):
-                wordmap['new_para'] = 'V_ROHTUA'
-            elif wordmap['lemma'].endswith('tyä'):
-                wordmap['new_para'] = 'V_SILIYTYÄ'
-            else:
-                fail_guess_because(wordmap, ['V', 52, 'F'],
-                                   ['toa', 'tua', 'tyä'])
-        elif wordmap['kotus_av'] == 'G':
-            if wordmap['lemma'].endswith('nkua'):
-                wordmap['new_para'] = 'V_VINKUA'
-            elif wordmap['lemma'].endswith('nkoa'):
-                wordmap['new_para'] = 'V_PENKOA'
-            else:
-                fail_guess_because(wordmap, ['V', 52, 'G'],
-                                   ['nko'])
-        elif wordmap['kotus_av'] == 'H':
-            if wordmap['lemma'].endswith('mpoa'):
-                wordmap['new_para'] = 'V_TEMPOA'
-            elif wordmap['lemma'].endswith('mpua'):
-                wordmap['new_para'] = 'V_AMPUA'
-            else:
-                fail_guess_because(wordmap, ['V', 52, 'G'],
-                                   ['nko'])
-        elif wordmap['kotus_av'] == 'I':
-            if wordmap['lemma'].endswith('ltua'):
-                wordmap['new_para'] = 'V_HUMALTUA'
-            elif wordmap['lemma'].endswith('ltyä'):
-                wordmap['new_para'] = 'V_MIELTYÄ'
-            else:
-                fail_guess_because(wordmap, ['V', 52, 'I'],
-                                   ['lto', 'ltu', 'lty'])
-        elif wordmap['kotus_av'] == 'J':
-            if wordmap['lemma'].endswith('ntua'):
-                wordmap['new_para'] = 'V_VAKAANTUA'
-            elif wordmap['lemma'].endswith('ntyä'):
-                wordmap['new_para'] = 'V_TYHJENTYÄ'
-            else:
-                fail_guess_because(wordmap, ['V', 52, 'J'],
-                                   ['nto', 'ntu', 'nty'])
-        elif wordmap['kotus_av'] == 'K':
-            if wordmap['lemma'].endswith('rtoa'):
-                wordmap['new_para'] = 'V_VARTOA'
-            elif wordmap['lemma'].endswith('rtua'):
-                wordmap['new_para'] = 'V_PUSERTUA'
-            elif wordmap['lemma'].endswith('rtyä'):
-                wordmap['new_para'] = 'V_KIERTYÄ'
-            else:
-                fail_guess_because(wordmap, ['V', 52, 'K'],
-                                   ['rtoa', 'rtua', 'rtyä'])
-        else:
-            fail_guess_because(wordmap, ['V', 52],
-                               [False, 'A-K'])
-    elif tn == 53:
-        if not wordmap['kotus_av']:
-            if wordmap['lemma'].endswith('aa'):
-                wordmap['new_para'] = 'V_MUTRISTAA'
-            elif wordmap['lemma'].endswith('ää'):
-                wordmap['new_para'] = 'V_KIVISTÄÄ'
-            else:
-                fail_guess_because(wordmap, ['V', 53, False],
-                                   ['aa', 'ää'])
-        elif wordmap['kotus_av'] == 'C':
-            if wordmap['lemma'].endswith('ttaa'):
-                wordmap['new_para'] = 'V_VIEROITTAA'
-            elif wordmap['lemma'].endswith('ttää'):
-                wordmap['new_para'] = 'V_RÄPSYTTÄÄ'
-            else:
-                fail_guess_because(wordmap, ['V', 53, 'C'],
-                                   ['nto', 'ntu', 'nty'])
-        elif wordmap['kotus_av'] == 'D':
-            if wordmap['lemma'].endswith('kaa'):
-                wordmap['new_para'] = 'V_PURKAA'
-            else:
-                fail_guess_because(wordmap, ['V', 53, 'D'],
-                                   ['nto', 'ntu', 'nty'])
-        elif wordmap['kotus_av'] == 'F':
-            if wordmap['lemma'].endswith('taa'):
-                wordmap['new_para'] = 'V_MOJAHTAA'
-            elif wordmap['lemma'].endswith('tää'):
-                wordmap['new_para'] = 'V_YSKÄHTÄÄ'
-            else:
-                fail_guess_because(wordmap, ['V', 53, 'F'],
-                                   ['nto', 'ntu', 'nty'])
-        elif wordmap['kotus_av'] == 'J':
-            if wordmap['lemma'].endswith('ntää'):
-                wordmap['new_para'] = 'V_KYNTÄÄ'
-            else:
-                fail_guess_because(wordmap, ['V', 53, 'J'],
-                                   ['nto', 'ntu', 'nty'])
-        elif wordmap['kotus_av'] == 'K':
-            if wordmap['lemma'].endswith('rtaa'):
-                wordmap['new_para'] = 'V_SORTAA'
-            else:
-                fail_guess_because(wordmap, ['V', 53, 'K'],
-                                   ['nto', 'ntu', 'nty'])
-        else:
-            fail_guess_because(wordmap, ['V', 53], [False])
-    elif tn == 54:
-        if wordmap['kotus_av'] == 'F':
-            if wordmap['lemma'].endswith('taa'):
-                wordmap['new_para'] = 'V_HUUTAA'
-            elif wordmap['lemma'].endswith('tää'):
-                wordmap['new_para'] = 'V_PYYTÄÄ'
-            else:
-                fail_guess_because(wordmap, ['V', 54, False],
-                                   ['tää', 'taa'])
-        elif wordmap['kotus_av'] == 'I':
-            if wordmap['lemma'].endswith('ltaa'):
-                wordmap['new_para'] = 'V_SIVALTAA'
-            elif wordmap['lemma'].endswith('ltää'):
-                wordmap['new_para'] = 'V_VIHELTÄÄ'
-            else:
-                fail_guess_because(wordmap, ['V', 54, 'I'],
-                                   ['tää', 'taa'])
-        elif wordmap['kotus_av'] == 'J':
-            if wordmap['lemma'].endswith('ntaa'):
-                wordmap['new_para'] = 'V_HUONONTAA'
-            elif wordmap['lemma'].endswith('ntää'):
-                wordmap['new_para'] = 'V_HIVENTÄÄ'
-            else:
-                fail_guess_because(wordmap, ['V', 54, 'J'],
-                                   ['tää', 'taa'])
-        elif wordmap['kotus_av'] == 'K':
-            if wordmap['lemma'].endswith('rtaa'):
-                wordmap['new_para'] = 'V_KUHERTAA'
-            elif wordmap['lemma'].endswith('rtää'):
-                wordmap['new_para'] = 'V_NÄPERTÄÄ'
-            else:
-                fail_guess_because(wordmap, ['V', 54, 'K'],
-                                   ['tää', 'taa'])
-        else:
-            fail_guess_because(wordmap, ['V', 54], ['F', 'I-K'])
-    elif tn == 55:
-        if wordmap['kotus_av'] == 'F':
-            if wordmap['lemma'].endswith('taa'):
-                wordmap['new_para'] = 'V_JOUTAA'
-            elif wordmap['lemma'].endswith('tää'):
-                wordmap['new_para'] = 'V_KIITÄÄ'
-            else:
-                fail_guess_because(wordmap, ['V', 55, 'F'],
-                                   ['kko'])
-        elif wordmap['kotus_av'] == 'I':
-            if wordmap['lemma'].endswith('ltää'):
-                wordmap['new_para'] = 'V_YLTÄÄ'
-            else:
-                fail_guess_because(wordmap, ['V', 55, 'I'],
-                                   ['ltää'])
-        elif wordmap['kotus_av'] == 'J':
-            if wordmap['lemma'].endswith('ntää'):
-                wordmap['new_para'] = 'V_ENTÄÄ'
-            else:
-                fail_guess_because(wordmap, ['V', 55, 'J'],
-                                   ['tää', 'taa'])
-        else:
-            fail_guess_because(wordmap, ['V', 55], ['F', 'I', 'J'])
-    elif tn == 56:
-        if not wordmap['kotus_av']:
-            if wordmap['lemma'].endswith('aa'):
-                wordmap['new_para'] = 'V_KASVAA'
-            else:
-                fail_guess_because(wordmap, ['V', 56, False],
-                                   ['front', 'back'])
-        elif wordmap['kotus_av'] in ['A', 'D']:
-            if wordmap['lemma'].endswith('kaa'):
-                wordmap['new_para'] = 'V_VIRKKAA'
-            else:
-                fail_guess_because(wordmap, ['V', 56, 'A'],
-                                   ['kaa'])
-        elif wordmap['kotus_av'] == 'B':
-            if wordmap['lemma'].endswith('ppaa'):
-                wordmap['new_para'] = 'V_TAPPAA'
-            else:
-                fail_guess_because(wordmap, ['V', 56, 'B'],
-                                   ['kkaa'])
-        elif wordmap['kotus_av'] == 'C':
-            if wordmap['lemma'].endswith('ttaa'):
-                wordmap['new_para'] = 'V_AUTTAA'
-            else:
-                fail_guess_because(wordmap, ['V', 56, 'C'],
-                                   ['kkaa'])
-        elif wordmap['kotus_av'] == 'F':
-            if wordmap['lemma'].endswith('taa'):
-                wordmap['new_para'] = 'V_SATAA'
-            else:
-                fail_guess_because(wordmap, ['V', 56, 'F'],
-                                   ['kkaa'])
-        elif wordmap['kotus_av'] == 'J':
-            if wordmap['lemma'].endswith('ntaa'):
-                wordmap['new_para'] = 'V_KANTAA'
-            else:
-                fail_guess_because(wordmap, ['V', 56, 'J'],
-                                   ['kkaa'])
-        else:
-            fail_guess_because(wordmap, ['V', 56],
-                               [False])
-    elif tn == 57:
-        if wordmap['kotus_av'] == 'F':
-            if wordmap['lemma'].endswith('taa'):
-                wordmap['new_para'] = 'V_KAATAA'
-            else:
-                fail_guess_because(wordmap, ['V', 57, 'F'],
-                                   ['e', 'front', 'back'])
-        elif wordmap['kotus_av'] == 'K':
-            if wordmap['lemma'].endswith('rtaa'):
-                wordmap['new_para'] = 'V_SAARTAA'
-            else:
-                fail_guess_because(wordmap, ['V', 57, 'K'],
-                                   ['e', 'front', 'back'])
-        else:
-            fail_guess_because(wordmap, ['V', 57],
-                               [False])
-    elif tn == 58:
-        if not wordmap['kotus_av']:
-            if wordmap['lemma'].endswith('ea'):
-                wordmap['new_para'] = 'V_SOTKEA'
-            elif wordmap['lemma'].endswith('eä'):
-                wordmap['new_para'] = 'V_KYTKEÄ'
-            else:
-                fail_guess_because(wordmap, ['V', 58, False],
-                                   ['ea', 'eä'])
-        elif wordmap['kotus_av'] == 'D':
-            if wordmap['lemma'].endswith('kea'):
-                wordmap['new_para'] = 'V_PUKEA'
-            else:
-                fail_guess_because(wordmap, ['V', 58, 'D'],
-                                   ['kka'])
-        elif wordmap['kotus_av'] == 'E':
-            if wordmap['lemma'].endswith('peä'):
-                wordmap['new_para'] = 'V_RYPEÄ'
-            else:
-                fail_guess_because(wordmap, ['V', 58, 'E'],
-                                   ['tta'])
-        elif wordmap['kotus_av'] == 'F':
-            if wordmap['lemma'].endswith('tea'):
-                wordmap['new_para'] = 'V_KUTEA'
-            elif wordmap['lemma'].endswith('teä'):
-                wordmap['new_para'] = 'V_PÄTEÄ'
-            else:
-                fail_guess_because(wordmap, ['V', 58, 'F'],
-                                   ['ka'])
-        elif wordmap['kotus_av'] == 'G':
-            if wordmap['lemma'].endswith('nkea'):
-                wordmap['new_para'] = 'V_TUNKEA'
-            else:
-                fail_guess_because(wordmap, ['V', 58, 'G'],
-                                   ['pa'])
-        elif wordmap['kotus_av'] == 'L':
-            if wordmap['lemma'].endswith('kea'):
-                wordmap['new_para'] = 'V_POLKEA'
-            elif wordmap['lemma'].endswith('keä'):
-                wordmap['new_para'] = 'V_SÄRKEÄ'
-            else:
-                fail_guess_because(wordmap, ['V', 58, 'L'],
-                                   ['ta'])
-        else:
-            fail_guess_because(wordmap, ['V', 58],
-                               [False, 'V-K'])
-    elif tn == 59:
-        if wordmap['kotus_av'] == 'J':
-            if wordmap['lemma'].endswith('ntea'):
-                wordmap['new_para'] = 'V_TUNTEA'
-            else:
-                fail_guess_because(wordmap, ['V', 59, False],
-                                   ['a', 'ä'])
-        else:
-            fail_guess_because(wordmap, ['V', 59, 'K'],
-                               ['rta'])
-    elif tn == 60:
-        if wordmap['kotus_av'] == 'F':
-            if wordmap['lemma'].endswith('hteä'):
-                wordmap['new_para'] = 'V_LÄHTEÄ'
-            else:
-                fail_guess_because(wordmap, ['V', 60, False],
-                                   ['a', 'ä'])
-        else:
-            fail_guess_because(wordmap, ['V', 60],
-                               [False])
-    elif tn == 61:
-        if not wordmap['kotus_av']:
-            if wordmap['lemma'].endswith('ia'):
-                wordmap['new_para'] = 'V_KOSIA'
-            elif wordmap['lemma'].endswith('iä'):
-                wordmap['new_para'] = 'V_RYSKIÄ'
-            else:
-                fail_guess_because(wordmap, ['V', 61, False],
-                                   ['ia', 'iä'])
-        elif wordmap['kotus_av'] == 'A':
-            if wordmap['lemma'].endswith('kia'):
-                wordmap['new_para'] = 'V_KUKKIA'
-            elif wordmap['lemma'].endswith('kiä'):
-                wordmap['new_para'] = 'V_SÖRKKIÄ'
-            else:
-                fail_guess_because(wordmap, ['V', 61, 'A'],
-                                   ['kia', 'kiä'])
-        elif wordmap['kotus_av'] == 'B':
-            if wordmap['lemma'].endswith('ppia'):
-                wordmap['new_para'] = 'V_KALPPIA'
-            elif wordmap['lemma'].endswith('ppiä'):
-                wordmap['new_para'] = 'V_HYPPIÄ'
-            else:
-                fail_guess_because(wordmap, ['V', 61, 'B'],
-                                   ['a'])
-        elif wordmap['kotus_av'] == 'C':
-            if wordmap['lemma'].endswith('ttia'):
-                wordmap['new_para'] = 'V_MOITTIA'
-            elif wordmap['lemma'].endswith('ttiä'):
-                wordmap['new_para'] = 'V_MIETTIÄ'
-            else:
-                fail_guess_because(wordmap, ['V', 61, 'C'],
-                                   ['a'])
-        elif wordmap['kotus_av'] == 'D':
-            if wordmap['lemma'].endswith('kia'):
-                wordmap['new_para'] = 'V_KUKKIA'
-            elif wordmap['lemma'].endswith('kiä'):
-                wordmap['new_para'] = 'V_SÖRKKIÄ'
-            else:
-                fail_guess_because(wordmap, ['V', 61, 'D'],
-                                   ['a'])
-        elif wordmap['kotus_av'] == 'E':
-            if wordmap['lemma'].endswith('pia'):
-                wordmap['new_para'] = 'V_RAAPIA'
-            elif wordmap['lemma'].endswith('piä'):
-                wordmap['new_para'] = 'V_RIIPIÄ'
-            else:
-                fail_guess_because(wordmap, ['V', 61, 'E'],
-                                   ['a'])
-        elif wordmap['kotus_av'] == 'F':
-            if wordmap['lemma'].endswith('tia'):
-                wordmap['new_para'] = 'V_AHNEHTIA'
-            elif wordmap['lemma'].endswith('tiä'):
-                wordmap['new_para'] = 'V_EHTIÄ'
-            else:
-                fail_guess_because(wordmap, ['V', 61, 'F'],
-                                   ['a'])
-        elif wordmap['kotus_av'] == 'G':
-            if wordmap['lemma'].endswith('nkia'):
-                wordmap['new_para'] = 'V_ONKIA'
-            elif wordmap['lemma'].endswith('nkiä'):
-                wordmap['new_para'] = 'V_MÖNKIÄ'
-            else:
-                fail_guess_because(wordmap, ['V', 61, 'G'],
-                                   ['a'])
-        elif wordmap['kotus_av'] == 'H':
-            if wordmap['lemma'].endswith('mpiä'):
-                wordmap['new_para'] = 'V_TYMPIÄ'
-            else:
-                fail_guess_because(wordmap, ['V', 61, 'H'],
-                                   ['a'])
-        elif wordmap['kotus_av'] == 'J':
-            if wordmap['lemma'].endswith('ntia'):
-                wordmap['new_para'] = 'V_KONTIA'
-            else:
-                fail_guess_because(wordmap, ['V', 61, 'J'],
-                                   ['a'])
-        elif wordmap['kotus_av'] == 'L':
-            if wordmap['lemma'].endswith('kiä'):
-                wordmap['new_para'] = 'V_HYLKIÄ'
-            else:
-                fail_guess_because(wordmap, ['V', 61, 'L'],
-                                   ['a'])
-        else:
-            fail_guess_because(wordmap, ['V', 61],
-                               [False])
-    elif tn == 62:
-        if not wordmap['kotus_av']:
-            if wordmap['lemma'].endswith('ida'):
-                wordmap['new_para'] = 'V_KOPIOIDA'
-            elif wordmap['lemma'].endswith('idä'):
-                wordmap['new_para'] = 'V_ÖYKKÄRÖIDÄ'
-            else:
-                fail_guess_because(wordmap, ['V', 62, False],
-                                   ['ida', 'idä'])
-        else:
-            fail_guess_because(wordmap, ['V', 62],
-                               [False])
-    elif tn == 63:
-        if not wordmap['kotus_av']:
-            if wordmap['lemma'].endswith('aada'):
-                wordmap['new_para'] = 'V_SAADA'
-            elif wordmap['lemma'].endswith('yydä'):
-                wordmap['new_para'] = 'V_MYYDÄ'
-            elif wordmap['lemma'].endswith('äädä'):
-                wordmap['new_para'] = 'V_JÄÄDÄ'
-            else:
-                fail_guess_because(wordmap, ['V', 63, False],
-                                   ['kka', 'kkä'])
-        else:
-            fail_guess_because(wordmap, ['V', 63],
-                               [False])
-    elif tn == 64:
-        if not wordmap['kotus_av']:
-            if wordmap['lemma'].endswith('iedä'):
-                wordmap['new_para'] = 'V_VIEDÄ'
-            elif wordmap['lemma'].endswith('uoda'):
-                wordmap['new_para'] = 'V_TUODA'
-            elif wordmap['lemma'].endswith('yödä'):
-                wordmap['new_para'] = 'V_SYÖDÄ'
-            else:
-                fail_guess_because(wordmap, ['V', 64, False],
-                                   ['oa', 'ea', 'eä'])
-        else:
-            fail_guess_because(wordmap, ['V', 64],
-                               [False])
-    elif tn == 65:
-        if not wordmap['kotus_av']:
-            if wordmap['lemma'].endswith('käydä'):
-                wordmap['new_para'] = 'V_KÄYDÄ'
-            else:
-                fail_guess_because(wordmap, ['V', 65, False],
-                                   ['back'])
-        else:
-            fail_guess_because(wordmap, ['V', 65],
-                               ['H'])
-    elif tn == 66:
-        if not wordmap['kotus_av']:
-            if wordmap['lemma'].endswith('ta'):
-                wordmap['new_para'] = 'V_MARISTA'
-            elif wordmap['lemma'].endswith('tä'):
-                wordmap['new_para'] = 'V_ÄRISTÄ'
-            else:
-                fail_guess_because(wordmap, ['V', 66, False],
-                                   ['ta', 'tä'])
-        elif wordmap['kotus_av'] == 'E':
-            if wordmap['lemma'].endswith('vista'):
-                wordmap['new_para'] = 'V_VAVISTA'
-            elif wordmap['lemma'].endswith('väistä'):
-                wordmap['new_para'] = 'V_HÄVÄISTÄ'
-            else:
-                fail_guess_because(wordmap, ['V', 66, False],
-                                   ['vista', 'väistä'])
-        elif wordmap['kotus_av'] == 'G':
-            if wordmap['lemma'].endswith('ngaista'):
-                wordmap['new_para'] = 'V_RANGAISTA'
-            else:
-                fail_guess_because(wordmap, ['V', 66, False],
-                                   ['gaista'])
-        else:
-            fail_guess_because(wordmap, ['V', 66],
-                               [False])
-    elif tn == 67:
-        if not wordmap['kotus_av']:
-            if wordmap['lemma'].endswith('tulla'):
-                wordmap['new_para'] = 'V_TULLA'
-            elif wordmap['lemma'].endswith('ailla') or \
-                    wordmap['lemma'].endswith('oilla'):
-                wordmap['new_para'] = 'V_ARVAILLA'
-            elif wordmap['lemma'].endswith('äillä') or \
-                    wordmap['lemma'].endswith('öilla'):
-                wordmap['new_para'] = 'V_LEPÄILLÄ'
-            elif wordmap['lemma'].endswith('lla'):
-                wordmap['new_para'] = 'V_ETUILLA'
-            elif wordmap['lemma'].endswith('llä'):
-                wordmap['new_para'] = 'V_ÄKSYILLÄ'
-            elif wordmap['lemma'].endswith('nna'):
-                wordmap['new_para'] = 'V_PANNA'
-            elif wordmap['lemma'].endswith('nnä'):
-                wordmap['new_para'] = 'V_MENNÄ'
-            elif wordmap['lemma'].endswith('rra'):
-                wordmap['new_para'] = 'V_SURRA'
-            elif wordmap['lemma'].endswith('rrä'):
-                wordmap['new_para'] = 'V_PIERRÄ'
-            else:
-                fail_guess_because(wordmap, ['V', 67, False],
-                                   ['rra', 'rrä'])
-        elif wordmap['kotus_av'] in ['A', 'D']:
-            if wordmap['lemma'].endswith('ella'):
-                wordmap['new_para'] = 'V_NAKELLA'
-            elif wordmap['lemma'].endswith('ellä'):
-                wordmap['new_para'] = 'V_LEIKELLÄ'
-            else:
-                fail_guess_because(wordmap, ['V', 67, 'A'],
-                                   ['a'])
-        elif wordmap['kotus_av'] == 'B':
-            if wordmap['lemma'].endswith('pella'):
-                wordmap['new_para'] = 'V_TAPELLA'
-            elif wordmap['lemma'].endswith('pellä'):
-                wordmap['new_para'] = 'V_HYPELLÄ'
-            else:
-                fail_guess_because(wordmap, ['V', 67, 'B'],
-                                   ['a'])
-        elif wordmap['kotus_av'] == 'C':
-            if wordmap['lemma'].endswith('tella'):
-                wordmap['new_para'] = 'V_SULATELLA'
-            elif wordmap['lemma'].endswith('tellä'):
-                wordmap['new_para'] = 'V_HERÄTELLÄ'
-            else:
-                fail_guess_because(wordmap, ['V', 67, 'C'],
-                                   ['a'])
-        elif wordmap['kotus_av'] == 'F':
-            if wordmap['lemma'].endswith('della'):
-                wordmap['new_para'] = 'V_TIPAHDELLA'
-            elif wordmap['lemma'].endswith('dellä'):
-                wordmap['new_para'] = 'V_SÄPSÄHDELLÄ'
-            else:
-                fail_guess_because(wordmap, ['V', 67, 'F'],
-                                   ['a'])
-        elif wordmap['kotus_av'] == 'H':
-            if wordmap['lemma'].endswith('mmella'):
-                wordmap['new_para'] = 'V_OMMELLA'
-            else:
-                fail_guess_because(wordmap, ['V', 67, 'H'],
-                                   ['a'])
-        elif wordmap['kotus_av'] == 'I':
-            if wordmap['lemma'].endswith('llella'):
-                wordmap['new_para'] = 'V_VAELLELLA'
-            elif wordmap['lemma'].endswith('llellä'):
-                wordmap['new_para'] = 'V_KIILLELLÄ'
-            else:
-                fail_guess_because(wordmap, ['V', 67, 'I'],
-                                   ['a'])
-        elif wordmap['kotus_av'] == 'J':
-            if wordmap['lemma'].endswith('nnella'):
-                wordmap['new_para'] = 'V_KOMENNELLA'
-            elif wordmap['lemma'].endswith('nnellä'):
-                wordmap['new_para'] = 'V_KÄÄNNELLÄ'
-            else:
-                fail_guess_because(wordmap, ['V', 67, 'J'],
-                                   ['a'])
-        elif wordmap['kotus_av'] == 'K':
-            if wordmap['lemma'].endswith('rrella'):
-                wordmap['new_para'] = 'V_NAKERRELLA'
-            elif wordmap['lemma'].endswith('rrellä'):
-                wordmap['new_para'] = 'V_KIHERRELLÄ'
-            else:
-                fail_guess_because(wordmap, ['V', 67, 'K'],
-                                   ['a'])
-        else:
-            fail_guess_because(wordmap, ['V', 18],
-                               [False])
-    elif tn == 68:
-        if not wordmap['kotus_av']:
-            if wordmap['lemma'].endswith('oida'):
-                wordmap['new_para'] = 'V_MELLAKOIDA'
-            elif wordmap['lemma'].endswith('öidä'):
-                wordmap['new_para'] = 'V_ISÄNNÖIDÄ'
-            else:
-                fail_guess_because(wordmap, ['V', 68, False],
-                                   ['a'])
-        else:
-            fail_guess_because(wordmap, ['V', 68],
-                               [False])
-    elif tn == 69:
-        if not wordmap['kotus_av']:
-            if wordmap['lemma'].endswith('ita'):
-                wordmap['new_para'] = 'V_PALKITA'
-            elif wordmap['lemma'].endswith('itä'):
-                wordmap['new_para'] = 'V_MERKITÄ'
-            else:
-                fail_guess_because(wordmap, ['V', 69, False],
-                                   ['a'])
-        else:
-            fail_guess_because(wordmap, ['V', 69],
-                               [False])
-    elif tn == 70:
-        if not wordmap['kotus_av']:
-            if wordmap['lemma'].endswith('sta'):
-                wordmap['new_para'] = 'V_JUOSTA'
-            elif wordmap['lemma'].endswith('stä'):
-                wordmap['new_para'] = 'V_PIESTÄ'
-            else:
-                fail_guess_because(wordmap, ['V', 70, False],
-                                   ['back', 'front'])
-        else:
-            fail_guess_because(wordmap, ['V', 70],
-                               [False])
-    elif tn == 71:
-        if not wordmap['kotus_av']:
-            if wordmap['lemma'].endswith('hdä'):
-                wordmap['new_para'] = 'V_NÄHDÄ'
-            else:
-                fail_guess_because(wordmap, ['V', 71, False],
-                                   ['back', 'front'])
-        else:
-            fail_guess_because(wordmap, ['V', 71],
-                               [False])
-    elif tn == 72:
-        if not wordmap['kotus_av']:
-            if wordmap['lemma'].endswith('ta'):
-                wordmap['new_para'] = 'V_KARHETA'
-            elif wordmap['lemma'].endswith('tä'):
-                wordmap['new_para'] = 'V_VÄHETÄ'
-            else:
-                fail_guess_because(wordmap, ['V', 72, False],
-                                   ['back', 'front'])
-        elif wordmap['kotus_av'] == 'A':
-            if wordmap['lemma'].endswith('keta'):
-                wordmap['new_para'] = 'V_NIUKETA'
-            elif wordmap['lemma'].endswith('kota'):
-                wordmap['new_para'] = 'V_ULOTA'
-            elif wordmap['lemma'].endswith('ketä'):
-                wordmap['new_para'] = 'V_JYRKETÄ'
-            else:
-                fail_guess_because(wordmap, ['V', 72, 'A'],
-                                   ['back', 'front'])
-        elif wordmap['kotus_av'] == 'B':
-            if wordmap['lemma'].endswith('peta'):
-                wordmap['new_para'] = 'V_SUPETA'
-            elif wordmap['lemma'].endswith('petä'):
-                wordmap['new_para'] = 'V_TYLPETÄ'
-            elif wordmap['lemma'].endswith('pota'):
-                wordmap['new_para'] = 'V_HELPOTA'
-            elif wordmap['lemma'].endswith('pata'):
-                wordmap['new_para'] = 'V_HAPATA'
-            else:
-                fail_guess_because(wordmap, ['V', 72, 'B'],
-                                   ['peta', 'petä', 'pata', 'pota'])
-        elif wordmap['kotus_av'] == 'C':
-            if wordmap['lemma'].endswith('tota'):
-                wordmap['new_para'] = 'V_LOITOTA'
-            else:
-                fail_guess_because(wordmap, ['V', 72, 'C'],
-                                   ['back', 'front'])
-        elif wordmap['kotus_av'] == 'D':
-            if wordmap['lemma'].endswith('ota'):
-                wordmap['new_para'] = 'V_ULOTA'
-            elif wordmap['lemma'].endswith('ata'):
-                wordmap['new_para'] = 'V_ERATA'
-            elif wordmap['lemma'].endswith('eta'):
-                wordmap['new_para'] = 'V_NIUKETA'
-            elif wordmap['lemma'].endswith('etä'):
-                wordmap['new_para'] = 'V_JYRKETÄ'
-            else:
-                fail_guess_because(wordmap, ['V', 72, 'D'],
-                                   ['back', 'front'])
-        elif wordmap['kotus_av'] == 'E':
-            if wordmap['lemma'].endswith('veta'):
-                wordmap['new_para'] = 'V_KAVETA'
-            elif wordmap['lemma'].endswith('vetä'):
-                wordmap['new_para'] = 'V_KIVETÄ'
-            else:
-                fail_guess_because(wordmap, ['V', 72, 'E'],
-                                   ['back', 'front'])
-        elif wordmap['kotus_av'] == 'F':
-            if wordmap['lemma'].endswith('dota'):
-                wordmap['new_para'] = 'V_LEUDOTA'
-            elif wordmap['lemma'].endswith('detä'):
-                wordmap['new_para'] = 'V_PIDETÄ'
-            elif wordmap['lemma'].endswith('dätä'):
-                wordmap['new_para'] = 'V_MÄDÄTÄ'
-            else:
-                fail_guess_because(wordmap, ['V', 72, 'F'],
-                                   ['back', 'front'])
-        elif wordmap['kotus_av'] == 'H':
-            if wordmap['lemma'].endswith('mmetä'):
-                wordmap['new_para'] = 'V_LÄMMETÄ'
-            else:
-                fail_guess_because(wordmap, ['V', 72, 'H'],
-                                   ['back', 'front'])
-        elif wordmap['kotus_av'] == 'J':
-            if wordmap['lemma'].endswith('nnetä'):
-                wordmap['new_para'] = 'V_KIINNETÄ'
-            elif wordmap['lemma'].endswith('nnota'):
-                wordmap['new_para'] = 'V_RENNOTA'
-            else:
-                fail_guess_because(wordmap, ['V', 72, 'J'],
-                                   ['nnetä', 'nnota'])
-        elif wordmap['kotus_av'] == 'L':
-            if wordmap['lemma'].endswith('jeta'):
-                wordmap['new_para'] = 'V_ROHJETA'
-            elif wordmap['lemma'].endswith('jetä'):
-                wordmap['new_para'] = 'V_ILJETÄ'
-            else:
-                fail_guess_because(wordmap, ['V', 72, 'L'],
-                                   ['back', 'front'])
-        else:
-            fail_guess_because(wordmap, ['V', 72],
-                               [False, 'A-L'])
-    elif wordmap['kotus_tn'] == 73:
-        if not wordmap['kotus_av']:
-            if wordmap['lemma'].endswith('ata'):
-                wordmap['new_para'] = 'V_ARVATA'
-            elif wordmap['lemma'].endswith('ätä'):
-                wordmap['new_para'] = 'V_YNNÄTÄ'
-            else:
-                fail_guess_because(wordmap, ['V', 73, False],
-                                   ['ata', 'ätä'])
-        elif wordmap['kotus_av'] in ['A', 'D']:
-            if wordmap['lemma'].endswith('ata'):
-                wordmap['new_para'] = 'V_MORKATA'
-            elif wordmap['lemma'].endswith('ätä'):
-                wordmap['new_para'] = 'V_YÖKÄTÄ'
-            else:
-                fail_guess_because(wordmap, ['V', 73, 'A'],
-                                   ['hapan'])
-        elif wordmap['kotus_av'] == 'B':
-            if wordmap['lemma'].endswith('pata'):
-                wordmap['new_para'] = 'V_SIEPATA'
-            elif wordmap['lemma'].endswith('pätä'):
-                wordmap['new_para'] = 'V_VÄLPÄTÄ'
-            else:
-                fail_guess_because(wordmap, ['V', 73, 'B'],
-                                   ['hapan'])
-        elif wordmap['kotus_av'] == 'C':
-            if wordmap['lemma'].endswith('tata'):
-                wordmap['new_para'] = 'V_LUNTATA'
-            elif wordmap['lemma'].endswith('tätä'):
-                wordmap['new_para'] = 'V_LÄNTÄTÄ'
-            else:
-                fail_guess_because(wordmap, ['V', 73, 'C'],
-                                   ['hapan'])
-        elif wordmap['kotus_av'] == 'E':
-            if wordmap['lemma'].endswith('vata'):
-                wordmap['new_para'] = 'V_KAIVATA'
-            elif wordmap['lemma'].endswith('vätä'):
-                wordmap['new_para'] = 'V_LEVÄTÄ'
-            else:
-                fail_guess_because(wordmap, ['V', 73, 'E'],
-                                   ['hapan'])
-        elif wordmap['kotus_av'] == 'F':
-            if wordmap['lemma'].endswith('data'):
-                wordmap['new_para'] = 'V_JAHDATA'
-            elif wordmap['lemma'].endswith('dätä'):
-                wordmap['new_para'] = 'V_TÄHDÄTÄ'
-            else:
-                fail_guess_because(wordmap, ['V', 73, 'F'],
-                                   ['hapan'])
-        elif wordmap['kotus_av'] == 'G':
-            if wordmap['lemma'].endswith('gata'):
-                wordmap['new_para'] = 'V_VONGATA'
-            elif wordmap['lemma'].endswith('gätä'):
-                wordmap['new_para'] = 'V_VÄNGÄTÄ'
-            else:
-                fail_guess_because(wordmap, ['V', 73, 'G'],
-                                   ['hapan'])
-        elif wordmap['kotus_av'] == 'H':
-            if wordmap['lemma'].endswith('mmata'):
-                wordmap['new_para'] = 'V_TEMMATA'
-            else:
-                fail_guess_because(wordmap, ['V', 73, 'H'],
-                                   ['hapan'])
-        elif wordmap['kotus_av'] == 'I':
-            if wordmap['lemma'].endswith('llata'):
-                wordmap['new_para'] = 'V_MULLATA'
-            else:
-                fail_guess_because(wordmap, ['V', 73, 'I'],
-                                   ['hapan'])
-        elif wordmap['kotus_av'] == 'J':
-            if wordmap['lemma'].endswith('nnata'):
-                wordmap['new_para'] = 'V_SUUNNATA'
-            elif wordmap['lemma'].endswith('nnätä'):
-                wordmap['new_para'] = 'V_RYNNÄTÄ'
-            else:
-                fail_guess_because(wordmap, ['V', 73, 'J'],
-                                   ['hapan'])
-        elif wordmap['kotus_av'] == 'K':
-            if wordmap['lemma'].endswith('rata'):
-                wordmap['new_para'] = 'V_VERRATA'
-            else:
-                fail_guess_because(wordmap, ['V', 73, 'K'],
-                                   ['hapan'])
-        elif wordmap['kotus_av'] == 'L':
-            if wordmap['lemma'].endswith('jätä'):
-                wordmap['new_para'] = 'V_HYLJÄTÄ'
-            else:
-                fail_guess_because(wordmap, ['V', 73, 'K'],
-                                   ['hapan'])
-        elif wordmap['kotus_av'] == 'O':
-            if wordmap['lemma'].endswith('gata'):
-                wordmap['new_para'] = 'V_DIGATA'
-            else:
-                fail_guess_because(wordmap, ['V', 73, 'N'],
-                                   ['hapan'])
-        elif wordmap['kotus_av'] == 'P':
-            if wordmap['lemma'].endswith('bata'):
-                wordmap['new_para'] = 'V_LOBATA'
-            else:
-                fail_guess_because(wordmap, ['V', 73, 'P'],
-                                   ['hapan'])
-        else:
-            fail_guess_because(wordmap, ['V', 73], [False, 'A-P'])
-    elif wordmap['kotus_tn'] == 74:
-        if not wordmap['kotus_av']:
-            if wordmap['lemma'].endswith('ta'):
-                wordmap['new_para'] = 'V_KARHUTA'
-            elif wordmap['lemma'].endswith('tä'):
-                wordmap['new_para'] = 'V_TÄHYTÄ'
-            else:
-                fail_guess_because(wordmap, ['V', 74, False],
-                                   ['ton'])
-        elif wordmap['kotus_av'] in ['A', 'D']:
-            if wordmap['lemma'].endswith('ota'):
-                wordmap['new_para'] = 'V_KAIKOTA'
-            elif wordmap['lemma'].endswith('eta'):
-                wordmap['new_para'] = 'V_POIKETA'
-            elif wordmap['lemma'].endswith('etä'):
-                wordmap['new_para'] = 'V_KERETÄ'
-            elif wordmap['lemma'].endswith('uta'):
-                wordmap['new_para'] = 'V_KOUKUTA'
-            else:
-                fail_guess_because(wordmap, ['V', 74, 'A'],
-                                   ['hapan'])
-        elif wordmap['kotus_av'] == 'B':
-            if wordmap['lemma'].endswith('puta'):
-                wordmap['new_para'] = 'V_PULPUTA'
-            elif wordmap['lemma'].endswith('pota'):
-                wordmap['new_para'] = 'V_UPOTA'
-            else:
-                fail_guess_because(wordmap, ['V', 74, 'B'],
-                                   ['hapan'])
-        elif wordmap['kotus_av'] == 'C':
-            if wordmap['lemma'].endswith('tota'):
-                wordmap['new_para'] = 'V_LOTOTA'
-            elif wordmap['lemma'].endswith('tuta'):
-                wordmap['new_para'] = 'V_LUUTUTA'
-            else:
-                fail_guess_because(wordmap, ['V', 74, 'C'],
-                                   ['hapan'])
-        elif wordmap['kotus_av'] == 'E':
-            if wordmap['lemma'].endswith('vuta'):
-                wordmap['new_para'] = 'V_KIVUTA'
-            elif wordmap['lemma'].endswith('veta'):
-                wordmap['new_para'] = 'V_KORVETA'
-            elif wordmap['lemma'].endswith('vetä'):
-                wordmap['new_para'] = 'V_REVETÄ'
-            elif wordmap['lemma'].endswith('vota'):
-                wordmap['new_para'] = 'V_KIRVOTA'
-            else:
-                fail_guess_because(wordmap, ['V', 74, 'E'],
-                                   ['hapan'])
-        elif wordmap['kotus_av'] == 'F':
-            if wordmap['lemma'].endswith('duta'):
-                wordmap['new_para'] = 'V_LIIDUTA'
-            elif wordmap['lemma'].endswith('deta'):
-                wordmap['new_para'] = 'V_TODETA'
-            elif wordmap['lemma'].endswith('dota'):
-                wordmap['new_para'] = 'V_VAAHDOTA'
-            elif wordmap['lemma'].endswith('detä'):
-                wordmap['new_para'] = 'V_VYYHDETÄ'
-            else:
-                fail_guess_because(wordmap, ['V', 74, 'F'],
-                                   ['deta', 'detä', 'dota', 'duta'])
-        elif wordmap['kotus_av'] == 'G':
-            if wordmap['lemma'].endswith('geta'):
-                wordmap['new_para'] = 'V_TUNGETA'
-            elif wordmap['lemma'].endswith('gota'):
-                wordmap['new_para'] = 'V_PINGOTA'
-            elif wordmap['lemma'].endswith('getä'):
-                wordmap['new_para'] = 'V_ÄNGETÄ'
-            else:
-                fail_guess_because(wordmap, ['V', 74, 'G'],
-                                   ['hapan'])
-        elif wordmap['kotus_av'] == 'H':
-            if wordmap['lemma'].endswith('mmuta'):
-                wordmap['new_para'] = 'V_KUMMUTA'
-            elif wordmap['lemma'].endswith('mmeta'):
-                wordmap['new_para'] = 'V_KAMMETA'
-            elif wordmap['lemma'].endswith('mmota'):
-                wordmap['new_para'] = 'V_SAMMOTA'
-            else:
-                fail_guess_because(wordmap, ['V', 74, 'H'],
-                                   ['hapan'])
-        elif wordmap['kotus_av'] == 'J':
-            if wordmap['lemma'].endswith('nnota'):
-                wordmap['new_para'] = 'V_INNOTA'
-            else:
-                fail_guess_because(wordmap, ['V', 74, 'J'],
-                                   ['hapan'])
-        elif wordmap['kotus_av'] == 'K':
-            if wordmap['lemma'].endswith('rrota'):
-                wordmap['new_para'] = 'V_IRROTA'
-            else:
-                fail_guess_because(wordmap, ['V', 74, 'K'],
-                                   ['hapan'])
-        elif wordmap['kotus_av'] == 'L':
-            if wordmap['lemma'].endswith('jeta'):
-                wordmap['new_para'] = 'V_HALJETA'
-            elif wordmap['lemma'].endswith('jetä'):
-                wordmap['new_para'] = 'V_ILJETÄ'
-            else:
-                fail_guess_because(wordmap, ['V', 74, 'K'],
-                                   ['hapan'])
-        else:
-            fail_guess_because(wordmap, ['V', 74], [False, 'A-K'])
-    elif wordmap['kotus_tn'] == 75:
-        if not wordmap['kotus_av']:
-            if wordmap['lemma'].endswith('ta'):
-                wordmap['new_para'] = 'V_LASSOTA'
-            elif wordmap['lemma'].endswith('tä'):
-                wordmap['new_para'] = 'V_SELVITÄ'
-            else:
-                fail_guess_because(wordmap, ['V', 75, False],
-                                   ['ta', 'tä'])
-        elif wordmap['kotus_av'] == 'B':
-            if wordmap['lemma'].endswith('pytä'):
-                wordmap['new_para'] = 'V_RYÖPYTÄ'
-            else:
-                fail_guess_because(wordmap, ['V', 75, 'B'],
-                                   ['ton'])
-        elif wordmap['kotus_av'] == 'C':
-            if wordmap['lemma'].endswith('tota'):
-                wordmap['new_para'] = 'V_PEITOTA'
-            else:
-                fail_guess_because(wordmap, ['V', 75, 'C'],
-                                   ['ton'])
-        elif wordmap['kotus_av'] == 'D':
-            if wordmap['lemma'].endswith('itä'):
-                wordmap['new_para'] = 'V_KERITÄ'
-            else:
-                fail_guess_because(wordmap, ['V', 75, 'D'],
-                                   ['ton'])
-        elif wordmap['kotus_av'] == 'F':
-            if wordmap['lemma'].endswith('dota'):
-                wordmap['new_para'] = 'V_MUODOTA'
-            else:
-                fail_guess_because(wordmap, ['V', 75, 'E'],
-                                   ['ton'])
-        elif wordmap['kotus_av'] == 'H':
-            if wordmap['lemma'].endswith('mmitä'):
-                wordmap['new_para'] = 'V_LÄMMITÄ'
-            else:
-                fail_guess_because(wordmap, ['V', 75, 'H'],
-                                   ['ton'])
-        elif wordmap['kotus_av'] == 'I':
-            if wordmap['lemma'].endswith('llitä'):
-                wordmap['new_para'] = 'V_HELLITÄ'
-            elif wordmap['lemma'].endswith('llota'):
-                wordmap['new_para'] = 'V_AALLOTA'
-            else:
-                fail_guess_because(wordmap, ['V', 75, 'I'],
-                                   ['ton'])
-        else:
-            fail_guess_because(wordmap, ['V', 75],
-                               [False, 'B', 'D', 'F', 'H', 'I'])
-    elif wordmap['kotus_tn'] == 76:
-        if wordmap['kotus_av'] == 'F':
-            if wordmap['lemma'].endswith('taa'):
-                wordmap['new_para'] = 'V_TAITAA'
-            elif wordmap['lemma'].endswith('tää'):
-                wordmap['new_para'] = 'V_TIETÄÄ'
-            else:
-                fail_guess_because(wordmap, ['V', 76, 'F'],
-                                   ['front', 'back'])
-        else:
-            fail_guess_because(wordmap, ['V', 76],
-                               ['F'])
-    elif wordmap['kotus_tn'] == 77:
-        if not wordmap['kotus_av']:
-            if wordmap['lemma'].endswith('aa'):
-                wordmap['new_para'] = 'V_VIPAJAA'
-            elif wordmap['lemma'].endswith('ää'):
-                wordmap['new_para'] = 'V_HELÄJÄÄ'
-            else:
-                fail_guess_because(wordmap, ['V', 77, False],
-                                   ['vasen'])
-        else:
-            fail_guess_because(wordmap, ['V', 77],
-                               [False], "cannot have gradation")
-    elif wordmap['kotus_tn'] == 78:
-        if not wordmap['kotus_av']:
-            if wordmap['lemma'].endswith('aa'):
-                wordmap['new_para'] = 'V_RAIKAA'
-            elif wordmap['lemma'].endswith('ää'):
-                wordmap['new_para'] = 'V_ÄHKÄÄ'
-            elif wordmap['lemma'].endswith('ata'):
-                wordmap['new_para'] = 'V_HALAJAA'
-            else:
-                fail_guess_because(wordmap, ['V', 78, False],
-                                   ['aa', 'ää', 'ata'])
-        elif wordmap['kotus_av'] == 'A':
-            if wordmap['lemma'].endswith('kkaa'):
-                wordmap['new_para'] = 'V_TUIKKAA'
-            else:
-                fail_guess_because(wordmap, ['V', 78, 'A'],
-                                   ['kkaa'])
-        else:
-            fail_guess_because(wordmap, ['V', 78],
-                               [False, 'A'])
-    elif tn == 99:
-        fail_guess_because(wordmap, ['V', 99], [99],
-                           "Illegal class for V, 99 can only apply to P")
-        wordmap['new_para'] = '#'
-    elif tn == 1067:
-        if not wordmap['kotus_av']:
-            if wordmap['lemma'].endswith('olla'):
-                wordmap['new_para'] = 'V_OLLA'
-            else:
-                fail_guess_because(wordmap, ['V', 10, 'D', 'OLLA'],
-                                   ['olla'], 'must be olla')
-    elif tn == 1099:
-        if not wordmap['kotus_av']:
-            if wordmap['lemma'].endswith('ei'):
-                wordmap['new_para'] = 'V_EI'
-            else:
-                fail_guess_because(wordmap, ['V', 99, 'D', 'EI'],
-                                   ['ei'], 'must be ei')
-    else:
-        fail_guess_because(wordmap, ['V'],
-                           ['52-78', '99', '1067'])
-    return wordmap
+    return guess_new_para_from_rules(wordmap, 'VERB')
 
 
 def guess_new_acro(wordmap):
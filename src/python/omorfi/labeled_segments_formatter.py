@@ -364,7 +364,7 @@ class LabeledSegmentsFormatter(Formatter):
 
     def multichars_lexc(self):
         multichars = "Multichar_Symbols\n"
-        for mc in self.multichars:
+        for mc in sorted(self.multichars):
             multichars += lexc_escape(mc) + "\n"
         multichars += Formatter.multichars_lexc(self)
         return multichars
@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Binary columnar format for the expanded omorfi lexeme database.
+
+The lexdb file stores the same data as master.tsv column by column: each
+column is a string table of its distinct values and an array of indices to
+the table, one for each lexeme. The arrays are memory-mapped when reading,
+and each distinct string is decoded only once, so iterating over the
+lexemes does not need any TSV parsing.
+
+The layout of the file is:
+
+* 16 bytes of magic @c LEXDB_MAGIC
+* 8 bytes of little-endian header length
+* JSON header with field names, row count, byte order and column layouts
+* column data, each part aligned at 8 bytes: NUL-separated UTF-8 string
+  table and array of indices of typecode B, H or I
+"""
+
+# Author: Omorfi contributors <omorfi-devel@groups.google.com> 2015
+
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import csv
+import json
+import mmap
+import struct
+import sys
+from array import array
+
+LEXDB_MAGIC = b'OMORFI-LEXDB\x00\x00\x00\x01'
+
+
+def _index_typecode(count):
+    """Pick smallest unsigned array typecode that can index count strings."""
+    for typecode in ['B', 'H', 'I', 'L']:
+        if count < 1 << (8 * array(typecode).itemsize):
+            return typecode
+    raise ValueError("too many distinct values for lexdb column")
+
+
+def _padding(offset):
+    return -offset % 8
+
+
+def write_lexdb(filename, fieldnames, rows):
+    """Write rows of wordmaps with fieldnames into lexdb file filename.
+
+    The field values must be strings or None.
+    """
+    tables = [dict() for _ in fieldnames]
+    indices = [array('L') for _ in fieldnames]
+    count = 0
+    for row in rows:
+        count += 1
+        for field, table, index in zip(fieldnames, tables, indices):
+            value = row[field]
+            if value not in table:
+                if value is not None and '\0' in value:
+                    raise ValueError("NUL in lexdb field " + field)
+                table[value] = len(table)
+            index.append(table[value])
+    columns = []
+    parts = []
+    offset = 0
+    for table, index in zip(tables, indices):
+        strings = [value for value in table if value is not None]
+        none = None in table
+        if none:
+            # None goes last, after the strings
+            nonevalue = table[None]
+            remap = [i - 1 if i > nonevalue else i
+                     for i in range(len(table))]
+            remap[nonevalue] = len(strings)
+            index = array('L', map(remap.__getitem__, index))
+        blob = '\0'.join(strings).encode('utf-8')
+        typecode = _index_typecode(len(table))
+        index = array(typecode, index)
+        columns.append({'strings': [offset, len(blob)],
+                        'count': len(strings),
+                        'none': none,
+                        'index': [offset + len(blob) + _padding(len(blob)),
+                                  typecode]})
+        parts.append(blob)
+        parts.append(bytes(_padding(len(blob))))
+        offset += len(blob) + _padding(len(blob))
+        data = index.tobytes()
+        parts.append(data)
+        parts.append(bytes(_padding(len(data))))
+        offset += len(data) + _padding(len(data))
+    header = json.dumps({'fieldnames': list(fieldnames), 'rows': count,
+                         'byteorder': sys.byteorder,
+                         'itemsizes': {typecode: array(typecode).itemsize
+                                       for typecode in 'BHIL'},
+                         'columns': columns}).encode('utf-8')
+    header += b' ' * _padding(len(header))
+    with open(filename, 'wb') as lexdbfile:
+        lexdbfile.write(LEXDB_MAGIC)
+        lexdbfile.write(struct.pack('<Q', len(header)))
+        lexdbfile.write(header)
+        for part in parts:
+            lexdbfile.write(part)
+
+
+def is_lexdb(filename):
+    """Check if filename is a lexdb file."""
+    with open(filename, 'rb') as lexdbfile:
+        return lexdbfile.read(len(LEXDB_MAGIC)) == LEXDB_MAGIC
+
+
+class LexDB:
+
+    """
+    A memory-mapped lexdb file.
+
+    Iterating over the LexDB gives each lexeme as a wordmap dict, like
+    csv.DictReader on master.tsv does, and @c fieldnames has the field
+    names of the database.
+    """
+
+    def __init__(self, filename):
+        """Open lexdb file filename."""
+        self.filename = filename
+        with open(filename, 'rb') as lexdbfile:
+            if lexdbfile.read(len(LEXDB_MAGIC)) != LEXDB_MAGIC:
+                raise ValueError(filename + " is not a lexdb file")
+            headerlen = struct.unpack('<Q', lexdbfile.read(8))[0]
+            header = json.loads(lexdbfile.read(headerlen).decode('utf-8'))
+            self._mmap = mmap.mmap(lexdbfile.fileno(), 0,
+                                   access=mmap.ACCESS_READ)
+        self.fieldnames = header['fieldnames']
+        self.rows = header['rows']
+        self._base = len(LEXDB_MAGIC) + 8 + headerlen
+        self._swap = header['byteorder'] != sys.byteorder
+        self._itemsizes = header['itemsizes']
+        self._columns = dict(zip(self.fieldnames, header['columns']))
+        self._tables = dict()
+        self._indices = dict()
+        self._views = []
+
+    def __len__(self):
+        return self.rows
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        """Release the memory map."""
+        self._indices = dict()
+        for view in reversed(self._views):
+            view.release()
+        self._views = []
+        self._mmap.close()
+
+    def _view(self, start, length):
+        view = memoryview(self._mmap)
+        self._views.append(view)
+        view = view[self._base + start:self._base + start + length]
+        self._views.append(view)
+        return view
+
+    def table(self, field):
+        """Get list of distinct values of field, indexed by @c index()."""
+        if field not in self._tables:
+            column = self._columns[field]
+            start, length = column['strings']
+            if column['count']:
+                table = str(self._view(start, length), 'utf-8').split('\0')
+            else:
+                table = []
+            if column['none']:
+                table.append(None)
+            self._tables[field] = table
+        return self._tables[field]
+
+    def index(self, field):
+        """Get array of indices of field values in @c table() per row."""
+        if field not in self._indices:
+            start, typecode = self._columns[field]['index']
+            itemsize = self._itemsizes[typecode]
+            if self._swap or itemsize != array(typecode).itemsize:
+                index = array(typecode)
+                index.frombytes(self._view(start, self.rows * itemsize))
+                if self._swap:
+                    index.byteswap()
+            else:
+                index = self._view(start, self.rows * itemsize).cast(
+                    typecode)
+                self._views.append(index)
+            self._indices[field] = index
+        return self._indices[field]
+
+    def column(self, field):
+        """Iterate over values of field for each row."""
+        return map(self.table(field).__getitem__, self.index(field))
+
+    def __iter__(self):
+        fieldnames = self.fieldnames
+        for values in zip(*[self.column(field) for field in fieldnames]):
+            yield dict(zip(fieldnames, values))
+
+
+class _TSVLexemes:
+
+    """Lexemes from master.tsv with the interface of @c LexDB."""
+
+    def __init__(self, filename, **csvargs):
+        self._file = open(filename, 'r', newline='')
+        self._reader = csv.DictReader(self._file, **csvargs)
+        self.fieldnames = self._reader.fieldnames
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        self._file.close()
+
+    def __iter__(self):
+        return iter(self._reader)
+
+
+def open_lexemes(filename, delimiter='\t', quoting=csv.QUOTE_NONE,
+                 quotechar=None, escapechar='%'):
+    """Open expanded lexeme database filename for iterating wordmaps.
+
+    The file can be a lexdb file or a master.tsv file, which is read with
+    given csv options. The result has field names in fieldnames and can be
+    used in a with statement.
+    """
+    if is_lexdb(filename):
+        return LexDB(filename)
+    return _TSVLexemes(filename, delimiter=delimiter, quoting=quoting,
+                       quotechar=quotechar, escapechar=escapechar,
+                       strict=True)
+
+
+def main():
+    """Self test: convert TSV to lexdb and compare."""
+    from tempfile import NamedTemporaryFile
+    if len(sys.argv) != 2:
+        print("Usage:", sys.argv[0], "MASTER.TSV", file=sys.stderr)
+        sys.exit(1)
+    with open_lexemes(sys.argv[1]) as tsv:
+        fieldnames = tsv.fieldnames
+        wordmaps = list(tsv)
+    with NamedTemporaryFile() as tmp:
+        write_lexdb(tmp.name, fieldnames, wordmaps)
+        with LexDB(tmp.name) as lexdb:
+            if list(lexdb) != wordmaps:
+                print("lexdb differs from", sys.argv[1], file=sys.stderr)
+                sys.exit(1)
+    sys.exit(0)
+
+
+if __name__ == "__main__":
+    main()
@@ -21,10 +21,15 @@
 #
 # utils to format apertium style data from omorfi database values
 
+from types import MappingProxyType
+
 from .error_logging import fail_formatting_missing_for, just_fail
 from .formatter import Formatter
 from .string_manglers import egrep2xerox, lexc_escape, regex_delete_surface
 
+# read-only stuff2omor tables compiled per formatter class and options
+_compiled_stuff2omors = dict()
+
 
 class OmorFormatter(Formatter):
     common_multichars = {
@@ -587,68 +592,77 @@ class OmorFormatter(Formatter):
         "XForeign": "[FOREIGN=FOREIGN]",
         "": ""}
 
+    # fields with |-separated stuff added to analysis in this order
+    multivalued_fields = ('particle', 'symbol', 'prontype', 'lex', 'abbr',
+                          'numtype', 'adptype')
+
     def __init__(self, verbose=False, **kwargs):
-        for stuff, omor in self.stuff2omor.items():
-            if len(omor) < 2:
-                continue
-            elif omor not in self.common_multichars | self.old_poses | \
-                    self.allo_multichars:
+        self.verbose = verbose
+        self.semantics = bool(kwargs.get('sem'))
+        self.allo = bool(kwargs.get('allo'))
+        self.props = bool(kwargs.get('props'))
+        self.ktnkav = bool(kwargs.get('ktnkav'))
+        self.newparas = bool(kwargs.get('newparas'))
+        self.stuff2omor = self.compile_stuff2omor(self.semantics, self.allo,
+                                                  self.props, self.ktnkav,
+                                                  self.newparas)
+
+    @classmethod
+    def compile_stuff2omor(cls, sem=False, allo=False, props=False,
+                           ktnkav=False, newparas=False):
+        '''Get read-only stuff2omor table with unselected tags blanked.
+
+        The tables are compiled once per option combination and shared by
+        all formatters, the class level stuff2omor is never modified.
+        '''
+        key = (cls, sem, allo, props, ktnkav, newparas)
+        if key in _compiled_stuff2omors:
+            return _compiled_stuff2omors[key]
+        multichars = cls.common_multichars | cls.old_poses | \
+            cls.allo_multichars
+        blanks = []
+        if not sem:
+            blanks.append("SEM=")
+        if not allo:
+            blanks.append("ALLO=")
+        if not props:
+            blanks.append("PROPER=")
+        if not ktnkav:
+            blanks += ["KTN=", "KAV="]
+        if not newparas:
+            blanks.append("NEWPARA=")
+        stuff2omor = dict()
+        for stuff, omor in cls.stuff2omor.items():
+            if len(omor) >= 2 and omor not in multichars:
                 just_fail(
                     "There are conflicting formattings in here!\n" +
                     omor + " corresponding " + stuff +
                     " is not a valid defined omor multichar_symbol!")
-        self.verbose = verbose
-        self.semantics = True
-        if 'sem' not in kwargs or not kwargs['sem']:
-            for k, v in self.stuff2omor.items():
-                if "SEM=" in v:
-                    self.stuff2omor[k] = ""
-            self.semantics = False
-        self.allo = True
-        if 'allo' not in kwargs or not kwargs['allo']:
-            for k, v in self.stuff2omor.items():
-                if "ALLO=" in v:
-                    self.stuff2omor[k] = ""
-            self.allo = False
-        self.props = True
-        if 'props' not in kwargs or not kwargs['props']:
-            for k, v in self.stuff2omor.items():
-                if "PROPER=" in v:
-                    self.stuff2omor[k] = ""
-            self.props = False
-        self.ktnkav = True
-        if 'ktnkav' not in kwargs or not kwargs['ktnkav']:
-            for k, v in self.stuff2omor.items():
-                if "KTN=" in v or "KAV=" in v:
-                    self.stuff2omor[k] = ""
-            self.ktnkav = False
-        self.newparas = True
-        if 'newparas' not in kwargs or not kwargs['newparas']:
-            for k, v in self.stuff2omor.items():
-                if "NEWPARA=" in v:
-                    self.stuff2omor[k] = ""
-            self.newparas = False
+            if any(blank in omor for blank in blanks):
+                omor = ""
+            stuff2omor[stuff] = omor
+        stuff2omor['0'] = "0"
+        _compiled_stuff2omors[key] = MappingProxyType(stuff2omor)
+        return _compiled_stuff2omors[key]
 
     def stuff2lexc(self, stuff):
-        if stuff == '0':
-            return "0"
-        if stuff in self.stuff2omor:
-            return self.stuff2omor[stuff]
-        else:
+        omor = self.stuff2omor.get(stuff)
+        if omor is None:
             if self.verbose:
                 fail_formatting_missing_for(stuff, "omor")
             return "ERRORMACRO"
+        return omor
 
     def analyses2lexc(self, anals, surf):
-        omorstring = ''
+        omorstrings = []
         for tag in anals.split('|'):
             if tag == '@@COPY-STEM@@':
-                omorstring += lexc_escape(surf)
+                omorstrings.append(lexc_escape(surf))
             elif tag.startswith('@@LITERAL') and tag.endswith('@@'):
-                omorstring += lexc_escape(tag[len('@@LITERAL'):-len('@@')])
+                omorstrings.append(lexc_escape(tag[len('@@LITERAL'):-len('@@')]))
             else:
-                omorstring += self.stuff2lexc(tag)
-        return omorstring
+                omorstrings.append(self.stuff2lexc(tag))
+        return ''.join(omorstrings)
 
     def continuation2lexc(self, anals, surf, cont):
         tags = self.analyses2lexc(anals, surf)
@@ -669,70 +683,48 @@ class OmorFormatter(Formatter):
         if wordmap['stub'] == ' ':
             # do not include normal white space for now
             return ""
+        stuff2lexc = self.stuff2lexc
         wordmap['stub'] = lexc_escape(wordmap['stub'])
         if int(wordmap['homonym']) == 1:
-            wordmap['analysis'] = "[WORD_ID=%s]" % (
-                lexc_escape(wordmap['lemma']))
+            analysis = ["[WORD_ID=", lexc_escape(wordmap['lemma']), "]"]
         else:
-            wordmap['analysis'] = "[WORD_ID=%s_%s]" % (
-                lexc_escape(wordmap['lemma']), wordmap['homonym'])
-        wordmap['analysis'] += self.stuff2lexc(wordmap['upos'])
+            analysis = ["[WORD_ID=", lexc_escape(wordmap['lemma']), "_",
+                        str(wordmap['homonym']), "]"]
+        analysis.append(stuff2lexc(wordmap['upos']))
         if wordmap['is_suffix']:
-            wordmap['analysis'] += self.stuff2lexc('SUFFIX')
+            analysis.append(stuff2lexc('SUFFIX'))
         if wordmap['is_prefix']:
-            wordmap['analysis'] += self.stuff2lexc('PREFIX')
+            analysis.append(stuff2lexc('PREFIX'))
             if wordmap['upos'] == 'ADJ':
-                wordmap['analysis'] += self.stuff2lexc('Cpos')
+                analysis.append(stuff2lexc('Cpos'))
 
         if wordmap['blacklist']:
-            wordmap['analysis'] += self.stuff2lexc('BLACKLISTED') + \
-                wordmap['blacklist'] + ']'
-        if wordmap['particle']:
-            for pclass in wordmap['particle'].split('|'):
-                wordmap['analysis'] += self.stuff2lexc(pclass)
-
-        if wordmap['symbol']:
-            for subcat in wordmap['symbol'].split('|'):
-                wordmap['analysis'] += self.stuff2lexc(subcat)
-
-        if wordmap['prontype']:
-            for stuff in wordmap['prontype'].split("|"):
-                wordmap['analysis'] += self.stuff2lexc(stuff)
-        if wordmap['lex']:
-            for stuff in wordmap['lex'].split("|"):
-                wordmap['analysis'] += self.stuff2lexc(stuff)
-        if wordmap['abbr']:
-            for stuff in wordmap['abbr'].split("|"):
-                wordmap['analysis'] += self.stuff2lexc(stuff)
-        if wordmap['numtype']:
-            for stuff in wordmap['numtype'].split("|"):
-                wordmap['analysis'] += self.stuff2lexc(stuff)
-        if wordmap['adptype']:
-            for stuff in wordmap['adptype'].split("|"):
-                wordmap['analysis'] += self.stuff2lexc(stuff)
+            analysis += [stuff2lexc('BLACKLISTED'), wordmap['blacklist'], ']']
+        for field in self.multivalued_fields:
+            if wordmap[field]:
+                analysis += map(stuff2lexc, wordmap[field].split('|'))
 
         if self.props and wordmap['proper_noun_class']:
-            wordmap['analysis'] += self.stuff2lexc(wordmap['proper_noun_class'])
+            analysis.append(stuff2lexc(wordmap['proper_noun_class']))
         if self.semantics and wordmap['sem']:
-            wordmap['analysis'] += self.stuff2lexc(wordmap['sem'])
+            analysis.append(stuff2lexc(wordmap['sem']))
 
         if wordmap['style']:
-            wordmap['analysis'] += self.stuff2lexc(wordmap['style'])
+            analysis.append(stuff2lexc(wordmap['style']))
 
         if self.ktnkav and wordmap['upos'] != 'ACRONYM':
             tag = "[KTN=%s]" % (lexc_escape(wordmap['kotus_tn']))
             if tag in self.ktnkav_multichars:
-                wordmap['analysis'] += tag
+                analysis.append(tag)
                 if wordmap['kotus_av']:
-                    wordmap['analysis'] += "[KAV=%(kotus_av)s]" % (wordmap)
+                    analysis.append("[KAV=%(kotus_av)s]" % (wordmap))
         if self.newparas:
-            wordmap['analysis'] += "[NEWPARA=%s]" % (wordmap['new_para'],)
+            analysis.append("[NEWPARA=%s]" % (wordmap['new_para'],))
+        wordmap['analysis'] = ''.join(analysis)
 
         # match WORD_ID= with epsilon, then stub and lemma might match
-        lex_stub = '0' + wordmap['stub']
-
-        lexc_line = "%s:%s\t%s\t;" % (wordmap['analysis'], lex_stub,
-                                      wordmap['new_para'])
+        lexc_line = ''.join((wordmap['analysis'], ':0', wordmap['stub'], '\t',
+                             wordmap['new_para'], '\t;'))
         if 'BLACKLISTED' in wordmap['new_para']:
             return "! ! !" + lexc_line
         else:
@@ -741,7 +733,7 @@ class OmorFormatter(Formatter):
     def multichars_lexc(self):
         multichars = "Multichar_Symbols\n"
         multichars += "!! OMOR multichars:\n"
-        for mcs in self.common_multichars:
+        for mcs in sorted(self.common_multichars):
             multichars += mcs + "\n"
         multichars += Formatter.multichars_lexc(self)
         return multichars
@@ -10,13 +10,22 @@ the standard shell scripts or java interface.
 """
 
 
+import gc
+import re
 from argparse import ArgumentParser
+from collections import OrderedDict
 from glob import glob
+from multiprocessing import get_context
 from os import F_OK, access, getenv
-from sys import stderr, stdin
+from sys import stderr, stdin, stdout
 
 import libhfst
 
+from .analysis import Analysis
+from .cache_snapshot import (dump_cache_snapshot, load_cache_snapshot,
+                             read_frequency_list)
+from .omorfi_server import OmorfiClient
+from .sentence_writer import add_output_arguments, writer_from_args
 from .settings import fin_punct_leading, fin_punct_trailing
 
 can_udpipe = True
@@ -25,6 +34,48 @@ try:
 except ImportError:
     can_udpipe = False
 
+_forked_omorfi = None
+
+
+def _read_pmatch(his):
+    transducers = []
+    while not his.is_eof():
+        transducers.append(his.read())
+    return libhfst.PmatchContainer(transducers)
+
+
+class _LazyAutomaton:
+
+    """An automaton file that is read on first lookup."""
+
+    def __init__(self, path, pmatch=False):
+        self.path = path
+        self.pmatch = pmatch
+        self._fsa = None
+
+    def load(self):
+        if self._fsa is None:
+            his = libhfst.HfstInputStream(self.path)
+            if self.pmatch:
+                self._fsa = _read_pmatch(his)
+            else:
+                self._fsa = his.read()
+        return self._fsa
+
+    def lookup(self, *args, **kwargs):
+        return self.load().lookup(*args, **kwargs)
+
+    def __getattr__(self, name):
+        if name.startswith('_'):
+            raise AttributeError(name)
+        return getattr(self.load(), name)
+
+
+def forked_omorfi():
+    """Get the Omorfi instance a worker of @c Omorfi.fork_pool was forked
+    from, or None outside such workers."""
+    return _forked_omorfi
+
 
 class Omorfi:
 
@@ -49,6 +100,13 @@ class Omorfi:
         try_detitlecase: to use `str[0].lower + str[1:]`
 
     The annotations will be changed when transformation has been applied.
+
+    Analyses are cached in a size-bounded LRU cache keyed by the token and
+    the casing flags above; the size is given to constructor as
+    `cache_size`, 0 disables caching. `cache_stats()` gives the hit, miss and
+    eviction counts and `clear_cache()` empties the cache. `warm_cache()`
+    fills the cache from a word-form frequency list, and `dump_cache()` and
+    `load_cache()` save it to and restore it from a snapshot file.
     """
     analyser = None
     tokeniser = None
@@ -66,6 +124,7 @@ class Omorfi:
     try_titlecase = True
     try_detitlecase = True
     try_uppercase = False
+    analyser_path = None
     can_analyse = False
     can_tokenise = True
     can_generate = False
@@ -78,17 +137,32 @@ class Omorfi:
 
     _verbosity = False
 
+    _cache = None
+    _recase_cache = None
+    _cache_size = 0
+    cache_hits = 0
+    cache_misses = 0
+    cache_evictions = 0
+
     _stdpaths = ['/usr/local/share/hfst/fi/',
                  '/usr/share/hfst/fi/',
                  '/usr/local/share/omorfi/',
                  '/usr/share/omorfi/',
                  './', 'generated/', 'src/generated/', '../src/generated/']
 
-    def __init__(self, verbosity=False):
-        """Construct Omorfi with given verbosity for printouts."""
+    def __init__(self, verbosity=False, cache_size=65536):
+        """Construct Omorfi with given verbosity for printouts.
+
+        The cache_size is the maximum number of tokens whose analyses, and
+        separately tokenisation acceptance results, are kept in memory, 0
+        disables the caches.
+        """
         self._verbosity = verbosity
+        self._cache_size = cache_size
+        self._cache = OrderedDict()
+        self._recase_cache = OrderedDict()
 
-    def load_filename(self, path, **include):
+    def load_filename(self, path, lazy=False, **include):
         """Load omorfi automaton from filename and guess its use.
 
         A file name should consist of three parts separated by full stop.
@@ -99,17 +173,22 @@ class Omorfi:
 
         The named arguments can include a name of automaton type as name,
         and truth value as value, for types of automata allowed to load.
-        By default, the names `analyse`, `generate` and `segment` are loaded.
+        By default, the names `analyse`, `generate`, `segment`, `accept` and
+        `tokenise` are loaded.
         Names not included are defaulted to False. E.g.,
         `omorfi.load_filename(fn, analyse=True)`
         will only load file named fn if it can be identified as omorfi
         analyser. This is best used in conjunction with omorfi.load_from_dir.
+
+        If lazy is True, the file is only recorded for its use and the
+        automaton is read when it is first used.
         """
         if len(include) == 0:
             include['analyse'] = True
             include['generate'] = True
             include['segment'] = True
             include['accept'] = True
+            include['tokenise'] = True
         for ttype in ['analyse', 'generate', 'accept', 'tokenise', 'lemmatise',
                       'hyphenate', 'segment', 'labelsegment', 'guesser',
                       'udpipe']:
@@ -119,7 +198,8 @@ class Omorfi:
         if self._verbosity:
             print('Opening file', path)
         if access(path, F_OK):
-            his = libhfst.HfstInputStream(path)
+            if not lazy:
+                his = libhfst.HfstInputStream(path)
         else:
             # FIXME: should fail
             if self._verbosity:
@@ -135,60 +215,71 @@ class Omorfi:
         elif parts[1] == 'analyse' and include['analyse']:
             if self._verbosity:
                 print('analyser', parts[0])
-            self.analyser = his.read()
+            self.analyser = self._read_automaton(his, path, lazy)
+            self.analyser_path = path
+            self.clear_cache()
             self.can_analyse = True
             self.can_accept = True
             self.can_lemmatise = True
         elif parts[1] == 'generate' and include['generate']:
             if self._verbosity:
                 print('generator', parts[0])
-            self.generator = his.read()
+            self.generator = self._read_automaton(his, path, lazy)
             self.can_generate = True
         elif parts[1] == 'accept' and include['accept']:
             if self._verbosity:
                 print('acceptor', parts[0])
-            self.acceptor = his.read()
+            self.acceptor = self._read_automaton(his, path, lazy)
+            self._recase_cache.clear()
             self.can_accept = True
         elif parts[1] == 'tokenise' and include['tokenise']:
             if self._verbosity:
                 print('tokeniser', parts[0])
-            self.tokeniser = his.read()
+            self.tokeniser = self._read_automaton(
+                his, path, lazy, path.endswith('.pmatchfst'))
             self.can_tokenise = True
         elif parts[1] == 'lemmatise' and include['lemmatise']:
             if self._verbosity:
                 print('lemmatiser', parts[0])
-            self.lemmatiser = his.read()
+            self.lemmatiser = self._read_automaton(his, path, lazy)
             self.can_lemmatise = True
         elif parts[1] == 'hyphenate' and include['hyphenate']:
             if self._verbosity:
                 print('hyphenator', parts[0])
-            self.hyphenator = his.read()
+            self.hyphenator = self._read_automaton(his, path, lazy)
             self.can_hyphenate = True
         elif parts[1] == 'segment' and include['segment']:
             if self._verbosity:
                 print('segmenter', parts[0])
-            self.segmenter = his.read()
+            self.segmenter = self._read_automaton(his, path, lazy)
             self.can_segment = True
         elif parts[1] == 'guesser' and include['guesser']:
             if self._verbosity:
                 print('guesser', parts[0])
-            self.guesser = his.read()
+            self.guesser = self._read_automaton(his, path, lazy)
             self.can_guess = True
         elif parts[1] == 'labelsegment' and include['labelsegment']:
             if self._verbosity:
                 print('labelsegmenter', parts[0])
-            self.labelsegmenter = his.read()
+            self.labelsegmenter = self._read_automaton(his, path, lazy)
             self.can_segment = True
         elif self._verbosity:
             print('skipped', parts)
 
+    def _read_automaton(self, his, path, lazy, pmatch=False):
+        if lazy:
+            return _LazyAutomaton(path, pmatch)
+        if pmatch:
+            return _read_pmatch(his)
+        return his.read()
+
     def _maybe_str2token(self, s):
         if isinstance(s, str):
             return (s, "")
         else:
             return s
 
-    def load_from_dir(self, path=None, **include):
+    def load_from_dir(self, path=None, lazy=False, **include):
         """Load omorfi automata from given or known locations.
 
         If path is given it should point to directory of automata,
@@ -203,11 +294,15 @@ class Omorfi:
         * getenv('HOME') + /.omorfi/*.hfst
 
         Last two paths require getenv('HOME'). All automata matching
-        glob *.hfst are loaded and stored in part of omorfi class appropriate
-        for their usage.
+        glob *.hfst or *.pmatchfst are loaded and stored in part of omorfi
+        class appropriate for their usage.
 
         They keyword args can be used to limit loading of automata. The name
         is analyser type and value is True.
+
+        If lazy is True, the automata are not read until first used, see
+        @c load_filename(self, path, lazy, **include). Note that broken
+        files will then only show up on first use.
         """
         homepaths = []
         if getenv('HOME'):
@@ -218,18 +313,40 @@ class Omorfi:
         if path:
             if self._verbosity:
                 print('adding', path + '/*.hfst')
-            loadable = glob(path + '/*.hfst')
+            loadable = glob(path + '/*.hfst') + glob(path + '/*.pmatchfst')
         else:
             for sp in self._stdpaths + homepaths:
                 if self._verbosity:
                     print('adding', sp + '/*.hfst')
-                loadable += glob(sp + '/*.hfst')
+                loadable += glob(sp + '/*.hfst') + glob(sp + '/*.pmatchfst')
         for filename in loadable:
             try:
-                self.load_filename(filename, **include)
+                self.load_filename(filename, lazy, **include)
             except:
                 print("broken HFST", filename, file=stderr)
 
+    def fork_pool(self, processes=None, initializer=None, initargs=()):
+        """Fork a multiprocessing pool of workers sharing loaded automata.
+
+        The automata should be loaded before calling this, lazily loaded
+        automata are read in each worker separately. The workers are
+        forked from current process so the transducers are shared with
+        copy-on-write pages instead of being loaded again in each worker.
+        Inside the worker functions the instance is available via
+        @c forked_omorfi(). The initializer and initargs are passed on to
+        the pool.
+        """
+        global _forked_omorfi
+        _forked_omorfi = self
+        # keep the garbage collector from touching the inherited pages
+        gc.collect()
+        gc.freeze()
+        try:
+            pool = get_context('fork').Pool(processes, initializer, initargs)
+        finally:
+            gc.unfreeze()
+        return pool
+
     def load_udpipe(self, filename):
         if not can_udpipe:
             print("importing udpipe failed, cannot load udpipe xxx")
@@ -242,6 +359,20 @@ class Omorfi:
         self.can_udpipe = True
 
     def _find_retoken_recase(self, token):
+        key = (token, self.try_lowercase, self.try_uppercase,
+               self.try_titlecase, self.try_detitlecase)
+        retoken = self._recase_cache.get(key)
+        if retoken is not None:
+            self._recase_cache.move_to_end(key)
+            return retoken
+        retoken = self._find_retoken_recase_uncached(token)
+        if self._cache_size:
+            self._recase_cache[key] = retoken
+            while len(self._recase_cache) > self._cache_size:
+                self._recase_cache.popitem(last=False)
+        return retoken
+
+    def _find_retoken_recase_uncached(self, token):
         if self.accept(token):
             return (token, "ORIGINALCASE")
         if self.try_lowercase and self.accept(token.lower()):
@@ -255,66 +386,59 @@ class Omorfi:
                 return (token[0].lower() + token[1:], "DETITLECASED=" + token)
         return False
 
+    def _peel_candidates(self, leads, trails, length):
+        """List (leading, trailing) punctuation counts to peel, in order.
+
+        The candidates are made from leads leading and trails trailing
+        punctuations of a token of length, e.g. `word.`, `"word"` or
+        `"word.",`. The single punctuation cases come first, then the
+        longer trailing runs without and with the leading one, which is
+        the order of the hand-written cases before. Only one leading
+        punctuation is peeled, longer leading runs are split off by the
+        non-word fallback of @c _find_retokens.
+        """
+        leads = min(leads, 1)
+        candidates = [(0, 1), (1, 0), (1, 1)]
+        for lead in range(leads + 1):
+            candidates += [(lead, trail) for trail in range(2, trails + 1)]
+        return [(lead, trail) for lead, trail in candidates
+                if lead <= leads and trail <= min(trails, length - lead - 1)]
+
+    def _peeled_retokens(self, token, lead, trail, retoken):
+        retokens = []
+        if lead > 0:
+            retokens.append((token[:lead], "SpaceAfter=No"))
+        misc = retoken[1]
+        if lead > 0:
+            misc += "|SpaceBefore=No"
+        if trail > 0:
+            misc += "|SpaceAfter=No"
+        retokens.append((retoken[0], misc))
+        for i in range(len(token) - trail, len(token)):
+            if i == len(token) - 1:
+                retokens.append((token[i], "SpaceBefore=No"))
+            else:
+                retokens.append((token[i], "SpaceBefore=No|SpaceAfter=No"))
+        return retokens
+
     def _find_retokens(self, token):
         retoken = self._find_retoken_recase(token)
         if retoken:
             return [retoken]
-        # Word.
-        if token[-1] in fin_punct_trailing:
-            retoken = self._find_retoken_recase(token[:-1])
-            if retoken:
-                return[(retoken[0], retoken[1] + "|SpaceAfter=No"),
-                       (token[-1], "SpaceBefore=No")]
-        # -Word
+        # peel punctuation runs around the word, see _peel_candidates
+        leads = 0
         if token[0] in fin_punct_leading:
-            retoken = self._find_retoken_recase(token[1:])
-            if retoken:
-                return [(token[0], "SpaceAfter=No"),
-                        (retoken[0], retoken[1] + "|SpaceBefore=No")]
-        # "Word"
-        if token[0] in fin_punct_leading and token[-1] in fin_punct_trailing:
-            retoken = self._find_retoken_recase(token[1:-1])
-            if retoken:
-                return [
-                    (token[0], "SpaceAfter=No"),
-                    (retoken[0], retoken[1] + "|SpaceBefore=No|SpaceAfter=No"),
-                    (token[-1], "SpaceBefore=No")]
-        # word." or word",
-        if len(token) > 2 and token[-1] in fin_punct_trailing and token[-2] in fin_punct_trailing:
-            retoken = self._find_retoken_recase(token[:-2])
-            if retoken:
-                return [
-                    (retoken[0], retoken[1] + "|SpaceAfter=No"),
-                    (token[-2], "SpaceBefore=No|SpaceAfter=No"),
-                    (token[-1], "SpaceBefore=No")]
-        # word.",
-        if len(token) > 3 and token[-1] in fin_punct_trailing and token[-2] in fin_punct_trailing and token[-3] in fin_punct_trailing:
-            retoken = self._find_retoken_recase(token[:-3])
-            if retoken:
-                return [
-                    (retoken[0], retoken[1] + "|SpaceAfter=No"),
-                    (token[-3], "SpaceBefore=No|SpaceAfter=No"),
-                    (token[-2], "SpaceBefore=No|SpaceAfter=No"),
-                    (token[-1], "SpaceBefore=No")]
-        # "word."
-        if len(token) > 3 and token[-1] in fin_punct_trailing and token[-2] in fin_punct_trailing and token[0] in fin_punct_leading:
-            retoken = self._find_retoken_recase(token[1:-2])
-            if retoken:
-                return [
-                    (token[0], "SpaceAfter=No"),
-                    (retoken[0], retoken[1] + "|SpaceBefore=No|SpaceAfter=No"),
-                    (token[-2], "SpaceBefore=No|SpaceAfter=No"),
-                    (token[-1], "SpaceBefore=No")]
-        # "word.",
-        if len(token) > 4 and token[-1] in fin_punct_trailing and token[-2] in fin_punct_trailing and token[-3] in fin_punct_trailing and token[0] in fin_punct_leading:
-            retoken = self._find_retoken_recase(token[1:-3])
-            if retoken:
-                return [
-                    (token[0], "SpaceAfter=No"),
-                    (retoken[0], retoken[1] + "|SpaceBefore=No|SpaceAfter=No"),
-                    (token[-3], "SpaceBefore=No|SpaceAfter=No"),
-                    (token[-2], "SpaceBefore=No|SpaceAfter=No"),
-                    (token[-1], "SpaceBefore=No")]
+            leads = 1
+        trails = 0
+        while trails < len(token) and token[-1 - trails] in fin_punct_trailing:
+            trails += 1
+        if leads or trails:
+            for lead, trail in self._peel_candidates(leads, trails,
+                                                     len(token)):
+                retoken = self._find_retoken_recase(
+                    token[lead:len(token) - trail])
+                if retoken:
+                    return self._peeled_retokens(token, lead, trail, retoken)
         # ...non-word...
         pretokens = []
         posttokens = []
@@ -328,34 +452,98 @@ class Omorfi:
             [(token, "SpaceBefore=No|SpaceAfter=No")] + \
             posttokens
 
-    def _retokenise(self, tokens):
-        retokens = []
-        for token in tokens:
-            for retoken in self._find_retokens(token):
-                retokens.append(retoken)
-        return retokens
+    def _retoken_spans(self, word, start):
+        pos = 0
+        for retoken in self._find_retokens(word):
+            offset = word.find(retoken[0], pos)
+            if offset < 0:
+                # the non-word fallback lists trailing punctuation last
+                # first
+                offset = word.rfind(retoken[0], 0, pos)
+            yield retoken[0], retoken[1], start + offset
+            pos = offset + len(retoken[0])
+
+    def _split_spans(self, line):
+        for match in re.finditer(r'\S+', line):
+            yield from self._retoken_spans(match.group(0), match.start())
+
+    def _located_spans(self, line):
+        pos = 0
+        for locations in self.tokeniser.locate(line):
+            location = locations[0]
+            start = line.find(location.input, pos)
+            if start < 0:
+                start = pos
+            pos = start + len(location.input)
+            if location.tag == '@_NONMATCHING_@':
+                for match in re.finditer(r'\S+', location.input):
+                    yield from self._retoken_spans(match.group(0),
+                                                   start + match.start())
+            else:
+                yield location.input, None, start
+
+    def _mark_spacing(self, span, prev_end, next_start):
+        surf, misc, start = span
+        if misc is not None:
+            return span
+        miscs = []
+        if prev_end == start:
+            miscs.append("SpaceBefore=No")
+        if start + len(surf) == next_start:
+            miscs.append("SpaceAfter=No")
+        return surf, '|'.join(miscs), start
 
     def _tokenise(self, line):
-        return None
+        # mark spacing of matched tokens from their neighbours, holding
+        # back one span until the start of the next one is known
+        prev_end = None
+        held = None
+        for span in self._located_spans(line):
+            if held is not None:
+                yield self._mark_spacing(held, prev_end, span[2])
+                prev_end = held[2] + len(held[0])
+            held = span
+        if held is not None:
+            yield self._mark_spacing(held, prev_end, None)
+
+    def _token_spans(self, line):
+        if self.tokeniser and hasattr(self.tokeniser, 'locate'):
+            spans = self._tokenise(line)
+            first = next(spans, None)
+            if first is not None:
+                yield first
+                yield from spans
+                return
+        yield from self._split_spans(line)
 
     def tokenise(self, line):
         """Perform tokenisation with loaded tokeniser if any, or `split()`.
 
-        If tokeniser is available, it is applied to input line and if
+        If pmatch tokeniser is available, it is applied to input line and if
         result is achieved, it is split to tokens according to tokenisation
-        strategy and returned as a list.
+        strategy and returned as a list. The stretches of text not matched
+        by the tokeniser are tokenised like below.
 
         If no tokeniser are present, or none give results, the line will be
         tokenised using python's basic string functions. If analyser is
         present, tokeniser will try harder to get some analyses for each
         token using hard-coded list of extra splits.
         """
-        tokens = None
-        if self.tokeniser:
-            tokens = self._tokenise(line)
-        if not tokens:
-            tokens = self._retokenise(line.split())
-        return tokens
+        return [(surf, misc) for surf, misc, start in
+                self._token_spans(line)]
+
+    def tokenise_stream(self, fileobj):
+        """Tokenise a whole file lazily.
+
+        Yields pairs of token and its character offset from the start of
+        the file, tokens are as in @c tokenise(self, line). The file is read
+        a line at a time and no token lists are kept.
+        """
+        offset = 0
+        for line in fileobj:
+            for surf, misc, start in self._token_spans(line):
+                yield (surf, misc), offset + start
+            offset += len(line)
 
     def _analyse_str(self, s):
         token = (s, "")
@@ -400,7 +588,104 @@ class Omorfi:
             r = (r[0] + '[WEIGHT=%f]' % (r[1]), r[1], token[1])
         return res
 
-    def analyse(self, token):
+    def _cache_key(self, token):
+        if isinstance(token, str):
+            return (token, None, self.try_lowercase, self.try_titlecase,
+                    self.try_detitlecase, self.try_uppercase)
+        else:
+            # pre-tokenised analyses only depend on the surface form
+            return (token[0],)
+
+    def _cache_get(self, key):
+        if not self._cache_size:
+            return None
+        anals = self._cache.get(key)
+        if anals is None:
+            self.cache_misses += 1
+            return None
+        self._cache.move_to_end(key)
+        self.cache_hits += 1
+        return anals
+
+    def _cache_put(self, key, anals):
+        if not self._cache_size:
+            return
+        self._cache[key] = tuple(anals)
+        while len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
+            self.cache_evictions += 1
+
+    def clear_cache(self):
+        """Empty the analysis caches and reset their statistics."""
+        self._cache.clear()
+        self._recase_cache.clear()
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.cache_evictions = 0
+
+    def cache_stats(self):
+        """Get analysis cache statistics as a dict.
+
+        The dict has keys hits, misses, evictions, size and maxsize.
+        """
+        return {'hits': self.cache_hits, 'misses': self.cache_misses,
+                'evictions': self.cache_evictions, 'size': len(self._cache),
+                'maxsize': self._cache_size}
+
+    def warm_cache(self, freqfile, top_n=None):
+        """Fill the analysis cache with the most frequent word-forms.
+
+        The freqfile is read with @c read_frequency_list and its top_n
+        word-forms, or as many as fit in the cache, are analysed as in
+        @c analyse(self, token). The cache statistics are left as they were.
+        Returns the number of word-forms analysed.
+        """
+        if not self._cache_size or not self.can_analyse:
+            return 0
+        if top_n is None or top_n > self._cache_size:
+            top_n = self._cache_size
+        words = read_frequency_list(freqfile, top_n)
+        stats = (self.cache_hits, self.cache_misses, self.cache_evictions)
+        # least frequent first so that the most frequent are evicted last
+        for word in reversed(words):
+            self.analyse(word)
+        self.cache_hits, self.cache_misses, self.cache_evictions = stats
+        return len(words)
+
+    def dump_cache(self, filename):
+        """Write the analysis cache to snapshot file filename.
+
+        See @c dump_cache_snapshot for the format. Returns the number of
+        cached tokens written, nothing is written if the analyser was not
+        loaded from a file.
+        """
+        if not self.analyser_path:
+            if self._verbosity:
+                print("No analyser file to snapshot cache for", file=stderr)
+            return 0
+        return dump_cache_snapshot(self._cache, self.analyser_path, filename)
+
+    def load_cache(self, filename):
+        """Load analysis cache snapshot written by @c dump_cache.
+
+        The snapshot is only used if the analyser automaton file has the same
+        size, mtime and sha256 hash as when the snapshot was written. The
+        snapshot entries are added to the cache as most recently used ones.
+        Returns the number of cached tokens loaded, 0 if the snapshot was
+        missing, broken or made for another analyser.
+        """
+        if not self._cache_size or not self.analyser_path:
+            return 0
+        entries = load_cache_snapshot(filename, self.analyser_path,
+                                      self._verbosity)
+        for key, anals in entries:
+            self._cache[key] = anals
+            self._cache.move_to_end(key)
+        while len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
+        return len(entries)
+
+    def analyse(self, token, objects=False):
         """Perform a simple morphological analysis lookup.
 
         If try_titlecase does not evaluate to False,
@@ -413,8 +698,17 @@ class Omorfi:
 
         The analyses with case mangling will have an additional element to them
         identifying the casing.
+
+        The results are served from the analysis cache when possible.
+        The analyses are tuples of omor string, weight and possibly misc, or
+        with objects=True @c Analysis objects with parsed tags.
         """
-        anals = None
+        key = self._cache_key(token)
+        anals = self._cache_get(key)
+        if anals is not None:
+            if objects:
+                return [Analysis(anal) for anal in anals]
+            return list(anals)
         if isinstance(token, str):
             anals = self._analyse_str(token)
         else:
@@ -427,28 +721,79 @@ class Omorfi:
                 anal = ('[WORD_ID=%s][GUESS=UNKNOWN][WEIGHT=inf]' %
                     (token[0]), float('inf'), "Unknown")
             anals = [anal]
-        return anals
-
-    def analyse_sentence(self, s):
+        self._cache_put(key, anals)
+        if objects:
+            return [Analysis(anal) for anal in anals]
+        return list(anals)
+
+    def analyse_many(self, tokens, objects=False):
+        """Analyse an iterable of tokens or strings in one batch.
+
+        Each unique token is analysed only once, see @c analyse(self, token)
+        for details of the analysis. The results are returned as a list of
+        analyses in the same order as the input tokens. With objects=True
+        the repeated tokens share the same @c Analysis objects, so their
+        tags are only parsed once.
+        """
+        uniqs = dict()
+        results = []
+        for token in tokens:
+            key = self._cache_key(token)
+            anals = uniqs.get(key)
+            if anals is None:
+                anals = self.analyse(token, objects)
+                uniqs[key] = anals
+            results.append(list(anals))
+        return results
+
+    def analyse_sentence(self, s, objects=False):
         """Analyse a full sentence with tokenisation and guessing.
 
         for details of tokenisation, see @c tokenise(self, s).
         for details of analysis, see @c analyse(self, token).
         If further models like udpipe are loaded, may fill in gaps with that.
+        Returns a list of analyses for each token.
         """
         tokens = self.tokenise(s)
         if not tokens:
             tokens = [(s, "ERRORS=analyse_sentence_1")]
-        analyses = []
-        for token in tokens:
-            analyses += [self.analyse(token)]
+        analyses = self.analyse_many(tokens, objects)
         if self.can_udpipe:
             udinput = '\n'.join([token[0] for token in tokens])
-            uds = self.udpipe(udinput)
-        if len(uds) == len(analyses):
-            for i in range(len(uds)):
-                analsyses[i] += [uds[i]]
-        return None
+            uds = self._udpipe(udinput)
+            if uds and len(uds) == len(analyses):
+                for i in range(len(uds)):
+                    if objects:
+                        analyses[i] += [Analysis(uds[i])]
+                    else:
+                        analyses[i] += [uds[i]]
+        return analyses
+
+    def analyse_conllu(self, s, hacks=None):
+        """Analyse a sentence and format it as CoNLL-U.
+
+        The sentence is tokenised and the first analysis of each token is
+        converted to UD like in omorfi-conllu.py, unknown tokens are guessed
+        if the guesser gives any results. The hacks selects UD version, see
+        @c UdConverter. Returns the token lines of the sentence as a string
+        ending in newline. Raises ValueError if an analysis has tags without
+        UD conversion.
+        """
+        # the UD tables are only needed for CoNLL-U output
+        from .ud_converter import get_ud_converter
+        converter = get_ud_converter(hacks)
+        tokens = self.tokenise(s)
+        if not tokens:
+            return ''
+        surfs = [token[0] for token in tokens]
+        lines = []
+        analyses = self.analyse_many(surfs)
+        for wordn, (surf, anals) in enumerate(zip(surfs, analyses), start=1):
+            if len(anals) == 1 and 'UNKNOWN' in anals[0][0]:
+                anals = self.guess(surf) or anals
+            lines.append(converter.format_conllu(wordn, surf, anals[0]))
+        lines.append('')
+        return '\n'.join(lines)
 
     def _guess_str(self, s):
         token = (s, "")
@@ -581,27 +926,35 @@ def main():
                    dest="infile", help="source of analysis data")
     a.add_argument('-v', '--verbose', action='store_true',
                    help="print verbosely while processing")
+    a.add_argument('--server', metavar='ADDR',
+                   help="use omorfi server at ADDR instead of loading automata")
+    add_output_arguments(a)
     options = a.parse_args()
-    omorfi = Omorfi(options.verbose)
-    if options.fsa:
-        omorfi.load_from_dir(options.fsa)
+    if options.server:
+        omorfi = OmorfiClient(options.server)
     else:
-        omorfi.load_from_dir()
+        omorfi = Omorfi(options.verbose)
+        if options.fsa:
+            omorfi.load_from_dir(options.fsa)
+        else:
+            omorfi.load_from_dir()
     if not options.infile:
         options.infile = stdin
     if options.verbose:
         print("reading from", options.infile.name)
+    writer = writer_from_args(stdout, options)
     for line in options.infile:
         line = line.strip()
         if not line or line == '':
             continue
         surfs = omorfi.tokenise(line)
-        for surf in surfs:
-            anals = omorfi.analyse(surf)
-            print(surf, end='')
+        for surf, anals in zip(surfs, omorfi.analyse_many(surfs)):
+            writer.write(str(surf))
             for anal in anals:
-                print("\t", anal[0], sep='', end='')
-            print()
+                writer.write("\t" + anal[0])
+            writer.write("\n")
+        writer.end_sentence()
+    writer.close()
     exit(0)
 
 
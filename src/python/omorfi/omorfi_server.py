@@ -0,0 +1,314 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Persistent omorfi server and client over a local socket.
+
+The server keeps the omorfi automata loaded and serves requests over a Unix
+domain socket or a localhost TCP socket using a line-delimited JSON
+protocol. Each request is one line of JSON object with the command name and
+its arguments:
+
+    {"cmd": "analyse", "args": ["kissa"]}
+
+and each response is one line of JSON object with either a result or an
+error:
+
+    {"result": [["[WORD_ID=kissa][UPOS=NOUN]...", 0.0]]}
+    {"error": "unknown command: analyze"}
+
+The responses are strict JSON, so weights that are not finite, such as the
+infinite weight of unknown tokens, are sent as strings "inf", "-inf" or
+"nan".
+
+The client implements the same methods as the Omorfi class, so the CLI
+scripts can use a running server in place of loading the automata.
+"""
+
+import json
+from errno import EADDRINUSE, ECONNREFUSED, EEXIST
+from ipaddress import ip_address
+from math import isfinite
+from os import remove, stat
+from socket import (AF_UNIX, SOCK_STREAM, create_connection, gaierror,
+                    getaddrinfo, socket)
+from socketserver import (StreamRequestHandler, TCPServer, ThreadingMixIn,
+                          UnixStreamServer)
+from stat import S_ISSOCK
+from threading import Lock
+
+# commands that take a token that may be a (surface, misc) tuple
+TOKEN_COMMANDS = ['analyse', 'guess']
+# commands that return a list of analysis or token tuples
+TUPLE_LIST_COMMANDS = ['analyse', 'guess', 'generate', 'lemmatise',
+                       'segment', 'labelsegment', 'tokenise']
+COMMANDS = TUPLE_LIST_COMMANDS + ['analyse_many', 'accept', 'capabilities']
+CAPABILITIES = ['can_analyse', 'can_accept', 'can_tokenise', 'can_generate',
+                'can_lemmatise', 'can_hyphenate', 'can_segment',
+                'can_labelsegment', 'can_guess', 'can_udpipe']
+
+
+def parse_address(address):
+    """Parse server address into a (host, port) pair or a socket path.
+
+    Addresses of form HOST:PORT are TCP sockets, anything else is taken as
+    a path to Unix domain socket.
+    """
+    if ':' in address:
+        host, port = address.rsplit(':', 1)
+        if port.isdigit():
+            return (host or 'localhost', int(port))
+    return address
+
+
+def is_loopback_host(host):
+    """Check if all addresses of host are loopback addresses."""
+    try:
+        infos = getaddrinfo(host, None, type=SOCK_STREAM)
+    except gaierror:
+        return False
+    if not infos:
+        return False
+    for info in infos:
+        address = info[4][0].split('%', 1)[0]
+        if not ip_address(address).is_loopback:
+            return False
+    return True
+
+
+def _socket_id(path):
+    """Get identity of socket file at path or None if there is none.
+
+    Raises FileExistsError if path is some other kind of file.
+    """
+    try:
+        st = stat(path)
+    except FileNotFoundError:
+        return None
+    if not S_ISSOCK(st.st_mode):
+        raise FileExistsError(EEXIST, "refusing to replace non-socket file",
+                              path)
+    return (st.st_dev, st.st_ino, st.st_ctime_ns)
+
+
+def _remove_stale_socket(path):
+    """Remove socket file at path if no server is listening on it.
+
+    Raises OSError with EADDRINUSE if a server accepts connections at path.
+    """
+    if not _socket_id(path):
+        return
+    probe = socket(AF_UNIX, SOCK_STREAM)
+    try:
+        probe.connect(path)
+    except OSError as e:
+        if e.errno != ECONNREFUSED:
+            raise
+        remove(path)
+        return
+    finally:
+        probe.close()
+    raise OSError(EADDRINUSE, "address in use by a running server", path)
+
+
+def _finite2json(value):
+    """Replace non-finite floats in value with their names for JSON."""
+    if isinstance(value, float) and not isfinite(value):
+        return str(value)
+    if isinstance(value, (list, tuple)):
+        return [_finite2json(v) for v in value]
+    if isinstance(value, dict):
+        return {k: _finite2json(v) for k, v in value.items()}
+    return value
+
+
+def _json2weight(weight):
+    if isinstance(weight, str):
+        return float(weight)
+    return weight
+
+
+def _json2token(token):
+    if isinstance(token, list):
+        return tuple(token)
+    return token
+
+
+def _json2tuples(results):
+    if results is None:
+        return None
+    return [tuple(r) for r in results]
+
+
+def _json2analyses(results):
+    if results is None:
+        return None
+    return [(r[0], _json2weight(r[1])) + tuple(r[2:]) for r in results]
+
+
+class _ThreadingUnixServer(ThreadingMixIn, UnixStreamServer):
+    daemon_threads = True
+
+
+class _ThreadingTCPServer(ThreadingMixIn, TCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+class _OmorfiRequestHandler(StreamRequestHandler):
+
+    def handle(self):
+        for line in self.rfile:
+            if not line.strip():
+                continue
+            try:
+                request = json.loads(line.decode('utf-8'))
+                response = {'result': _finite2json(
+                    self.server.omorfi_server.dispatch(
+                        request.get('cmd'), request.get('args', [])))}
+            except Exception as e:
+                response = {'error': str(e)}
+            self.wfile.write(json.dumps(response, allow_nan=False).encode(
+                'utf-8') + b'\n')
+
+
+class OmorfiServer:
+
+    """
+    A server answering omorfi requests of many concurrent clients.
+
+    Each client connection is handled in its own thread, the lookups are
+    serialised on the one loaded Omorfi object. The server has no
+    authentication, so TCP sockets are only opened on loopback addresses
+    unless allow_remote is set.
+    """
+
+    def __init__(self, omorfi, address, allow_remote=False):
+        """Construct server for loaded omorfi listening at address.
+
+        The address is parsed with @c parse_address(address). Raises
+        ValueError if a TCP host is not a loopback address and allow_remote
+        is not set. A stale socket at a Unix socket path is replaced, but
+        OSError with EADDRINUSE is raised if a server still listens on it,
+        and FileExistsError if the path is some other file.
+        """
+        self.omorfi = omorfi
+        self.address = parse_address(address)
+        self._lock = Lock()
+        self._socket_id = None
+        if isinstance(self.address, tuple):
+            if not allow_remote and not is_loopback_host(self.address[0]):
+                raise ValueError("refusing to listen on non-loopback host %s"
+                                 % (self.address[0]))
+            self._server = _ThreadingTCPServer(self.address,
+                                               _OmorfiRequestHandler)
+        else:
+            _remove_stale_socket(self.address)
+            self._server = _ThreadingUnixServer(self.address,
+                                                _OmorfiRequestHandler)
+            self._socket_id = _socket_id(self.address)
+        self._server.omorfi_server = self
+
+    def dispatch(self, cmd, args):
+        """Perform command cmd with args and return JSON-able result."""
+        if cmd not in COMMANDS:
+            raise ValueError("unknown command: %s" % (cmd))
+        if cmd == 'capabilities':
+            return {can: bool(getattr(self.omorfi, can, False))
+                    for can in CAPABILITIES}
+        if cmd in TOKEN_COMMANDS:
+            args = [_json2token(args[0])] + list(args[1:])
+        elif cmd == 'analyse_many':
+            args = [[_json2token(token) for token in args[0]]]
+        with self._lock:
+            return getattr(self.omorfi, cmd)(*args)
+
+    def serve_forever(self):
+        """Serve requests until shut down."""
+        self._server.serve_forever()
+
+    def shutdown(self):
+        """Stop serving and close the socket."""
+        self._server.shutdown()
+        self.close()
+
+    def close(self):
+        """Close the socket and remove the socket file made by server."""
+        self._server.server_close()
+        if self._socket_id:
+            try:
+                if _socket_id(self.address) == self._socket_id:
+                    remove(self.address)
+            except FileExistsError:
+                pass
+            self._socket_id = None
+
+
+class OmorfiClient:
+
+    """
+    A client for omorfi server working in place of Omorfi object.
+
+    The methods analyse, analyse_many, guess, tokenise, generate, lemmatise,
+    segment, labelsegment and accept work as in the Omorfi class, and the
+    can_* attributes are fetched from the server.
+    """
+
+    def __init__(self, address):
+        """Connect to omorfi server at address."""
+        address = parse_address(address)
+        if isinstance(address, tuple):
+            self._socket = create_connection(address)
+        else:
+            self._socket = socket(AF_UNIX, SOCK_STREAM)
+            self._socket.connect(address)
+        self._rfile = self._socket.makefile('rb')
+        self._wfile = self._socket.makefile('wb')
+        for can, value in self._call('capabilities').items():
+            setattr(self, can, value)
+
+    def _call(self, cmd, *args):
+        request = json.dumps({'cmd': cmd, 'args': args})
+        self._wfile.write(request.encode('utf-8') + b'\n')
+        self._wfile.flush()
+        line = self._rfile.readline()
+        if not line:
+            raise ConnectionError("omorfi server closed connection")
+        response = json.loads(line.decode('utf-8'))
+        if 'error' in response:
+            raise RuntimeError("omorfi server: " + response['error'])
+        return response['result']
+
+    def close(self):
+        """Close the connection."""
+        self._rfile.close()
+        self._wfile.close()
+        self._socket.close()
+
+    def analyse(self, token):
+        return _json2analyses(self._call('analyse', token))
+
+    def analyse_many(self, tokens):
+        return [_json2analyses(anals) for anals in
+                self._call('analyse_many', list(tokens))]
+
+    def guess(self, token):
+        return _json2analyses(self._call('guess', token))
+
+    def tokenise(self, line):
+        return _json2tuples(self._call('tokenise', line))
+
+    def generate(self, omorstring):
+        return _json2analyses(self._call('generate', omorstring))
+
+    def lemmatise(self, token):
+        return _json2analyses(self._call('lemmatise', token))
+
+    def segment(self, token):
+        return _json2analyses(self._call('segment', token))
+
+    def labelsegment(self, token):
+        return _json2analyses(self._call('labelsegment', token))
+
+    def accept(self, token):
+        return self._call('accept', token)
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Buffered output of the command line tools a sentence at a time.
+
+The tools give the output of each sentence to @c SentenceWriter.write in
+pieces and call @c SentenceWriter.end_sentence after it. The pieces are
+joined and encoded once per sentence and written to a large buffered
+binary stream on the file descriptor of the output file, so printing a
+token costs no print calls or system calls. The buffer is flushed after
+every N sentences given with the --flush-every option added by
+@c add_output_arguments, by default after each sentence when writing to a
+terminal and otherwise only when the buffer is full.
+"""
+
+# Author: Omorfi contributors <omorfi-devel@groups.google.com> 2015
+
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import atexit
+
+# size of the binary output buffer in bytes
+BUFFER_SIZE = 1 << 20
+
+
+def add_output_arguments(ap):
+    """Add --flush-every option to argument parser ap."""
+    ap.add_argument("--flush-every", metavar="SENTS", type=int, default=None,
+                    help="flush output after every SENTS sentences, 0 only "
+                    "when buffer is full (default: 1 on terminal, else 0)")
+
+
+def writer_from_args(outfile, args):
+    """Create SentenceWriter for outfile using parsed output options."""
+    return SentenceWriter(outfile, args.flush_every)
+
+
+class SentenceWriter:
+    """Writer collecting output of a sentence into one buffered write.
+
+    If the outfile has no file descriptor, e.g. it is a StringIO, the
+    sentences are written to it as strings.
+    """
+
+    def __init__(self, outfile, flush_every=None, buffer_size=BUFFER_SIZE):
+        self.outfile = outfile
+        self.parts = []
+        self.sentences = 0
+        self.stream = None
+        self.encoding = getattr(outfile, 'encoding', None) or 'utf-8'
+        self.errors = getattr(outfile, 'errors', None) or 'strict'
+        try:
+            fileno = outfile.fileno()
+        except (AttributeError, OSError, ValueError):
+            fileno = None
+        if fileno is not None:
+            # anything printed to outfile before must come out first
+            outfile.flush()
+            self.stream = open(fileno, 'wb', buffering=buffer_size,
+                               closefd=False)
+        if flush_every is None:
+            isatty = getattr(outfile, 'isatty', None)
+            flush_every = 1 if isatty and isatty() else 0
+        self.flush_every = flush_every
+        atexit.register(self.flush)
+
+    def write(self, s):
+        """Add string s to the output of current sentence."""
+        self.parts.append(s)
+
+    def end_sentence(self):
+        """Write the output of current sentence, flushing every N sentences."""
+        self._write_parts()
+        self.sentences += 1
+        if self.flush_every and self.sentences % self.flush_every == 0:
+            self.flush()
+
+    def _write_parts(self):
+        if not self.parts:
+            return
+        s = ''.join(self.parts)
+        self.parts = []
+        if self.stream:
+            self.stream.write(s.encode(self.encoding, self.errors))
+        else:
+            self.outfile.write(s)
+
+    def flush(self):
+        """Write everything given so far to outfile."""
+        self._write_parts()
+        if self.stream:
+            self.stream.flush()
+        else:
+            self.outfile.flush()
+
+    def close(self):
+        """Flush the output, so outfile can be written directly again.
+
+        The outfile itself is left open.
+        """
+        self.flush()
+        if self.stream:
+            self.stream.close()
+            self.stream = None
+        atexit.unregister(self.flush)
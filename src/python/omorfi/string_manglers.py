@@ -30,28 +30,71 @@ from .error_logging import fail_guess_because
 # Xerox stuff
 
 
+# characters escaped with % in lexc and twolc
+lexc_specials = '% <>0!:";'
+twolc_specials = '% @<>0!:";_^(){}-[]/?+|&*=$,'
+
+re_lexc_specials = re.compile('[' + re.escape(lexc_specials) + ']')
+re_twolc_specials = re.compile('[' + re.escape(twolc_specials) + ']')
+re_lexc_escaped = re.compile('%([' + re.escape(lexc_specials) + '])')
+re_twolc_escaped = re.compile('%([' + re.escape(twolc_specials) + '])')
+
+
+def _percent_escape(match):
+    return '%' + match.group()
+
+
+def _percent_unescape(match):
+    return match.group(1)
+
+
+def percent_escape(s, specials):
+    '''Escape characters matching specials regex with % in one pass.'''
+    if specials.search(s) is None:
+        return s
+    return specials.sub(_percent_escape, s)
+
+
+def percent_escapes(ss, specials):
+    '''Escape list of strings with % in one pass over all of them.
+
+    The strings are joined with newlines for one substitution and split
+    back, strings that contain newlines themselves are escaped one by one.
+    '''
+    joined = '\n'.join(ss)
+    if joined.count('\n') != len(ss) - 1:
+        return [percent_escape(s, specials) for s in ss]
+    return percent_escape(joined, specials).split('\n')
+
+
 def lexc_escape(s):
     '''Escape symbols that have special meaning in lexc.'''
-    s = s.replace("%", "__PERCENT__")
-    s = s.replace(" ", "% ")
-    s = s.replace("<", "%<")
-    s = s.replace(">", "%>")
-    s = s.replace("0", "%0")
-    s = s.replace("!", "%!")
-    s = s.replace(":", "%:")
-    s = s.replace('"', '%"')
-    s = s.replace(";", "%;")
-    s = s.replace("__PERCENT__", "%%")
-    return s
+    return percent_escape(s, re_lexc_specials)
+
+
+def lexc_escapes(ss):
+    '''Escape list of strings for lexc.'''
+    return percent_escapes(ss, re_lexc_specials)
+
+
+def lexc_unescape(s):
+    '''Remove escapes added by lexc_escape.'''
+    return re_lexc_escaped.sub(_percent_unescape, s)
 
 
 def twolc_escape(s):
     '''Escape symbols that have special meaning in twolc.'''
-    s = s.replace("%", "__PERCENT__")
-    for c in ' @<>0!:";_^(){}-[]/?+|&*=$,':
-        s = s.replace(c, "%" + c)
-    s = s.replace("%_%_PERCENT%_%_", "%%")
-    return s
+    return percent_escape(s, re_twolc_specials)
+
+
+def twolc_escapes(ss):
+    '''Escape list of strings for twolc.'''
+    return percent_escapes(ss, re_twolc_specials)
+
+
+def twolc_unescape(s):
+    '''Remove escapes added by twolc_escape.'''
+    return re_twolc_escaped.sub(_percent_unescape, s)
 
 
 def egrep2xerox(s, multichars=None):
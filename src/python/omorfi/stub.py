@@ -4,6 +4,32 @@ from .error_logging import fail_guess_because
 from .string_manglers import mangle_suffixes_or_die
 
 
+def stub_column(stubs, deletions):
+    '''Stub a column of stubs at once.
+
+    The deletions is a deletion for all stubs or a list of deletions
+    parallel to stubs, empty or None deletion leaves the stub as is. Returns
+    lists of stubs and bracketstubs, with None for stubs that could not be
+    stubbed.
+    '''
+    if deletions is None or isinstance(deletions, str):
+        deletions = [deletions] * len(stubs)
+    newstubs = []
+    bracketstubs = []
+    for s, deletion in zip(stubs, deletions):
+        if not deletion:
+            newstubs.append(s)
+            bracketstubs.append(s)
+        elif s.endswith(deletion):
+            newstubs.append(s[:-len(deletion)])
+            bracketstubs.append(s[:-len(deletion)] + '<Del>→' +
+                                s[-len(deletion):])
+        else:
+            newstubs.append(None)
+            bracketstubs.append(s)
+    return newstubs, bracketstubs
+
+
 def stub_all_new_para(wordmap, stubmap):
     if not wordmap['new_para']:
         return wordmap
@@ -19,6 +45,33 @@ def stub_all_new_para(wordmap, stubmap):
     return wordmap
 
 
+def stub_all_new_para_column(wordmaps, stubmap):
+    '''Cut the deletions of new_paras from stubs of a list of wordmaps.
+
+    Works like stub_all_new_para on each wordmap, but the stubs with
+    deletions are stubbed at once with stub_column. Returns list of
+    wordmaps, with None for those that could not be stubbed.
+    '''
+    stubbed = list(wordmaps)
+    column = []
+    for i, wordmap in enumerate(wordmaps):
+        if wordmap['new_para'] and stubmap.get(wordmap['new_para']):
+            column.append(i)
+        else:
+            stubbed[i] = stub_all_new_para(wordmap, stubmap)
+    newstubs, bracketstubs = stub_column(
+        [wordmaps[i]['stub'] for i in column],
+        [stubmap[wordmaps[i]['new_para']] for i in column])
+    for i, newstub, bracketstub in zip(column, newstubs, bracketstubs):
+        if newstub is None:
+            # let the old code complain and die
+            stubbed[i] = stub_all_new_para(wordmaps[i], stubmap)
+        else:
+            wordmaps[i]['stub'] = newstub
+            wordmaps[i]['bracketstub'] = bracketstub
+    return stubbed
+
+
 def stub_all_ktn(wordmap):
     '''Generate unmodifiable stub for inflectional processes.
     this cuts every morphologically varying character.
@@ -0,0 +1,522 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Interned omor tag vocabulary and integer coded analyses.
+
+The omor strings of analyses repeat the same few hundred [KEY=VALUE] tags,
+@c TagVocabulary gives each tag of the omor formatter tables a number so
+that an analysis can be stored as an array('H') of tag codes. The open
+valued WORD_ID and WEIGHT tags and any text the vocabulary does not know
+are kept in a string table of the vocabulary and coded as the index to it,
+so the coding is lossless and @c TagVocabulary.decode gives back the
+original omor string. Analyses can be decoded in bulk to omor strings, UD
+features or ftb3 tags.
+
+The string table grows when new strings are encoded, so arrays must be
+decoded with the vocabulary that encoded them. A separate array for each
+analysis costs about as much memory as the omor string because of the
+per-object overhead, @c TagVocabulary.encode_many packs many analyses
+into one array that takes a fraction of the memory of the strings.
+"""
+
+# Author: Omorfi contributors <omorfi-devel@groups.google.com> 2015
+
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import re
+from array import array
+from sys import intern
+from threading import Lock
+
+from .analysis import re_tag, strip_homonym
+from .ftb3_formatter import Ftb3Formatter
+from .omor_formatter import OmorFormatter
+from .string_manglers import lexc_unescape
+
+# codes below FIRST_TAG are followed by two codes of string table index
+WORD_ID = 0
+WEIGHT = 1
+VERBATIM = 2
+FIRST_TAG = 3
+MAX_CODES = 0x10000
+
+# prefixes and suffixes of the string coded tags
+_open_prefixes = ('[WORD_ID=', '[WEIGHT=', '')
+_open_suffixes = (']', ']', '')
+
+# tags, or runs of text outside tags, of omor strings
+re_omor_token = re.compile(r"\[[^]=]*=[^]]*\]|[^[]+|\[")
+
+# keys that start feats of a new word in UD and ftb3
+_word_keys = ('WORD_ID', 'BOUNDARY')
+
+# UD derivations from DRV and LEX values
+_ud_derivations = ('INEN', 'JA', 'LAINEN', 'LLINEN', 'MINEN', 'STI', 'TAR',
+                   'TON', 'TTAA', 'TTAIN', 'U', 'VS')
+_ud_non_derivations = ('S', 'MAISILLA', 'VA', 'MATON', 'UUS', 'ADE', 'INE',
+                       'ELA', 'ILL', 'NEN', 'MPI', 'IN', 'HKO', 'ISA',
+                       'MAINEN', 'NUT', 'TU', 'TAVA', 'MA', 'LOC', 'LA')
+_ud_ignored_keys = ('UPOS', 'ALLO', 'WEIGHT', 'CASECHANGE', 'NEWPARA',
+                    'GUESS', 'PROPER', 'POSITION', 'SEM', 'CONJ')
+
+_default_vocabulary = None
+
+
+def omor_vocabulary_tags():
+    """Get sorted list of all single omor tags of omor formatter tables."""
+    tables = OmorFormatter.common_multichars | OmorFormatter.old_poses | \
+        OmorFormatter.allo_multichars | OmorFormatter.ktnkav_multichars | \
+        set(OmorFormatter.stuff2omor.values())
+    tags = set()
+    for omor in tables:
+        for key, value in re_tag.findall(omor):
+            if key not in ('WORD_ID', 'WEIGHT'):
+                tags.add('[' + key + '=' + value + ']')
+    return sorted(tags)
+
+
+def ud_feats_for_tag(key, value, hacks=None):
+    """Get UD features set by omor tag key=value.
+
+    Returns tuple of (feature, value) pairs in the order they are set, value
+    None means the feature is removed. Returns None for tags that have no
+    UD conversion.
+    """
+    if key == 'CASE':
+        if value == 'LAT' and hacks != 'ftb':
+            # XXX: hack to retain compability
+            return (('Number', 'Sing'),)
+        return (('Case', value[0] + value[1:].lower()),)
+    elif key == 'NUM':
+        if value == 'SG':
+            return (('Number', 'Sing'),)
+        elif value == 'PL':
+            return (('Number', 'Plur'),)
+    elif key == 'TENSE':
+        if 'PRESENT' in value:
+            return (('Tense', 'Pres'),)
+        elif 'PAST' in value:
+            return (('Tense', 'Past'),)
+    elif key == 'MOOD':
+        moods = {'INDV': 'Ind', 'COND': 'Cnd', 'IMPV': 'Imp'}
+        return (('VerbForm', 'Fin'),
+                ('Mood', moods.get(value, value[0] + value[1:].lower())))
+    elif key == 'VOICE':
+        if value == 'PSS':
+            return (('Voice', 'Pass'),)
+        elif value == 'ACT':
+            return (('Voice', 'Act'),)
+    elif key in ('PERS', 'POSS'):
+        psor = '[psor]' if key == 'POSS' else ''
+        feats = []
+        if 'SG' in value:
+            feats.append(('Number' + psor, 'Sing'))
+        elif 'PL' in value:
+            feats.append(('Number' + psor, 'Plur'))
+        for person in '123':
+            if person in value:
+                feats.append(('Person' + psor, person))
+                break
+        return tuple(feats)
+    elif key == 'NEG':
+        if value == 'CON':
+            # XXX
+            return (('Connegative', 'Yes'), ('Voice', None))
+        elif value == 'NEG':
+            return (('Polarity', 'Neg'), ('VerbForm', 'Fin'))
+    elif key == 'PCP':
+        partforms = {'VA': 'Pres', 'NUT': 'Past', 'MA': 'Agent',
+                     'MATON': 'Neg'}
+        if value in partforms:
+            return (('VerbForm', 'Part'), ('PartForm', partforms[value]))
+        return (('VerbForm', 'Part'),)
+    elif key == 'INF':
+        if value == 'A':
+            return (('VerbForm', 'Inf'), ('InfForm', '1'))
+        elif value == 'E':
+            # XXX
+            return (('VerbForm', 'Inf'), ('InfForm', '2'), ('Number', 'Sing'))
+        elif value == 'MA':
+            # XXX
+            return (('VerbForm', 'Inf'), ('InfForm', '3'), ('Number', 'Sing'))
+        elif value == 'MINEN':
+            return (('VerbForm', 'Inf'), ('InfForm', '4'))
+        elif value == 'MAISILLA':
+            return (('VerbForm', 'Inf'), ('InfForm', '5'))
+        return (('VerbForm', 'Inf'),)
+    elif key == 'CMP':
+        degrees = {'SUP': 'Sup', 'CMP': 'Cmp', 'POS': 'Pos'}
+        if value in degrees:
+            return (('Degree', degrees[value]),)
+    elif key == 'SUBCAT':
+        if value == 'NEG':
+            return (('Polarity', 'Neg'), ('VerbForm', 'Fin'))
+        elif value == 'QUANTIFIER':
+            return (('PronType', 'Ind'),)
+        elif value == 'REFLEXIVE':
+            return (('Reflexive', 'Yes'),)
+        elif value in ('COMMA', 'DASH', 'QUOTATION', 'BRACKET', 'DECIMAL',
+                       'ROMAN'):
+            # punctuation classes and decimal, roman NumType not in UD
+            return ()
+        return None
+    elif key == 'ABBR':
+        # XXX?
+        return (('Abbr', 'Yes'),)
+    elif key in ('NUMTYPE', 'PRONTYPE', 'ADPTYPE', 'CLIT', 'FOREIGN'):
+        feat = {'NUMTYPE': 'NumType', 'PRONTYPE': 'PronType',
+                'ADPTYPE': 'AdpType', 'CLIT': 'Clitic',
+                'FOREIGN': 'Foreign'}[key]
+        return ((feat, value[0] + value[1:].lower()),)
+    elif key == 'STYLE':
+        if value in ('DIALECTAL', 'COLLOQUIAL'):
+            return (('Style', 'Coll'),)
+        elif value == 'NONSTANDARD':
+            # XXX: Non-standard spelling is kind of a typo?
+            return (('Typo', 'Yes'),)
+        elif value == 'ARCHAIC':
+            return (('Style', 'Arch'),)
+        elif value == 'RARE':
+            return ()
+        return None
+    elif key in ('DRV', 'LEX'):
+        if value in _ud_derivations:
+            return (('Derivation', value[0] + value[1:].lower()),)
+        elif value in _ud_non_derivations:
+            return ()
+        return None
+    elif key in _ud_ignored_keys:
+        return ()
+    else:
+        return None
+    return ()
+
+
+def omor2ftb3_tags():
+    """Get dict of ftb3 tag strings for single omor tags.
+
+    The omor and ftb3 formatters share the keys of their tables, when
+    several keys give same omor tag, the first one is used.
+    """
+    omor2ftb3 = dict()
+    for stuff, omor in OmorFormatter.stuff2omor.items():
+        if stuff not in Ftb3Formatter.stuff2ftb3 or omor in omor2ftb3:
+            continue
+        tags = re_tag.findall(omor)
+        if len(tags) != 1:
+            continue
+        ftb3 = Ftb3Formatter.stuff2ftb3[stuff]
+        if ftb3 == '#':
+            ftb3 = ''
+        omor2ftb3[omor] = lexc_unescape(ftb3)
+    return omor2ftb3
+
+
+def get_tag_vocabulary():
+    """Get the tag vocabulary shared by the whole process."""
+    global _default_vocabulary
+    if _default_vocabulary is None:
+        _default_vocabulary = TagVocabulary()
+    return _default_vocabulary
+
+
+class TagVocabulary:
+
+    """
+    Numbering of omor tags for compact storage of analyses.
+
+    The tags get codes from FIRST_TAG on in sorted order, so they are the
+    same for all vocabularies of the same omorfi version. WORD_ID and
+    WEIGHT values and unknown text are added to the string table of the
+    vocabulary when they are first encoded.
+    """
+
+    def __init__(self, tags=None):
+        if tags is None:
+            tags = omor_vocabulary_tags()
+        if len(tags) + FIRST_TAG > MAX_CODES:
+            raise ValueError("too many tags for 16 bit codes: %d" %
+                             len(tags))
+        self.tags = (None,) * FIRST_TAG + tuple(intern(tag) for tag in tags)
+        self.codes = {tag: code for code, tag in enumerate(self.tags)
+                      if code >= FIRST_TAG}
+        self.keys = (None,) * FIRST_TAG + \
+            tuple(tag[1:tag.index('=')] for tag in tags)
+        self.strings = []
+        self.string_indices = dict()
+        self.lock = Lock()
+        self._ud_feats = dict()
+        self._ftb3_tags = None
+
+    def __len__(self):
+        return len(self.tags) - FIRST_TAG
+
+    def string_index(self, s):
+        """Get index of s in the string table, adding it if needed."""
+        index = self.string_indices.get(s)
+        if index is None:
+            with self.lock:
+                index = self.string_indices.get(s)
+                if index is None:
+                    index = len(self.strings)
+                    if index >= MAX_CODES * MAX_CODES:
+                        raise ValueError("string table is full")
+                    s = intern(s)
+                    self.strings.append(s)
+                    self.string_indices[s] = index
+        return index
+
+    def _encode_into(self, omorstring, codes):
+        """Append codes of omorstring to array codes."""
+        tagcodes = self.codes
+        for token in re_omor_token.findall(omorstring):
+            code = tagcodes.get(token)
+            if code is not None:
+                codes.append(code)
+                continue
+            if token.startswith('[WORD_ID=') and token.endswith(']'):
+                code = WORD_ID
+                token = token[len('[WORD_ID='):-1]
+            elif token.startswith('[WEIGHT=') and token.endswith(']'):
+                code = WEIGHT
+                token = token[len('[WEIGHT='):-1]
+            else:
+                code = VERBATIM
+            index = self.string_index(token)
+            codes.append(code)
+            codes.append(index >> 16)
+            codes.append(index & 0xffff)
+
+    def encode(self, omorstring):
+        """Encode omor string as array('H') of codes."""
+        codes = array('H')
+        self._encode_into(omorstring, codes)
+        return codes
+
+    def encode_many(self, omorstrings):
+        """Encode omor strings into one array('H').
+
+        Each analysis is preceded by the count of its codes.
+        """
+        codes = array('H')
+        for omorstring in omorstrings:
+            start = len(codes)
+            codes.append(0)
+            self._encode_into(omorstring, codes)
+            length = len(codes) - start - 1
+            if length >= MAX_CODES:
+                raise ValueError("analysis too long to encode: " + omorstring)
+            codes[start] = length
+        return codes
+
+    def split_many(self, codes):
+        """Get list of code arrays of each analysis in encode_many codes."""
+        parts = []
+        i = 0
+        n = len(codes)
+        while i < n:
+            length = codes[i]
+            parts.append(codes[i + 1:i + 1 + length])
+            i += 1 + length
+        return parts
+
+    def decode(self, codes):
+        """Decode codes of one analysis to omor string."""
+        tags = self.tags
+        strings = self.strings
+        omor = []
+        i = 0
+        n = len(codes)
+        while i < n:
+            code = codes[i]
+            if code >= FIRST_TAG:
+                omor.append(tags[code])
+                i += 1
+            else:
+                omor.append(_open_prefixes[code])
+                omor.append(strings[(codes[i + 1] << 16) | codes[i + 2]])
+                omor.append(_open_suffixes[code])
+                i += 3
+        return ''.join(omor)
+
+    def decode_many(self, codes):
+        """Decode codes of encode_many to list of omor strings."""
+        return [self.decode(part) for part in self.split_many(codes)]
+
+    def decode_tags(self, codes):
+        """Decode codes of one analysis to list of (key, value) tags."""
+        tags = []
+        i = 0
+        n = len(codes)
+        while i < n:
+            code = codes[i]
+            if code >= FIRST_TAG:
+                key = self.keys[code]
+                tags.append((key, self.tags[code][len(key) + 2:-1]))
+                i += 1
+            else:
+                s = self.strings[(codes[i + 1] << 16) | codes[i + 2]]
+                if code == WORD_ID:
+                    tags.append(('WORD_ID', s))
+                elif code == WEIGHT:
+                    tags.append(('WEIGHT', s))
+                else:
+                    tags += re_tag.findall(s)
+                i += 3
+        return tags
+
+    def lemmas(self, codes):
+        """Get lemmas of the WORD_IDs of codes, homonym numbers stripped."""
+        lemmas = []
+        i = 0
+        n = len(codes)
+        while i < n:
+            if codes[i] >= FIRST_TAG:
+                i += 1
+                continue
+            if codes[i] == WORD_ID:
+                lemmas.append(strip_homonym(
+                    self.strings[(codes[i + 1] << 16) | codes[i + 2]]))
+            i += 3
+        return lemmas
+
+    def ud_feats_table(self, hacks=None):
+        """Get tuple of UD features set by each tag code.
+
+        Codes of WORD_ID and BOUNDARY tags that start a new word have False
+        and tags without UD conversion None.
+        """
+        table = self._ud_feats.get(hacks)
+        if table is None:
+            table = [False] + [()] * (FIRST_TAG - 1)
+            for code in range(FIRST_TAG, len(self.tags)):
+                key = self.keys[code]
+                if key in _word_keys:
+                    table.append(False)
+                else:
+                    value = self.tags[code][len(key) + 2:-1]
+                    table.append(ud_feats_for_tag(key, value, hacks))
+            table = self._ud_feats[hacks] = tuple(table)
+        return table
+
+    def decode_ud_feats(self, codes, hacks=None):
+        """Decode codes of one analysis to UD FEATS field.
+
+        The features come from the tags of the last word like in
+        omorfi-conllu.py, '_' is returned if there are none. Raises
+        ValueError if the last word has a tag without UD conversion.
+        """
+        table = self.ud_feats_table(hacks)
+        rvs = dict()
+        unhandled = None
+        i = 0
+        n = len(codes)
+        while i < n:
+            code = codes[i]
+            if code >= FIRST_TAG:
+                feats = table[code]
+                i += 1
+            elif code == VERBATIM:
+                unhandled = self._ud_feats_verbatim(
+                    self.strings[(codes[i + 1] << 16) | codes[i + 2]], rvs,
+                    hacks, unhandled)
+                i += 3
+                continue
+            else:
+                feats = table[code]
+                i += 3
+            if feats is False:
+                rvs.clear()
+                unhandled = None
+            elif feats is None:
+                unhandled = self.decode(codes[i - 1:i])
+            else:
+                for feat, value in feats:
+                    if value is None:
+                        rvs.pop(feat, None)
+                    else:
+                        rvs[feat] = value
+        if unhandled is not None:
+            raise ValueError("Unhandled %s in %s" % (unhandled,
+                                                     self.decode(codes)))
+        if not rvs:
+            return '_'
+        return '|'.join(k + '=' + rvs[k] for k in sorted(rvs, key=str.lower))
+
+    def _ud_feats_verbatim(self, s, rvs, hacks, unhandled):
+        """Apply UD features of tags in verbatim string s to rvs.
+
+        Returns the last tag of current word without UD conversion, or
+        unhandled from before s if there is none.
+        """
+        for key, value in re_tag.findall(s):
+            if key in _word_keys:
+                rvs.clear()
+                unhandled = None
+                continue
+            feats = ud_feats_for_tag(key, value, hacks)
+            if feats is None:
+                unhandled = '[%s=%s]' % (key, value)
+                continue
+            for feat, featvalue in feats:
+                if featvalue is None:
+                    rvs.pop(feat, None)
+                else:
+                    rvs[feat] = featvalue
+        return unhandled
+
+    def decode_many_ud_feats(self, codes, hacks=None):
+        """Decode codes of encode_many to list of UD FEATS fields."""
+        return [self.decode_ud_feats(part, hacks)
+                for part in self.split_many(codes)]
+
+    def ftb3_table(self):
+        """Get tuple of ftb3 tag strings of each tag code.
+
+        Codes of WORD_ID and BOUNDARY tags that start a new word have None.
+        """
+        if self._ftb3_tags is None:
+            omor2ftb3 = omor2ftb3_tags()
+            table = [None] + [''] * (FIRST_TAG - 1)
+            for code in range(FIRST_TAG, len(self.tags)):
+                if self.keys[code] in _word_keys:
+                    table.append(None)
+                else:
+                    table.append(omor2ftb3.get(self.tags[code], ''))
+            self._ftb3_tags = tuple(table)
+        return self._ftb3_tags
+
+    def decode_ftb3(self, codes):
+        """Decode codes of one analysis to ftb3 style analysis.
+
+        The lemmas of compound parts are joined with # and followed by the
+        ftb3 tags of the omor tags of the last part, in omor order.
+        """
+        table = self.ftb3_table()
+        tags = []
+        i = 0
+        n = len(codes)
+        while i < n:
+            code = codes[i]
+            ftb3 = table[code]
+            i += 1 if code >= FIRST_TAG else 3
+            if ftb3 is None:
+                tags = []
+            elif ftb3:
+                tags.append(ftb3)
+        return '#'.join(self.lemmas(codes)) + ''.join(tags)
+
+    def decode_many_ftb3(self, codes):
+        """Decode codes of encode_many to list of ftb3 style analyses."""
+        return [self.decode_ftb3(part) for part in self.split_many(codes)]
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Unit test to check that analysis tags are parsed right."""
+
+# Author: Omorfi contributors <omorfi-devel@groups.google.com> 2015
+
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import unittest
+
+from .analysis import Analysis
+
+
+class AnalysisTest(unittest.TestCase):
+
+    omor = ('[WORD_ID=koira_2][UPOS=NOUN][NUM=SG][CASE=NOM]'
+            '[BOUNDARY=COMPOUND][WORD_ID=talo][UPOS=NOUN][NUM=PL][CASE=INE]'
+            '[WEIGHT=2.500000]')
+
+    def test_tuple(self):
+        anal = Analysis((self.omor, 2.5))
+        self.assertEqual(anal[0], self.omor)
+        self.assertEqual(len(anal), 2)
+        omor, weight = anal
+        self.assertEqual(weight, 2.5)
+        self.assertEqual(anal, (self.omor, 2.5))
+        self.assertIsNone(anal.misc)
+        self.assertIs(Analysis.from_tuple(anal), anal)
+
+    def test_tags(self):
+        anal = Analysis((self.omor, 2.5, 'LowerCased=Koiratalo'))
+        self.assertEqual(anal.misc, 'LowerCased=Koiratalo')
+        self.assertEqual(anal.lemmas, ('koira', 'talo'))
+        self.assertEqual(anal.get_feats('WORD_ID'), ['koira_2', 'talo'])
+        self.assertEqual(anal.upos, 'NOUN')
+        self.assertEqual(anal.get_last_feat('CASE'), 'INE')
+        self.assertEqual(anal.get_last_feat('DRV'), '')
+        self.assertEqual(anal.feats, {'UPOS': 'NOUN', 'NUM': 'PL',
+                                      'CASE': 'INE', 'WEIGHT': '2.500000'})
+        self.assertEqual(len(anal.parts), 2)
+        self.assertEqual(anal.parts[0], (('WORD_ID', 'koira_2'),
+                                         ('UPOS', 'NOUN'), ('NUM', 'SG'),
+                                         ('CASE', 'NOM')))
+        self.assertIs(anal.tags, anal.tags)
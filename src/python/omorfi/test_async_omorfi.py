@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Unit test to check that async omorfi runs concurrent lookups."""
+
+# Author: Omorfi contributors <omorfi-devel@groups.google.com> 2015
+
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import asyncio
+import unittest
+from os import getpid
+from threading import Lock
+from time import sleep
+
+from .async_omorfi import AsyncOmorfi
+
+
+class StubOmorfi:
+
+    """Analyser stub recording how many lookups run at the same time."""
+
+    def __init__(self):
+        self.running = 0
+        self.max_running = 0
+        self._lock = Lock()
+
+    def analyse(self, token):
+        with self._lock:
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+        sleep(0.001)
+        with self._lock:
+            self.running -= 1
+        return [('[WORD_ID=' + token + ']', 0.0, getpid())]
+
+
+async def analyse_all(async_omorfi, tokens):
+    return await asyncio.gather(*[async_omorfi.analyse(token)
+                                  for token in tokens])
+
+
+class AsyncOmorfiTest(unittest.TestCase):
+
+    tokens = ['sana%d' % (i) for i in range(50)]
+
+    def check_results(self, results):
+        self.assertEqual([anals[0][0] for anals in results],
+                         ['[WORD_ID=' + token + ']' for token in self.tokens])
+
+    def test_threads(self):
+        stub = StubOmorfi()
+        async_omorfi = AsyncOmorfi(stub, max_workers=4, max_in_flight=8)
+        try:
+            results = asyncio.run(analyse_all(async_omorfi, self.tokens))
+        finally:
+            async_omorfi.close()
+        self.check_results(results)
+        # lookups on the shared object are serialised
+        self.assertEqual(stub.max_running, 1)
+        self.assertEqual(results[0][0][2], getpid())
+
+    def test_loops(self):
+        async_omorfi = AsyncOmorfi(StubOmorfi(), max_in_flight=8)
+        try:
+            for _ in range(2):
+                results = asyncio.run(analyse_all(async_omorfi, self.tokens))
+                self.check_results(results)
+        finally:
+            async_omorfi.close()
+
+    def test_processes(self):
+        async_omorfi = AsyncOmorfi(StubOmorfi(), max_workers=2,
+                                   max_in_flight=8, processes=True)
+        try:
+            results = asyncio.run(analyse_all(async_omorfi, self.tokens))
+            with self.assertRaises(RuntimeError):
+                async_omorfi.load_from_dir()
+        finally:
+            async_omorfi.close()
+        self.check_results(results)
+        self.assertNotIn(getpid(), [anals[0][2] for anals in results])
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Unit test to check that build timings are reported."""
+
+# Author: Omorfi contributors <omorfi-devel@groups.google.com> 2015
+
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import json
+import unittest
+from multiprocessing import get_context
+from os.path import join
+from tempfile import TemporaryDirectory
+
+from .build_timings import BuildTimings
+
+# timings shared with the forked worker, as in the build scripts
+_timings = None
+
+
+def _start_worker():
+    _timings.start_worker('format')
+
+
+def _busy_worker():
+    """Spend some CPU in format and write phases of the worker."""
+    sum(i * i for i in range(200000))
+    with _timings.phase('write'):
+        sum(i * i for i in range(200000))
+    return _timings.take_phases()
+
+
+class BuildTimingsTest(unittest.TestCase):
+
+    def test_disabled(self):
+        timings = BuildTimings('test')
+        self.assertIsNone(timings.switch('read'))
+        timings.count(10)
+        timings.finish()
+        self.assertEqual(timings.phases, {})
+
+    def test_report(self):
+        with TemporaryDirectory() as tmpdir:
+            timingsname = join(tmpdir, 'timings.json')
+            timings = BuildTimings('test', timingsname)
+            timings.switch('read')
+            timings.count(2)
+            with timings.phase('format'):
+                timings.count(1)
+            self.assertEqual(timings.switch('write'), 'read')
+            timings.finish()
+            with open(timingsname) as timingsfile:
+                report = json.load(timingsfile)
+        self.assertEqual(report['step'], 'test')
+        self.assertEqual(report['rows'], 3)
+        self.assertEqual(sorted(report['phases']),
+                         ['format', 'read', 'write'])
+        self.assertGreaterEqual(report['wall'],
+                                report['phases']['read']['wall'])
+
+    def test_worker_phases(self):
+        global _timings
+        with TemporaryDirectory() as tmpdir:
+            timingsname = join(tmpdir, 'timings.json')
+            timings = _timings = BuildTimings('test', timingsname)
+            timings.switch('read')
+            with get_context('fork').Pool(1, _start_worker) as pool:
+                timings.switch('wait')
+                phases = pool.apply(_busy_worker)
+            timings.merge_phases(phases)
+            timings.finish()
+            with open(timingsname) as timingsfile:
+                report = json.load(timingsfile)
+        self.assertEqual(sorted(phases), ['format', 'write'])
+        self.assertEqual(sorted(report['phases']),
+                         ['format', 'read', 'wait', 'write'])
+        self.assertGreater(report['worker_cpu'], 0.0)
+        self.assertGreaterEqual(report['cpu'], report['worker_cpu'])
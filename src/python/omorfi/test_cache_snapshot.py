@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Unit test to check that analysis cache snapshots are saved and checked."""
+
+# Author: Omorfi contributors <omorfi-devel@groups.google.com> 2015
+
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import gzip
+import json
+import unittest
+from collections import OrderedDict
+from os.path import join
+from tempfile import TemporaryDirectory
+
+from .cache_snapshot import (dump_cache_snapshot, file_signature,
+                             load_cache_snapshot, read_frequency_list)
+
+
+class CacheSnapshotTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = TemporaryDirectory()
+        self.automaton = join(self.tmpdir.name, 'omorfi.analyse.hfst')
+        with open(self.automaton, 'wb') as automaton:
+            automaton.write(b'not really an automaton')
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_frequency_list(self):
+        freqfile = join(self.tmpdir.name, 'freqs')
+        with open(freqfile, 'w') as freqs:
+            freqs.write("115362474\t,\n63108890\tja\n1 000\n\n12\tx\ty\n")
+        self.assertEqual(read_frequency_list(freqfile),
+                         [',', 'ja', '1 000', 'x\ty'])
+        self.assertEqual(read_frequency_list(freqfile, 2), [',', 'ja'])
+
+    def test_snapshot(self):
+        cache = OrderedDict()
+        cache[('talo', None, True, True, True, False)] = \
+            (('[WORD_ID=talo][UPOS=NOUN][NUM=SG][CASE=NOM]', 0.0),)
+        cache[('xyz',)] = (('[WORD_ID=xyz][GUESS=UNKNOWN][WEIGHT=inf]',
+                            float('inf'), 'Unknown'),)
+        snapfile = join(self.tmpdir.name, 'cache.snapshot')
+        self.assertEqual(dump_cache_snapshot(cache, self.automaton,
+                                             snapfile), 2)
+        self.assertEqual(load_cache_snapshot(snapfile, self.automaton),
+                         list(cache.items()))
+        self.assertEqual(load_cache_snapshot(snapfile + '.missing',
+                                             self.automaton), [])
+
+    def test_stale_snapshot(self):
+        snapfile = join(self.tmpdir.name, 'cache.snapshot')
+        dump_cache_snapshot({('talo',): ()}, self.automaton, snapfile)
+        signature = file_signature(self.automaton)
+        with open(self.automaton, 'wb') as automaton:
+            automaton.write(b'another automaton')
+        self.assertNotEqual(file_signature(self.automaton), signature)
+        self.assertEqual(load_cache_snapshot(snapfile, self.automaton), [])
+
+    def test_broken_snapshot(self):
+        snapfile = join(self.tmpdir.name, 'cache.snapshot')
+        cache = {('talo%d' % (i),): (('[WORD_ID=talo]', float(i)),)
+                 for i in range(1000)}
+        dump_cache_snapshot(cache, self.automaton, snapfile)
+        with open(snapfile, 'rb') as snap:
+            data = bytearray(snap.read())
+        # flip bytes in the compressed body
+        for i in range(len(data) // 2, len(data) // 2 + 16):
+            data[i] ^= 0xff
+        with open(snapfile, 'wb') as snap:
+            snap.write(data)
+        self.assertEqual(load_cache_snapshot(snapfile, self.automaton), [])
+        with open(snapfile, 'wb') as snap:
+            snap.write(data[:len(data) // 2])
+        self.assertEqual(load_cache_snapshot(snapfile, self.automaton), [])
+        # entries of wrong shape
+        for entries in [{'talo': []}, [[['talo'], [[['nested']]]]],
+                        [['talo', []]], [[['talo']]]]:
+            with gzip.open(snapfile, 'wt', encoding='utf-8') as snap:
+                json.dump({'format': 2,
+                           'automaton': file_signature(self.automaton),
+                           'entries': entries}, snap)
+            self.assertEqual(load_cache_snapshot(snapfile, self.automaton),
+                             [])
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Unit test to check paradigm guessing from the rule tables."""
+
+# Author: Omorfi contributors <omorfi-devel@groups.google.com> 2015
+
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import unittest
+
+from .guess_new_class import guess_new_class
+from .wordmap import init_wordmap
+
+
+class GuessNewClassTest(unittest.TestCase):
+
+    def guess(self, pos, lemma, tn, av=None, harmony='back', plt=None):
+        wordmap = init_wordmap()
+        wordmap.update(pos=pos, lemma=lemma, stub=lemma, kotus_tn=tn,
+                       kotus_av=av, harmony=harmony, plurale_tantum=plt)
+        return guess_new_class(wordmap)['new_para']
+
+    def test_new_para(self):
+        self.assertEqual(self.guess('NOUN', 'talo', 1), 'N_TALO')
+        self.assertEqual(self.guess('PROPER', 'Oulu', 1), 'N_ASU')
+        self.assertEqual(self.guess('NOUN', 'ukko', 1, 'A'), 'N_UKKO')
+        self.assertEqual(self.guess('NOUN', 'asema', 10), 'N_ASEMA')
+        self.assertEqual(self.guess('NOUN', 'voima', 10), 'N_VOIMA')
+        self.assertEqual(self.guess('NOUN', 'gay', 21), 'N_GAY')
+        self.assertEqual(self.guess('NOUN', 'rosé', 21), 'N_ROSÉ')
+        self.assertEqual(self.guess('NOUN', 'aivot', 1, plt='obligatory'),
+                         'N_AIVOT')
+        self.assertEqual(self.guess('ADJECTIVE', 'hölö', 1, harmony='front'),
+                         'A_HÖLÖ')
+        self.assertEqual(self.guess('VERB', 'punoa', '52'), 'V_PUNOA')
+
+    def test_fail(self):
+        self.assertEqual(self.guess('NOUN', 'aivo', 1, plt='obligatory'), '#')
+        self.assertEqual(self.guess('NOUN', 'talo', 1, 'Q'), '#')
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Unit test to check that lexdb files read back as written."""
+
+# Author: Omorfi contributors <omorfi-devel@groups.google.com> 2015
+
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+import unittest
+from os.path import join
+from tempfile import TemporaryDirectory
+
+from .lexdb import LexDB, is_lexdb, open_lexemes, write_lexdb
+
+
+class LexDBTest(unittest.TestCase):
+
+    def test_roundtrip(self):
+        fieldnames = ['lemma', 'homonym', 'new_para', 'blacklist']
+        wordmaps = [{'lemma': 'kissa', 'homonym': '1',
+                     'new_para': 'N_KISSA', 'blacklist': None},
+                    {'lemma': 'äiti', 'homonym': '1',
+                     'new_para': 'N_KISSA', 'blacklist': ''},
+                    {'lemma': 'kissa', 'homonym': '2',
+                     'new_para': 'N_KISSA', 'blacklist': 'FGK'}]
+        with TemporaryDirectory() as tmpdir:
+            tsvname = join(tmpdir, 'master.tsv')
+            lexdbname = join(tmpdir, 'master.lexdb')
+            write_lexdb(lexdbname, fieldnames, wordmaps)
+            self.assertTrue(is_lexdb(lexdbname))
+            with LexDB(lexdbname) as lexdb:
+                self.assertEqual(lexdb.fieldnames, fieldnames)
+                self.assertEqual(len(lexdb), 3)
+                self.assertEqual(list(lexdb), wordmaps)
+                self.assertEqual(list(lexdb.column('lemma')),
+                                 ['kissa', 'äiti', 'kissa'])
+            with open(tsvname, 'w') as tsv:
+                print('\t'.join(fieldnames), file=tsv)
+                print('kissa\t2\tN_KISSA\tFGK', file=tsv)
+            self.assertFalse(is_lexdb(tsvname))
+            with open_lexemes(tsvname) as lexemes:
+                self.assertEqual(list(lexemes), [wordmaps[2]])
@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Unit test to check that omor formatter options do not leak."""
+
+# Author: Omorfi contributors <omorfi-devel@groups.google.com> 2015
+
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import unittest
+
+from .omor_formatter import OmorFormatter
+from .wordmap import init_wordmap
+
+
+class OmorFormatterTest(unittest.TestCase):
+
+    def test_options(self):
+        plain = OmorFormatter(False)
+        allo = OmorFormatter(False, allo=True)
+        self.assertEqual(plain.stuff2lexc('Aa'), '')
+        self.assertEqual(allo.stuff2lexc('Aa'), '[ALLO=A]')
+        self.assertEqual(OmorFormatter.stuff2omor['Aa'], '[ALLO=A]')
+        self.assertIs(plain.stuff2omor, OmorFormatter(False).stuff2omor)
+        self.assertEqual(plain.stuff2lexc('0'), '0')
+        self.assertEqual(plain.stuff2lexc('NO SUCH STUFF'), 'ERRORMACRO')
+
+    def test_wordmap2lexc(self):
+        wordmap = init_wordmap()
+        wordmap.update(lemma='kissa', homonym='2', upos='NOUN',
+                       stub='kiss', new_para='N_KISSA')
+        self.assertEqual(OmorFormatter(False).wordmap2lexc(wordmap),
+                         '[WORD_ID=kissa_2][UPOS=NOUN]:0kiss\tN_KISSA\t;')
+        self.assertEqual(wordmap['analysis'], '[WORD_ID=kissa_2][UPOS=NOUN]')
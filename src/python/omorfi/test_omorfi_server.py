@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Unit tests for omorfi server and client."""
+
+# Author: Omorfi contributors <omorfi-devel@groups.google.com> 2015
+
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import json
+import unittest
+from errno import EADDRINUSE
+from os.path import exists, join
+from socket import AF_UNIX, SOCK_STREAM, socket
+from tempfile import TemporaryDirectory
+from threading import Thread
+
+from .omorfi_server import (OmorfiClient, OmorfiServer, is_loopback_host,
+                            parse_address)
+
+
+class FakeOmorfi:
+
+    """Stand-in for loaded Omorfi with just enough to answer requests."""
+
+    can_analyse = True
+    can_tokenise = True
+
+    def analyse(self, token):
+        if isinstance(token, tuple):
+            surf, misc = token
+            return [('[WORD_ID=%s][MISC=%s]' % (surf, misc), 0.0)]
+        if token == 'virhe':
+            raise KeyError('virhe')
+        if token == 'xyzzy':
+            return [('[WORD_ID=xyzzy][GUESS=UNKNOWN][WEIGHT=inf]',
+                     float('inf'), "Unknown")]
+        return [('[WORD_ID=%s]' % (token), 0.0)]
+
+    def analyse_many(self, tokens):
+        return [self.analyse(token) for token in tokens]
+
+    def tokenise(self, line):
+        return [(surf, '') for surf in line.split()]
+
+
+class OmorfiServerTest(unittest.TestCase):
+
+    def test_parse_address(self):
+        self.assertEqual(parse_address('localhost:8080'),
+                         ('localhost', 8080))
+        self.assertEqual(parse_address(':8080'), ('localhost', 8080))
+        self.assertEqual(parse_address('/tmp/omorfi.sock'),
+                         '/tmp/omorfi.sock')
+
+    def test_loopback(self):
+        self.assertTrue(is_loopback_host('localhost'))
+        self.assertTrue(is_loopback_host('127.0.0.1'))
+        self.assertFalse(is_loopback_host('0.0.0.0'))
+
+    def test_refuse_remote(self):
+        with self.assertRaises(ValueError):
+            OmorfiServer(None, '0.0.0.0:0')
+        server = OmorfiServer(None, '127.0.0.1:0')
+        server.close()
+
+    def test_round_trip(self):
+        with TemporaryDirectory() as tmpdir:
+            path = join(tmpdir, 'omorfi.sock')
+            server = OmorfiServer(FakeOmorfi(), path)
+            thread = Thread(target=server.serve_forever)
+            thread.start()
+            client = OmorfiClient(path)
+            try:
+                self.assertTrue(client.can_analyse)
+                self.assertFalse(client.can_generate)
+                self.assertEqual(client.analyse(('Kissa', 'SpaceAfter=No')),
+                                 [('[WORD_ID=Kissa][MISC=SpaceAfter=No]',
+                                   0.0)])
+                self.assertEqual(client.analyse_many(['kissa', ('koira', '')]),
+                                 [[('[WORD_ID=kissa]', 0.0)],
+                                  [('[WORD_ID=koira][MISC=]', 0.0)]])
+                self.assertEqual(client.tokenise('kissa istuu'),
+                                 [('kissa', ''), ('istuu', '')])
+                with self.assertRaises(RuntimeError):
+                    client.analyse('virhe')
+                with self.assertRaises(RuntimeError):
+                    client._call('analyze', 'kissa')
+                self.assertEqual(client.analyse('xyzzy'),
+                                 [('[WORD_ID=xyzzy][GUESS=UNKNOWN]'
+                                   '[WEIGHT=inf]', float('inf'),
+                                   "Unknown")])
+                # connection still works after an error response
+                self.assertEqual(client.analyse('kissa'),
+                                 [('[WORD_ID=kissa]', 0.0)])
+            finally:
+                client.close()
+                server.shutdown()
+                thread.join()
+
+    def test_strict_json(self):
+        with TemporaryDirectory() as tmpdir:
+            path = join(tmpdir, 'omorfi.sock')
+            server = OmorfiServer(FakeOmorfi(), path)
+            thread = Thread(target=server.serve_forever)
+            thread.start()
+            sock = socket(AF_UNIX, SOCK_STREAM)
+            try:
+                sock.connect(path)
+                sock.sendall(b'{"cmd": "analyse", "args": ["xyzzy"]}\n')
+                line = sock.makefile('rb').readline().decode('utf-8')
+            finally:
+                sock.close()
+                server.shutdown()
+                thread.join()
+
+            def reject(constant):
+                raise ValueError("not JSON: " + constant)
+            response = json.loads(line, parse_constant=reject)
+            self.assertEqual(response['result'][0][1], 'inf')
+
+    def test_unix_socket_path(self):
+        with TemporaryDirectory() as tmpdir:
+            path = join(tmpdir, 'data.tsv')
+            with open(path, 'w') as data:
+                data.write('precious\n')
+            with self.assertRaises(FileExistsError):
+                OmorfiServer(None, path)
+            self.assertTrue(exists(path))
+            path = join(tmpdir, 'omorfi.sock')
+            server = OmorfiServer(None, path)
+            server.close()
+            self.assertFalse(exists(path))
+            # a stale socket is replaced
+            stale = OmorfiServer(None, path)
+            stale._server.server_close()
+            server = OmorfiServer(None, path)
+            # but the socket of another server is left alone
+            stale.close()
+            self.assertTrue(exists(path))
+            # nor is the socket of a server still listening on it
+            with self.assertRaises(OSError) as cm:
+                OmorfiServer(None, path)
+            self.assertEqual(cm.exception.errno, EADDRINUSE)
+            self.assertTrue(exists(path))
+            server.close()
+            self.assertFalse(exists(path))
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Unit test to check that sentence output is buffered right."""
+
+# Author: Omorfi contributors <omorfi-devel@groups.google.com> 2015
+
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import unittest
+from argparse import ArgumentParser
+from io import StringIO
+from tempfile import TemporaryFile
+
+from .sentence_writer import (SentenceWriter, add_output_arguments,
+                              writer_from_args)
+
+
+class SentenceWriterTest(unittest.TestCase):
+
+    def test_string_output(self):
+        outfile = StringIO()
+        writer = SentenceWriter(outfile)
+        self.assertEqual(writer.flush_every, 0)
+        writer.write("1\ttalo")
+        writer.write("\n")
+        self.assertEqual(outfile.getvalue(), "")
+        writer.end_sentence()
+        self.assertEqual(outfile.getvalue(), "1\ttalo\n")
+        writer.write("\n")
+        writer.close()
+        self.assertEqual(outfile.getvalue(), "1\ttalo\n\n")
+
+    def test_file_output(self):
+        with TemporaryFile('w+', encoding='utf-8') as outfile:
+            print("# alku", file=outfile)
+            writer = SentenceWriter(outfile, 2)
+            for surf in ["talo", "äö", "kissa"]:
+                writer.write(surf + "\n")
+                writer.end_sentence()
+            self.assertEqual(writer.sentences, 3)
+            writer.close()
+            print("# loppu", file=outfile)
+            outfile.flush()
+            outfile.seek(0)
+            self.assertEqual(outfile.read(),
+                             "# alku\ntalo\näö\nkissa\n# loppu\n")
+
+    def test_arguments(self):
+        ap = ArgumentParser()
+        add_output_arguments(ap)
+        args = ap.parse_args(['--flush-every', '10'])
+        self.assertEqual(writer_from_args(StringIO(), args).flush_every, 10)
+        args = ap.parse_args([])
+        self.assertIsNone(args.flush_every)
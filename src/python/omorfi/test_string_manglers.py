@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Unit test to check lexc and twolc escaping."""
+
+# Author: Omorfi contributors <omorfi-devel@groups.google.com> 2015
+
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import unittest
+
+from .string_manglers import (lexc_escape, lexc_escapes, lexc_unescape,
+                              twolc_escape, twolc_escapes, twolc_unescape)
+
+
+class EscapeTest(unittest.TestCase):
+
+    def test_lexc(self):
+        self.assertEqual(lexc_escape('talo'), 'talo')
+        self.assertEqual(lexc_escape('100 % <a>!'), '1%0%0% %%% %<a%>%!')
+        self.assertEqual(lexc_escape('a-b_c'), 'a-b_c')
+        self.assertEqual(lexc_unescape('1%0%0% %%% %<a%>%!'), '100 % <a>!')
+        self.assertEqual(lexc_escapes(['0:0', 'a\nb;', '']),
+                         ['%0%:%0', 'a\nb%;', ''])
+        self.assertEqual(lexc_escapes([]), [])
+
+    def test_twolc(self):
+        self.assertEqual(twolc_escape('a-b_%'), 'a%-b%_%%')
+        self.assertEqual(twolc_unescape('a%-b%_%%'), 'a-b_%')
+        self.assertEqual(twolc_escapes(['(x)', 'y']), ['%(x%)', 'y'])
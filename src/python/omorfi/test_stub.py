@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Unit test to check that stub tries cut same suffixes as string manglers."""
+
+# Author: Omorfi contributors <omorfi-devel@groups.google.com> 2015
+
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import unittest
+
+from .stub import stub_all_new_para, stub_all_new_para_column, stub_column
+
+
+class StubTest(unittest.TestCase):
+
+    stubmap = {'N_TALO': '', 'N_KISSA': 'a', 'V_SANOA': 'a',
+               'V_HUUTAA': 'taa'}
+
+    def stub(self, stub, new_para, stubmap):
+        wordmap = {'stub': stub, 'bracketstub': stub, 'new_para': new_para}
+        wordmap = stub_all_new_para(wordmap, stubmap)
+        return wordmap['stub'], wordmap['bracketstub']
+
+    def test_column(self):
+        self.assertEqual(stub_column(['talo', 'kissa', 'talo'],
+                                     ['', 'a', 'a']),
+                         (['talo', 'kiss', None],
+                          ['talo', 'kiss<Del>→a', 'talo']))
+        self.assertEqual(stub_column(['sanoa', 'huutaa'], 'taa'),
+                         ([None, 'huu'], ['sanoa', 'huu<Del>→taa']))
+
+    def test_new_para_column(self):
+        rows = [('talo', 'N_TALO'), ('kissa', 'N_KISSA'),
+                ('huutaa', 'V_HUUTAA'), ('sanoa', 'V_SANOA'), ('ja', '')]
+        wordmaps = [{'stub': stub, 'bracketstub': stub, 'new_para': new_para}
+                    for stub, new_para in rows]
+        stubbed = stub_all_new_para_column(wordmaps, self.stubmap)
+        self.assertEqual([(w['stub'], w['bracketstub']) for w in stubbed],
+                         [self.stub(stub, new_para, self.stubmap)
+                          for stub, new_para in rows])
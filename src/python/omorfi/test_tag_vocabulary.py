@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Unit test to check that analyses are coded and decoded right."""
+
+# Author: Omorfi contributors <omorfi-devel@groups.google.com> 2015
+
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import unittest
+
+from .tag_vocabulary import FIRST_TAG, TagVocabulary, get_tag_vocabulary
+
+
+class TagVocabularyTest(unittest.TestCase):
+
+    omor = ('[WORD_ID=koira_2][UPOS=NOUN][NUM=SG][CASE=NOM]'
+            '[BOUNDARY=COMPOUND][WORD_ID=talo][UPOS=NOUN][NUM=PL][CASE=INE]'
+            '[WEIGHT=2.500000]')
+
+    def test_vocabulary(self):
+        vocabulary = get_tag_vocabulary()
+        self.assertIs(get_tag_vocabulary(), vocabulary)
+        self.assertIn('[CASE=NOM]', vocabulary.codes)
+        self.assertEqual(vocabulary.codes, TagVocabulary().codes)
+        self.assertTrue(all(code >= FIRST_TAG
+                            for code in vocabulary.codes.values()))
+
+    def test_round_trip(self):
+        vocabulary = TagVocabulary()
+        codes = vocabulary.encode(self.omor)
+        self.assertEqual(codes.typecode, 'H')
+        self.assertEqual(vocabulary.decode(codes), self.omor)
+        self.assertEqual(vocabulary.lemmas(codes), ['koira', 'talo'])
+        for odd in ['', 'koira[UPOS=NOUN]', '[WORD_ID=]][UPOS=PUNCT]',
+                    '[FOO=BAR][', '[UPOS=NOUN]]']:
+            self.assertEqual(vocabulary.decode(vocabulary.encode(odd)), odd)
+
+    def test_many(self):
+        vocabulary = TagVocabulary()
+        omors = [self.omor, '', '[WORD_ID=koira][UPOS=NOUN]']
+        codes = vocabulary.encode_many(omors)
+        self.assertEqual(vocabulary.decode_many(codes), omors)
+        self.assertEqual(len(vocabulary.split_many(codes)), 3)
+        self.assertEqual(vocabulary.strings.count('koira'), 1)
+
+    def test_ud_feats(self):
+        vocabulary = TagVocabulary()
+        codes = vocabulary.encode_many([
+            self.omor,
+            '[WORD_ID=olla][UPOS=AUX][VOICE=ACT][MOOD=INDV][TENSE=PRESENT]'
+            '[NEG=CON]',
+            '[WORD_ID=juosta][UPOS=VERB][CASE=LAT]',
+            '[WORD_ID=ja][UPOS=CCONJ]'])
+        self.assertEqual(vocabulary.decode_many_ud_feats(codes),
+                         ['Case=Ine|Number=Plur',
+                          'Connegative=Yes|Mood=Ind|Tense=Pres|VerbForm=Fin',
+                          'Number=Sing', '_'])
+        self.assertEqual(vocabulary.decode_many_ud_feats(codes, 'ftb')[2],
+                         'Case=Lat')
+
+    def test_unhandled_ud_feats(self):
+        vocabulary = TagVocabulary()
+        # only the tags of the last word are converted
+        codes = vocabulary.encode('[WORD_ID=koira][FOO=BAR][STYLE=FOO]'
+                                  '[BOUNDARY=COMPOUND][WORD_ID=talo]'
+                                  '[UPOS=NOUN][NUM=SG][CASE=NOM]')
+        self.assertEqual(vocabulary.decode_ud_feats(codes),
+                         'Case=Nom|Number=Sing')
+        for omor in ['[WORD_ID=talo][UPOS=NOUN][FOO=BAR]',
+                     '[WORD_ID=talo][UPOS=NOUN][STYLE=FOO][NUM=SG]']:
+            with self.assertRaises(ValueError):
+                vocabulary.decode_ud_feats(vocabulary.encode(omor))
+
+    def test_ftb3(self):
+        vocabulary = TagVocabulary()
+        codes = vocabulary.encode(self.omor)
+        self.assertEqual(vocabulary.decode_ftb3(codes), 'koira#talo N Pl Ine')
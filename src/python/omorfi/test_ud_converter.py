@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Unit test to check that analyses are converted to UD right."""
+
+# Author: Omorfi contributors <omorfi-devel@groups.google.com> 2015
+
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import unittest
+
+from .analysis import Analysis
+from .ud_converter import UdConverter, get_ud_converter
+
+
+class UdConverterTest(unittest.TestCase):
+
+    omor = ('[WORD_ID=koira_2][UPOS=NOUN][NUM=SG][CASE=NOM]'
+            '[BOUNDARY=COMPOUND][WORD_ID=talo][UPOS=NOUN][NUM=PL][CASE=INE]'
+            '[WEIGHT=2.500000]')
+
+    def test_fields(self):
+        ud = UdConverter().convert((self.omor, 2.5))
+        self.assertEqual(ud.lemma, 'koira#talo')
+        self.assertEqual(ud.upos, 'NOUN')
+        self.assertEqual(ud.xpos, 'N')
+        self.assertEqual(ud.feats, 'Case=Ine|Number=Plur')
+        self.assertEqual(ud.misc, '_')
+        ud = UdConverter().convert_omor(
+            '[WORD_ID=juokseminen][UPOS=VERB][DRV=MINEN][GUESS=FSA]')
+        self.assertEqual(ud.upos, 'VERB')
+        self.assertEqual(ud.match_upos, 'NOUN')
+        self.assertEqual(ud.feats, 'Derivation=Minen')
+        self.assertEqual(ud.misc, 'GUESS=FSA')
+        ud = UdConverter().convert_omor('[WORD_ID=x][GUESS=UNKNOWN]')
+        self.assertEqual((ud.upos, ud.xpos, ud.feats), ('X', 'X', '_'))
+
+    def test_hacks(self):
+        omor = '[WORD_ID=juosta][UPOS=VERB][CASE=LAT][NEG=CON]'
+        self.assertEqual(UdConverter().convert_omor(omor).feats,
+                         'Connegative=Yes|Number=Sing')
+        ud = UdConverter('ftb').convert_omor(omor)
+        self.assertEqual(ud.feats, 'Case=Lat|Connegative=Yes')
+        self.assertEqual(ud.xpos, 'VERB')
+
+    def test_unhandled(self):
+        converter = UdConverter()
+        # only the tags of the last part are converted
+        ud = converter.convert_omor('[WORD_ID=koira][FOO=BAR]'
+                                    '[BOUNDARY=COMPOUND][WORD_ID=talo]'
+                                    '[UPOS=NOUN][NUM=SG][CASE=NOM]')
+        self.assertEqual(ud.feats, 'Case=Nom|Number=Sing')
+        with self.assertRaises(ValueError):
+            converter.convert_omor('[WORD_ID=talo][UPOS=NOUN][FOO=BAR]')
+
+    def test_match_analysis(self):
+        converter = UdConverter()
+        demonstrative = ('[WORD_ID=tämä][UPOS=PRON][SUBCAT=DEMONSTRATIVE]'
+                         '[NUM=SG][CASE=NOM]', 0.0)
+        with self.assertRaises(ValueError):
+            converter.convert(demonstrative)
+        noun = ('[WORD_ID=tämä][UPOS=NOUN][NUM=SG][CASE=NOM]', 1.0)
+        plural = ('[WORD_ID=tämä][UPOS=NOUN][NUM=PL][CASE=NOM]', 2.0)
+        anals = [demonstrative, noun, plural]
+        # analyses of other UPOS are not converted
+        self.assertIs(converter.match_analysis(anals, 'tämä', 'NOUN',
+                                               'Case=Nom|Number=Plur'),
+                      plural)
+        self.assertIs(converter.match_analysis(anals, 'tämä', 'NOUN',
+                                               'Case=Ela|Number=Sing'),
+                      noun)
+        self.assertIs(converter.match_analysis(anals, 'tämä', 'ADJ', '_'),
+                      demonstrative)
+        minen = ('[WORD_ID=juosta][UPOS=VERB][DRV=MINEN][NUM=SG][CASE=NOM]',
+                 0.0)
+        self.assertIs(converter.match_analysis([noun, minen], 'juoksu',
+                                               'NOUN', 'Case=Ela'), noun)
+        feats = 'Case=Nom|Derivation=Minen|Number=Sing'
+        self.assertIs(converter.match_analysis([noun, minen], 'juosta',
+                                               'NOUN', feats), minen)
+
+    def test_conllu(self):
+        converter = get_ud_converter()
+        self.assertIs(get_ud_converter(), converter)
+        line = converter.format_conllu(3, 'koiratalossa',
+                                       Analysis((self.omor, 2.5)))
+        self.assertEqual(line.split('\t'),
+                         ['3', 'koiratalossa', 'koira#talo', 'NOUN', 'N',
+                          'Case=Ine|Number=Plur', '_', '_', '_', '_'])
+        self.assertIs(converter.convert_omor(self.omor),
+                      converter.convert_omor(self.omor))
+        uncached = UdConverter(cache_size=0)
+        self.assertIsNot(uncached.convert_omor(self.omor),
+                         uncached.convert_omor(self.omor))
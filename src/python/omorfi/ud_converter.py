@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Conversion of omor analyses to Universal Dependencies fields.
+
+@c UdConverter maps the tags of an omor analysis to the LEMMA, UPOS, XPOS,
+FEATS and MISC fields of CoNLL-U. The UD features of each omor tag are
+looked up from a table compiled from the tag vocabulary, and the fields
+of each analysis string are cached, so the tags of an analysis are only
+read once however many times it is seen in a corpus.
+"""
+
+# Author: Omorfi contributors <omorfi-devel@groups.google.com> 2015
+
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from collections import OrderedDict, namedtuple
+
+from .analysis import Analysis, re_tag, strip_homonym
+from .tag_vocabulary import omor_vocabulary_tags, ud_feats_for_tag
+
+# UD fields of one analysis, match_upos is the UPOS used to match gold
+# standard annotations and conllu the fields from LEMMA to MISC as a line
+UdFields = namedtuple('UdFields', ['lemma', 'upos', 'xpos', 'feats', 'misc',
+                                   'match_upos', 'conllu'])
+
+# tdt style XPOS of UPOS
+upos2tdt = {'NOUN': 'N', 'PROPN': 'N', 'ADJ': 'A', 'VERB': 'V', 'AUX': 'V',
+            'CCONJ': 'C', 'SCONJ': 'C', 'ADP': 'Adp', 'ADV': 'Adv',
+            'PRON': 'Pron', 'PUNCT': 'Punct', 'SYM': 'Symb', 'INTJ': 'Interj',
+            'NUM': 'Num'}
+
+_converters = dict()
+
+
+def compile_ud_feats(hacks=None):
+    """Get dict of UD features set by each (key, value) tag of vocabulary.
+
+    Tags that start a new word have False and tags without UD conversion
+    None, see @c ud_feats_for_tag for the rest.
+    """
+    table = dict()
+    for tag in omor_vocabulary_tags():
+        for key, value in re_tag.findall(tag):
+            if key == 'BOUNDARY':
+                table[(key, value)] = False
+            else:
+                table[(key, value)] = ud_feats_for_tag(key, value, hacks)
+    return table
+
+
+def match_upos(anal):
+    """Get UPOS of analysis tuple or @c Analysis anal to match gold standard.
+
+    This is the match_upos of @c UdFields, read without converting the
+    other tags.
+    """
+    anal = Analysis.from_tuple(anal)
+    upos = anal.upos
+    if upos == 'VERB' and anal.get_last_feat('DRV') == 'MINEN':
+        return 'NOUN'
+    return upos
+
+
+def get_ud_converter(hacks=None):
+    """Get UD converter for hacks shared by the whole process."""
+    converter = _converters.get(hacks)
+    if converter is None:
+        converter = _converters[hacks] = UdConverter(hacks)
+    return converter
+
+
+class UdConverter:
+
+    """
+    Converter of omor analyses to UD fields for one UD version.
+
+    The hacks is None for the default UD version or 'ftb' for the version
+    of the FTB treebank. The converted fields are kept in a size-bounded
+    LRU cache keyed by the omor string, cache_size 0 disables caching.
+    """
+
+    def __init__(self, hacks=None, cache_size=65536):
+        self.hacks = hacks
+        self.tag_feats = compile_ud_feats(hacks)
+        self._cache = OrderedDict()
+        self._cache_size = cache_size
+
+    def convert(self, anal):
+        """Get UdFields of analysis tuple or @c Analysis anal.
+
+        Raises ValueError if a tag of the last part has no UD conversion.
+        """
+        return self.convert_omor(anal[0])
+
+    def match_analysis(self, anals, lemma, upos, feats):
+        """Get the analysis of anals that best matches gold standard fields.
+
+        The first analysis matching upos, feats and lemma is preferred,
+        then one matching upos and feats, then upos only, and otherwise the
+        first one. Only analyses of matching UPOS are converted, so other
+        analyses may have tags without UD conversion.
+        """
+        candidates = [anal for anal in anals if match_upos(anal) == upos]
+        uds = []
+        for anal in candidates:
+            ud = self.convert(anal)
+            if ud.feats == feats and ud.lemma == lemma:
+                return anal
+            uds.append(ud)
+        # no exact match found (re-try without lemma)
+        for anal, ud in zip(candidates, uds):
+            if ud.feats == feats:
+                return anal
+        # and re-try without feats
+        if candidates:
+            return candidates[0]
+        return anals[0]
+
+    def convert_omor(self, omor):
+        """Get UdFields of omor string."""
+        fields = self._cache.get(omor)
+        if fields is not None:
+            self._cache.move_to_end(omor)
+            return fields
+        fields = self._convert(omor)
+        if self._cache_size:
+            self._cache[omor] = fields
+            while len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+        return fields
+
+    def _convert(self, omor):
+        tag_feats = self.tag_feats
+        lemmas = []
+        upos = ''
+        drv = ''
+        guess = ''
+        rvs = dict()
+        unhandled = None
+        for tag in re_tag.findall(omor):
+            key, value = tag
+            if key == 'WORD_ID':
+                lemmas.append(strip_homonym(value))
+                rvs = dict()
+                unhandled = None
+                continue
+            elif key == 'UPOS':
+                upos = value
+            elif key == 'DRV':
+                drv = value
+            elif key == 'GUESS':
+                guess = value
+            feats = tag_feats.get(tag)
+            if feats is None:
+                feats = ud_feats_for_tag(key, value, self.hacks)
+                if key == 'BOUNDARY':
+                    feats = False
+            if feats is False:
+                rvs = dict()
+                unhandled = None
+            elif feats is None:
+                # only the feats of the last part end up in the fields
+                if unhandled is None:
+                    unhandled = key + '=' + value
+            else:
+                for feat, featvalue in feats:
+                    if featvalue is None:
+                        rvs.pop(feat, None)
+                    else:
+                        rvs[feat] = featvalue
+        if unhandled:
+            raise ValueError("Unhandled %s in %s" % (unhandled, omor))
+        if rvs:
+            feats = '|'.join(k + '=' + rvs[k]
+                             for k in sorted(rvs, key=str.lower))
+        else:
+            feats = '_'
+        lemma = '#'.join(lemmas)
+        match_upos = upos
+        if upos == 'VERB' and drv == 'MINEN':
+            match_upos = 'NOUN'
+        if self.hacks == 'ftb':
+            xpos = upos
+        else:
+            xpos = upos2tdt.get(upos, 'X')
+        if not upos:
+            upos = 'X'
+        misc = 'GUESS=' + guess if guess else '_'
+        conllu = '\t'.join((lemma, upos, xpos, feats, '_', '_', '_', misc))
+        return UdFields(lemma, upos, xpos, feats, misc, match_upos, conllu)
+
+    def format_conllu(self, wordn, surf, anal):
+        """Format analysis tuple or @c Analysis anal as CoNLL-U line.
+
+        The line has no newline at the end.
+        """
+        return '\t'.join((str(wordn), surf,
+                          self.convert_omor(anal[0]).conllu))
+
+    def clear_cache(self):
+        """Empty the cache of converted analyses."""
+        self._cache.clear()
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+# -*- coding: utf8 -*-
+"""
+This script converts the expanded omorfi lexeme database from TSV to the
+binary lexdb format that the generator scripts can read faster.
+"""
+
+# Author: Omorfi contributors <omorfi-devel@groups.google.com> 2015
+
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import argparse
+import csv
+from sys import exit
+
+from omorfi.lexdb import open_lexemes, write_lexdb
+
+
+def main():
+    ap = argparse.ArgumentParser(
+        description="Convert expanded omorfi TSV database into lexdb format")
+    ap.add_argument("--quiet", "-q", action="store_false", dest="verbose",
+                    default=False,
+                    help="do not print output to stdout while processing")
+    ap.add_argument("--verbose", "-v", action="store_true", default=False,
+                    help="print each step to stdout while processing")
+    ap.add_argument("--version", "-V", action="version")
+    ap.add_argument("--input", "-i", action="store", required=True,
+                    metavar="IFILE", help="read TSV data from IFILE")
+    ap.add_argument("--output", "-o", action="store", required=True,
+                    metavar="OFILE", help="write lexdb data to OFILE")
+    ap.add_argument("--separator", "-s", action="store", default="\t",
+                    metavar="SEP", help="use SEP as separator")
+    ap.add_argument("--strip", "-S", action="store",
+                    metavar="STRIP", help="strip STRIP characters")
+    args = ap.parse_args()
+
+    if args.strip == '"' or args.strip == "'":
+        quoting = csv.QUOTE_ALL
+        quotechar = args.strip
+    else:
+        quoting = csv.QUOTE_NONE
+        quotechar = None
+    if args.verbose:
+        print("Reading from", args.input)
+    with open_lexemes(args.input, delimiter=args.separator, quoting=quoting,
+                      quotechar=quotechar) as lexemes:
+        if args.verbose:
+            print("Writing lexdb to", args.output)
+        write_lexdb(args.output, lexemes.fieldnames, lexemes)
+    exit()
+
+
+if __name__ == "__main__":
+    main()
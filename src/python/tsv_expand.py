@@ -24,13 +24,188 @@ automatic guessing. The
 
 import argparse
 import csv
+import os
+import sys
+from collections import deque
+from multiprocessing import get_context
 from sys import exit, stderr
+from tempfile import TemporaryFile
+from traceback import print_exc
+
+from omorfi.build_timings import add_timing_arguments, timings_from_args
 from omorfi.guess_feats import guess_bound_morphs
 from omorfi.parse_csv_data import parse_defaults_from_tsv, parse_extras_from_tsv
-from omorfi.stub import stub_all_new_para
+from omorfi.stub import stub_all_new_para_column
 from omorfi.wordmap import get_wordmap_fieldnames, init_wordmap
 
 
+def join_row(tsv_parts, joinmap, fields):
+    """Parse one lexeme row of the database and join its paradigm data.
+
+    Returns the wordmap, False if the row was skipped, or None if the row
+    could not be expanded.
+    """
+    if len(tsv_parts) < fields:
+        print("Must have at least N separators on each",
+              "non-comment non-empty line; skipping:",
+              tsv_parts, file=stderr)
+        return False
+    # here starts the guessworks
+    # the aim is to fill dict wordmap with data necessary to
+    # generate a lexc line
+    wordmap = init_wordmap()
+    wordmap = parse_defaults_from_tsv(wordmap, tsv_parts)
+    wordmap = parse_extras_from_tsv(wordmap, tsv_parts)
+    # Extend from known new paras
+    joinkey = wordmap['new_para']
+    if joinkey in joinmap:
+        for k, v in joinmap[joinkey].items():
+            if k != 'new_para':
+                if v == "False":
+                    wordmap[k] = False
+                elif v == "None":
+                    wordmap[k] = None
+                elif k == 'kotus_tn':
+                    try:
+                        wordmap[k] = int(v)
+                    except:
+                        print("FAIL", k, v, tsv_parts)
+                        exit(2)
+                else:
+                    wordmap[k] = v
+    else:
+        print("\033[93mMissing!\033[0m",
+              "new para not in join data:", joinkey,
+              "\n\033[92mExplanation:\033[0m"
+              "add paradigm to morphophonology.tsv and carry on")
+        return None
+
+    # Guess-works in order
+    # wordmap = guess_stem_features_ktn(wordmap)
+    # wordmap = guess_pronunciation(wordmap)
+    # wordmap = guess_grade_dir_from_ktn(wordmap)
+    # wordmap = guess_harmony(wordmap)
+    # wordmap = guess_new_class(wordmap)
+    return wordmap
+
+
+def guess_lexicon(wordmap):
+    """Move suffixes and interjections to their own lexicons."""
+    # suffixes can be id'd by the - in beginning. They need an own
+    # lexicon
+    wordmap = guess_bound_morphs(wordmap)
+    if wordmap['is_suffix']:
+        wordmap['real_pos'] = wordmap['pos']
+        wordmap['pos'] = 'SUFFIX'
+    if "PCLE_HAH" == wordmap['new_para']:
+        wordmap['real_pos'] = wordmap['pos']
+        wordmap['pos'] = 'INTERJECTION'
+    return wordmap
+
+
+def expand_rows(rows, joinmap, stubmap, fields):
+    """Expand lexeme rows of the database into wordmaps.
+
+    The stubs of the rows are cut as one column. Returns list of wordmaps
+    and whether any row could not be expanded.
+
+    Failures are handled in row order: if joining a row raises or exits,
+    the rows before it are stubbed, reporting their failures, before the
+    error is passed on. The messages of skipped and unjoinable rows are
+    printed before the stub failure messages of the same rows.
+    """
+    wordmaps = []
+    errors = False
+    fatal = None
+    for tsv_parts in rows:
+        try:
+            wordmap = join_row(tsv_parts, joinmap, fields)
+        except BaseException as e:
+            fatal = e
+            break
+        if wordmap is None:
+            errors = True
+        elif wordmap:
+            wordmaps.append(wordmap)
+    expanded = []
+    for wordmap in stub_all_new_para_column(wordmaps, stubmap):
+        if not wordmap:
+            errors = True
+        else:
+            expanded.append(guess_lexicon(wordmap))
+    if fatal:
+        raise fatal
+    return expanded, errors
+
+
+# join data of the worker processes
+_joinmap = None
+_stubmap = None
+_fields = None
+_timings = None
+
+
+def _init_worker(joinmap, stubmap, fields, timings):
+    global _joinmap, _stubmap, _fields, _timings
+    _joinmap = joinmap
+    _stubmap = stubmap
+    _fields = fields
+    _timings = timings
+    _timings.start_worker('guess')
+
+
+def expand_chunk(chunk):
+    """Expand chunk of rows in a worker process.
+
+    The messages printed while expanding are captured so that they can be
+    printed in input order, an uncaught exception is printed as a traceback
+    with exit status 1. Returns list of wordmaps, whether any row failed,
+    exit status, the captured stdout and stderr, and the phase times of the
+    worker.
+    """
+    wordmaps = []
+    errors = False
+    status = 0
+    sys.stdout.flush()
+    sys.stderr.flush()
+    with TemporaryFile() as out, TemporaryFile() as err:
+        saved_out = os.dup(1)
+        saved_err = os.dup(2)
+        os.dup2(out.fileno(), 1)
+        os.dup2(err.fileno(), 2)
+        try:
+            wordmaps, errors = expand_rows(chunk, _joinmap, _stubmap,
+                                           _fields)
+        except SystemExit as e:
+            status = e.code
+        except Exception:
+            print_exc()
+            status = 1
+        finally:
+            sys.stdout.flush()
+            sys.stderr.flush()
+            os.dup2(saved_out, 1)
+            os.dup2(saved_err, 2)
+            os.close(saved_out)
+            os.close(saved_err)
+        out.seek(0)
+        err.seek(0)
+        return (wordmaps, errors, status, out.read(), err.read(),
+                _timings.take_phases())
+
+
+def read_chunks(tsv_reader, chunksize):
+    """Read rows of tsv_reader in lists of chunksize."""
+    chunk = []
+    for tsv_parts in tsv_reader:
+        chunk.append(tsv_parts)
+        if len(chunk) >= chunksize:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
 # standard UI stuff
 
 def main():
@@ -58,7 +233,16 @@ def main():
                     "do not have SEPs")
     ap.add_argument("--strip", "-S", action="store",
                     metavar="STRIP", help="strip STRIP characters")
+    ap.add_argument("--jobs", "-J", action="store", type=int, default=1,
+                    metavar="N", help="expand rows in N worker processes")
+    ap.add_argument("--chunksize", action="store", type=int, default=1000,
+                    metavar="N",
+                    help="expand and stub N rows at a time, in each worker "
+                    "process with --jobs")
+    add_timing_arguments(ap)
     args = ap.parse_args()
+    timings = timings_from_args('tsv_expand', args)
+    timings.switch('read')
 
     if args.strip == '"' or args.strip == "'":
         quoting = csv.QUOTE_ALL
@@ -94,68 +278,59 @@ def main():
             tsv_reader = csv.reader(infile, delimiter=args.separator,
                                     quoting=quoting, escapechar='\\', strict=True)
             linecount = 0
-            for tsv_parts in tsv_reader:
-                linecount += 1
-                if args.verbose and (linecount % 10000 == 0):
-                    print(linecount, "...", sep='', end='\r')
-                if len(tsv_parts) < args.fields:
-                    print("Must have at least N separators on each",
-                          "non-comment non-empty line; skipping:",
-                          tsv_parts, file=stderr)
-                    continue
-                # here starts the guessworks
-                # the aim is to fill dict wordmap with data necessary to
-                # generate a lexc line
-                wordmap = init_wordmap()
-                wordmap = parse_defaults_from_tsv(wordmap, tsv_parts)
-                wordmap = parse_extras_from_tsv(wordmap, tsv_parts)
-                # Extend from known new paras
-                joinkey = wordmap['new_para']
-                if joinkey in joinmap:
-                    for k, v in joinmap[joinkey].items():
-                        if k != 'new_para':
-                            if v == "False":
-                                wordmap[k] = False
-                            elif v == "None":
-                                wordmap[k] = None
-                            elif k == 'kotus_tn':
-                                try:
-                                    wordmap[k] = int(v)
-                                except:
-                                    print("FAIL", k, v, tsv_parts)
-                                    exit(2)
-                            else:
-                                wordmap[k] = v
-                else:
-                    print("\033[93mMissing!\033[0m",
-                          "new para not in join data:", joinkey,
-                          "\n\033[92mExplanation:\033[0m"
-                          "add paradigm to morphophonology.tsv and carry on")
-                    errors = True
-                    continue
-
-                # Guess-works in order
-                # wordmap = guess_stem_features_ktn(wordmap)
-                # wordmap = guess_pronunciation(wordmap)
-                # wordmap = guess_grade_dir_from_ktn(wordmap)
-                # wordmap = guess_harmony(wordmap)
-                # wordmap = guess_new_class(wordmap)
-                wordmap = stub_all_new_para(wordmap, stubmap)
-                if not wordmap:
-                    errors = True
-                    continue
-                # suffixes can be id'd by the - in beginning. They need an own
-                # lexicon
-                wordmap = guess_bound_morphs(wordmap)
-                if wordmap['is_suffix']:
-                    wordmap['real_pos'] = wordmap['pos']
-                    wordmap['pos'] = 'SUFFIX'
-                if "PCLE_HAH" == wordmap['new_para']:
-                    wordmap['real_pos'] = wordmap['pos']
-                    wordmap['pos'] = 'INTERJECTION'
-                wordmaps = [wordmap]
-                for wordmap in wordmaps:
-                    tsv_writer.writerow(wordmap)
+            if args.jobs > 1:
+                with get_context('fork').Pool(
+                        args.jobs, _init_worker,
+                        (joinmap, stubmap, args.fields, timings)) as pool:
+                    # the workers charge their own guess phases, this
+                    # process reads chunks and waits for the results
+                    timings.switch('wait')
+                    # keep at most 2 * jobs chunks read ahead of output
+                    pending = deque()
+                    chunks = read_chunks(tsv_reader, args.chunksize)
+                    chunk = next(chunks, None)
+                    while chunk is not None or pending:
+                        while chunk is not None and \
+                                len(pending) < 2 * args.jobs:
+                            pending.append((len(chunk), pool.apply_async(
+                                expand_chunk, (chunk,))))
+                            chunk = next(chunks, None)
+                        rowcount, result = pending.popleft()
+                        wordmaps, chunk_errors, status, out, err, phases = \
+                            result.get()
+                        timings.merge_phases(phases)
+                        timings.switch('write')
+                        sys.stdout.flush()
+                        sys.stdout.buffer.write(out)
+                        sys.stdout.flush()
+                        sys.stderr.buffer.write(err)
+                        sys.stderr.flush()
+                        for wordmap in wordmaps:
+                            tsv_writer.writerow(wordmap)
+                        timings.count(len(wordmaps))
+                        if status:
+                            exit(status)
+                        if chunk_errors:
+                            errors = True
+                        linecount += rowcount
+                        if args.verbose:
+                            print(linecount, "...", sep='', end='\r')
+                        timings.switch('wait')
+            else:
+                for chunk in read_chunks(tsv_reader, args.chunksize):
+                    timings.switch('guess')
+                    wordmaps, chunk_errors = expand_rows(chunk, joinmap,
+                                                         stubmap, args.fields)
+                    timings.switch('write')
+                    for wordmap in wordmaps:
+                        tsv_writer.writerow(wordmap)
+                    timings.count(len(wordmaps))
+                    if chunk_errors:
+                        errors = True
+                    linecount += len(chunk)
+                    if args.verbose:
+                        print(linecount, "...", sep='', end='\r')
+                    timings.switch('read')
     if errors:
         print("you must fix database integrity or hack the scripts",
               "before continuing")
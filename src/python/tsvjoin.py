@@ -23,7 +23,204 @@ fields on right.
 
 import argparse
 import csv
+import pickle
+from heapq import merge
+from itertools import groupby
+from operator import itemgetter
+from os import remove, replace
+from os.path import abspath, dirname
 from sys import exit, stderr
+from tempfile import NamedTemporaryFile, TemporaryFile
+
+from omorfi.build_timings import add_timing_arguments, timings_from_args
+
+
+def _spill(run):
+    """Write sorted run into temporary file and return reader of it."""
+    runfile = TemporaryFile()
+    for item in run:
+        pickle.dump(item, runfile, pickle.HIGHEST_PROTOCOL)
+    runfile.seek(0)
+
+    def read_run():
+        with runfile:
+            while True:
+                try:
+                    yield pickle.load(runfile)
+                except EOFError:
+                    return
+    return read_run()
+
+
+def external_sort(items, buffer_rows):
+    """Sort items keeping at most buffer_rows of them in memory at a time.
+
+    Items that do not fit in memory are sorted in runs that are written
+    to temporary files and merged back.
+    """
+    runs = []
+    run = []
+    for item in items:
+        run.append(item)
+        if len(run) >= buffer_rows:
+            run.sort()
+            runs.append(_spill(run))
+            run = []
+    run.sort()
+    if not runs:
+        return iter(run)
+    runs.append(iter(run))
+    return merge(*runs)
+
+
+def read_master_keyed(csv_filename, filenum, args, quoting):
+    """Read master rows as (key, filenum, linecount, fields) tuples."""
+    linecount = 0
+    with open(csv_filename, 'r', newline='') as csv_file:
+        csv_reader = csv.reader(csv_file,
+                                delimiter=args.separator, quoting=quoting,
+                                strict=True)
+        next(csv_reader)
+        for csv_parts in csv_reader:
+            linecount += 1
+            if args.verbose and (linecount % 10000) == 0:
+                print(linecount, "...", end='\r')
+            if len(csv_parts) < args.fields - 1:
+                print("Must have at least", args.fields - 2, "separators on each "
+                      "non-comment non-empty line. Skipping:", csv_parts,
+                      file=stderr)
+                continue
+            if csv_parts[-1].endswith('<-HEADERS'):
+                # skip header line
+                continue
+            key = args.separator.join(csv_parts[0:args.fields - 1])
+            yield (key, filenum, linecount, csv_parts)
+
+
+def read_join_keyed(join_filename, args, quoting):
+    """Read join rows as (key, linecount, value) tuples."""
+    linecount = 0
+    with open(join_filename, 'r', newline='') as join_file:
+        join_reader = csv.reader(join_file,
+                                 delimiter=args.separator, quoting=quoting,
+                                 strict=True)
+        next(join_reader)
+        for join_parts in join_reader:
+            linecount += 1
+            if len(join_parts) < args.fields:
+                print("Must have at least", args.fields - 1, "separators on each",
+                      "non-comment non-empty line of join; Skipping:\n",
+                      args.separator.join(join_parts),
+                      file=stderr)
+                continue
+            join_on = args.separator.join(join_parts[0:args.fields - 1])
+            if join_parts[-1].endswith('<-HEADERS'):
+                # skip header line
+                continue
+            yield (join_on, linecount, join_parts[args.fields - 1])
+
+
+def read_join_header(join_filename, args, quoting):
+    """Read name of the joined field from header of join file."""
+    with open(join_filename, 'r', newline='') as join_file:
+        join_reader = csv.reader(join_file,
+                                 delimiter=args.separator, quoting=quoting,
+                                 strict=True)
+        return next(join_reader)[args.fields - 1]
+
+
+def streaming_join(args, quoting, timings):
+    """Join master and join files by sort-merge without loading them.
+
+    Each file is sorted by key with @c external_sort and all of them are
+    merged in one pass writing the output. The errors are reported like in
+    the in-memory join, in the order of the join files and lines, and the
+    output file is only created if there were none.
+    """
+    timings.switch('sort')
+    if args.verbose:
+        print("Sorting dictionary from", " ".join(args.infilenames))
+    masters = external_sort(
+        (item for filenum, csv_filename in enumerate(args.infilenames)
+         for item in read_master_keyed(csv_filename, filenum, args,
+                                       quoting)),
+        args.buffer_rows)
+    fieldnames = []
+    joins = []
+    for join_filename in args.joinfilenames:
+        if args.verbose:
+            print("Sorting joins from", join_filename)
+        fieldnames.append(read_join_header(join_filename, args, quoting))
+        joins.append(groupby(external_sort(read_join_keyed(join_filename,
+                                                           args, quoting),
+                                           args.buffer_rows),
+                             itemgetter(0)))
+    # current (key, rows) group of each join file
+    join_groups = [next(join, None) for join in joins]
+    joincounts = [0 for _ in joins]
+    errors = [[] for _ in joins]
+    linecount = 0
+    timings.switch('write')
+    with NamedTemporaryFile('w', newline='', delete=False,
+                            dir=dirname(abspath(args.outfilename))) as output:
+        tsv_writer = csv.writer(output, delimiter=args.separator,
+                                quoting=quoting, escapechar='\\', strict=True)
+        for key, entries in groupby(masters, itemgetter(0)):
+            # later master entries override earlier ones
+            for _, _, _, fields in entries:
+                pass
+            for i, join in enumerate(joins):
+                while join_groups[i] and join_groups[i][0] < key:
+                    for _, join_linecount, _ in join_groups[i][1]:
+                        errors[i].append((join_linecount, join_groups[i][0],
+                                          'missing'))
+                    join_groups[i] = next(join, None)
+                if join_groups[i] and join_groups[i][0] == key:
+                    rows = iter(join_groups[i][1])
+                    _, _, value = next(rows)
+                    fields.append(fieldnames[i] + '=' + value)
+                    joincounts[i] += 1
+                    for _, join_linecount, _ in rows:
+                        errors[i].append((join_linecount, key, 'duplicated'))
+                    join_groups[i] = next(join, None)
+            linecount += 1
+            if args.verbose and ((linecount % 10000) == 0 or linecount == 1):
+                print(linecount, "...", end='\r')
+            tsv_writer.writerow(fields)
+        timings.count(linecount)
+        for i, join in enumerate(joins):
+            while join_groups[i]:
+                for _, join_linecount, _ in join_groups[i][1]:
+                    errors[i].append((join_linecount, join_groups[i][0],
+                                      'missing'))
+                join_groups[i] = next(join, None)
+    failed = False
+    for join_filename, join_errors in zip(args.joinfilenames, errors):
+        for join_linecount, join_on, error in sorted(join_errors):
+            if args.ignore_errors:
+                continue
+            failed = True
+            if error == 'missing':
+                print("\033[93mMissing!\033[0m "
+                      "Could not find the key",
+                      join_on, "used in\033[91m", join_filename,
+                      "\033[0mline\033[91m", join_linecount, "\033[0min any of",
+                      " ".join(args.infilenames), file=stderr)
+            else:
+                print("\033[93mDuplicated!\033[0m "
+                      "This key will be overwritten",
+                      join_on, "used in\033[91m", join_filename,
+                      "\033[0mline\033[91m", join_linecount, "\033[0m",
+                      file=stderr)
+    if args.verbose:
+        for fieldname, joincount in zip(fieldnames, joincounts):
+            print(joincount, "lexical joins for", fieldname,
+                  "in the table\n")
+    if failed:
+        remove(output.name)
+        return False
+    replace(output.name, args.outfilename)
+    return True
 
 
 def main():
@@ -58,13 +255,30 @@ def main():
                     metavar="STRIP", help="strip STRIP from fields before using")
     ap.add_argument("--ignore-errors", "-I", action="store_true", default=False,
                     help="silently ignore references to entries missing from master file")
+    ap.add_argument("--streaming", action="store_true", default=False,
+                    help="join by sorting and merging the files instead of "
+                    "loading the master into memory")
+    ap.add_argument("--buffer-rows", action="store", type=int,
+                    default=100000, metavar="N",
+                    help="keep at most N rows per file in memory when "
+                    "--streaming, sort the rest in temporary files")
+    add_timing_arguments(ap)
     args = ap.parse_args()
+    timings = timings_from_args('tsvjoin', args)
 
     if args.strip == '"' or args.strip == "'":
         quoting = csv.QUOTE_ALL
     else:
         quoting = csv.QUOTE_NONE
 
+    if args.streaming:
+        if not streaming_join(args, quoting, timings):
+            print("you must fix database integrity or hack the scripts",
+                  "before continuing")
+            exit(1)
+        exit()
+
+    timings.switch('read')
     words = dict()
     for csv_filename in args.infilenames:
         if args.verbose:
@@ -94,6 +308,7 @@ def main():
         if args.verbose:
             print("\n", entry_count, "entries in database")
     # join all join files (slow but more workable)
+    timings.switch('parse')
     errors = False
     for join_filename in args.joinfilenames:
         if args.verbose:
@@ -162,11 +377,15 @@ def main():
         linecount = 0
         tsv_writer = csv.writer(output, delimiter=args.separator,
                                 quoting=quoting, escapechar='\\', strict=True)
-        for (line, fields) in sorted(words.items()):
+        timings.switch('sort')
+        rows = sorted(words.items())
+        timings.switch('write')
+        for (line, fields) in rows:
             linecount += 1
             if args.verbose and ((linecount % 10000) == 0 or linecount == 1):
                 print(linecount, "...", end='\r')
             tsv_writer.writerow(fields)
+        timings.count(linecount)
         if args.verbose:
             print()
     exit()
@@ -12,6 +12,31 @@ from time import perf_counter, process_time
 from omorfi.omorfi import Omorfi
 
 
+def read_frequencies(infile, count):
+    """Read (frequency, word-form) pairs down to frequency count."""
+    for line in infile:
+        fields = line.strip().replace(' ', '\t', 1).split('\t')
+        if len(fields) < 2:
+            print("ERROR: Skipping line", fields, file=stderr)
+            continue
+        freq = int(fields[0])
+        if freq < count:
+            break
+        yield freq, fields[1]
+
+
+def read_batches(pairs, batchsize):
+    """Read pairs in lists of batchsize."""
+    batch = []
+    for pair in pairs:
+        batch.append(pair)
+        if len(batch) >= batchsize:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
 def main():
     a = ArgumentParser()
     a.add_argument('-f', '--fsa', metavar='FSAFILE', required=True,
@@ -27,6 +52,8 @@ def main():
                    help="test only word-forms with frequency higher than FREQ")
     a.add_argument('-t', '--threshold', metavar='THOLD', default=99, type=int,
                    help="require THOLD % coverage or exit 1 (for testing)")
+    a.add_argument('-b', '--batchsize', metavar='N', default=1000, type=int,
+                   help="analyse N word-forms at a time")
     options = a.parse_args()
     omorfi = Omorfi(options.verbose)
     if options.fsa:
@@ -47,27 +74,22 @@ def main():
     # for make check target
     realstart = perf_counter()
     cpustart = process_time()
-    for line in options.infile:
-        fields = line.strip().replace(' ', '\t', 1).split('\t')
-        if len(fields) < 2:
-            print("ERROR: Skipping line", fields, file=stderr)
-            continue
-        freq = int(fields[0])
-        if freq < int(options.count):
-            break
-        surf = fields[1]
-        tokens += freq
-        uniqs += 1
-        if options.verbose:
-            print(tokens, "(", freq, ')...', end='\r')
-        anals = omorfi.analyse(surf)
-        if len(anals) > 0 and "GUESS=UNKNOWN" not in anals[0][0]:
-            found_tokens += freq
-            found_uniqs += 1
-        else:
-            missed_tokens += freq
-            missed_uniqs += 1
-            print(freq, surf, "? (missed)", sep="\t", file=options.outfile)
+    pairs = read_frequencies(options.infile, int(options.count))
+    for batch in read_batches(pairs, options.batchsize):
+        analyses = omorfi.analyse_many([surf for freq, surf in batch])
+        for (freq, surf), anals in zip(batch, analyses):
+            tokens += freq
+            uniqs += 1
+            if options.verbose:
+                print(tokens, "(", freq, ')...', end='\r')
+            if len(anals) > 0 and "GUESS=UNKNOWN" not in anals[0][0]:
+                found_tokens += freq
+                found_uniqs += 1
+            else:
+                missed_tokens += freq
+                missed_uniqs += 1
+                print(freq, surf, "? (missed)", sep="\t",
+                      file=options.outfile)
     if options.verbose:
         print()
     cpuend = process_time()
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Time lexc and twolc escaping over all strings of a lexicon database.
+"""
+
+
+from argparse import ArgumentParser
+from csv import QUOTE_NONE, DictReader
+from time import perf_counter
+
+from omorfi.string_manglers import (lexc_escape, lexc_escapes, lexc_unescape,
+                                    twolc_escape, twolc_escapes,
+                                    twolc_unescape)
+
+
+def chained_lexc_escape(s):
+    '''Escape for lexc with chained replaces for comparison.'''
+    s = s.replace("%", "__PERCENT__")
+    s = s.replace(" ", "% ")
+    s = s.replace("<", "%<")
+    s = s.replace(">", "%>")
+    s = s.replace("0", "%0")
+    s = s.replace("!", "%!")
+    s = s.replace(":", "%:")
+    s = s.replace('"', '%"')
+    s = s.replace(";", "%;")
+    s = s.replace("__PERCENT__", "%%")
+    return s
+
+
+def chained_twolc_escape(s):
+    '''Escape for twolc with chained replaces for comparison.'''
+    s = s.replace("%", "__PERCENT__")
+    for c in ' @<>0!:";_^(){}-[]/?+|&*=$,':
+        s = s.replace(c, "%" + c)
+    s = s.replace("%_%_PERCENT%_%_", "%%")
+    return s
+
+
+def timed(name, f, strings, rounds):
+    '''Run f on strings rounds times and print the best time.'''
+    best = None
+    for _ in range(rounds):
+        start = perf_counter()
+        result = f(strings)
+        elapsed = perf_counter() - start
+        if best is None or elapsed < best:
+            best = elapsed
+    print("%s\t%.4f s\t%.1f ns/string" %
+          (name, best, best * 1e9 / max(len(strings), 1)))
+    return result
+
+
+def main():
+    a = ArgumentParser()
+    a.add_argument('-i', '--input', metavar="INFILE", required=True,
+                   help="read strings from lexicon database INFILE")
+    a.add_argument('-f', '--fields', metavar="FIELD", action="append",
+                   default=None,
+                   help="escape FIELD of each row (default lemma and stub)")
+    a.add_argument('-r', '--rounds', metavar="N", type=int, default=5,
+                   help="report best of N rounds")
+    options = a.parse_args()
+    fields = options.fields or ['lemma', 'stub']
+    strings = []
+    with open(options.input, 'r', newline='') as infile:
+        for row in DictReader(infile, delimiter='\t', quoting=QUOTE_NONE,
+                              escapechar='%', strict=True):
+            for field in fields:
+                if row.get(field):
+                    strings.append(row[field])
+    print(len(strings), "strings from", options.input)
+    rounds = options.rounds
+    expected = timed("chained lexc_escape", lambda ss:
+                     [chained_lexc_escape(s) for s in ss], strings, rounds)
+    escaped = timed("lexc_escape", lambda ss:
+                    [lexc_escape(s) for s in ss], strings, rounds)
+    bulk = timed("lexc_escapes", lexc_escapes, strings, rounds)
+    unescaped = timed("lexc_unescape", lambda ss:
+                      [lexc_unescape(s) for s in ss], escaped, rounds)
+    if escaped != expected or bulk != expected or unescaped != strings:
+        print("lexc escapes differ!")
+        exit(1)
+    expected = timed("chained twolc_escape", lambda ss:
+                     [chained_twolc_escape(s) for s in ss], strings, rounds)
+    escaped = timed("twolc_escape", lambda ss:
+                    [twolc_escape(s) for s in ss], strings, rounds)
+    bulk = timed("twolc_escapes", twolc_escapes, strings, rounds)
+    unescaped = timed("twolc_unescape", lambda ss:
+                      [twolc_unescape(s) for s in ss], escaped, rounds)
+    if escaped != expected or bulk != expected or unescaped != strings:
+        print("twolc escapes differ!")
+        exit(1)
+    exit(0)
+
+
+if __name__ == '__main__':
+    main()
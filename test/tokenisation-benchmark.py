@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Time punctuation peeling of the fallback tokeniser against the old if-chain.
+
+The results are compared too, and must be identical to those of the old
+chain, e.g. on tokenisation-test-set.text. Tokens with more than three
+trailing punctuations are left out of the comparison, since the old chain
+left them to the non-word fallback and they are now peeled like the shorter
+runs; their differences are only listed.
+"""
+
+
+from argparse import ArgumentParser
+from time import perf_counter
+
+from omorfi.omorfi import Omorfi
+from omorfi.settings import fin_punct_leading, fin_punct_trailing
+
+
+def chained_find_retokens(omorfi, token):
+    '''Retokenise with the hand-written if-chain of the old _find_retokens.'''
+    recase = omorfi._find_retoken_recase_uncached
+    retoken = recase(token)
+    if retoken:
+        return [retoken]
+    # Word.
+    if token[-1] in fin_punct_trailing:
+        retoken = recase(token[:-1])
+        if retoken:
+            return [(retoken[0], retoken[1] + "|SpaceAfter=No"),
+                    (token[-1], "SpaceBefore=No")]
+    # -Word
+    if token[0] in fin_punct_leading:
+        retoken = recase(token[1:])
+        if retoken:
+            return [(token[0], "SpaceAfter=No"),
+                    (retoken[0], retoken[1] + "|SpaceBefore=No")]
+    # "Word"
+    if token[0] in fin_punct_leading and token[-1] in fin_punct_trailing:
+        retoken = recase(token[1:-1])
+        if retoken:
+            return [
+                (token[0], "SpaceAfter=No"),
+                (retoken[0], retoken[1] + "|SpaceBefore=No|SpaceAfter=No"),
+                (token[-1], "SpaceBefore=No")]
+    # word." or word",
+    if len(token) > 2 and token[-1] in fin_punct_trailing and token[-2] in fin_punct_trailing:
+        retoken = recase(token[:-2])
+        if retoken:
+            return [
+                (retoken[0], retoken[1] + "|SpaceAfter=No"),
+                (token[-2], "SpaceBefore=No|SpaceAfter=No"),
+                (token[-1], "SpaceBefore=No")]
+    # word.",
+    if len(token) > 3 and token[-1] in fin_punct_trailing and token[-2] in fin_punct_trailing and token[-3] in fin_punct_trailing:
+        retoken = recase(token[:-3])
+        if retoken:
+            return [
+                (retoken[0], retoken[1] + "|SpaceAfter=No"),
+                (token[-3], "SpaceBefore=No|SpaceAfter=No"),
+                (token[-2], "SpaceBefore=No|SpaceAfter=No"),
+                (token[-1], "SpaceBefore=No")]
+    # "word."
+    if len(token) > 3 and token[-1] in fin_punct_trailing and token[-2] in fin_punct_trailing and token[0] in fin_punct_leading:
+        retoken = recase(token[1:-2])
+        if retoken:
+            return [
+                (token[0], "SpaceAfter=No"),
+                (retoken[0], retoken[1] + "|SpaceBefore=No|SpaceAfter=No"),
+                (token[-2], "SpaceBefore=No|SpaceAfter=No"),
+                (token[-1], "SpaceBefore=No")]
+    # "word.",
+    if len(token) > 4 and token[-1] in fin_punct_trailing and token[-2] in fin_punct_trailing and token[-3] in fin_punct_trailing and token[0] in fin_punct_leading:
+        retoken = recase(token[1:-3])
+        if retoken:
+            return [
+                (token[0], "SpaceAfter=No"),
+                (retoken[0], retoken[1] + "|SpaceBefore=No|SpaceAfter=No"),
+                (token[-3], "SpaceBefore=No|SpaceAfter=No"),
+                (token[-2], "SpaceBefore=No|SpaceAfter=No"),
+                (token[-1], "SpaceBefore=No")]
+    # ...non-word...
+    pretokens = []
+    posttokens = []
+    while len(token) > 1 and token[-1] in fin_punct_trailing:
+        posttokens += [(token[-1], "SpaceBefore=No")]
+        token = token[:-1]
+    while len(token) > 1 and token[0] in fin_punct_leading:
+        pretokens += [(token[0], "SpaceAfter=No")]
+        token = token[1:]
+    return pretokens + \
+        [(token, "SpaceBefore=No|SpaceAfter=No")] + \
+        posttokens
+
+
+def long_trail(token):
+    '''Check if token has more trailing punctuations than the old chain.'''
+    trails = 0
+    while trails < len(token) and token[-1 - trails] in fin_punct_trailing:
+        trails += 1
+    return trails > 3
+
+
+def timed(name, f, tokens, rounds, omorfi):
+    '''Run f on tokens rounds times and print the best time and lookups.'''
+    best = None
+    lookups = 0
+    accept = omorfi.accept
+
+    def counted_accept(token):
+        nonlocal lookups
+        lookups += 1
+        return accept(token)
+    omorfi.accept = counted_accept
+    for _ in range(rounds):
+        omorfi.clear_cache()
+        lookups = 0
+        start = perf_counter()
+        result = [f(token) for token in tokens]
+        elapsed = perf_counter() - start
+        if best is None or elapsed < best:
+            best = elapsed
+    del omorfi.accept
+    print("%s\t%.4f s\t%.0f tokens/s\t%d lookups" %
+          (name, best, len(tokens) / best, lookups))
+    return result
+
+
+def main():
+    a = ArgumentParser()
+    a.add_argument('-f', '--fsa', metavar='FSAPATH',
+                   help="Path to directory of HFST format automata")
+    a.add_argument('-i', '--input', metavar="INFILE", action="append",
+                   required=True,
+                   help="retokenise whitespace separated tokens of INFILE")
+    a.add_argument('-r', '--rounds', metavar="N", type=int, default=5,
+                   help="report best of N rounds")
+    options = a.parse_args()
+    omorfi = Omorfi()
+    omorfi.load_from_dir(options.fsa, accept=True)
+    tokens = []
+    for filename in options.input:
+        with open(filename) as infile:
+            for line in infile:
+                tokens += line.split()
+    print(len(tokens), "tokens from", ", ".join(options.input))
+    rounds = options.rounds
+    expected = timed("if-chain", lambda token:
+                     chained_find_retokens(omorfi, token), tokens, rounds,
+                     omorfi)
+    retokens = timed("_find_retokens", omorfi._find_retokens, tokens, rounds,
+                     omorfi)
+    differs = 0
+    long_trails = 0
+    for token, old, new in zip(tokens, expected, retokens):
+        if long_trail(token):
+            long_trails += 1
+            if old != new:
+                print("long trail:", token, old, new)
+        elif old != new:
+            print("differs:", token, old, new)
+            differs += 1
+    print(long_trails, "tokens with long trailing punctuation not compared")
+    if differs:
+        print(differs, "tokens differ")
+        exit(1)
+    print("identical")
+    exit(0)
+
+
+if __name__ == '__main__':
+    main()